@@ -0,0 +1,146 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .schemas import BackupCatalogEntry, BackupManifest
+
+log = logging.getLogger(__name__)
+
+# A line with only this key set to true removes the backup it names
+REMOVED_KEY = "removed"
+
+
+def catalog_entry(manifest: BackupManifest, backup_dir: Path) -> BackupCatalogEntry:
+    """Summarize a backup manifest for the catalog."""
+    blob_store = None
+    if manifest.volume_blobs:
+        blob_store = str((Path(backup_dir) / (manifest.blob_store or "../blob-store")).resolve())
+    return BackupCatalogEntry(
+        backup_id=manifest.backup_id,
+        created_at=manifest.created_at,
+        path=str(Path(backup_dir).resolve()),
+        size_bytes=manifest.size_bytes,
+        volumes=manifest.volumes,
+        codec=manifest.codec,
+        checksum=manifest.checksum,
+        files=manifest.files,
+        blob_store=blob_store,
+        blob_digests=sorted({ref.digest for refs in manifest.volume_blobs.values() for ref in refs}),
+        description=manifest.description,
+    )
+
+
+class BackupCatalog:
+    """
+    Append-only index of directory backups, one JSON line per event.
+
+    create_backup appends an entry for every backup it completes and pruning
+    appends a removal line for every backup it deletes, so recording a
+    backup never rewrites the file, and listing or pruning reads this one
+    file instead of opening and validating each ``backup_manifest.json``.
+    A later line for the same backup ID supersedes earlier ones; compact()
+    rewrites the file with the live entries only.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def add(self, entry: BackupCatalogEntry) -> None:
+        self._append([entry.model_dump_json()])
+
+    def remove(self, backup_ids: Iterable[str]) -> None:
+        self._append([json.dumps({"backup_id": backup_id, REMOVED_KEY: True}) for backup_id in backup_ids])
+
+    def _append(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One write in append mode, so concurrent backups don't interleave lines
+        with open(self.path, "a") as f:
+            f.write("".join(f"{line}\n" for line in lines))
+
+    def entries(self) -> List[BackupCatalogEntry]:
+        """Live catalog entries, newest first."""
+        live: Dict[str, BackupCatalogEntry] = {}
+        try:
+            with open(self.path, "r") as f:
+                for number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        if record.get(REMOVED_KEY):
+                            live.pop(record["backup_id"], None)
+                        else:
+                            entry = BackupCatalogEntry(**record)
+                            live[entry.backup_id] = entry
+                    except (ValueError, KeyError, TypeError) as e:
+                        # A line cut short by a crash should not hide the rest of the catalog
+                        log.warning(f"Skipping unreadable line {number} of backup catalog {self.path}: {e}")
+        except FileNotFoundError:
+            return []
+        return sorted(live.values(), key=lambda entry: entry.created_at, reverse=True)
+
+    def compact(self, entries: Optional[List[BackupCatalogEntry]] = None) -> None:
+        """Rewrite the catalog with only the given (default: live) entries, oldest first."""
+        if entries is None:
+            entries = self.entries()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial_file = self.path.with_name(f"{self.path.name}.partial")
+        with open(partial_file, "w") as f:
+            for entry in sorted(entries, key=lambda entry: entry.created_at):
+                f.write(f"{entry.model_dump_json()}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        partial_file.replace(self.path)
+
+    def rebuild(self, backup_root: Path) -> List[BackupCatalogEntry]:
+        """
+        Replace the catalog with entries read from the manifests of backups in backup_root.
+
+        This is the slow path the catalog otherwise avoids, for backups made
+        before it existed or moved since. Cataloged backups elsewhere are kept
+        if their directory still exists.
+        """
+        backup_root = Path(backup_root).expanduser().resolve()
+        found: Dict[str, BackupCatalogEntry] = {}
+        for manifest_file in sorted(backup_root.glob("*/backup_manifest.json")):
+            try:
+                with open(manifest_file, "r") as f:
+                    manifest = BackupManifest(**json.load(f))
+            except (OSError, ValueError) as e:
+                log.warning(f"Skipping unreadable backup manifest {manifest_file}: {e}")
+                continue
+            found[manifest.backup_id] = catalog_entry(manifest, manifest_file.parent)
+        for entry in self.entries():
+            if entry.backup_id not in found and Path(entry.path).is_dir():
+                found[entry.backup_id] = entry
+        self.compact(list(found.values()))
+        return sorted(found.values(), key=lambda entry: entry.created_at, reverse=True)
+
+
+def retained_backups(entries: Iterable[BackupCatalogEntry], keep_daily: int = 0, keep_weekly: int = 0) -> Set[str]:
+    """
+    IDs of the backups a keep-daily/keep-weekly retention policy keeps.
+
+    For each of the ``keep_daily`` most recent days that have backups, the
+    newest backup of that day is kept, and likewise per ISO week for
+    ``keep_weekly``. A backup kept by either rule is kept.
+    """
+    newest_first = sorted(entries, key=lambda entry: entry.created_at, reverse=True)
+    keep: Set[str] = set()
+    for count, period in (
+        (keep_daily, lambda entry: entry.created_at.date()),
+        (keep_weekly, lambda entry: tuple(entry.created_at.isocalendar()[:2])),
+    ):
+        periods = set()
+        for entry in newest_first:
+            if len(periods) >= count:
+                break
+            key = period(entry)
+            if key not in periods:
+                periods.add(key)
+                keep.add(entry.backup_id)
+    return keep
@@ -0,0 +1,233 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, List, NamedTuple, Optional, Tuple
+
+from .compression import get_codec
+from .integrity import HASH_BUFFER_SIZE, HashingWriter, file_sha256
+from .schemas import (
+    ArchiveChunk,
+    BackupCheckpointState,
+    BackupConfig,
+    BlobRef,
+    VolumeBackupStats,
+    VolumeCheckpoint,
+)
+from .volume_archive import TarPosition
+
+log = logging.getLogger(__name__)
+
+# Written into the backup directory while a backup runs; removed once it completes
+CHECKPOINT_FILE = "backup_checkpoint.json"
+
+# Uncompressed tar bytes between checkpoints of a volume archive. Each
+# checkpoint ends a compressed frame and syncs the archive to disk.
+CHECKPOINT_INTERVAL = 1024 * 1024 * 1024
+
+
+class ResumePoint(NamedTuple):
+    """Where a partly written volume archive continues, after its checkpointed chunks."""
+    volume: VolumeCheckpoint
+    position: TarPosition
+    size: int
+    sha256: "hashlib._Hash"
+
+
+class ChunkedArchiveWriter(io.RawIOBase):
+    """
+    Compressing writer that can end its compressed frame between members.
+
+    Every chunk is a complete gzip member (or zstd/lz4 frame), and concatenated
+    frames decompress to the concatenated data, so the archive is still one
+    ordinary file; a chunk boundary is a point it can be truncated to and
+    appended from. Each chunk's compressed bytes are hashed and counted on
+    their way to ``fileobj``, which is left open when the writer is closed.
+    """
+
+    def __init__(self, fileobj: BinaryIO, codec: str, level: Optional[int] = None, threads: int = 0):
+        self._fileobj = fileobj
+        self._codec = get_codec(codec)
+        self._level = level
+        self._threads = threads
+        self._open_chunk()
+
+    def _open_chunk(self) -> None:
+        self._chunk = HashingWriter(self._fileobj)
+        self._compressed = self._codec.open_writer(self._chunk, level=self._level, threads=self._threads)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._compressed.write(data)
+        return memoryview(data).nbytes
+
+    def cut(self) -> Tuple[int, str]:
+        """End the current chunk and start the next; returns the chunk's size and SHA-256."""
+        self._compressed.close()
+        size, sha256 = self._chunk.bytes_written, self._chunk.hexdigest()
+        self._open_chunk()
+        return size, sha256
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._compressed.close()
+        finally:
+            super().close()
+
+
+class BackupCheckpoint:
+    """
+    Progress of a directory backup, kept in ``backup_checkpoint.json``.
+
+    Volume backups record every checkpointed chunk of an archive and every
+    finished archive here with their digests, so ``backup --resume`` keeps
+    what an interrupted run wrote once it re-verifies it. Volumes are backed
+    up concurrently, so updates are serialized, and the file is replaced
+    atomically so a crash mid-save leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, backup_dir: Path, state: BackupCheckpointState, interval: int = CHECKPOINT_INTERVAL):
+        self.backup_dir = Path(backup_dir)
+        self.path = self.backup_dir / CHECKPOINT_FILE
+        self.state = state
+        self.interval = interval
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls, backup_dir: Path, backup_id: str, backup_config: BackupConfig, interval: int = CHECKPOINT_INTERVAL
+    ) -> "BackupCheckpoint":
+        """Start a checkpoint for a new backup, replacing any earlier one in backup_dir."""
+        checkpoint = cls(backup_dir, BackupCheckpointState(backup_id=backup_id, backup_config=backup_config), interval)
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def load(cls, backup_dir: Path, interval: int = CHECKPOINT_INTERVAL) -> Optional["BackupCheckpoint"]:
+        """Read the checkpoint of an interrupted backup, or None if backup_dir has none."""
+        path = Path(backup_dir) / CHECKPOINT_FILE
+        try:
+            with open(path, "r") as f:
+                state = BackupCheckpointState(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.error(f"Cannot read backup checkpoint {path}: {e}")
+            return None
+        return cls(backup_dir, state, interval)
+
+    def save(self) -> None:
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        self.state.updated_at = datetime.now()
+        partial_file = self.path.with_name(f"{CHECKPOINT_FILE}.partial")
+        with open(partial_file, "w") as f:
+            json.dump(self.state.model_dump(), f, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        partial_file.replace(self.path)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def has_chunks(self, volume_name: str) -> bool:
+        volume = self.state.volumes.get(volume_name)
+        return volume is not None and bool(volume.chunks)
+
+    def record_chunk(
+        self,
+        volume_name: str,
+        archive: str,
+        chunk: ArchiveChunk,
+        stats: VolumeBackupStats,
+        blob_refs: List[BlobRef],
+    ) -> None:
+        """Record a chunk synced to disk, with the volume's counters and blob references up to it."""
+        with self._lock:
+            volume = self.state.volumes.get(volume_name)
+            if volume is None or volume.archive != archive:
+                volume = self.state.volumes[volume_name] = VolumeCheckpoint(name=volume_name, archive=archive)
+            volume.chunks.append(chunk)
+            volume.stats = stats
+            volume.blob_refs = list(blob_refs)
+            self._save()
+
+    def record_volume(self, stats: VolumeBackupStats, blob_refs: List[BlobRef]) -> None:
+        """Record a finished volume archive."""
+        with self._lock:
+            self.state.volumes[stats.name] = VolumeCheckpoint(
+                name=stats.name, archive=stats.archive, complete=True, stats=stats, blob_refs=list(blob_refs)
+            )
+            self._save()
+
+    def discard_volume(self, volume_name: str) -> None:
+        with self._lock:
+            if self.state.volumes.pop(volume_name, None) is not None:
+                self._save()
+
+    def completed_volume(self, volume_name: str, archive: str, backup_file: Path) -> Optional[VolumeCheckpoint]:
+        """
+        Checkpoint of a volume archive an earlier run finished, if the archive still matches it.
+
+        The archive is re-hashed in full; one that is missing or altered is
+        dropped from the checkpoint so the volume is backed up again.
+        """
+        volume = self.state.volumes.get(volume_name)
+        if volume is None or not volume.complete or volume.archive != archive or volume.stats is None:
+            return None
+        try:
+            if backup_file.stat().st_size == volume.stats.size_bytes and file_sha256(backup_file) == volume.stats.sha256:
+                return volume
+        except OSError as e:
+            log.debug(f"Cannot verify {backup_file}: {e}")
+        log.warning(f"Archive of volume {volume_name} does not match its checkpoint, backing it up again")
+        self.discard_volume(volume_name)
+        return None
+
+    def resume_point(self, volume_name: str, archive: str, partial_file: Path) -> Optional[ResumePoint]:
+        """
+        Verify the checkpointed chunks of a partly written archive and cut it back to them.
+
+        Whatever an interrupted run wrote after its last checkpoint is
+        truncated away. Returns None, dropping the volume from the checkpoint,
+        when there is nothing to resume or a chunk does not match its digest.
+        """
+        volume = self.state.volumes.get(volume_name)
+        if volume is None or volume.complete or volume.archive != archive or not volume.chunks:
+            return None
+        sha256 = hashlib.sha256()
+        size = 0
+        try:
+            with open(partial_file, "r+b") as f:
+                for index, chunk in enumerate(volume.chunks):
+                    digest = hashlib.sha256()
+                    remaining = chunk.size
+                    while remaining and (data := f.read(min(HASH_BUFFER_SIZE, remaining))):
+                        digest.update(data)
+                        sha256.update(data)
+                        remaining -= len(data)
+                    if remaining or digest.hexdigest() != chunk.sha256:
+                        log.warning(
+                            f"Chunk {index} of volume {volume_name} does not match its checkpoint, "
+                            f"backing the volume up from the start"
+                        )
+                        self.discard_volume(volume_name)
+                        return None
+                    size += chunk.size
+                f.truncate(size)
+        except OSError as e:
+            log.warning(f"Cannot resume volume {volume_name}, backing it up from the start: {e}")
+            self.discard_volume(volume_name)
+            return None
+        last = volume.chunks[-1]
+        return ResumePoint(volume, TarPosition(last.members, last.last_member, last.tar_offset), size, sha256)
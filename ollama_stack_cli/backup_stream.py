@@ -0,0 +1,197 @@
+import hashlib
+import io
+import logging
+import tarfile
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from .compression import CODECS, detect_codec, get_codec
+from .schemas import FileDigest
+
+log = logging.getLogger(__name__)
+
+# First and last members of a backup stream. The header is the manifest as
+# planned, so a reader knows what follows; the trailer is the final manifest
+# with digests, written once they are known.
+STREAM_HEADER = "backup_header.json"
+STREAM_TRAILER = "backup_manifest.json"
+
+# Files whose size is unknown until written (volume archives) are split into
+# members of at most this size, since a tar header must give the size up front
+STREAM_PART_SIZE = 16 * 1024 * 1024
+
+# PAX headers tying a part member to the file it belongs to
+STREAM_FILE_KEY = "OLLAMASTACK.file"
+STREAM_PART_KEY = "OLLAMASTACK.part"
+
+
+def is_stream_path(path: str) -> bool:
+    """Whether a backup path names a backup stream ("-" or a tar file) rather than a directory."""
+    return path == "-" or any(path.endswith(codec.extension) for codec in CODECS.values())
+
+
+def codec_for_path(path: str, default: str) -> str:
+    """
+    Codec a backup stream file should be written with, from its extension.
+
+    ``default`` is kept when it matches the extension (gzip-mt for ``.tar.gz``);
+    "-" has no extension and always uses ``default``.
+    """
+    if path == "-" or path.endswith(get_codec(default).extension):
+        return default
+    for codec in CODECS.values():
+        if path.endswith(codec.extension):
+            return codec.name
+    return default
+
+
+class _PartWriter(io.RawIOBase):
+    """Writes one file into a tar stream as a sequence of bounded part members."""
+
+    def __init__(self, tar: tarfile.TarFile, name: str, part_size: int):
+        self._tar = tar
+        self.name = name
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._parts = 0
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        count = memoryview(data).nbytes
+        self._buffer += data
+        self.bytes_written += count
+        while len(self._buffer) >= self._part_size:
+            self._emit(self._buffer[:self._part_size])
+            del self._buffer[:self._part_size]
+        return count
+
+    def close(self) -> None:
+        if not self.closed:
+            # An empty file still gets one (empty) part so readers see it
+            if self._buffer or not self._parts:
+                self._emit(self._buffer)
+                self._buffer = bytearray()
+        super().close()
+
+    def _emit(self, data) -> None:
+        member = tarfile.TarInfo(f"{self.name}.part{self._parts:06d}")
+        member.size = len(data)
+        member.mtime = int(time.time())
+        member.pax_headers = {STREAM_FILE_KEY: self.name, STREAM_PART_KEY: str(self._parts)}
+        self._tar.addfile(member, io.BytesIO(data))
+        self._parts += 1
+
+
+class BackupStreamWriter:
+    """
+    Write a backup as a single compressed tar stream.
+
+    The stream holds the same files as a backup directory (config files,
+    stack_state.json, one plain tar archive per volume) between a header and a
+    trailer manifest, and is written front to back with constant memory, so it
+    can go to stdout, a pipe or a file. The whole stream is compressed with
+    ``codec``, making a file ``zstd -d | tar -x`` (or ``tar -xzf``) can unpack.
+    """
+
+    def __init__(self, fileobj: BinaryIO, codec: str = "gzip", level: Optional[int] = None,
+                 threads: int = 0, part_size: int = STREAM_PART_SIZE):
+        self._compressed = get_codec(codec).open_writer(fileobj, level=level, threads=threads)
+        self._tar = tarfile.open(fileobj=self._compressed, mode="w|", format=tarfile.PAX_FORMAT)
+        self._part_size = part_size
+
+    def add_bytes(self, name: str, data: bytes) -> FileDigest:
+        """Add a small file held in memory."""
+        member = tarfile.TarInfo(name)
+        member.size = len(data)
+        member.mtime = int(time.time())
+        self._tar.addfile(member, io.BytesIO(data))
+        return FileDigest(path=name, size=len(data), sha256=hashlib.sha256(data).hexdigest())
+
+    def add_file(self, name: str, path: Path) -> FileDigest:
+        """Add a small file from disk."""
+        return self.add_bytes(name, Path(path).read_bytes())
+
+    def open_file(self, name: str) -> _PartWriter:
+        """Open a file of unknown size for writing; it is split into parts as it is written."""
+        return _PartWriter(self._tar, name, self._part_size)
+
+    def close(self) -> None:
+        self._tar.close()
+        self._compressed.close()
+
+    def __enter__(self) -> "BackupStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _PartReader(io.RawIOBase):
+    """Reads a file written by _PartWriter back across its consecutive part members."""
+
+    def __init__(self, tar: tarfile.TarFile, first: tarfile.TarInfo, name: str):
+        self._tar = tar
+        self._name = name
+        self._current = tar.extractfile(first)
+        self._next_part = 1
+        self._following: Optional[tarfile.TarInfo] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while self._current is not None:
+            count = self._current.readinto(target)
+            if count:
+                return count
+            self._advance()
+        return 0
+
+    def _advance(self) -> None:
+        member = self._tar.next()
+        if member is not None and member.pax_headers.get(STREAM_FILE_KEY) == self._name:
+            if member.pax_headers.get(STREAM_PART_KEY) != str(self._next_part):
+                raise ValueError(f"Backup stream is missing part {self._next_part} of {self._name}")
+            self._current = self._tar.extractfile(member)
+            self._next_part += 1
+        else:
+            self._following = member
+            self._current = None
+
+    def finish(self) -> Optional[tarfile.TarInfo]:
+        """Skip any unread parts and return the member after this file."""
+        while self._current is not None:
+            self._advance()
+        return self._following
+
+
+class BackupStreamReader:
+    """
+    Read a backup stream written by BackupStreamWriter.
+
+    The codec is detected from the first bytes, so ``fileobj`` must support
+    ``peek`` (stdin and files opened in buffered binary mode do). Files are
+    yielded in stream order, each as a file object that is valid until the
+    next one is requested; unread contents are skipped.
+    """
+
+    def __init__(self, fileobj: BinaryIO):
+        self.codec = detect_codec(fileobj.peek(4)[:4])
+        self._tar = tarfile.open(fileobj=get_codec(self.codec).open_reader(fileobj), mode="r|")
+
+    def __iter__(self) -> Iterator[Tuple[str, BinaryIO]]:
+        member = self._tar.next()
+        while member is not None:
+            name = member.pax_headers.get(STREAM_FILE_KEY)
+            if name is not None:
+                parts = _PartReader(self._tar, member, name)
+                yield name, parts
+                member = parts.finish()
+                continue
+            if member.isreg():
+                yield member.name, self._tar.extractfile(member)
+            member = self._tar.next()
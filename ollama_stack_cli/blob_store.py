@@ -0,0 +1,125 @@
+import hashlib
+import logging
+import os
+import re
+import tarfile
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from .schemas import BlobRef
+
+log = logging.getLogger(__name__)
+
+# Ollama keeps model layers under models/blobs, named after their SHA-256 digest;
+# a blob is written under a -partial name and never changes once it has its own
+MODEL_BLOB_DIR = "models/blobs"
+MODEL_BLOB_PATTERN = re.compile(r"^\./models/blobs/sha256-([0-9a-f]{64})$")
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def model_blob_digest(archive_name: str) -> Optional[str]:
+    """Return the digest of an Ollama model blob archive entry, or None for other entries."""
+    match = MODEL_BLOB_PATTERN.match(archive_name)
+    return match.group(1) if match else None
+
+
+class BlobStore:
+    """
+    Content-addressed store for Ollama model blobs, shared by all backups.
+
+    Blobs are stored once under ``sha256/<digest>`` no matter how many backups
+    reference them, so a backup of an unchanged model library only records
+    references. Objects are written to a temporary name and renamed into place,
+    which keeps concurrent volume backups and interrupted runs from leaving
+    partial objects behind.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / "sha256" / digest
+
+    def has(self, digest: str) -> bool:
+        return self.object_path(digest).is_file()
+
+    def ingest(self, member: tarfile.TarInfo, fileobj: BinaryIO, digest: str) -> Tuple[BlobRef, bool]:
+        """
+        Record a blob archive member, copying its contents only if the store lacks them.
+
+        The blob's file name already names its digest, so a known blob is
+        referenced without reading it. New blobs are hashed while copied; if
+        the contents do not match the name, they are stored under the digest
+        actually computed so restores reproduce the file exactly.
+
+        Returns:
+            Tuple of the blob reference and whether its contents were copied
+        """
+        copied = False
+        if not self.has(digest):
+            digest = self._copy_in(fileobj, digest)
+            copied = True
+        ref = BlobRef(
+            path=member.name,
+            digest=digest,
+            size=member.size,
+            mode=member.mode,
+            uid=member.uid,
+            gid=member.gid,
+            mtime=member.mtime,
+        )
+        return ref, copied
+
+    def _copy_in(self, fileobj: BinaryIO, expected_digest: str) -> str:
+        directory = self.root / "sha256"
+        directory.mkdir(parents=True, exist_ok=True)
+        temp_path = directory / f".{expected_digest}.{uuid.uuid4().hex}.tmp"
+        sha256 = hashlib.sha256()
+        try:
+            with open(temp_path, "wb") as out:
+                while chunk := fileobj.read(COPY_CHUNK_SIZE):
+                    sha256.update(chunk)
+                    out.write(chunk)
+            digest = sha256.hexdigest()
+            if digest != expected_digest:
+                log.warning(f"Model blob sha256-{expected_digest} has digest {digest}; storing by content")
+            os.replace(temp_path, self.object_path(digest))
+            return digest
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def open(self, digest: str) -> BinaryIO:
+        return open(self.object_path(digest), "rb")
+
+    def digests(self) -> Iterator[str]:
+        """Digests of the stored blobs, skipping copies still in progress."""
+        directory = self.root / "sha256"
+        if not directory.is_dir():
+            return
+        for entry in os.scandir(directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                yield entry.name
+
+    def remove(self, digest: str) -> int:
+        """Delete a stored blob; returns the bytes freed (0 if it was already gone)."""
+        path = self.object_path(digest)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        return size
+
+    @staticmethod
+    def member_for(ref: BlobRef) -> tarfile.TarInfo:
+        """Rebuild the archive member a blob reference was recorded from."""
+        member = tarfile.TarInfo(ref.path)
+        member.size = ref.size
+        member.mode = ref.mode
+        member.uid = ref.uid
+        member.gid = ref.gid
+        member.mtime = ref.mtime
+        return member
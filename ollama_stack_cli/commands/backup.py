@@ -9,7 +9,7 @@ import typer
 import logging
 from pathlib import Path
 from typing_extensions import Annotated
-from typing import Optional
+from typing import List, Optional
 import datetime
 
 from ..context import AppContext
@@ -24,12 +24,49 @@ def backup_stack_logic(
     include_extensions: bool = True,
     output_path: Optional[str] = None,
     compress: bool = True,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    max_workers: int = 4,
+    dedupe_blobs: bool = False,
+    blob_store: Optional[str] = None,
+    codec: str = "gzip",
+    compression_level: Optional[int] = None,
+    compression_threads: int = 0,
+    adaptive: bool = False,
+    verify: bool = False,
+    exclude_patterns: Optional[List[str]] = None,
+    default_excludes: bool = True,
+    online: bool = False,
+    rate_limit: Optional[float] = None,
+    nice: Optional[int] = None,
+    ionice: Optional[str] = None,
+    helper_cpu_shares: Optional[int] = None,
+    helper_blkio_weight: Optional[int] = None
 ) -> bool:
     """Business logic for creating stack backups."""
+    from ..backup_stream import codec_for_path, is_stream_path
+    from ..compression import get_codec
+    
+    # "-" or a .tar[.gz|.zst|.lz4] file gets a single streamed archive instead of a directory
+    streaming = output_path is not None and is_stream_path(output_path)
+    if streaming and compress:
+        codec = codec_for_path(output_path, codec)
+    
+    if compress:
+        try:
+            get_codec(codec).require()
+        except (ValueError, RuntimeError) as e:
+            log.error(f"Cannot use compression codec: {e}")
+            return False
+    
+    if ionice is not None and ionice not in ("idle", "best-effort"):
+        log.error(f"Unknown I/O class: {ionice} (use idle or best-effort)")
+        return False
     
     # Determine backup directory
-    if output_path:
+    if streaming:
+        backup_dir = None if output_path == "-" else Path(output_path).expanduser().resolve()
+        log.info(f"Writing backup stream to: {backup_dir or 'stdout'}")
+    elif output_path:
         backup_dir = Path(output_path).expanduser().resolve()
     else:
         # Use default backup location with timestamp
@@ -44,7 +81,22 @@ def backup_stack_logic(
         "include_config": include_config, 
         "include_extensions": include_extensions,
         "compression": compress,
-        "exclude_patterns": []
+        "codec": codec,
+        "compression_level": compression_level,
+        "compression_threads": compression_threads,
+        "adaptive_compression": adaptive,
+        "verify_after_backup": verify,
+        "exclude_patterns": exclude_patterns or [],
+        "default_excludes": default_excludes,
+        "max_workers": max_workers,
+        "deduplicate_blobs": dedupe_blobs,
+        "blob_store": blob_store,
+        "online": online,
+        "rate_limit_mb": rate_limit,
+        "nice": nice,
+        "ionice": ionice,
+        "helper_cpu_shares": helper_cpu_shares,
+        "helper_blkio_weight": helper_blkio_weight
     }
     
     # Add description if provided
@@ -55,6 +107,8 @@ def backup_stack_logic(
     backup_items = []
     if include_volumes:
         backup_items.append("Docker volumes (models, conversations)")
+        if dedupe_blobs:
+            log.info("Model blobs will be deduplicated into the shared blob store")
     if include_config:
         backup_items.append("Configuration files")
     if include_extensions:
@@ -62,13 +116,26 @@ def backup_stack_logic(
     
     if backup_items:
         log.info(f"Backup will include: {', '.join(backup_items)}")
+        if include_volumes and exclude_patterns:
+            log.info(f"Excluding from volumes: {', '.join(exclude_patterns)}")
+        if include_volumes and online:
+            log.info("Online backup: services are paused only while their volumes are snapshotted")
     else:
         log.error("No backup items selected - nothing to backup")
         return False
     
+    if streaming:
+        if dedupe_blobs:
+            log.error("--dedupe-blobs needs a backup directory and cannot be used with a backup stream")
+            return False
+        return _backup_to_stream(app_context, backup_dir, backup_config, codec if compress else "none", description)
+    
     # Check if backup directory already exists
     if backup_dir.exists():
+        from ..backup_checkpoint import CHECKPOINT_FILE
         log.warning(f"Backup directory already exists: {backup_dir}")
+        if (backup_dir / CHECKPOINT_FILE).is_file():
+            log.info(f"It holds an interrupted backup; run: ollama-stack backup --resume {backup_dir} to continue it")
         if not typer.confirm("Do you want to overwrite the existing backup?"):
             log.info("Backup cancelled by user")
             return False
@@ -86,7 +153,7 @@ def backup_stack_logic(
             log.info("Backup completed successfully!")
             log.info(f"Location: {backup_dir}")
             log.info(f"Includes: {', '.join(backup_items)}")
-            log.info(f"Compressed: {'Yes' if compress else 'No'}")
+            log.info(f"Compressed: {f'Yes ({codec}, per file)' if compress and adaptive else f'Yes ({codec})' if compress else 'No'}")
             if description:
                 log.info(f"Description: {description}")
             log.info(f"To restore this backup, run: ollama-stack restore {backup_dir}")
@@ -101,6 +168,208 @@ def backup_stack_logic(
         return False
 
 
+def _backup_to_stream(
+    app_context: AppContext,
+    backup_file: Optional[Path],
+    backup_config: dict,
+    codec: str,
+    description: Optional[str] = None
+) -> bool:
+    """Write the backup as one stream to a file, or to stdout when backup_file is None."""
+    import sys
+    
+    if backup_file is None:
+        if sys.stdout.isatty():
+            log.error("Refusing to write a backup stream to a terminal - redirect or pipe stdout")
+            return False
+        try:
+            success = app_context.stack_manager.create_backup_stream(sys.stdout.buffer, backup_config)
+            sys.stdout.buffer.flush()
+        except Exception as e:
+            log.error(f"Backup failed with error: {e}")
+            return False
+        if not success:
+            log.error("Backup failed - the stream written to stdout is incomplete and cannot be restored")
+        return success
+    
+    if backup_file.exists():
+        log.warning(f"Backup file already exists: {backup_file}")
+        if not typer.confirm("Do you want to overwrite the existing backup?"):
+            log.info("Backup cancelled by user")
+            return False
+    
+    # Written under a temporary name so an interrupted backup never looks complete
+    partial_file = backup_file.with_name(backup_file.name + ".partial")
+    try:
+        backup_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(partial_file, "wb") as output:
+            success = app_context.stack_manager.create_backup_stream(output, backup_config)
+        if not success:
+            log.error("Backup failed - check logs for details")
+            partial_file.unlink(missing_ok=True)
+            return False
+        partial_file.replace(backup_file)
+    except Exception as e:
+        log.error(f"Backup failed with error: {e}")
+        partial_file.unlink(missing_ok=True)
+        return False
+    
+    log.info("Backup completed successfully!")
+    log.info(f"Location: {backup_file}")
+    log.info(f"Compressed: {f'Yes ({codec})' if codec != 'none' else 'No'}")
+    if description:
+        log.info(f"Description: {description}")
+    log.info(f"To restore this backup, run: ollama-stack restore {backup_file}")
+    return True
+
+
+def resume_backup_logic(app_context: AppContext, backup_path: str) -> bool:
+    """Business logic for continuing an interrupted directory backup."""
+    from ..backup_checkpoint import CHECKPOINT_FILE
+    
+    backup_dir = Path(backup_path).expanduser().resolve()
+    if not (backup_dir / CHECKPOINT_FILE).is_file():
+        log.error(f"No interrupted backup to resume in: {backup_dir}")
+        return False
+    
+    log.info(f"Resuming backup in: {backup_dir}")
+    log.info("Using the options the backup was started with")
+    try:
+        success = app_context.stack_manager.create_backup(backup_dir=backup_dir, resume=True)
+    except Exception as e:
+        log.error(f"Backup failed with error: {e}")
+        return False
+    
+    if success:
+        log.info("Backup completed successfully!")
+        log.info(f"Location: {backup_dir}")
+        log.info(f"To restore this backup, run: ollama-stack restore {backup_dir}")
+    else:
+        log.error("Backup failed - check logs for details")
+    return success
+
+
+def benchmark_compression_logic(
+    app_context: AppContext,
+    codecs: Optional[List[str]] = None,
+    sample_mb: int = 64,
+    compression_threads: int = 0
+) -> bool:
+    """Business logic for benchmarking compression codecs on stack volume data."""
+    log.info(f"Sampling up to {sample_mb} MB of each volume for the codec benchmark...")
+    try:
+        results = app_context.stack_manager.benchmark_compression(
+            codecs=codecs,
+            sample_bytes=sample_mb * 1024 * 1024,
+            compression_threads=compression_threads
+        )
+    except Exception as e:
+        log.error(f"Compression benchmark failed: {e}")
+        return False
+    
+    if not results:
+        log.error("No volume data available to benchmark")
+        return False
+    
+    def rate(value: Optional[float]) -> str:
+        return f"{value:.1f}" if value is not None else "-"
+    
+    rows = [
+        [
+            result.volume or "-",
+            result.codec,
+            str(result.level) if result.level is not None else "-",
+            str(result.threads),
+            f"{result.sample_bytes / (1024 * 1024):.1f}",
+            f"{result.ratio:.2f}",
+            rate(result.compress_mb_per_sec),
+            rate(result.decompress_mb_per_sec),
+        ]
+        for result in results
+    ]
+    app_context.display.table(
+        "Compression Benchmark",
+        ["Volume", "Codec", "Level", "Threads", "Sample MB", "Ratio", "Compress MB/s", "Decompress MB/s"],
+        rows
+    )
+    return True
+
+
+def backup_list_logic(app_context: AppContext, rebuild: bool = False) -> bool:
+    """Business logic for listing cataloged backups."""
+    try:
+        entries = app_context.stack_manager.list_backups(rebuild=rebuild)
+    except Exception as e:
+        log.error(f"Failed to read the backup catalog: {e}")
+        return False
+    
+    if not entries:
+        log.info("No backups in the catalog")
+        if not rebuild:
+            log.info("Backups made before the catalog existed appear after: ollama-stack backup list --rebuild")
+        return True
+    
+    rows = [
+        [
+            entry.backup_id,
+            entry.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            f"{entry.size_bytes / (1024 * 1024):.1f}",
+            entry.codec,
+            ", ".join(entry.volumes) or "-",
+            entry.description or "",
+            entry.path,
+        ]
+        for entry in entries
+    ]
+    app_context.display.table(
+        "Backups",
+        ["ID", "Created", "Size MB", "Codec", "Volumes", "Description", "Location"],
+        rows
+    )
+    return True
+
+
+def prune_backups_logic(
+    app_context: AppContext,
+    keep_daily: int = 0,
+    keep_weekly: int = 0,
+    dry_run: bool = False,
+    force: bool = False
+) -> bool:
+    """Business logic for deleting backups outside a retention policy."""
+    if not keep_daily and not keep_weekly:
+        log.error("Refusing to prune every backup: give --keep-daily and/or --keep-weekly")
+        return False
+    
+    if not dry_run and not force:
+        log.warning(f"Backups other than the newest of the last {keep_daily} day(s) and {keep_weekly} week(s) will be deleted")
+        log.info("Use --dry-run to see which, or --force to skip this confirmation")
+        if not typer.confirm("Do you want to delete these backups?"):
+            log.info("Prune cancelled by user")
+            return False
+    
+    try:
+        report = app_context.stack_manager.prune_backups(
+            keep_daily=keep_daily,
+            keep_weekly=keep_weekly,
+            dry_run=dry_run
+        )
+    except Exception as e:
+        log.error(f"Prune failed with error: {e}")
+        return False
+    
+    verb = "Would remove" if dry_run else "Removed"
+    for entry in report.removed:
+        log.info(f"{verb} backup {entry.backup_id} ({entry.created_at:%Y-%m-%d %H:%M}): {entry.path}")
+    log.info(f"{verb} {len(report.removed)} backup(s), keeping {len(report.kept)}")
+    if report.reclaimed_blobs:
+        log.info(
+            f"{verb} {report.reclaimed_blobs} unreferenced model blob(s), "
+            f"{report.reclaimed_bytes / (1024 * 1024):.1f} MB"
+        )
+    return True
+
+
 def backup(
     ctx: typer.Context,
     include_volumes: Annotated[
@@ -128,7 +397,8 @@ def backup(
         Optional[str],
         typer.Option(
             "--output", "-o",
-            help="Specify backup location (default: ~/.ollama-stack/backups/backup-TIMESTAMP).",
+            help="Specify backup location (default: ~/.ollama-stack/backups/backup-TIMESTAMP). "
+                 "A .tar, .tar.gz, .tar.zst or .tar.lz4 file, or - for stdout, writes a single streamed archive.",
         ),
     ] = None,
     compress: Annotated[
@@ -138,6 +408,104 @@ def backup(
             help="Create compressed backup archive.",
         ),
     ] = True,
+    codec: Annotated[
+        str,
+        typer.Option(
+            "--codec",
+            help="Compression codec for volume archives: none, gzip, gzip-mt, zstd or lz4.",
+        ),
+    ] = "gzip",
+    compression_level: Annotated[
+        Optional[int],
+        typer.Option(
+            "--compression-level",
+            help="Codec compression level (default: the codec's own default).",
+        ),
+    ] = None,
+    compression_threads: Annotated[
+        int,
+        typer.Option(
+            "--compression-threads",
+            min=0,
+            help="Threads per archive for gzip-mt and zstd (0 = one per CPU).",
+        ),
+    ] = 0,
+    adaptive: Annotated[
+        bool,
+        typer.Option(
+            "--adaptive/--no-adaptive",
+            help="Compress volume files individually, storing incompressible ones (model weights, media) as-is.",
+        ),
+    ] = False,
+    exclude: Annotated[
+        Optional[List[str]],
+        typer.Option(
+            "--exclude", "-x",
+            help="Glob pattern for volume paths to leave out (repeatable), e.g. 'uploads/tmp' or '*.log'.",
+        ),
+    ] = None,
+    default_excludes: Annotated[
+        bool,
+        typer.Option(
+            "--default-excludes/--no-default-excludes",
+            help="Leave out caches and partial downloads that are rebuilt on demand.",
+        ),
+    ] = True,
+    online: Annotated[
+        bool,
+        typer.Option(
+            "--online",
+            help="Keep services running: pause each volume's writers only while it is snapshotted, then archive the snapshot.",
+        ),
+    ] = False,
+    rate_limit: Annotated[
+        Optional[float],
+        typer.Option(
+            "--rate-limit",
+            min=0.1,
+            help="Read volumes at no more than this many MB/s in total, to leave disk bandwidth for inference.",
+        ),
+    ] = None,
+    nice: Annotated[
+        Optional[int],
+        typer.Option(
+            "--nice",
+            min=0,
+            max=19,
+            help="Run compression at this CPU niceness (19 = lowest priority).",
+        ),
+    ] = None,
+    ionice: Annotated[
+        Optional[str],
+        typer.Option(
+            "--ionice",
+            help="I/O scheduling class for writing the backup: idle or best-effort (Linux, needs ionice).",
+        ),
+    ] = None,
+    helper_cpu_shares: Annotated[
+        Optional[int],
+        typer.Option(
+            "--helper-cpu-shares",
+            min=2,
+            help="CPU shares for helper containers that copy volume data (default 1024).",
+        ),
+    ] = None,
+    helper_blkio_weight: Annotated[
+        Optional[int],
+        typer.Option(
+            "--helper-blkio-weight",
+            min=10,
+            max=1000,
+            help="Block I/O weight for helper containers that copy volume data (default 500).",
+        ),
+    ] = None,
+    verify: Annotated[
+        bool,
+        typer.Option(
+            "--verify",
+            help="Re-read every backup file after writing it and check it against its digest.",
+        ),
+    ] = False,
     description: Annotated[
         Optional[str],
         typer.Option(
@@ -145,6 +513,50 @@ def backup(
             help="Add a description to the backup for identification.",
         ),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers", "-j",
+            min=1,
+            help="Maximum number of volumes to back up concurrently.",
+        ),
+    ] = 4,
+    dedupe_blobs: Annotated[
+        bool,
+        typer.Option(
+            "--dedupe-blobs/--no-dedupe-blobs",
+            help="Store Ollama model blobs once in a shared blob store instead of in each backup.",
+        ),
+    ] = False,
+    blob_store: Annotated[
+        Optional[str],
+        typer.Option(
+            "--blob-store",
+            help="Shared blob store location (default: blob-store next to the backup directory).",
+        ),
+    ] = None,
+    benchmark: Annotated[
+        bool,
+        typer.Option(
+            "--benchmark",
+            help="Report ratio and MB/s of each codec on a sample of every volume, without backing up.",
+        ),
+    ] = False,
+    benchmark_sample: Annotated[
+        int,
+        typer.Option(
+            "--benchmark-sample",
+            min=1,
+            help="Megabytes sampled from each volume by --benchmark.",
+        ),
+    ] = 64,
+    resume: Annotated[
+        Optional[str],
+        typer.Option(
+            "--resume",
+            help="Continue the interrupted backup in this directory, keeping volumes and chunks that verify against its checkpoint.",
+        ),
+    ] = None,
 ):
     """Create a backup of the current stack state and data.
     
@@ -156,10 +568,48 @@ def backup(
         ollama-stack backup                    # Full backup with default settings
         ollama-stack backup --no-volumes       # Backup without volume data
         ollama-stack backup -o ./my-backup     # Backup to specific location
+        ollama-stack backup -o backup.tar.zst  # Single streamed archive file
+        ollama-stack backup -o - | ssh host 'cat > backup.tar.gz'  # Stream to stdout
         ollama-stack backup -d "Before update" # Backup with description
+        ollama-stack backup --workers 1        # Back up volumes one at a time
+        ollama-stack backup --dedupe-blobs     # Copy only model blobs no earlier backup has
+        ollama-stack backup --codec zstd       # Multithreaded zstd instead of gzip
+        ollama-stack backup --adaptive         # Skip compressing model weights
+        ollama-stack backup --verify           # Re-read the written backup to check it
+        ollama-stack backup --online           # Pause services only for per-volume snapshots
+        ollama-stack backup --rate-limit 50 --nice 19 --ionice idle  # Stay out of inference's way
+        ollama-stack backup -x 'uploads/tmp'   # Leave a volume path out of the backup
+        ollama-stack backup --benchmark        # Compare codecs on samples of each volume
+        ollama-stack backup --resume ./my-backup  # Continue an interrupted backup
+        ollama-stack backup list               # Backups recorded in the catalog
+        ollama-stack backup prune --keep-daily 7 --keep-weekly 4
     """
+    if ctx.invoked_subcommand is not None:
+        return
+    
     app_context: AppContext = ctx.obj
     
+    # Keep stdout for the backup stream itself
+    if output == "-":
+        app_context.display.use_stderr()
+    
+    if benchmark:
+        if not benchmark_compression_logic(
+            app_context=app_context,
+            sample_mb=benchmark_sample,
+            compression_threads=compression_threads
+        ):
+            raise typer.Exit(1)
+        return
+    
+    if resume:
+        if output:
+            log.error("--resume continues the backup in its own directory and cannot be combined with --output")
+            raise typer.Exit(1)
+        if not resume_backup_logic(app_context, resume):
+            raise typer.Exit(1)
+        return
+    
     success = backup_stack_logic(
         app_context=app_context,
         include_volumes=include_volumes,
@@ -167,8 +617,104 @@ def backup(
         include_extensions=include_extensions,
         output_path=output,
         compress=compress,
-        description=description
+        description=description,
+        max_workers=workers,
+        dedupe_blobs=dedupe_blobs,
+        blob_store=blob_store,
+        codec=codec,
+        compression_level=compression_level,
+        compression_threads=compression_threads,
+        adaptive=adaptive,
+        verify=verify,
+        exclude_patterns=exclude,
+        default_excludes=default_excludes,
+        online=online,
+        rate_limit=rate_limit,
+        nice=nice,
+        ionice=ionice,
+        helper_cpu_shares=helper_cpu_shares,
+        helper_blkio_weight=helper_blkio_weight
     )
     
     if not success:
-        raise typer.Exit(1) 
\ No newline at end of file
+        raise typer.Exit(1) 
+
+
+def list_backups(
+    ctx: typer.Context,
+    rebuild: Annotated[
+        bool,
+        typer.Option(
+            "--rebuild",
+            help="Re-read the manifests in the backup directory into the catalog first.",
+        ),
+    ] = False,
+):
+    """List backups recorded in the backup catalog, newest first.
+    
+    Examples:
+        ollama-stack backup list               # Read the catalog only
+        ollama-stack backup list --rebuild     # Also pick up backups made before the catalog
+    """
+    app_context: AppContext = ctx.obj
+    if not backup_list_logic(app_context, rebuild=rebuild):
+        raise typer.Exit(1)
+
+
+def prune(
+    ctx: typer.Context,
+    keep_daily: Annotated[
+        int,
+        typer.Option(
+            "--keep-daily",
+            min=0,
+            help="Keep the newest backup of each of this many most recent days with backups.",
+        ),
+    ] = 0,
+    keep_weekly: Annotated[
+        int,
+        typer.Option(
+            "--keep-weekly",
+            min=0,
+            help="Keep the newest backup of each of this many most recent weeks with backups.",
+        ),
+    ] = 0,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Show what would be deleted without deleting anything.",
+        ),
+    ] = False,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force", "-f",
+            help="Skip the confirmation prompt.",
+        ),
+    ] = False,
+):
+    """Delete cataloged backups outside a retention policy.
+    
+    Model blobs in a shared blob store that no remaining backup references
+    are deleted along with the backups.
+    
+    Examples:
+        ollama-stack backup prune --keep-daily 7 --keep-weekly 4
+        ollama-stack backup prune --keep-daily 3 --dry-run
+    """
+    app_context: AppContext = ctx.obj
+    if not prune_backups_logic(
+        app_context,
+        keep_daily=keep_daily,
+        keep_weekly=keep_weekly,
+        dry_run=dry_run,
+        force=force
+    ):
+        raise typer.Exit(1)
+
+
+backup_app = typer.Typer()
+backup_app.callback(invoke_without_command=True)(backup)
+backup_app.command("list")(list_backups)
+backup_app.command()(prune)
@@ -61,6 +61,7 @@ sequenceDiagram
     Note over Check: Delegate comprehensive checks
     Check->>SM: run_environment_checks(fix=True)
     SM->>SM: log.debug("Running comprehensive environment checks...")
+    SM->>SM: refresh_platform() (invalidates ~/.ollama-stack/platform-cache.json)
     
     Note over SM: Docker environment checks
     SM->>DC: run_environment_checks(fix=True, platform="apple")
@@ -128,6 +129,7 @@ sequenceDiagram
 ## Key Architecture Points
 
 - **Platform Detection**: StackManager detects platform and configures service types accordingly
+- **Platform Cache**: `--fix` discards the cached platform and re-detects it; a plain check re-detects only if the daemon fingerprint changed
 - **Clean Delegation**: Command coordinates, StackManager orchestrates, clients implement
 - **Configuration Recovery**: Handles config fallback scenarios with optional automatic fixing
 - **Comprehensive Validation**: Docker daemon, ports, platform requirements, compose files, images
@@ -9,7 +9,7 @@ import typer
 import logging
 from pathlib import Path
 from typing_extensions import Annotated
-from typing import Optional
+from typing import Dict, List, Optional
 
 from ..context import AppContext
 
@@ -21,9 +21,28 @@ def restore_stack_logic(
     backup_path: str,
     include_volumes: bool = True,
     validate_only: bool = False,
-    force: bool = False
+    force: bool = False,
+    max_workers: int = 4,
+    volumes: Optional[List[str]] = None,
+    paths: Optional[List[str]] = None
 ) -> bool:
     """Business logic for restoring stack from backup."""
+    from ..backup_stream import is_stream_path
+    
+    volume_paths = _parse_volume_paths(paths or [])
+    if volume_paths is None:
+        return False
+    selective = bool(volumes or volume_paths)
+    
+    if selective and not include_volumes:
+        log.error("--volume and --path restore volume data and cannot be combined with --no-volumes")
+        return False
+    
+    if is_stream_path(backup_path):
+        if selective:
+            log.error("--volume and --path need a backup directory; backup streams can only be restored whole")
+            return False
+        return _restore_from_stream(app_context, backup_path, validate_only, force)
     
     backup_dir = Path(backup_path).expanduser().resolve()
     
@@ -50,7 +69,9 @@ def restore_stack_logic(
         # First run validation to check backup integrity
         validation_success = app_context.stack_manager.restore_from_backup(
             backup_dir=backup_dir,
-            validate_only=True
+            validate_only=True,
+            volumes=volumes,
+            paths=volume_paths
         )
         
         if not validation_success:
@@ -66,6 +87,9 @@ def restore_stack_logic(
             log.info(f"To restore this backup, run: ollama-stack restore {backup_dir}")
             return True
         
+        if selective:
+            return _restore_selected(app_context, backup_dir, volumes or [], volume_paths, force, max_workers)
+        
         # Check if stack is currently running
         if app_context.stack_manager.is_stack_running():
             log.warning("Stack is currently running")
@@ -113,7 +137,8 @@ def restore_stack_logic(
         
         success = app_context.stack_manager.restore_from_backup(
             backup_dir=backup_dir,
-            validate_only=False
+            validate_only=False,
+            max_workers=max_workers
         )
         
         if success:
@@ -134,12 +159,123 @@ def restore_stack_logic(
         return False
 
 
+def _parse_volume_paths(paths: List[str]) -> Optional[Dict[str, List[str]]]:
+    """Group VOLUME:/subpath arguments by volume; None (after logging why) if one is malformed."""
+    volume_paths: Dict[str, List[str]] = {}
+    for spec in paths:
+        volume, separator, subpath = spec.partition(":")
+        if not separator or not volume or not subpath:
+            log.error(f"Invalid --path '{spec}': expected VOLUME:/subpath, e.g. ollama-stack_webui_data:/webui.db")
+            return None
+        volume_paths.setdefault(volume, []).append(subpath)
+    return volume_paths
+
+
+def _restore_selected(
+    app_context: AppContext,
+    backup_dir: Path,
+    volumes: List[str],
+    volume_paths: Dict[str, List[str]],
+    force: bool,
+    max_workers: int
+) -> bool:
+    """Restore only some volumes, or paths within them, from a validated backup directory."""
+    targets = [f"{volume} (whole volume)" for volume in volumes if volume not in volume_paths]
+    targets += [f"{volume}:{subpath}" for volume, subpaths in volume_paths.items() for subpath in subpaths]
+    log.info(f"Restore will include: {', '.join(targets)}")
+    
+    if app_context.stack_manager.is_stack_running() and not force:
+        log.warning("Services using these volumes will be stopped during the restore and started again afterwards")
+        log.info("Use --force to skip this confirmation")
+        if not typer.confirm("Do you want to proceed with the restore?"):
+            log.info("Restore cancelled by user")
+            return False
+    
+    log.info(f"Restoring from backup: {backup_dir}")
+    success = app_context.stack_manager.restore_from_backup(
+        backup_dir=backup_dir,
+        validate_only=False,
+        max_workers=max_workers,
+        volumes=volumes,
+        paths=volume_paths
+    )
+    if success:
+        log.info("Restore completed successfully!")
+        log.info(f"From: {backup_dir}")
+        log.info(f"Restored: {', '.join(targets)}")
+    else:
+        log.error("Restore failed - check logs for details")
+    return success
+
+
+def _restore_from_stream(
+    app_context: AppContext,
+    backup_path: str,
+    validate_only: bool = False,
+    force: bool = False
+) -> bool:
+    """Restore from a backup stream file, or from stdin when backup_path is "-"."""
+    import sys
+    
+    if backup_path == "-":
+        # stdin can be read once and carries the data, so prompts cannot be answered
+        if not validate_only and not force:
+            log.error("Restoring from stdin requires --force")
+            return False
+        log.info("Restoring from backup stream on stdin...")
+        success = app_context.stack_manager.restore_from_stream(sys.stdin.buffer, validate_only=validate_only)
+        if not success:
+            log.error("Restore failed - check logs for details")
+        return success
+    
+    backup_file = Path(backup_path).expanduser().resolve()
+    if not backup_file.is_file():
+        log.error(f"Backup file not found: {backup_file}")
+        return False
+    
+    # A file can be read twice: verify the whole stream before touching the stack
+    log.info("Validating backup integrity...")
+    try:
+        with open(backup_file, "rb") as source:
+            if not app_context.stack_manager.restore_from_stream(source, validate_only=True):
+                log.error("Backup validation failed - cannot proceed with restore")
+                return False
+        log.info("Backup validation passed")
+        
+        if validate_only:
+            log.info("Validation-only mode - restore not performed")
+            log.info(f"Backup: {backup_file}")
+            log.info("Status: Valid and ready for restore")
+            return True
+        
+        if app_context.stack_manager.is_stack_running() and not force:
+            log.warning("Stack is currently running")
+            log.info("Use --force to automatically stop services during restore")
+            if not typer.confirm("Do you want to stop the stack and proceed with restore?"):
+                log.info("Restore cancelled by user")
+                return False
+        
+        log.info(f"Restoring from backup: {backup_file}")
+        with open(backup_file, "rb") as source:
+            success = app_context.stack_manager.restore_from_stream(source)
+    except Exception as e:
+        log.error(f"Restore failed with error: {e}")
+        return False
+    
+    if success:
+        log.info("Restore completed successfully!")
+        log.info(f"From: {backup_file}")
+    else:
+        log.error("Restore failed - check logs for details")
+    return success
+
+
 def restore(
     ctx: typer.Context,
     backup_path: Annotated[
         str,
         typer.Argument(
-            help="Path to the backup directory to restore from.",
+            help="Path to the backup directory, or backup stream file (- for stdin), to restore from.",
         ),
     ],
     include_volumes: Annotated[
@@ -163,6 +299,28 @@ def restore(
             help="Skip confirmation prompts and automatically stop services if needed.",
         ),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers", "-j",
+            min=1,
+            help="Maximum number of volumes to restore concurrently.",
+        ),
+    ] = 4,
+    volume: Annotated[
+        Optional[List[str]],
+        typer.Option(
+            "--volume",
+            help="Restore only this volume (repeatable), stopping only the services that use it.",
+        ),
+    ] = None,
+    path: Annotated[
+        Optional[List[str]],
+        typer.Option(
+            "--path",
+            help="Restore only this file or directory, as VOLUME:/subpath (repeatable), e.g. ollama-stack_webui_data:/webui.db.",
+        ),
+    ] = None,
 ):
     """Restore the stack from a backup.
     
@@ -175,16 +333,26 @@ def restore(
         ollama-stack restore ./backup --validate-only  # Only validate backup
         ollama-stack restore ./backup --force     # Skip confirmation prompts
         ollama-stack restore ./backup --no-volumes # Restore without volume data
+        ollama-stack restore ./backup --workers 1  # Restore volumes one at a time
+        ollama-stack restore ./backup --volume ollama-stack_webui_data  # Restore one volume
+        ollama-stack restore ./backup --path ollama-stack_webui_data:/webui.db  # Restore one file
+        ollama-stack restore backup.tar.zst        # Restore from a streamed archive
+        ollama-stack restore - --force < backup.tar.gz  # Restore a stream from stdin
     """
     app_context: AppContext = ctx.obj
     
-    success = restore_stack_logic(
-        app_context=app_context,
-        backup_path=backup_path,
-        include_volumes=include_volumes,
-        validate_only=validate_only,
-        force=force
-    )
+    # One snapshot spans validation, the running-state check and the restore
+    with app_context.stack_manager.stack_snapshot("restore"):
+        success = restore_stack_logic(
+            app_context=app_context,
+            backup_path=backup_path,
+            include_volumes=include_volumes,
+            validate_only=validate_only,
+            force=force,
+            max_workers=workers,
+            volumes=volume,
+            paths=path
+        )
     
     if not success:
         raise typer.Exit(1) 
\ No newline at end of file
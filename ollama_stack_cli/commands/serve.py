@@ -0,0 +1,156 @@
+import typer
+import logging
+import signal
+from typing import Optional
+from typing_extensions import Annotated
+
+from ..context import AppContext
+
+log = logging.getLogger(__name__)
+
+
+def _interrupt_on_sigterm(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve_status_logic(
+    app_context: AppContext,
+    host: str = "127.0.0.1",
+    port: int = 9464,
+    socket_path: Optional[str] = None,
+    interval: float = 5,
+    health_interval: float = 15,
+    extensions_only: bool = False,
+):
+    """
+    Business logic for the long-running status daemon.
+
+    Builds a StatusCache that keeps the Docker client, stats streams, events
+    stream and health results warm, then serves its pre-rendered documents over
+    HTTP until interrupted. Each scrape is answered from memory, so the Docker
+    daemon sees one steady stream of requests regardless of how often clients
+    poll.
+    """
+    from ..status_server import create_status_server, remove_socket
+
+    cache = app_context.stack_manager.create_status_cache(
+        interval=interval,
+        health_interval=health_interval,
+        extensions_only=extensions_only,
+    )
+    server = create_status_server(cache, host=host, port=port, socket_path=socket_path)
+    endpoint = f"unix://{socket_path}" if socket_path else f"http://{host}:{server.server_address[1]}"
+
+    previous_handler = signal.signal(signal.SIGTERM, _interrupt_on_sigterm)
+    cache.start()
+    log.info(
+        f"Serving stack status on {endpoint} (/status, /metrics; refresh every {interval}s, "
+        f"health every {health_interval}s). Press Ctrl+C to stop..."
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log.info("Status server stopped")
+    finally:
+        server.server_close()
+        if socket_path:
+            remove_socket(socket_path)
+        cache.stop()
+        signal.signal(signal.SIGTERM, previous_handler)
+
+
+def serve(
+    ctx: typer.Context,
+    host: Annotated[
+        str,
+        typer.Option("--host", help="Address to listen on."),
+    ] = "127.0.0.1",
+    port: Annotated[
+        int,
+        typer.Option("--port", "-p", min=0, max=65535, help="TCP port to listen on."),
+    ] = 9464,
+    socket_path: Annotated[
+        Optional[str],
+        typer.Option("--socket", help="Listen on a unix domain socket instead of TCP."),
+    ] = None,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--interval",
+            min=0.5,
+            help="Seconds between resource usage refreshes.",
+        ),
+    ] = 5,
+    health_interval: Annotated[
+        float,
+        typer.Option(
+            "--health-interval",
+            min=1,
+            help="Seconds between container list and health re-probes.",
+        ),
+    ] = 15,
+    extensions_only: Annotated[
+        bool,
+        typer.Option("--extensions", help="Serve only extension status."),
+    ] = False,
+):
+    """
+    Serves cached stack status as JSON and Prometheus metrics.
+
+    Runs a lightweight daemon that keeps the Docker connection, stats streams
+    and health results warm, so monitoring scrapes are answered from memory
+    instead of paying for a cold CLI start and a full round of Docker and HTTP
+    calls each time.
+
+    ## Endpoints
+
+    - `GET /status` - the same document as `ollama-stack status --json`
+    - `GET /metrics` - Prometheus text exposition format
+    - `GET /healthz` - liveness of the daemon itself
+
+    `/status` and `/metrics` return 503 until the first refresh completes.
+
+    ## Key Architecture Points
+
+    - **Single Refresher**: One background thread owns all Docker and Ollama traffic
+    - **Event-Driven Re-probes**: Docker start/die/health events trigger an immediate refresh
+    - **Pre-rendered Output**: JSON and Prometheus text are rendered once per refresh, not per request
+
+    Args:
+        ctx: Typer context containing AppContext
+        host: Address to listen on
+        port: TCP port to listen on
+        socket_path: Unix domain socket path, used instead of host/port when given
+        interval: Seconds between resource usage refreshes
+        health_interval: Seconds between container list and health re-probes
+        extensions_only: Only serve extension status
+
+    Examples:
+        Serve on the default port:
+            ollama-stack serve
+
+        Serve on a unix socket with slower health probes:
+            ollama-stack serve --socket /run/ollama-stack.sock --health-interval 30
+
+        Scrape:
+            curl http://127.0.0.1:9464/metrics
+    """
+    app_context: AppContext = ctx.obj
+
+    try:
+        serve_status_logic(
+            app_context,
+            host=host,
+            port=port,
+            socket_path=socket_path,
+            interval=interval,
+            health_interval=health_interval,
+            extensions_only=extensions_only,
+        )
+    except OSError as e:
+        log.error(f"Failed to start status server: {e}")
+        app_context.display.error(
+            f"Unable to start status server: {e}",
+            "Check that the address is free or choose another with --port or --socket."
+        )
+        raise typer.Exit(1)
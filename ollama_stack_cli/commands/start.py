@@ -100,7 +100,7 @@ from ..context import AppContext
 log = logging.getLogger(__name__)
 
 
-def start_services_logic(app_context: AppContext, update: bool = False):
+def start_services_logic(app_context: AppContext, update: bool = False, wait: bool = False, wait_timeout: float = 120):
     """Business logic for starting services."""
     # Check if config fell back to defaults and inform user
     if app_context.config.fell_back_to_defaults:
@@ -168,6 +168,10 @@ def start_services_logic(app_context: AppContext, update: bool = False):
         log.info(f"Starting native services: {', '.join(native_to_start)}")
         app_context.stack_manager.start_native_services(native_to_start)
 
+    # Optionally block until the started containers report healthy
+    if wait and docker_to_start:
+        return app_context.stack_manager.wait_for_services_healthy(docker_to_start, timeout=wait_timeout)
+
     return True
 
 
@@ -180,7 +184,26 @@ def start(
             help="Pull the latest Docker images before starting.",
         ),
     ] = False,
+    wait: Annotated[
+        bool,
+        typer.Option(
+            "--wait",
+            help="Wait until started Docker services report healthy.",
+        ),
+    ] = False,
+    wait_timeout: Annotated[
+        float,
+        typer.Option(
+            "--wait-timeout",
+            min=1,
+            help="Maximum seconds to wait for services with --wait.",
+        ),
+    ] = 120,
 ):
     """Starts the core Ollama Stack services."""
     app_context: AppContext = ctx.obj
+    if wait:
+        if not start_services_logic(app_context, update=update, wait=True, wait_timeout=wait_timeout):
+            raise typer.Exit(1)
+        return
     start_services_logic(app_context, update=update) 
\ No newline at end of file
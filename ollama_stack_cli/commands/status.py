@@ -1,15 +1,20 @@
 import typer
 import logging
 import time
+from datetime import datetime
+from typing import TYPE_CHECKING
 from typing_extensions import Annotated
 
 from ..context import AppContext
-from ..schemas import StackStatus
+
+if TYPE_CHECKING:
+    # Annotation-only; importing pydantic schemas here would slow down `--help`
+    from ..schemas import StackStatus
 
 log = logging.getLogger(__name__)
 
 
-def get_stack_status_logic(app_context: AppContext, extensions_only: bool = False) -> StackStatus:
+def get_stack_status_logic(app_context: AppContext, extensions_only: bool = False) -> "StackStatus":
     """
     Business logic for gathering comprehensive stack status.
     
@@ -83,36 +88,68 @@ def get_stack_status_logic(app_context: AppContext, extensions_only: bool = Fals
     return stack_status
 
 
-def watch_status(app_context: AppContext, extensions_only: bool = False, json_output: bool = False, interval: int = 3):
-    """Continuously monitor stack status with periodic updates."""
-    log.info(f"Starting continuous status monitoring (refresh every {interval}s). Press Ctrl+C to stop...")
+def watch_status(
+    app_context: AppContext,
+    extensions_only: bool = False,
+    json_output: bool = False,
+    interval: float = 2,
+    health_interval: float = 15,
+):
+    """
+    Continuously monitor stack status with in-place updates.
+    
+    Resource usage comes from one persistent stats stream per container, so a
+    tick makes no Docker API calls. The container list and health probes are
+    only refreshed every ``health_interval`` seconds, or immediately when the
+    Docker events stream reports a stack container starting, dying or
+    changing health.
+    
+    In JSON mode one status document is printed per tick (JSON Lines), which
+    suits piping into other tools better than a redrawn table.
+    """
+    log.info(
+        f"Starting continuous status monitoring (refresh every {interval}s, "
+        f"health every {health_interval}s). Press Ctrl+C to stop..."
+    )
+    
+    stack_manager = app_context.stack_manager
+    stats_monitor = stack_manager.create_stats_monitor()
+    state_tracker = stack_manager.create_state_tracker()
+    state_tracker.start()
+    stack_status = None
+    last_refresh = 0.0
+    seen_generation = None
+    
+    def tick() -> "StackStatus":
+        nonlocal stack_status, last_refresh, seen_generation
+        now = time.monotonic()
+        state_changed = state_tracker.generation != seen_generation
+        if stack_status is None or state_changed or now - last_refresh >= health_interval:
+            seen_generation = state_tracker.generation
+            stack_status = stack_manager.get_stack_status(extensions_only=extensions_only, include_usage=False)
+            stats_monitor.sync()
+            last_refresh = now
+        return stack_manager.apply_live_usage(stack_status, stats_monitor)
     
     try:
-        while True:
-            # Clear screen and show timestamp
-            import os
-            os.system('clear' if os.name == 'posix' else 'cls')
-            
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            app_context.log.info(f"Stack Status - {timestamp} (refresh every {interval}s)")
-            app_context.log.info("Press Ctrl+C to stop monitoring")
-            print()
-            
-            # Get and display current status
-            stack_status = get_stack_status_logic(app_context, extensions_only=extensions_only)
-            
-            if json_output:
-                app_context.display.json(stack_status.model_dump_json())
-            else:
-                app_context.display.status(stack_status)
-            
-            # Wait for next refresh
-            time.sleep(interval)
+        if json_output:
+            while True:
+                app_context.display.json(tick().model_dump_json())
+                time.sleep(interval)
+        else:
+            with app_context.display.live() as live:
+                while True:
+                    current = tick()
+                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    caption = f"Updated {timestamp} (refresh every {interval}s) - Press Ctrl+C to stop"
+                    live.update(app_context.display.status_table(current, caption=caption), refresh=True)
+                    time.sleep(interval)
             
     except KeyboardInterrupt:
         log.info("Status monitoring stopped by user")
-        app_context.log.info("\nStatus monitoring stopped.")
+    finally:
+        state_tracker.stop()
+        stats_monitor.close()
 
 
 def status(
@@ -132,6 +169,22 @@ def status(
             help="Continuously monitor stack status.",
         ),
     ] = False,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--interval",
+            min=0.5,
+            help="Seconds between display refreshes in watch mode.",
+        ),
+    ] = 2,
+    health_interval: Annotated[
+        float,
+        typer.Option(
+            "--health-interval",
+            min=1,
+            help="Seconds between health re-probes in watch mode.",
+        ),
+    ] = 15,
 ):
     """
     Displays comprehensive stack status for all stack components.
@@ -243,12 +296,16 @@ def status(
         Note over User,Display: Watch Mode Flow (if --watch)
         rect rgb(240, 248, 255)
             Note over StatusCmd: watch_status() implementation
+            StatusCmd->>StackMgr: create_stats_monitor()
             StatusCmd->>StatusCmd: while True loop
-            StatusCmd->>StatusCmd: Clear screen + timestamp
-            StatusCmd->>StatusCmd: Call get_stack_status_logic()
-            StatusCmd->>StatusCmd: Display results
-            StatusCmd->>StatusCmd: time.sleep(3)
-            StatusCmd->>StatusCmd: Handle Ctrl+C → break
+            opt Every --health-interval seconds or on a Docker event
+                StatusCmd->>StackMgr: get_stack_status(include_usage=False)
+                StatusCmd->>StackMgr: stats_monitor.sync() (one stream per container)
+            end
+            StatusCmd->>StackMgr: apply_live_usage() (no API calls)
+            StatusCmd->>Display: live.update(status_table)
+            StatusCmd->>StatusCmd: time.sleep(--interval)
+            StatusCmd->>StatusCmd: Handle Ctrl+C → close streams
         end
     ```
     
@@ -259,7 +316,7 @@ def status(
     - **Platform Awareness**: StackManager routes to appropriate clients based on service types
     - **Error Resilience**: Each client interaction is wrapped with proper error handling
     - **Display Abstraction**: All output goes through Display module for consistency
-    - **Watch Mode**: Continuous monitoring with graceful exit handling
+    - **Watch Mode**: In-place Rich Live view fed by persistent stats streams, with health re-probed on its own cadence
     
     ## Critical Decision Points
     
@@ -273,6 +330,8 @@ def status(
         json_output: Output results in JSON format instead of table
         extensions_only: Only check extension status, skip core services
         watch: Enable continuous monitoring with periodic refresh
+        interval: Seconds between display refreshes in watch mode
+        health_interval: Seconds between container list/health refreshes in watch mode
         
     Examples:
         Basic status check:
@@ -286,11 +345,20 @@ def status(
             
         Continuous monitoring:
             ollama-stack status --watch
+            
+        Continuous monitoring with slower health probes:
+            ollama-stack status --watch --interval 1 --health-interval 30
     """
     app_context: AppContext = ctx.obj
     
     if watch:
-        watch_status(app_context, extensions_only=extensions_only, json_output=json_output)
+        watch_status(
+            app_context,
+            extensions_only=extensions_only,
+            json_output=json_output,
+            interval=interval,
+            health_interval=health_interval,
+        )
         return
     
     try:
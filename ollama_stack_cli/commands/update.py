@@ -269,11 +269,13 @@ def update(
         log.error("Cannot use both --services and --extensions flags together")
         raise typer.Exit(2)
     
-    success, user_cancelled = update_services_logic(
-        app_context, 
-        services_only=services, 
-        extensions_only=extensions
-    )
+    # One snapshot spans the running-state check and the update itself
+    with app_context.stack_manager.stack_snapshot("update"):
+        success, user_cancelled = update_services_logic(
+            app_context, 
+            services_only=services, 
+            extensions_only=extensions
+        )
     
     if user_cancelled:
         # User cancelled - this is normal, exit with code 0
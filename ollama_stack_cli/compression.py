@@ -0,0 +1,536 @@
+import copy
+import gzip
+import io
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional
+
+from .schemas import CodecBenchmark
+from .volume_archive import ARCHIVE_CHUNK_SIZE, iter_tar_stream
+
+log = logging.getLogger(__name__)
+
+# Uncompressed bytes per independently compressed gzip member in gzip-mt archives
+PARALLEL_GZIP_BLOCK_SIZE = 4 * 1024 * 1024
+
+BENCHMARK_CHUNK_SIZE = 1024 * 1024
+
+# PAX header keys recording how a member of an adaptive archive was encoded
+ADAPTIVE_CODEC_KEY = "OLLAMASTACK.codec"
+ADAPTIVE_SIZE_KEY = "OLLAMASTACK.size"
+# Bytes from the start of each file used to judge its compressibility
+ADAPTIVE_SAMPLE_SIZE = 64 * 1024
+# Files smaller than this are stored as-is; per-file codec framing would eat the gain
+ADAPTIVE_MIN_SIZE = 256
+# A file is compressed only if a fast trial compression of its sample saves this fraction
+ADAPTIVE_MIN_SAVINGS = 0.1
+# Compressed members are spooled (to disk beyond this size) because tar needs their size up front
+ADAPTIVE_SPOOL_MEMORY = 16 * 1024 * 1024
+
+# Magic numbers of formats that are already compressed or quantized
+INCOMPRESSIBLE_SIGNATURES = (
+    (0, b"GGUF", "gguf"),
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpeg"),
+    (0, b"GIF8", "gif"),
+    (8, b"WEBP", "webp"),
+    (8, b"WAVE", "wav"),
+    (0, b"ID3", "mp3"),
+    (0, b"OggS", "ogg"),
+    (0, b"fLaC", "flac"),
+    (4, b"ftyp", "mp4"),
+    (0, b"\x1f\x8b", "gzip"),
+    (0, b"\x28\xb5\x2f\xfd", "zstd"),
+    (0, b"\x04\x22\x4d\x18", "lz4"),
+    (0, b"\xfd7zXZ\x00", "xz"),
+    (0, b"BZh", "bzip2"),
+    (0, b"PK\x03\x04", "zip"),
+    (0, b"7z\xbc\xaf\x27\x1c", "7z"),
+)
+
+
+def _resolve_threads(threads: int) -> int:
+    """Map the configured thread count onto a worker count; 0 means one per CPU."""
+    return threads if threads > 0 else (os.cpu_count() or 1)
+
+
+class Codec:
+    """
+    A compression format for volume archives.
+
+    Writers and readers wrap an already open binary file object and never
+    close it, so callers keep control of the underlying file (and of renaming
+    a partial archive into place).
+    """
+
+    name: str = ""
+    extension: str = ""
+    default_level: Optional[int] = None
+    package: Optional[str] = None
+    multithreaded: bool = False
+
+    def available(self) -> bool:
+        return True
+
+    def require(self) -> None:
+        """Raise RuntimeError if the codec's optional dependency is not installed."""
+        if not self.available():
+            raise RuntimeError(
+                f"The {self.name} codec requires the '{self.package}' package "
+                f"(pip install {self.package})"
+            )
+
+    def open_writer(self, fileobj: BinaryIO, level: Optional[int] = None, threads: int = 0) -> BinaryIO:
+        raise NotImplementedError
+
+    def open_reader(self, fileobj: BinaryIO) -> BinaryIO:
+        raise NotImplementedError
+
+
+class _Uncompressed(io.RawIOBase):
+    """Pass-through file object that leaves the wrapped file open when closed."""
+
+    def __init__(self, fileobj: BinaryIO, writable: bool):
+        self._fileobj = fileobj
+        self._writable = writable
+
+    def readable(self) -> bool:
+        return not self._writable
+
+    def writable(self) -> bool:
+        return self._writable
+
+    def readinto(self, target) -> int:
+        data = self._fileobj.read(len(target))
+        target[:len(data)] = data
+        return len(data)
+
+    def write(self, data) -> int:
+        return self._fileobj.write(data)
+
+
+class NoneCodec(Codec):
+    name = "none"
+    extension = ".tar"
+
+    def open_writer(self, fileobj, level=None, threads=0):
+        return _Uncompressed(fileobj, writable=True)
+
+    def open_reader(self, fileobj):
+        return _Uncompressed(fileobj, writable=False)
+
+
+class GzipCodec(Codec):
+    name = "gzip"
+    extension = ".tar.gz"
+    # Beyond 6 the size gain rarely pays for the CPU
+    default_level = 6
+
+    def open_writer(self, fileobj, level=None, threads=0):
+        return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=self.default_level if level is None else level)
+
+    def open_reader(self, fileobj):
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """
+    pigz-style multithreaded gzip writer.
+
+    Input is cut into fixed-size blocks that are compressed as independent
+    gzip members on a thread pool (zlib releases the GIL), then written in
+    order. Concatenated members are a valid gzip file, so archives stay
+    readable by plain ``gzip``, ``tar -xzf`` and GzipCodec.
+    """
+
+    def __init__(self, fileobj: BinaryIO, level: int, threads: int, block_size: int = PARALLEL_GZIP_BLOCK_SIZE):
+        self._fileobj = fileobj
+        self._level = level
+        self._block_size = block_size
+        self._threads = threads
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="gzip-mt")
+        self._pending = deque()
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[:self._block_size])
+            del self._buffer[:self._block_size]
+            self._submit(block)
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._executor.submit(gzip.compress, block, self._level, mtime=0))
+        # Bound memory: keep at most two blocks in flight per thread
+        while len(self._pending) > self._threads * 2:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            super().close()
+
+
+class ParallelGzipCodec(GzipCodec):
+    name = "gzip-mt"
+    multithreaded = True
+
+    def open_writer(self, fileobj, level=None, threads=0):
+        return ParallelGzipWriter(
+            fileobj,
+            level=self.default_level if level is None else level,
+            threads=_resolve_threads(threads),
+        )
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+    extension = ".tar.zst"
+    default_level = 3
+    package = "zstandard"
+    multithreaded = True
+
+    def available(self) -> bool:
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def open_writer(self, fileobj, level=None, threads=0):
+        self.require()
+        import zstandard
+        compressor = zstandard.ZstdCompressor(
+            level=self.default_level if level is None else level,
+            # zstandard uses -1 for one worker per CPU
+            threads=threads if threads > 0 else -1,
+        )
+        return compressor.stream_writer(fileobj, closefd=False)
+
+    def open_reader(self, fileobj):
+        self.require()
+        import zstandard
+        # Checkpointed archives are a sequence of frames, one per chunk
+        return zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True, closefd=False)
+
+
+class Lz4Codec(Codec):
+    name = "lz4"
+    extension = ".tar.lz4"
+    default_level = 0
+    package = "lz4"
+
+    def available(self) -> bool:
+        try:
+            import lz4.frame  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def open_writer(self, fileobj, level=None, threads=0):
+        self.require()
+        import lz4.frame
+        return lz4.frame.LZ4FrameFile(
+            fileobj, mode="wb", compression_level=self.default_level if level is None else level
+        )
+
+    def open_reader(self, fileobj):
+        self.require()
+        import lz4.frame
+        return lz4.frame.LZ4FrameFile(fileobj, mode="rb")
+
+
+CODECS: Dict[str, Codec] = {
+    codec.name: codec
+    for codec in (NoneCodec(), GzipCodec(), ParallelGzipCodec(), ZstdCodec(), Lz4Codec())
+}
+
+
+def get_codec(name: str) -> Codec:
+    """Look up a codec by name, raising ValueError for unknown names."""
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown compression codec: {name} (choose from {', '.join(CODECS)})")
+
+
+def archive_name(volume_name: str, codec_name: str, adaptive: bool = False) -> str:
+    """
+    File name of a volume archive written with the given codec.
+
+    Adaptive archives compress members individually inside a plain tar, so
+    they are always named ``.tar``.
+    """
+    if adaptive:
+        return f"{volume_name}{NoneCodec.extension}"
+    return f"{volume_name}{get_codec(codec_name).extension}"
+
+
+# Leading bytes of each codec's output; gzip-mt writes ordinary gzip members
+_CODEC_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"\x04\x22\x4d\x18", "lz4"),
+)
+
+
+def detect_codec(head: bytes) -> str:
+    """Name the codec a compressed stream was written with, from its first bytes ("none" if unrecognized)."""
+    for magic, name in _CODEC_MAGIC:
+        if head.startswith(magic):
+            return name
+    return "none"
+
+
+# =============================================================================
+# Adaptive Per-File Compression
+# =============================================================================
+
+def detect_incompressible_format(head: bytes) -> Optional[str]:
+    """Name the already-compressed format a file starts with, or None."""
+    for offset, magic, name in INCOMPRESSIBLE_SIGNATURES:
+        if head[offset:offset + len(magic)] == magic:
+            return name
+    return None
+
+
+def is_compressible(head: bytes) -> bool:
+    """Judge compressibility by compressing a sample at zlib's fastest level."""
+    if not head:
+        return False
+    return len(zlib.compress(head, 1)) <= len(head) * (1 - ADAPTIVE_MIN_SAVINGS)
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Reads ``head`` and then the rest of ``fileobj``, after the head was consumed for sampling."""
+
+    def __init__(self, head: bytes, fileobj: BinaryIO):
+        self._head = memoryview(head)
+        self._fileobj = fileobj
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        if self._head:
+            count = min(len(target), len(self._head))
+            target[:count] = self._head[:count]
+            self._head = self._head[count:]
+            return count
+        data = self._fileobj.read(len(target))
+        target[:len(data)] = data
+        return len(data)
+
+
+class AdaptiveCompressor:
+    """
+    Per-file encoder for adaptive volume archives, used as ``rebase_tar_stream``'s ``encode``.
+
+    Each regular file is sampled: known compressed formats (GGUF weights,
+    images, audio, archives), tiny files and data a fast trial compression
+    cannot shrink are stored as-is, while text-like data such as SQLite
+    databases and JSON manifests is compressed with the configured codec. A
+    compressed member carries its codec and original size in PAX headers, so
+    the decision travels with the file and restore needs no other record.
+
+    One instance serves one volume; the counters feed VolumeBackupStats.
+    """
+
+    def __init__(self, codec_name: str, level: Optional[int] = None, threads: int = 0):
+        self.codec = get_codec(codec_name)
+        self.codec.require()
+        self.level = level
+        self.threads = threads
+        self.compressed_files = 0
+        self.stored_files = 0
+        self.stored_bytes = 0
+
+    def should_compress(self, member: tarfile.TarInfo, head: bytes) -> bool:
+        if member.size < ADAPTIVE_MIN_SIZE:
+            return False
+        detected = detect_incompressible_format(head)
+        if detected is not None:
+            log.debug(f"Storing {member.name} uncompressed ({detected})")
+            return False
+        return is_compressible(head)
+
+    def __call__(self, member: tarfile.TarInfo, contents: BinaryIO) -> BinaryIO:
+        head = contents.read(ADAPTIVE_SAMPLE_SIZE)
+        if not self.should_compress(member, head):
+            self.stored_files += 1
+            self.stored_bytes += member.size
+            return _PrefixedReader(head, contents)
+
+        spool = tempfile.SpooledTemporaryFile(max_size=ADAPTIVE_SPOOL_MEMORY)
+        try:
+            with self.codec.open_writer(spool, level=self.level, threads=self.threads) as writer:
+                writer.write(head)
+                shutil.copyfileobj(contents, writer, ARCHIVE_CHUNK_SIZE)
+            encoded_size = spool.tell()
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        # A stale PAX size would override the new one when the header is written
+        member.pax_headers.pop("size", None)
+        member.pax_headers[ADAPTIVE_CODEC_KEY] = self.codec.name
+        member.pax_headers[ADAPTIVE_SIZE_KEY] = str(member.size)
+        member.size = encoded_size
+        self.compressed_files += 1
+        return spool
+
+
+def _decoded_members(reader: tarfile.TarFile, select: Optional[Callable[[str], bool]] = None):
+    for member in reader:
+        if select is not None and not select(member.name):
+            continue
+        codec_name = member.pax_headers.get(ADAPTIVE_CODEC_KEY) if member.isreg() else None
+        if codec_name is None:
+            opener = (lambda m=member: reader.extractfile(m)) if member.isreg() else None
+            yield member, opener
+            continue
+        codec = get_codec(codec_name)
+        decoded = copy.copy(member)
+        decoded.pax_headers = {
+            key: value for key, value in member.pax_headers.items()
+            if key not in (ADAPTIVE_CODEC_KEY, ADAPTIVE_SIZE_KEY, "size")
+        }
+        decoded.size = int(member.pax_headers[ADAPTIVE_SIZE_KEY])
+        yield decoded, lambda m=member, c=codec: c.open_reader(reader.extractfile(m))
+
+
+def iter_adaptive_tar(source: BinaryIO) -> Iterator[bytes]:
+    """
+    Turn an adaptive archive back into a plain tar stream for ``put_archive``.
+
+    Members recorded as compressed are decompressed as the stream is
+    consumed; stored members pass through unchanged.
+    """
+    with tarfile.open(fileobj=source, mode="r|", bufsize=ARCHIVE_CHUNK_SIZE) as reader:
+        yield from iter_tar_stream(_decoded_members(reader))
+
+
+def iter_selected_tar(source: BinaryIO, select: Callable[[str], bool], seekable: bool = False) -> Iterator[bytes]:
+    """
+    Plain tar stream of only the archive members ``select`` accepts by name.
+
+    Adaptive members are decoded as in iter_adaptive_tar. A ``seekable``
+    source (a plain or adaptive archive file, whose member headers are
+    uncompressed) is walked header by header and the data of unselected
+    members is seeked past, never read or decompressed. Otherwise the source
+    is read through, e.g. out of a whole-archive decompressor, but only the
+    selected members reach the output.
+    """
+    mode = "r:" if seekable else "r|"
+    with tarfile.open(fileobj=source, mode=mode, bufsize=ARCHIVE_CHUNK_SIZE) as reader:
+        yield from iter_tar_stream(_decoded_members(reader, select))
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+class _CollectingSink(io.RawIOBase):
+    """Write target that keeps the compressed chunks after the writer closes it."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+
+def benchmark_codec(
+    codec_name: str,
+    sample: bytes,
+    level: Optional[int] = None,
+    threads: int = 0,
+    volume: Optional[str] = None,
+) -> CodecBenchmark:
+    """
+    Compress and decompress a sample with one codec, measuring ratio and throughput.
+
+    Args:
+        codec_name: Codec to measure
+        sample: Uncompressed data, e.g. the start of a volume's tar stream
+        level: Compression level (codec default if None)
+        threads: Compression threads for multithreaded codecs (0 = one per CPU)
+        volume: Volume the sample was taken from, recorded in the result
+
+    Returns:
+        CodecBenchmark: Compressed size, ratio and MB/s in each direction
+    """
+    codec = get_codec(codec_name)
+    codec.require()
+    view = memoryview(sample)
+
+    sink = _CollectingSink()
+    started = time.perf_counter()
+    with codec.open_writer(sink, level=level, threads=threads) as writer:
+        for offset in range(0, len(view), BENCHMARK_CHUNK_SIZE):
+            writer.write(view[offset:offset + BENCHMARK_CHUNK_SIZE])
+    compress_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with codec.open_reader(io.BytesIO(b"".join(sink.chunks))) as reader:
+        restored = 0
+        while chunk := reader.read(BENCHMARK_CHUNK_SIZE):
+            restored += len(chunk)
+    decompress_seconds = time.perf_counter() - started
+    if restored != len(sample):
+        raise RuntimeError(f"{codec_name} round trip produced {restored} bytes, expected {len(sample)}")
+
+    megabytes = len(sample) / (1024 * 1024)
+    return CodecBenchmark(
+        volume=volume,
+        codec=codec_name,
+        level=codec.default_level if level is None else level,
+        threads=_resolve_threads(threads) if codec.multithreaded else 1,
+        sample_bytes=len(sample),
+        compressed_bytes=sink.size,
+        ratio=round(len(sample) / sink.size, 3) if sink.size else 0.0,
+        compress_mb_per_sec=round(megabytes / compress_seconds, 1) if compress_seconds > 0 else None,
+        decompress_mb_per_sec=round(megabytes / decompress_seconds, 1) if decompress_seconds > 0 else None,
+    )
+
+
+def benchmark_codecs(
+    sample: bytes,
+    codecs: Optional[List[str]] = None,
+    threads: int = 0,
+    volume: Optional[str] = None,
+) -> List[CodecBenchmark]:
+    """Benchmark codecs at their default levels on one sample, skipping codecs that are not installed."""
+    results = []
+    for name in codecs or list(CODECS):
+        codec = get_codec(name)
+        if not codec.available():
+            log.info(f"Skipping {name} benchmark: '{codec.package}' is not installed")
+            continue
+        results.append(benchmark_codec(name, sample, threads=threads, volume=volume))
+    return results
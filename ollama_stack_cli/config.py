@@ -4,7 +4,7 @@ import hashlib
 import os
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import ValidationError
 from dotenv import dotenv_values, set_key
 
@@ -35,13 +35,100 @@ def get_compose_file_path(filename: str) -> Path:
         Path to the compose file in the installed package
     """
     try:
-        import pkg_resources
-        return Path(pkg_resources.resource_filename('ollama_stack_cli', filename))
+        # importlib.resources avoids the slow pkg_resources import at startup
+        from importlib.resources import files
+        return Path(str(files('ollama_stack_cli') / filename))
     except ImportError:
         # Fallback for development environment
         return Path(__file__).parent / filename
 
 
+def get_platform_cache_file():
+    return get_default_config_dir() / "platform-cache.json"
+
+
+def get_backup_catalog_file():
+    return get_default_config_dir() / "backup-catalog.jsonl"
+
+
+def docker_fingerprint(info: dict) -> dict:
+    """
+    Builds the cheap daemon fingerprint that keys the platform cache.
+
+    Args:
+        info: Response from the Docker daemon's info() call
+
+    Returns:
+        dict: Daemon ID, server version and sorted runtime names
+    """
+    return {
+        "daemon_id": info.get("ID"),
+        "server_version": info.get("ServerVersion"),
+        "runtimes": sorted((info.get("Runtimes") or {}).keys()),
+    }
+
+
+def load_platform_cache() -> Optional[dict]:
+    """
+    Loads the cached platform detection result.
+
+    The cache is only valid for the Docker endpoint it was recorded against, so
+    switching DOCKER_HOST forces a fresh detection.
+
+    Returns:
+        dict with "platform" and "fingerprint" keys, or None if missing or stale
+    """
+    cache_file = get_platform_cache_file()
+    try:
+        with open(cache_file, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or not entry.get("platform"):
+        return None
+    if entry.get("docker_host", "") != os.environ.get("DOCKER_HOST", ""):
+        log.debug("Platform cache was recorded for a different Docker host; ignoring it")
+        return None
+    return entry
+
+
+def save_platform_cache(platform: str, fingerprint: dict) -> None:
+    """
+    Persists a platform detection result alongside the daemon fingerprint.
+
+    Nothing is written until the configuration directory exists, so detection
+    on an uninstalled machine never creates ~/.ollama-stack as a side effect.
+    """
+    cache_file = get_platform_cache_file()
+    if not cache_file.parent.exists():
+        return
+    entry = {
+        "platform": platform,
+        "fingerprint": fingerprint,
+        "docker_host": os.environ.get("DOCKER_HOST", ""),
+    }
+    try:
+        payload = json.dumps(entry, indent=4)
+        with open(cache_file, "w") as f:
+            f.write(payload)
+        log.debug(f"Cached detected platform '{platform}' in {cache_file}")
+    except (OSError, TypeError, ValueError) as e:
+        log.debug(f"Could not write platform cache {cache_file}: {e}")
+
+
+def invalidate_platform_cache() -> None:
+    """Removes the cached platform so the next detection queries the daemon."""
+    cache_file = get_platform_cache_file()
+    try:
+        cache_file.unlink()
+        log.debug(f"Invalidated platform cache {cache_file}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        log.debug(f"Could not remove platform cache {cache_file}: {e}")
+
+
 def load_config(
     display: Display,
     config_path: Path = None,
@@ -252,13 +339,22 @@ def import_configuration(
 def validate_backup_manifest(
     manifest_path: Path,
     backup_dir: Path,
+    volumes: Optional[List[str]] = None,
+    verify_contents: bool = True,
 ) -> tuple[bool, Optional[BackupManifest]]:
     """
     Validate a backup manifest file and verify backup integrity.
     
+    Manifests with per-file digests are verified by re-hashing the files in
+    parallel against their recorded digests, after checking that the digests
+    still hash to the manifest's Merkle root. Older manifests with only a
+    checksum fall back to hashing all files serially.
+    
     Args:
         manifest_path: Path to the backup manifest file
         backup_dir: Directory containing the backup files
+        volumes: If given, only check these volumes' archives and model blobs
+        verify_contents: Re-hash files against their digests (existence is always checked)
         
     Returns:
         tuple: (is_valid, manifest) where is_valid is True if valid, manifest is the parsed manifest or None
@@ -278,23 +374,41 @@ def validate_backup_manifest(
             log.error(f"Invalid backup manifest format: {str(e)}")
             return False, None
         
+        if volumes is not None:
+            unknown = [volume for volume in volumes if volume not in manifest.volumes]
+            if unknown:
+                log.error(f"Volumes not in backup: {', '.join(unknown)}")
+                return False, manifest
+        
         # Verify backup files exist
         missing_files = []
         
         # Check volume backup files
-        for volume in manifest.volumes:
-            volume_file = backup_dir / "volumes" / f"{volume}.tar.gz"
+        from .compression import archive_name
+        for volume in (manifest.volumes if volumes is None else volumes):
+            volume_file = backup_dir / "volumes" / archive_name(volume, manifest.codec, manifest.adaptive_compression)
             if not volume_file.exists():
                 missing_files.append(f"volume: {volume}")
         
+        # Check deduplicated model blobs in the shared blob store
+        if manifest.volume_blobs:
+            from .blob_store import BlobStore
+            blob_store = BlobStore((backup_dir / Path(manifest.blob_store or "../blob-store")).resolve())
+            for volume, blob_refs in manifest.volume_blobs.items():
+                if volumes is not None and volume not in volumes:
+                    continue
+                for ref in blob_refs:
+                    if not blob_store.has(ref.digest):
+                        missing_files.append(f"model blob: sha256-{ref.digest} ({volume})")
+        
         # Check config files
-        for config_file in manifest.config_files:
+        for config_file in (manifest.config_files if volumes is None else []):
             config_path = backup_dir / "config" / config_file
             if not config_path.exists():
                 missing_files.append(f"config: {config_file}")
         
         # Check extension files
-        for extension in manifest.extensions:
+        for extension in (manifest.extensions if volumes is None else []):
             ext_file = backup_dir / "extensions" / f"{extension}.tar.gz"
             if not ext_file.exists():
                 missing_files.append(f"extension: {extension}")
@@ -303,8 +417,24 @@ def validate_backup_manifest(
             log.error(f"Missing backup files: {', '.join(missing_files)}")
             return False, manifest
         
-        # Verify checksum if present
-        if manifest.checksum:
+        # Verify per-file digests against the Merkle root, then the files against their digests
+        if verify_contents and manifest.files:
+            from .integrity import backup_file_paths, merkle_root, verify_files
+            if manifest.checksum and merkle_root(manifest.files) != manifest.checksum:
+                log.error("Backup checksum mismatch - manifest file digests were altered")
+                return False, manifest
+            selected = manifest.files
+            if volumes is not None:
+                paths = set(backup_file_paths(manifest, volumes))
+                selected = [digest for digest in manifest.files if digest.path in paths]
+            mismatched = verify_files(backup_dir, selected)
+            if mismatched:
+                log.error(f"Backup checksum mismatch - corrupted files: {', '.join(mismatched)}")
+                return False, manifest
+            log.debug(f"Verified {len(selected)} backup file digests")
+        
+        # Verify legacy whole-backup checksum if present
+        elif verify_contents and manifest.checksum:
             calculated_checksum = _calculate_backup_checksum(backup_dir, manifest)
             if calculated_checksum != manifest.checksum:
                 log.error("Backup checksum mismatch - backup may be corrupted")
@@ -323,6 +453,9 @@ def _calculate_backup_checksum(backup_dir: Path, manifest: BackupManifest) -> st
     """
     Calculate a checksum for the backup directory contents.
     
+    This is the single serial checksum of manifests written before per-file
+    digests; newer backups are verified with integrity.verify_files.
+    
     Args:
         backup_dir: Directory containing backup files
         manifest: Backup manifest with file list
@@ -330,14 +463,16 @@ def _calculate_backup_checksum(backup_dir: Path, manifest: BackupManifest) -> st
     Returns:
         str: SHA256 checksum of backup contents
     """
+    from .integrity import HASH_BUFFER_SIZE
     hasher = hashlib.sha256()
     
     # Sort files for consistent checksum calculation
     all_files = []
     
     # Add volume files
+    from .compression import archive_name
     for volume in sorted(manifest.volumes):
-        volume_file = backup_dir / "volumes" / f"{volume}.tar.gz"
+        volume_file = backup_dir / "volumes" / archive_name(volume, manifest.codec, manifest.adaptive_compression)
         if volume_file.exists():
             all_files.append(volume_file)
     
@@ -356,7 +491,7 @@ def _calculate_backup_checksum(backup_dir: Path, manifest: BackupManifest) -> st
     # Calculate hash of all files
     for file_path in sorted(all_files):
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b""):
                 hasher.update(chunk)
     
     return hasher.hexdigest()
@@ -1,25 +1,60 @@
 import sys
 import logging
-from .config import Config
-from .display import Display
-from .stack_manager import StackManager
 
 log = logging.getLogger(__name__)
 
 class AppContext:
-    """A central container for the application's runtime state."""
+    """
+    A central container for the application's runtime state.
+
+    Components are built on first access rather than up front, so an invocation
+    only pays for what it uses: `--help` never reads the configuration, and
+    nothing connects to Docker until a command asks the StackManager for work.
+    The modules behind each component are imported at the same point to keep
+    CLI startup fast.
+    """
 
     def __init__(self, verbose: bool = False):
+        self._verbose = verbose
+        self._display = None
+        self._config = None
+        self._stack_manager = None
+
+    @property
+    def display(self):
+        if self._display is None:
+            from .display import Display
+            self._display = self._build(lambda: Display(verbose=self._verbose))
+        return self._display
+
+    @property
+    def config(self):
+        if self._config is None:
+            display = self.display
+            from .config import Config
+            self._config = self._build(lambda: Config(display))
+        return self._config
+
+    @property
+    def stack_manager(self):
+        if self._stack_manager is None:
+            display = self.display
+            app_config = self.config.app_config
+            from .stack_manager import StackManager
+            self._stack_manager = self._build(lambda: StackManager(app_config, display))
+        return self._stack_manager
+
+    def _build(self, factory):
+        """Creates a component, exiting the application if it cannot be built."""
         try:
-            self.display = Display(verbose=verbose)
-            self.config = Config(self.display)
-            self.stack_manager = StackManager(self.config.app_config, self.display)
+            return factory()
         except Exception as e:
             # Manually create a display object for error reporting if the main one fails.
+            from .display import Display
             display = Display(verbose=True) # Use verbose to ensure traceback is shown
             log.error(f"Failed to initialize application: {e}", exc_info=True)
             sys.exit(1)
 
     @property
     def verbose(self) -> bool:
-        return self.display.verbose 
\ No newline at end of file
+        return self.display.verbose
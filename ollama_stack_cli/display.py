@@ -4,6 +4,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.live import Live
 from typing import List, Optional
 
 from .schemas import StackStatus, CheckReport
@@ -57,6 +58,10 @@ class Display:
             handlers=[RichHandler(console=self._console, rich_tracebacks=True, show_path=verbose, show_level=verbose)]
         )
 
+    def use_stderr(self):
+        """Send all output to stderr, keeping stdout free for data such as a backup stream."""
+        self._console.stderr = True
+
     @property
     def verbose(self) -> bool:
         """Returns whether verbose mode is enabled."""
@@ -98,7 +103,17 @@ class Display:
 
     def status(self, stack_status: StackStatus):
         """Displays the formatted status of the stack."""
-        table = Table(title="Ollama Stack Status")
+        if not stack_status.core_services and not stack_status.extensions:
+            # Use logging for simple informational messages
+            log = logging.getLogger(__name__)
+            log.info("Ollama Stack is not running.")
+            return
+
+        self._console.print(self.status_table(stack_status))
+
+    def status_table(self, stack_status: StackStatus, caption: Optional[str] = None) -> Table:
+        """Builds the status table without printing it, for reuse in live views."""
+        table = Table(title="Ollama Stack Status", caption=caption)
         table.add_column("Service", style="cyan")
         table.add_column("Running", style="magenta")
         table.add_column("Status", style="yellow")
@@ -107,12 +122,6 @@ class Display:
         table.add_column("CPU %", style="red")
         table.add_column("Memory (MB)", style="red")
 
-        if not stack_status.core_services and not stack_status.extensions:
-            # Use logging for simple informational messages
-            log = logging.getLogger(__name__)
-            log.info("Ollama Stack is not running.")
-            return
-
         for service in stack_status.core_services:
             table.add_row(
                 f"[bold]{service.name}[/bold]",
@@ -126,7 +135,11 @@ class Display:
         
         # Add extension processing here later if needed
 
-        self._console.print(table)
+        return table
+
+    def live(self) -> Live:
+        """Returns a Rich Live context manager that redraws renderables in place."""
+        return Live(console=self._console, auto_refresh=False, transient=False)
 
     def json(self, data: str):
         """Prints pre-formatted JSON to the console."""
@@ -7,11 +7,22 @@ import logging
 import socket
 import sys
 import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
+from contextlib import contextmanager, nullcontext
+from typing import BinaryIO, Optional, Dict, Iterable, Iterator, List, NamedTuple, Tuple
 from .schemas import AppConfig
 from .display import Display
 from .config import get_default_env_file, get_default_config_dir
+from .volume_archive import ARCHIVE_CHUNK_SIZE, ChunkStreamReader, ExcludeFilter, PathSelector, SourceChangedError, TarPosition, iter_file_chunks, iter_tar_stream, rebase_tar_stream
+from .blob_store import MODEL_BLOB_DIR, BlobStore, model_blob_digest
+from .compression import AdaptiveCompressor, archive_name, benchmark_codecs, get_codec, iter_adaptive_tar, iter_selected_tar
+from .integrity import HashingWriter
+from .backup_stream import BackupStreamWriter
+from .backup_checkpoint import BackupCheckpoint, ChunkedArchiveWriter
+from .throttle import BackupThrottle
 
 from .schemas import (
     AppConfig,
@@ -19,24 +30,196 @@ from .schemas import (
     ResourceUsage,
     CheckReport,
     EnvironmentCheck,
+    VolumeBackupStats,
+    VolumeRestoreStats,
+    ArchiveChunk,
+    BlobRef,
+    CodecBenchmark,
 )
 
 log = logging.getLogger(__name__)
 
+
+class VolumeSnapshot(NamedTuple):
+    """Scratch copy of a volume taken while the containers writing to it were paused."""
+    volume: str
+    paused_containers: List[str]
+    pause_seconds: float
+    # Whether model blobs were left out of the copy, to be read from the live volume
+    live_blobs: bool = False
+
+# Process-wide Docker connection. Every DockerClient (and StackManager's platform
+# detection) shares one SDK client, and therefore one HTTP connection pool, per
+# CLI invocation. It is created on first use so commands that never touch Docker
+# don't pay for connecting to the daemon.
+_shared_lock = threading.Lock()
+_shared_client = None
+_shared_client_error: Optional[Exception] = None
+_shared_info: Optional[dict] = None
+
+# HTTP requests the shared client has sent, counted by a requests response hook
+# on its API session so verbose output can report what a command really cost
+_request_count = 0
+_request_count_lock = threading.Lock()
+
+
+def _count_request(response, **kwargs) -> None:
+    global _request_count
+    with _request_count_lock:
+        _request_count += 1
+
+
+def docker_request_count() -> int:
+    """Returns how many Docker API requests the shared client has sent in this process."""
+    with _request_count_lock:
+        return _request_count
+
+
+def get_shared_docker_client():
+    """
+    Returns the process-wide Docker SDK client, connecting on first use.
+
+    Raises:
+        docker.errors.DockerException: If the client could not be created. The
+            failure is remembered so later callers don't retry the connection.
+    """
+    global _shared_client, _shared_client_error
+    with _shared_lock:
+        if _shared_client is None and _shared_client_error is None:
+            try:
+                _shared_client = docker.from_env()
+                _shared_client.api.hooks["response"].append(_count_request)
+            except docker.errors.DockerException as e:
+                _shared_client_error = e
+        if _shared_client_error is not None:
+            raise _shared_client_error
+        return _shared_client
+
+
+def get_docker_info() -> dict:
+    """
+    Returns the daemon's `info()` response, fetched once per process.
+
+    Platform detection, the NVIDIA runtime check and state export all read from
+    this single response instead of issuing their own requests.
+    """
+    global _shared_info
+    client = get_shared_docker_client()
+    with _shared_lock:
+        if _shared_info is None:
+            _shared_info = client.info()
+        return _shared_info
+
+
+def reset_shared_docker_client():
+    """Drops the shared client and cached daemon info so the next use reconnects."""
+    global _shared_client, _shared_client_error, _shared_info
+    with _shared_lock:
+        if _shared_client is not None:
+            try:
+                _shared_client.close()
+            except Exception:
+                pass
+        _shared_client = None
+        _shared_client_error = None
+        _shared_info = None
+
+
 class DockerClient:
     """A wrapper for Docker operations."""
 
+    # Upper bound on concurrent stats requests against the daemon
+    STATS_MAX_WORKERS = 8
+    # Gap between the two samples used to derive CPU% when no baseline is cached
+    STATS_SAMPLE_INTERVAL = 0.5
+    # Upper bound on concurrent volume backups and restores; the Docker
+    # SDK's connection pool holds 10 connections
+    BACKUP_MAX_WORKERS = 8
+    # Uncompressed bytes read from each volume for codec benchmarks
+    BENCHMARK_SAMPLE_BYTES = 64 * 1024 * 1024
+    # Image for the never-started helper containers that expose volumes to the archive API
+    ARCHIVE_HELPER_IMAGE = "alpine:latest"
+    # Label on scratch volumes holding online backup snapshots, set to the source volume
+    SNAPSHOT_LABEL = "ollama-stack.snapshot-of"
+    # Run before the writers are paused, with the copy's find(1) prune tests as
+    # arguments: reports whether /data can be reflinked into /snapshot, how many
+    # bytes a plain copy would take, and whether the volume holds model blobs
+    SNAPSHOT_PROBE_SCRIPT = """
+cd /data || exit 1
+sample=$(find . -type f -size +0 | head -n 1)
+if [ -z "$sample" ] || cp --reflink=always "$sample" /snapshot/.reflink-probe 2>/dev/null; then
+    echo "reflink 1"
+else
+    echo "reflink 0"
+fi
+rm -f /snapshot/.reflink-probe
+find . -mindepth 1 \\( "$@" \\) -prune -o -type f -exec stat -c %s {} + | awk '{ total += $1 } END { print "bytes", total + 0 }'
+if [ -d models/blobs ]; then echo "blobs 1"; else echo "blobs 0"; fi
+"""
+    # Copies /data into /snapshot without the paths matching the prune tests. A
+    # reflink clone (near-instant on btrfs/XFS) is pruned afterwards; without
+    # reflinks only the files that are kept are copied
+    SNAPSHOT_COPY_SCRIPT = """
+mode=$1
+shift
+cd /data || exit 1
+if [ "$mode" = reflink ]; then
+    cp -a --reflink=always /data/. /snapshot/ && cd /snapshot && find . -mindepth 1 \\( "$@" \\) -prune -exec rm -rf {} +
+else
+    find . -mindepth 1 \\( "$@" \\) -prune -o -print | cpio -pdm /snapshot
+fi
+"""
+    # Largest plain (non-reflink) snapshot copy an online backup pauses writers for
+    ONLINE_COPY_LIMIT_BYTES = 2 * 1024 * 1024 * 1024
+
     def __init__(self, config: AppConfig, display: Display):
         self.config = config
         self.display = display
+        # Last stats snapshot per container ID, used as the CPU% baseline for one-shot samples
+        self._stats_cache: Dict[str, dict] = {}
+        # None until we learn whether the engine accepts one-shot stats requests
+        self._one_shot_supported: Optional[bool] = None
+        # The SDK client is resolved lazily from the shared connection on first access
+        self._client = None
+        self._client_resolved = False
+        self._connect_error: Optional[Exception] = None
+        # Containers paused for online backup snapshots: ID -> [holders, paused by us]
+        self._pauses: Dict[str, list] = {}
+        self._pause_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """The shared Docker SDK client, or None if the daemon is unavailable."""
+        if not self._client_resolved:
+            self._client = self._connect()
+            self._client_resolved = True
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+        self._client_resolved = True
+
+    def _connect(self):
+        """Attaches to the shared Docker client, verifying the daemon responds."""
         try:
-            self.client = docker.from_env()
-            self.client.ping()  # Test connection
+            client = get_shared_docker_client()
+            # A cached info() response already proved the daemon is reachable
+            if _shared_info is None:
+                client.ping()  # Test connection
             log.debug("Docker client initialized successfully")
+            return client
         except docker.errors.DockerException as e:
             log.error(f"Failed to initialize Docker client: {e}")
             # Don't raise here - let individual operations handle Docker unavailability
-            self.client = None
+            self._connect_error = e
+            return None
+
+    def get_docker_info(self) -> dict:
+        """Returns daemon info, reusing the process-wide response for the shared client."""
+        if self.client is not None and self.client is _shared_client:
+            return get_docker_info()
+        return self.client.info()
 
     # =============================================================================
     # Docker Compose Operations
@@ -131,8 +314,15 @@ class DockerClient:
             log.error("Could not connect to Docker to check stack status.", exc_info=True)
             raise
             
-    def get_container_status(self, service_names: list[str]) -> list[ServiceStatus]:
-        """Gathers and returns the status of a list of containerized services."""
+    def get_container_status(self, service_names: list[str], include_usage: bool = True) -> list[ServiceStatus]:
+        """
+        Gathers and returns the status of a list of containerized services.
+        
+        Args:
+            service_names: Services to report on
+            include_usage: Whether to sample CPU/memory stats. Callers that already
+                have usage from a ContainerStatsMonitor can skip the stats requests.
+        """
         try:
             containers = self.client.containers.list(
                 all=True, filters={"label": "ollama-stack.component"}
@@ -145,12 +335,19 @@ class DockerClient:
             c.labels.get("ollama-stack.component"): c for c in containers
         }
 
+        # Collect stats for every requested container in one concurrent batch
+        usage_map = {}
+        if include_usage:
+            usage_map = self.collect_resource_usage(
+                [c for name, c in container_map.items() if name in service_names]
+            )
+
         statuses = []
         for service_name in service_names:
             container = container_map.get(service_name)
             if container:
                 try:
-                    usage = self._get_resource_usage(container)
+                    usage = usage_map.get(container.id, ResourceUsage())
                     # Health checking is now handled by StackManager's unified system
                     ports = self._parse_ports(container.ports)
                 except (docker.errors.APIError, ConnectionResetError, ConnectionError) as e:
@@ -194,22 +391,122 @@ class DockerClient:
         """Gets the resource usage for a given container."""
         if container.status != "running":
             return ResourceUsage()
+        return self.collect_resource_usage([container]).get(container.id, ResourceUsage())
 
-        try:
-            stats = container.stats(stream=False)
-            
-            cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-            system_cpu_delta = stats["cpu_stats"]["system_cpu_usage"] - stats["precpu_stats"]["system_cpu_usage"]
-            number_cpus = stats["cpu_stats"]["online_cpus"]
-            cpu_percent = (cpu_delta / system_cpu_delta) * number_cpus * 100.0 if system_cpu_delta > 0 else 0
+    def create_stats_monitor(self) -> "ContainerStatsMonitor":
+        """Creates a streaming stats monitor bound to this client."""
+        return ContainerStatsMonitor(self)
+
+    def collect_resource_usage(self, containers: list) -> Dict[str, ResourceUsage]:
+        """
+        Collects resource usage for several containers concurrently.
+        
+        Stats are fetched in parallel using one-shot sampling where the engine
+        supports it, so the daemon doesn't block for a precpu cycle on every
+        container. CPU% needs two samples: if a snapshot has no precpu baseline
+        and none is cached from an earlier call, a second one-shot batch is taken
+        after STATS_SAMPLE_INTERVAL. Either way the cost is roughly one or two
+        round-trips regardless of the number of containers.
+        
+        Args:
+            containers: Docker container objects to sample
             
+        Returns:
+            Dict mapping container ID to ResourceUsage (empty usage on failure)
+        """
+        running = [c for c in containers if c.status == "running"]
+        usage = {c.id: ResourceUsage() for c in containers}
+        if not running:
+            return usage
+
+        snapshots = self._fetch_stats_batch(running)
+
+        # Containers whose CPU% can't be derived from what we have yet
+        needs_baseline = [
+            c for c in running
+            if snapshots.get(c.id) is not None
+            and not self._has_cpu_baseline(snapshots[c.id])
+            and c.id not in self._stats_cache
+        ]
+        if needs_baseline:
+            log.debug(f"Taking second stats sample for {len(needs_baseline)} containers")
+            for container in needs_baseline:
+                self._stats_cache[container.id] = snapshots[container.id]
+            time.sleep(self.STATS_SAMPLE_INTERVAL)
+            snapshots.update(self._fetch_stats_batch(needs_baseline))
+
+        for container in running:
+            stats = snapshots.get(container.id)
+            if stats is None:
+                continue
+            previous = self._stats_cache.get(container.id)
+            usage[container.id] = self._calculate_resource_usage(stats, previous)
+            self._stats_cache[container.id] = stats
+
+        return usage
+
+    def _fetch_stats_batch(self, containers: list) -> Dict[str, Optional[dict]]:
+        """Fetches a single stats snapshot for each container in parallel."""
+        max_workers = min(self.STATS_MAX_WORKERS, len(containers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {c.id: executor.submit(self._fetch_stats, c) for c in containers}
+            return {container_id: future.result() for container_id, future in futures.items()}
+
+    def _fetch_stats(self, container) -> Optional[dict]:
+        """Fetches one stats snapshot, preferring one-shot mode when available."""
+        try:
+            if self._one_shot_supported is not False:
+                try:
+                    stats = container.stats(stream=False, one_shot=True)
+                    self._one_shot_supported = True
+                    return stats
+                except (TypeError, docker.errors.InvalidVersion):
+                    # Older SDK or engine API < 1.41
+                    log.debug("One-shot stats not supported, falling back to blocking stats")
+                    self._one_shot_supported = False
+            return container.stats(stream=False)
+        except (docker.errors.APIError, ConnectionResetError, ConnectionError) as e:
+            log.debug(f"Failed to get stats for container {container.name}: {e}")
+            return None
+
+    @staticmethod
+    def _has_cpu_baseline(stats: dict) -> bool:
+        """Whether a snapshot carries its own precpu sample (non one-shot responses)."""
+        precpu = stats.get("precpu_stats") or {}
+        return bool(precpu.get("system_cpu_usage")) and "cpu_usage" in precpu
+
+    def _calculate_resource_usage(self, stats: dict, previous: Optional[dict] = None) -> ResourceUsage:
+        """
+        Derives CPU% and memory from a stats snapshot.
+        
+        Uses the snapshot's own precpu sample when present, otherwise the
+        cpu_stats of a previously cached snapshot for the same container.
+        """
+        try:
+            if self._has_cpu_baseline(stats):
+                pre = stats["precpu_stats"]
+            elif previous is not None:
+                pre = previous["cpu_stats"]
+            else:
+                pre = None
+
+            cpu_percent = None
+            if pre is not None:
+                cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - pre["cpu_usage"]["total_usage"]
+                system_cpu_delta = stats["cpu_stats"]["system_cpu_usage"] - pre["system_cpu_usage"]
+                number_cpus = stats["cpu_stats"].get("online_cpus") or len(
+                    stats["cpu_stats"]["cpu_usage"].get("percpu_usage") or [1]
+                )
+                cpu_percent = (cpu_delta / system_cpu_delta) * number_cpus * 100.0 if system_cpu_delta > 0 else 0
+                cpu_percent = round(cpu_percent, 2)
+
             memory_mb = stats["memory_stats"]["usage"] / (1024 * 1024) if "usage" in stats["memory_stats"] else 0
-            
+
             return ResourceUsage(
-                cpu_percent=round(cpu_percent, 2),
+                cpu_percent=cpu_percent,
                 memory_mb=round(memory_mb, 2)
             )
-        except (KeyError, docker.errors.APIError, ConnectionResetError, ConnectionError):
+        except (KeyError, TypeError):
             return ResourceUsage()
 
     # =============================================================================
@@ -271,6 +568,8 @@ class DockerClient:
 
         # 1. Docker Daemon Check
         try:
+            if self.client is None:
+                raise self._connect_error or docker.errors.DockerException("Docker client is not initialized")
             self.client.ping()
             log.debug("Docker daemon is running and accessible")
             checks.append(EnvironmentCheck(
@@ -341,7 +640,7 @@ class DockerClient:
     def _check_nvidia_runtime(self) -> EnvironmentCheck:
         """Check NVIDIA Docker runtime availability."""
         try:
-            info = self.client.info()
+            info = self.get_docker_info()
             if info.get("Runtimes", {}).get("nvidia"):
                 log.debug("NVIDIA Docker runtime is available")
                 return EnvironmentCheck(
@@ -598,13 +897,55 @@ class DockerClient:
     # Backup and Migration Support
     # =============================================================================
 
-    def backup_volumes(self, volume_names: List[str], backup_dir: Path) -> bool:
+    def backup_volumes(
+        self,
+        volume_names: List[str],
+        backup_dir: Path,
+        max_workers: int = 1,
+        volume_stats: Optional[List[VolumeBackupStats]] = None,
+        blob_store: Optional[BlobStore] = None,
+        volume_blobs: Optional[Dict[str, List[BlobRef]]] = None,
+        codec: str = "gzip",
+        compression_level: Optional[int] = None,
+        compression_threads: int = 0,
+        adaptive: bool = False,
+        exclude_patterns: Optional[List[str]] = None,
+        checkpoint: Optional[BackupCheckpoint] = None,
+        online: bool = False,
+        throttle: Optional[BackupThrottle] = None,
+    ) -> bool:
         """
         Backup Docker volumes using containers.
         
+        Each volume is streamed through the Docker archive API and compressed
+        on the host; up to ``max_workers`` volumes are processed at once so
+        separate volumes compress on separate cores.
+        
         Args:
             volume_names: List of volume names to backup
             backup_dir: Directory to store volume backups
+            max_workers: Maximum number of volumes to back up concurrently
+            volume_stats: If given, timing and throughput for each archived
+                volume are appended to it, in volume_names order
+            blob_store: If given, Ollama model blobs are recorded in this shared
+                store (copied only when it lacks them) instead of the archive
+            volume_blobs: Receives the blob references for each volume when
+                blob_store is used
+            codec: Compression codec for the archives (see compression.CODECS)
+            compression_level: Codec compression level (codec default if None)
+            compression_threads: Threads per archive for multithreaded codecs
+                (0 = one per CPU)
+            adaptive: Compress files individually, storing incompressible
+                ones (model weights, media) as-is, inside a plain tar archive
+            exclude_patterns: Glob patterns for paths to leave out of every
+                volume archive (see volume_archive.ExcludeFilter)
+            checkpoint: If given, archives are written in checkpointed chunks
+                and recorded in it; volumes it already holds are verified and
+                kept, or continued from their last chunk
+            online: Archive each volume from a snapshot taken while only the
+                containers writing to it are paused (see _snapshot_volume)
+            throttle: Rate limit shared by all volumes, and resource limits
+                for the helper containers
             
         Returns:
             bool: True if backup succeeded, False otherwise
@@ -614,48 +955,26 @@ class DockerClient:
             return False
         
         try:
+            get_codec(codec).require()
             backup_dir.mkdir(parents=True, exist_ok=True)
-            success = True
             
-            log.info(f"Starting backup of {len(volume_names)} volumes...")
+            workers = max(1, min(max_workers, self.BACKUP_MAX_WORKERS, len(volume_names) or 1))
+            log.info(f"Starting backup of {len(volume_names)} volumes ({workers} at a time)...")
             
-            for volume_name in volume_names:
-                try:
-                    # Check if volume exists
-                    try:
-                        volume = self.client.volumes.get(volume_name)
-                        log.debug(f"Found volume: {volume_name}")
-                    except docker.errors.NotFound:
-                        log.warning(f"Volume not found: {volume_name}")
-                        continue
-                    
-                    # Create backup using a temporary container
-                    backup_file = backup_dir / f"{volume_name}.tar.gz"
-                    
-                    log.info(f"Backing up volume: {volume_name}")
-                    
-                    # Use a minimal container to create the backup
-                    container = self.client.containers.run(
-                        "alpine:latest",
-                        f"tar -czf /backup/{volume_name}.tar.gz -C /data .",
-                        volumes={
-                            volume_name: {"bind": "/data", "mode": "ro"},
-                            str(backup_dir): {"bind": "/backup", "mode": "rw"}
-                        },
-                        remove=True,
-                        detach=False
-                    )
-                    
-                    if backup_file.exists():
-                        log.info(f"Volume backup completed: {volume_name}")
-                        log.debug(f"Backup file: {backup_file}")
-                    else:
-                        log.error(f"Volume backup failed: {volume_name}")
-                        success = False
-                        
-                except Exception as e:
-                    log.error(f"Failed to backup volume {volume_name}: {e}")
-                    success = False
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda name: self._backup_volume(
+                        name, backup_dir, blob_store, volume_blobs,
+                        codec=codec, compression_level=compression_level, compression_threads=compression_threads,
+                        adaptive=adaptive, exclude_patterns=exclude_patterns, checkpoint=checkpoint,
+                        online=online, throttle=throttle,
+                    ),
+                    volume_names,
+                ))
+            
+            success = all(ok for ok, _ in results)
+            if volume_stats is not None:
+                volume_stats.extend(stats for _, stats in results if stats is not None)
             
             if success:
                 log.info("All volume backups completed successfully")
@@ -668,13 +987,670 @@ class DockerClient:
             log.error(f"Volume backup operation failed: {e}")
             return False
 
-    def restore_volumes(self, volume_names: List[str], backup_dir: Path) -> bool:
+    def backup_volumes_to_stream(
+        self,
+        volume_names: List[str],
+        writer: BackupStreamWriter,
+        volume_stats: Optional[List[VolumeBackupStats]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        online: bool = False,
+        throttle: Optional[BackupThrottle] = None,
+    ) -> bool:
+        """
+        Write volumes into a backup stream, one after another.
+        
+        Each volume becomes a plain tar file ``volumes/<name>.tar`` in the
+        stream; the stream as a whole is compressed by the writer. Volumes are
+        written in order because the stream is sequential. Stops at the first
+        failure, leaving the stream without a trailer so readers reject it.
+        
+        Args:
+            volume_names: List of volume names to backup
+            writer: Backup stream to write into
+            volume_stats: If given, stats (including each archive's digest)
+                for every volume written are appended to it
+            exclude_patterns: Glob patterns for paths to leave out
+            online: Archive each volume from a snapshot taken while only the
+                containers writing to it are paused
+            throttle: Rate limit and helper container resource limits
+            
+        Returns:
+            bool: True if every volume was written, False otherwise
+        """
+        if not self.client:
+            log.warning("Docker client not available for volume backup")
+            return False
+        
+        log.info(f"Streaming backup of {len(volume_names)} volumes...")
+        for volume_name in volume_names:
+            try:
+                self.client.volumes.get(volume_name)
+            except docker.errors.NotFound:
+                log.warning(f"Volume not found: {volume_name}")
+                continue
+            with writer.open_file(f"volumes/{archive_name(volume_name, 'none')}") as entry:
+                ok, stats = self._backup_volume(
+                    volume_name, None, codec="none", exclude_patterns=exclude_patterns, destination=entry,
+                    online=online, throttle=throttle,
+                )
+            if not ok:
+                return False
+            if stats is not None and volume_stats is not None:
+                volume_stats.append(stats)
+        return True
+
+    def _backup_volume(
+        self,
+        volume_name: str,
+        backup_dir: Optional[Path],
+        blob_store: Optional[BlobStore] = None,
+        volume_blobs: Optional[Dict[str, List[BlobRef]]] = None,
+        codec: str = "gzip",
+        compression_level: Optional[int] = None,
+        compression_threads: int = 0,
+        adaptive: bool = False,
+        exclude_patterns: Optional[List[str]] = None,
+        destination: Optional[BinaryIO] = None,
+        checkpoint: Optional[BackupCheckpoint] = None,
+        online: bool = False,
+        throttle: Optional[BackupThrottle] = None,
+    ) -> Tuple[bool, Optional[VolumeBackupStats]]:
+        """
+        Stream one volume into a compressed archive on the host.
+        
+        The volume is mounted read-only into a helper container that is created
+        but never started, and its contents are read through the archive API.
+        The tar stream is rewritten and compressed with ``codec`` as it arrives,
+        so the data is never staged and no bind mount of backup_dir is needed.
+        The compressed bytes are hashed and counted as they are written, so
+        the stats carry the archive's size and SHA-256 without a re-read.
+        
+        With a blob_store, Ollama model blobs are diverted out of the stream:
+        blobs the store already holds are skipped without being hashed,
+        compressed or written, and new ones are copied into the store once.
+        
+        With ``adaptive``, the archive is a plain tar whose files are compressed
+        one by one, and only when they are compressible (see AdaptiveCompressor).
+        
+        Members matching ``exclude_patterns`` are dropped from the stream
+        before they reach the blob store or the compressor; the archive API
+        still sends their bytes, but they are neither compressed nor written.
+        
+        With a ``destination`` file object, the archive is written there
+        instead of to a file in backup_dir (e.g. into a backup stream).
+        
+        With a ``checkpoint``, the compressor ends its frame every
+        ``checkpoint.interval`` bytes of tar data, and the chunk is synced and
+        recorded with its digest. A volume the checkpoint lists as finished is
+        kept once its archive re-hashes to the recorded digest; a partly
+        written one continues after its last verified chunk, reading past the
+        members already archived without compressing or writing them again.
+        
+        With ``online``, the containers writing to the volume are paused only
+        while it is copied to a scratch volume, and the archive is read from
+        that snapshot while they run again. Model blobs are left out of the
+        copy and read from the live volume after the snapshot, since a
+        finished blob never changes.
+        
+        With a ``throttle``, the archive stream is read no faster than its
+        rate limit allows, and progress reports include the time spent
+        waiting on it.
+        
+        Returns:
+            Tuple of success flag and stats (None if the volume was skipped or failed)
+        """
+        try:
+            # Check if volume exists
+            try:
+                self.client.volumes.get(volume_name)
+                log.debug(f"Found volume: {volume_name}")
+            except docker.errors.NotFound:
+                log.warning(f"Volume not found: {volume_name}")
+                return True, None
+            
+            archive = archive_name(volume_name, codec, adaptive)
+            partial_file = None
+            resume = None
+            if destination is None:
+                backup_file = backup_dir / archive
+                partial_file = backup_file.with_name(f"{archive}.partial")
+                if checkpoint is not None:
+                    completed = checkpoint.completed_volume(volume_name, archive, backup_file)
+                    if completed is not None:
+                        log.info(f"Volume {volume_name} already backed up, archive verified against its checkpoint")
+                        if completed.blob_refs and volume_blobs is not None:
+                            volume_blobs[volume_name] = completed.blob_refs
+                        return True, completed.stats
+                    resume = checkpoint.resume_point(volume_name, archive, partial_file)
+            
+            if resume is not None:
+                log.info(
+                    f"Resuming backup of volume {volume_name} after {len(resume.volume.chunks)} checkpoints "
+                    f"({resume.size / (1024 * 1024):.0f} MB kept)"
+                )
+            else:
+                log.info(f"Backing up volume: {volume_name}")
+            started = time.perf_counter()
+            
+            def report_progress(bytes_read: int, rate: float):
+                throttled = ""
+                if limiter is not None:
+                    throttled = f", {reader.throttled_seconds:.0f}s throttled ({throttle})"
+                log.info(
+                    f"Backing up volume {volume_name}: {bytes_read / (1024 * 1024):.0f} MB read "
+                    f"({rate / (1024 * 1024):.1f} MB/s{throttled})"
+                )
+            
+            limiter = throttle.limiter if throttle is not None else None
+            resources = throttle.container_resources() if throttle is not None else {}
+            blob_refs: List[BlobRef] = list(resume.volume.blob_refs) if resume is not None else []
+            progress = resume.volume.stats if resume is not None else None
+            new_blobs = progress.new_blob_count if progress is not None else 0
+            deduplicated_bytes = progress.deduplicated_bytes if progress is not None else 0
+            
+            def divert_model_blob(member, contents) -> bool:
+                nonlocal new_blobs, deduplicated_bytes
+                digest = model_blob_digest(member.name)
+                if digest is None:
+                    return False
+                ref, copied = blob_store.ingest(member, contents, digest)
+                blob_refs.append(ref)
+                if copied:
+                    new_blobs += 1
+                else:
+                    deduplicated_bytes += ref.size
+                return True
+            
+            exclude = ExcludeFilter(exclude_patterns or [])
+            encoder = AdaptiveCompressor(codec, compression_level, compression_threads) if adaptive else None
+            stream_codec = get_codec("none" if adaptive else codec)
+            if progress is not None:
+                # Counters as of the last checkpoint; the members before it are not seen again
+                exclude.excluded_files = progress.excluded_files
+                exclude.excluded_bytes = progress.excluded_bytes
+                exclude.excluded_paths = list(progress.excluded_paths)
+                if encoder is not None:
+                    encoder.compressed_files = progress.compressed_files
+                    encoder.stored_files = progress.stored_files
+                    encoder.stored_bytes = progress.stored_bytes
+            
+            chunk_start = resume.position.offset if resume is not None else 0
+            
+            def checkpoint_chunk(position: TarPosition) -> None:
+                nonlocal chunk_start
+                if position.offset - chunk_start < checkpoint.interval:
+                    return
+                size, sha256 = compressed.cut()
+                raw.flush()
+                os.fsync(raw.fileno())
+                chunk_start = position.offset
+                checkpoint.record_chunk(
+                    volume_name, archive,
+                    ArchiveChunk(
+                        members=position.members, last_member=position.name, tar_offset=position.offset,
+                        size=size, sha256=sha256,
+                    ),
+                    VolumeBackupStats(
+                        name=volume_name,
+                        archive=archive,
+                        new_blob_count=new_blobs,
+                        deduplicated_bytes=deduplicated_bytes,
+                        compressed_files=encoder.compressed_files if encoder is not None else 0,
+                        stored_files=encoder.stored_files if encoder is not None else 0,
+                        stored_bytes=encoder.stored_bytes if encoder is not None else 0,
+                        excluded_files=exclude.excluded_files,
+                        excluded_bytes=exclude.excluded_bytes,
+                        excluded_paths=list(exclude.excluded_paths),
+                    ),
+                    blob_refs,
+                )
+            
+            chunked = checkpoint is not None and destination is None
+            source_changed = False
+            snapshot = self._snapshot_volume(volume_name, exclude_patterns, resources) if online else None
+            live_blobs = snapshot is not None and snapshot.live_blobs
+            helper = None
+            live_helper = None
+            live_reader = None
+            
+            def read_live_blobs():
+                nonlocal live_helper, live_reader
+                live_helper = self._create_archive_helper({volume_name: {"bind": "/data", "mode": "ro"}}, **resources)
+                chunks, _ = live_helper.get_archive(f"/data/{MODEL_BLOB_DIR}", chunk_size=ARCHIVE_CHUNK_SIZE)
+                live_reader = ChunkStreamReader(chunks, on_progress=report_progress, rate_limiter=limiter)
+                yield live_reader, MODEL_BLOB_DIR.rsplit("/", 1)[1], f"./{MODEL_BLOB_DIR}"
+            
+            def exclude_member(member) -> bool:
+                if exclude(member):
+                    return True
+                # Only finished blobs are read from the live volume; anything else there may be mid-write
+                return member.name.startswith(f"./{MODEL_BLOB_DIR}/") and model_blob_digest(member.name) is None
+            
+            if live_blobs:
+                member_filter = exclude_member
+            else:
+                member_filter = exclude if exclude.patterns else None
+            try:
+                source = snapshot.volume if snapshot is not None else volume_name
+                helper = self._create_archive_helper({source: {"bind": "/data", "mode": "ro"}}, **resources)
+                chunks, _ = helper.get_archive("/data", chunk_size=ARCHIVE_CHUNK_SIZE)
+                reader = ChunkStreamReader(chunks, on_progress=report_progress, rate_limiter=limiter)
+                if destination is not None:
+                    output = nullcontext(destination)
+                else:
+                    output = open(partial_file, "ab" if resume is not None else "wb")
+                with output as raw:
+                    if resume is not None:
+                        hashed = HashingWriter(raw, sha256=resume.sha256, bytes_written=resume.size)
+                    else:
+                        hashed = HashingWriter(raw)
+                    if chunked:
+                        compressor = ChunkedArchiveWriter(hashed, stream_codec.name, compression_level, compression_threads)
+                    else:
+                        compressor = stream_codec.open_writer(hashed, level=compression_level, threads=compression_threads)
+                    with compressor as compressed:
+                        rebase_tar_stream(
+                            reader, compressed, "data",
+                            divert=divert_model_blob if blob_store is not None else None,
+                            encode=encoder,
+                            exclude=member_filter,
+                            resume=resume.position if resume is not None else None,
+                            on_member=checkpoint_chunk if chunked else None,
+                            then=read_live_blobs() if live_blobs else (),
+                        )
+                reader.drain()
+                if live_reader is not None:
+                    live_reader.drain()
+                if partial_file is not None:
+                    partial_file.replace(backup_file)
+            except SourceChangedError as e:
+                log.warning(f"Volume {volume_name} changed since it was checkpointed ({e}), backing it up from the start")
+                source_changed = True
+            except Exception:
+                # Checkpointed chunks are kept for backup --resume
+                if partial_file is not None and not (chunked and checkpoint.has_chunks(volume_name)):
+                    partial_file.unlink(missing_ok=True)
+                raise
+            finally:
+                for archive_helper in (helper, live_helper):
+                    if archive_helper is not None:
+                        archive_helper.remove(force=True)
+                if snapshot is not None:
+                    self._remove_snapshot(snapshot.volume)
+            if source_changed:
+                checkpoint.discard_volume(volume_name)
+                partial_file.unlink(missing_ok=True)
+                return self._backup_volume(
+                    volume_name, backup_dir, blob_store, volume_blobs,
+                    codec=codec, compression_level=compression_level, compression_threads=compression_threads,
+                    adaptive=adaptive, exclude_patterns=exclude_patterns, checkpoint=checkpoint,
+                    online=online, throttle=throttle,
+                )
+            duration = time.perf_counter() - started
+            readers = [reader] if live_reader is None else [reader, live_reader]
+            bytes_read = sum(stream.bytes_read for stream in readers)
+            throttled_seconds = sum(stream.throttled_seconds for stream in readers)
+            
+            stats = VolumeBackupStats(
+                name=volume_name,
+                archive=archive,
+                size_bytes=hashed.bytes_written,
+                source_bytes=bytes_read,
+                duration_seconds=round(duration, 3),
+                throughput_bytes_per_sec=round(bytes_read / duration) if duration > 0 else None,
+                blob_count=len(blob_refs),
+                new_blob_count=new_blobs,
+                deduplicated_bytes=deduplicated_bytes,
+                excluded_files=exclude.excluded_files,
+                excluded_bytes=exclude.excluded_bytes,
+                excluded_paths=exclude.excluded_paths,
+                sha256=hashed.hexdigest(),
+                resumed_bytes=resume.size if resume is not None else 0,
+                throttled_seconds=round(throttled_seconds, 3),
+            )
+            if snapshot is not None:
+                stats.paused_containers = snapshot.paused_containers
+                stats.pause_seconds = round(snapshot.pause_seconds, 3)
+            if encoder is not None:
+                stats.compressed_files = encoder.compressed_files
+                stats.stored_files = encoder.stored_files
+                stats.stored_bytes = encoder.stored_bytes
+                log.info(
+                    f"Volume {volume_name}: {encoder.compressed_files} files compressed, "
+                    f"{encoder.stored_files} stored as-is ({encoder.stored_bytes / (1024 * 1024):.0f} MB)"
+                )
+            if exclude.excluded_paths:
+                log.info(
+                    f"Volume {volume_name}: excluded {len(exclude.excluded_paths)} paths "
+                    f"({exclude.excluded_bytes / (1024 * 1024):.0f} MB)"
+                )
+            if blob_refs:
+                if volume_blobs is not None:
+                    volume_blobs[volume_name] = blob_refs
+                log.info(
+                    f"Volume {volume_name}: {len(blob_refs)} model blobs, {new_blobs} new, "
+                    f"{deduplicated_bytes / (1024 * 1024):.0f} MB already in blob store"
+                )
+            log.info(
+                f"Volume backup completed: {volume_name} "
+                f"({bytes_read / (1024 * 1024):.1f} MB in {duration:.1f}s"
+                f"{f', {throttled_seconds:.1f}s throttled' if limiter is not None else ''})"
+            )
+            if partial_file is not None:
+                log.debug(f"Backup file: {backup_file}")
+            if chunked:
+                checkpoint.record_volume(stats, blob_refs)
+            return True, stats
+                
+        except Exception as e:
+            log.error(f"Failed to backup volume {volume_name}: {e}")
+            return False, None
+
+    def _create_archive_helper(self, volumes: dict, command="true", **resources):
+        """
+        Create (but do not start) a container that mounts volumes for the archive API.
+        
+        The helper image is only pulled if it is not available locally.
+        ``resources`` (e.g. cpu_shares, blkio_weight) are passed to the
+        container's host config.
+        """
+        try:
+            return self.client.containers.create(self.ARCHIVE_HELPER_IMAGE, command=command, volumes=volumes, **resources)
+        except docker.errors.ImageNotFound:
+            log.info(f"Pulling {self.ARCHIVE_HELPER_IMAGE} for volume access...")
+            self.client.images.pull(self.ARCHIVE_HELPER_IMAGE)
+            return self.client.containers.create(self.ARCHIVE_HELPER_IMAGE, command=command, volumes=volumes, **resources)
+
+    def _volume_writers(self, volume_name: str) -> list:
+        """Running (or paused) containers that mount a volume read-write."""
+        writers = []
+        for container in self.client.containers.list(filters={"volume": volume_name}):
+            mounts = container.attrs.get("Mounts", [])
+            if any(mount.get("Name") == volume_name and mount.get("RW", True) for mount in mounts):
+                writers.append(container)
+        return writers
+
+    def stop_volume_users(self, volume_names: List[str]) -> List[str]:
+        """
+        Stop the running containers that mount any of the given volumes.
+        
+        Used by a selective restore, which only has to take down the services
+        whose data it overwrites. Returns the names of the containers stopped,
+        for start_containers once the restore is done.
+        """
+        stopped = []
+        seen = set()
+        for volume_name in volume_names:
+            for container in self.client.containers.list(filters={"volume": volume_name}):
+                if container.id in seen:
+                    continue
+                seen.add(container.id)
+                log.info(f"Stopping {container.name} (uses volume {volume_name})")
+                container.stop()
+                stopped.append(container.name)
+        return stopped
+
+    def start_containers(self, names: List[str]) -> bool:
+        """Start containers by name, e.g. those stop_volume_users stopped."""
+        success = True
+        for name in names:
+            try:
+                self.client.containers.get(name).start()
+                log.info(f"Started {name}")
+            except docker.errors.DockerException as e:
+                log.error(f"Failed to start {name}: {e}")
+                success = False
+        return success
+
+    @contextmanager
+    def _paused(self, containers: list) -> Iterator[List[str]]:
+        """
+        Keep containers paused for the duration of the block; yields their names.
+        
+        Pauses are counted per container, so a writer shared by volumes that
+        are snapshotted concurrently stays paused until the last snapshot is
+        done. Containers that were already paused are left paused.
+        """
+        held = []
+        try:
+            for container in containers:
+                with self._pause_lock:
+                    if container.id not in self._pauses:
+                        container.reload()
+                        owned = container.status != "paused"
+                        if owned:
+                            container.pause()
+                        self._pauses[container.id] = [0, owned]
+                    self._pauses[container.id][0] += 1
+                held.append(container)
+            yield [container.name for container in held]
+        finally:
+            for container in reversed(held):
+                with self._pause_lock:
+                    pause = self._pauses[container.id]
+                    pause[0] -= 1
+                    if pause[0]:
+                        continue
+                    del self._pauses[container.id]
+                    if not pause[1]:
+                        continue
+                    try:
+                        container.unpause()
+                    except docker.errors.APIError as e:
+                        log.error(f"Failed to unpause {container.name} after snapshotting: {e}")
+
+    def _snapshot_volume(
+        self,
+        volume_name: str,
+        exclude_patterns: Optional[List[str]] = None,
+        resources: Optional[dict] = None,
+    ) -> Optional[VolumeSnapshot]:
+        """
+        Copy a volume into a new scratch volume while its writers are paused.
+        
+        Only the running containers that mount the volume read-write are
+        paused (``docker pause`` freezes their processes without stopping
+        them), and only while the copy runs, so the snapshot is consistent
+        as of one instant, like a crash-consistent filesystem snapshot.
+        
+        Paths matching ``exclude_patterns`` and Ollama's model blobs are left
+        out of the copy; the blobs are content-addressed and never change, so
+        the archive reads them from the live volume instead. Before pausing,
+        a probe checks whether the volume can be reflinked: if not, the
+        expected copy is logged, and a copy larger than
+        ONLINE_COPY_LIMIT_BYTES fails the volume rather than pausing its
+        writers for it. ``resources`` limits the copy's CPU and disk share,
+        at the cost of a longer pause.
+        
+        Returns:
+            The snapshot, or None if nothing writes to the volume and it can
+            be archived in place
+        """
+        writers = self._volume_writers(volume_name)
+        if not writers:
+            log.info(f"Volume {volume_name} has no running writers, archiving it in place")
+            return None
+        
+        exclude = ExcludeFilter([*(exclude_patterns or []), MODEL_BLOB_DIR])
+        snapshot = self.client.volumes.create(
+            name=f"{volume_name}-snapshot-{uuid.uuid4().hex[:12]}",
+            labels={self.SNAPSHOT_LABEL: volume_name},
+        )
+        mounts = {
+            volume_name: {"bind": "/data", "mode": "ro"},
+            snapshot.name: {"bind": "/snapshot", "mode": "rw"},
+        }
+        try:
+            probe = self._run_snapshot_helper(
+                mounts, ["sh", "-c", self.SNAPSHOT_PROBE_SCRIPT, "probe", *exclude.find_predicates()], resources,
+            )
+            writer_names = ", ".join(writer.name for writer in writers)
+            copy_bytes = probe.get("bytes", 0)
+            if probe.get("reflink"):
+                mode = "reflink"
+                log.info(f"Volume {volume_name} will be snapshotted with a reflink copy")
+            elif copy_bytes > self.ONLINE_COPY_LIMIT_BYTES:
+                raise RuntimeError(
+                    f"its filesystem does not support reflinks, and {writer_names} would stay paused while "
+                    f"{copy_bytes / (1024 * 1024):.0f} MB is copied; back it up without --online, "
+                    "or exclude the paths that do not need a backup"
+                )
+            else:
+                mode = "copy"
+                log.warning(
+                    f"Volume {volume_name}'s filesystem does not support reflinks: {writer_names} will be paused "
+                    f"while {copy_bytes / (1024 * 1024):.0f} MB is copied"
+                )
+            
+            copier = self._create_archive_helper(
+                mounts,
+                command=["sh", "-c", self.SNAPSHOT_COPY_SCRIPT, "snapshot", mode, *exclude.find_predicates()],
+                **(resources or {}),
+            )
+            try:
+                started = time.perf_counter()
+                with self._paused(writers) as paused_containers:
+                    copier.start()
+                    result = copier.wait()
+                pause_seconds = time.perf_counter() - started
+                if result.get("StatusCode") != 0:
+                    output = copier.logs(stdout=False, stderr=True).decode(errors="replace").strip()
+                    raise RuntimeError(f"snapshot copy exited with status {result.get('StatusCode')}: {output}")
+            finally:
+                copier.remove(force=True)
+        except Exception:
+            self._remove_snapshot(snapshot.name)
+            raise
+        
+        log.info(
+            f"Snapshot of volume {volume_name} taken with {', '.join(paused_containers)} "
+            f"paused for {pause_seconds:.1f}s"
+        )
+        live_blobs = bool(probe.get("blobs")) and not ExcludeFilter(exclude_patterns or []).matches(MODEL_BLOB_DIR)
+        return VolumeSnapshot(snapshot.name, paused_containers, pause_seconds, live_blobs)
+
+    def _run_snapshot_helper(self, mounts: dict, command: List[str], resources: Optional[dict] = None) -> Dict[str, int]:
+        """Run a helper to completion and parse its ``key value`` output lines into integers."""
+        helper = self._create_archive_helper(mounts, command=command, **(resources or {}))
+        try:
+            helper.start()
+            result = helper.wait()
+            if result.get("StatusCode") != 0:
+                output = helper.logs(stdout=False, stderr=True).decode(errors="replace").strip()
+                raise RuntimeError(f"snapshot probe exited with status {result.get('StatusCode')}: {output}")
+            values = {}
+            for line in helper.logs(stdout=True, stderr=False).decode(errors="replace").splitlines():
+                key, _, value = line.partition(" ")
+                if value.strip().isdigit():
+                    values[key] = int(value)
+            return values
+        finally:
+            helper.remove(force=True)
+
+    def _remove_snapshot(self, snapshot_volume: str) -> None:
+        try:
+            self.client.volumes.get(snapshot_volume).remove(force=True)
+        except docker.errors.NotFound:
+            pass
+        except docker.errors.APIError as e:
+            log.error(f"Failed to remove snapshot volume {snapshot_volume}: {e}")
+
+    def sample_volume(self, volume_name: str, max_bytes: Optional[int] = None) -> bytes:
+        """
+        Read the start of a volume's uncompressed tar stream through the archive API.
+        
+        Used as representative data for codec benchmarks; the stream is closed
+        once ``max_bytes`` have been read, so large volumes are not read in full.
+        """
+        max_bytes = max_bytes or self.BENCHMARK_SAMPLE_BYTES
+        helper = self._create_archive_helper({volume_name: {"bind": "/data", "mode": "ro"}})
+        try:
+            chunks, _ = helper.get_archive("/data", chunk_size=ARCHIVE_CHUNK_SIZE)
+            sample = bytearray()
+            try:
+                for chunk in chunks:
+                    sample += chunk
+                    if len(sample) >= max_bytes:
+                        break
+            finally:
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    close()
+            return bytes(sample[:max_bytes])
+        finally:
+            helper.remove(force=True)
+
+    def benchmark_volumes(
+        self,
+        volume_names: List[str],
+        codecs: Optional[List[str]] = None,
+        sample_bytes: Optional[int] = None,
+        compression_threads: int = 0,
+    ) -> List[CodecBenchmark]:
+        """
+        Measure each codec's ratio and throughput on a sample of every volume.
+        
+        Args:
+            volume_names: Volumes to sample; missing volumes are skipped
+            codecs: Codec names to measure (all installed codecs if None)
+            sample_bytes: Uncompressed bytes to sample per volume
+            compression_threads: Threads for multithreaded codecs (0 = one per CPU)
+            
+        Returns:
+            List[CodecBenchmark]: One result per volume and codec
+        """
+        if not self.client:
+            log.warning("Docker client not available for compression benchmark")
+            return []
+        
+        results = []
+        for volume_name in volume_names:
+            try:
+                self.client.volumes.get(volume_name)
+            except docker.errors.NotFound:
+                log.warning(f"Volume not found: {volume_name}")
+                continue
+            sample = self.sample_volume(volume_name, sample_bytes)
+            if not sample:
+                continue
+            log.info(f"Benchmarking codecs on {len(sample) / (1024 * 1024):.1f} MB of {volume_name}")
+            results.extend(benchmark_codecs(sample, codecs, threads=compression_threads, volume=volume_name))
+        return results
+
+    def restore_volumes(
+        self,
+        volume_names: List[str],
+        backup_dir: Path,
+        blob_store: Optional[BlobStore] = None,
+        volume_blobs: Optional[Dict[str, List[BlobRef]]] = None,
+        codec: str = "gzip",
+        adaptive: bool = False,
+        max_workers: int = 1,
+        volume_stats: Optional[List[VolumeRestoreStats]] = None,
+        volume_paths: Optional[Dict[str, List[str]]] = None,
+    ) -> bool:
         """
         Restore Docker volumes from backups.
         
+        Archives are decompressed on the host with the codec they were written
+        with and streamed into the volume through the archive API of a helper
+        container, so restores do not depend on the decompressors available in
+        the helper image. Up to ``max_workers`` volumes are restored at once so
+        separate archives decompress on separate cores.
+        
         Args:
             volume_names: List of volume names to restore
             backup_dir: Directory containing volume backups
+            blob_store: Shared store holding deduplicated model blobs
+            volume_blobs: Model blob references recorded for each volume
+            codec: Compression codec the archives were written with
+            adaptive: Whether the archives were written with per-file
+                compression; their compressed members are decoded on the fly
+            max_workers: Maximum number of volumes to restore concurrently
+            volume_stats: If given, timing and throughput for each restored
+                volume are appended to it, in volume_names order
+            volume_paths: Paths relative to the volume root to restore, by
+                volume; volumes not in it are restored whole
             
         Returns:
             bool: True if restore succeeded, False otherwise
@@ -684,46 +1660,23 @@ class DockerClient:
             return False
         
         try:
-            success = True
+            get_codec(codec).require()
             
-            log.info(f"Starting restore of {len(volume_names)} volumes...")
+            workers = max(1, min(max_workers, self.BACKUP_MAX_WORKERS, len(volume_names) or 1))
+            log.info(f"Starting restore of {len(volume_names)} volumes ({workers} at a time)...")
             
-            for volume_name in volume_names:
-                try:
-                    backup_file = backup_dir / f"{volume_name}.tar.gz"
-                    
-                    if not backup_file.exists():
-                        log.error(f"Backup file not found: {backup_file}")
-                        success = False
-                        continue
-                    
-                    log.info(f"Restoring volume: {volume_name}")
-                    
-                    # Create volume if it doesn't exist
-                    try:
-                        volume = self.client.volumes.get(volume_name)
-                        log.debug(f"Volume exists: {volume_name}")
-                    except docker.errors.NotFound:
-                        log.info(f"Creating volume: {volume_name}")
-                        volume = self.client.volumes.create(name=volume_name)
-                    
-                    # Restore volume using a temporary container
-                    container = self.client.containers.run(
-                        "alpine:latest",
-                        f"tar -xzf /backup/{volume_name}.tar.gz -C /data",
-                        volumes={
-                            volume_name: {"bind": "/data", "mode": "rw"},
-                            str(backup_dir): {"bind": "/backup", "mode": "ro"}
-                        },
-                        remove=True,
-                        detach=False
-                    )
-                    
-                    log.info(f"Volume restore completed: {volume_name}")
-                    
-                except Exception as e:
-                    log.error(f"Failed to restore volume {volume_name}: {e}")
-                    success = False
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda name: self._restore_volume(
+                        name, backup_dir, blob_store, volume_blobs, codec=codec, adaptive=adaptive,
+                        paths=(volume_paths or {}).get(name),
+                    ),
+                    volume_names,
+                ))
+            
+            success = all(ok for ok, _ in results)
+            if volume_stats is not None:
+                volume_stats.extend(stats for _, stats in results if stats is not None)
             
             if success:
                 log.info("All volume restores completed successfully")
@@ -736,6 +1689,162 @@ class DockerClient:
             log.error(f"Volume restore operation failed: {e}")
             return False
 
+    def _restore_volume(
+        self,
+        volume_name: str,
+        backup_dir: Optional[Path],
+        blob_store: Optional[BlobStore] = None,
+        volume_blobs: Optional[Dict[str, List[BlobRef]]] = None,
+        codec: str = "gzip",
+        adaptive: bool = False,
+        source: Optional[BinaryIO] = None,
+        paths: Optional[List[str]] = None,
+    ) -> Tuple[bool, Optional[VolumeRestoreStats]]:
+        """
+        Stream one archive from the host into a volume.
+        
+        The archive is read in chunks, decompressed as it is read and handed
+        to ``put_archive`` as a generator, so neither the compressed nor the
+        decompressed archive is staged. Progress reports the share of the
+        archive read so far and the decompressed MB/s.
+        
+        With a ``source`` file object, the archive is read from it instead of
+        from backup_dir (e.g. out of a backup stream), and progress reports
+        the MB read since its size is not known.
+        
+        With ``paths``, only the archive members at or under those paths
+        (relative to the volume root) and their model blobs are restored; the
+        rest of the volume is left as it is. Plain and adaptive archive files
+        keep their member headers uncompressed, so they are walked header by
+        header and unselected member data is skipped with a seek rather than
+        read and decompressed. Archives compressed as a whole are
+        decompressed through, but only the selected members are uploaded.
+        
+        Returns:
+            Tuple of success flag and stats (None if the volume failed)
+        """
+        try:
+            archive = archive_name(volume_name, codec, adaptive)
+            if source is None:
+                backup_file = backup_dir / archive
+                if not backup_file.exists():
+                    log.error(f"Backup file not found: {backup_file}")
+                    return False, None
+            
+            selector = PathSelector(paths) if paths else None
+            if selector is None:
+                log.info(f"Restoring volume: {volume_name}")
+            else:
+                log.info(f"Restoring from volume {volume_name}: {', '.join(selector.paths) or '/'}")
+            
+            # Create volume if it doesn't exist
+            try:
+                self.client.volumes.get(volume_name)
+                log.debug(f"Volume exists: {volume_name}")
+            except docker.errors.NotFound:
+                log.info(f"Creating volume: {volume_name}")
+                self.client.volumes.create(name=volume_name)
+            
+            archive_size = backup_file.stat().st_size if source is None else None
+            restored_bytes = 0
+            started = time.perf_counter()
+            
+            def report_progress(bytes_read: int, rate: float):
+                elapsed = time.perf_counter() - started
+                if archive_size is None:
+                    read = f"{bytes_read / (1024 * 1024):.0f} MB of archive read"
+                else:
+                    read = f"{bytes_read * 100 / archive_size if archive_size else 100.0:.0f}% of archive read"
+                log.info(
+                    f"Restoring volume {volume_name}: {read}, "
+                    f"{restored_bytes / (1024 * 1024):.0f} MB written "
+                    f"({restored_bytes / elapsed / (1024 * 1024) if elapsed > 0 else 0.0:.1f} MB/s)"
+                )
+            
+            def count_restored(stream: Iterable[bytes]) -> Iterator[bytes]:
+                nonlocal restored_bytes
+                for chunk in stream:
+                    restored_bytes += len(chunk)
+                    yield chunk
+            
+            blob_refs = (volume_blobs or {}).get(volume_name) or []
+            if selector is not None:
+                blob_refs = [ref for ref in blob_refs if selector(ref.path)]
+            helper = self._create_archive_helper({volume_name: {"bind": "/data", "mode": "rw"}})
+            try:
+                with open(backup_file, "rb") if source is None else nullcontext(source) as raw:
+                    reader = ChunkStreamReader(iter_file_chunks(raw), on_progress=report_progress)
+                    if selector is not None and source is None and (adaptive or codec == "none"):
+                        stream = iter_selected_tar(raw, selector, seekable=True)
+                    elif selector is not None:
+                        stream = iter_selected_tar(reader if adaptive else get_codec(codec).open_reader(reader), selector)
+                    elif adaptive:
+                        stream = iter_adaptive_tar(reader)
+                    else:
+                        stream = iter_file_chunks(get_codec(codec).open_reader(reader))
+                    if not helper.put_archive("/data", count_restored(stream)):
+                        raise docker.errors.APIError(f"Docker rejected archive for volume {volume_name}")
+                
+                if selector is not None and not selector.selected:
+                    raise ValueError(f"nothing in the backup matches {', '.join(selector.paths) or '/'}")
+                if blob_refs:
+                    self._restore_model_blobs(helper, volume_name, blob_refs, blob_store)
+            finally:
+                helper.remove(force=True)
+            duration = time.perf_counter() - started
+            
+            stats = VolumeRestoreStats(
+                name=volume_name,
+                archive=archive,
+                size_bytes=reader.bytes_read if archive_size is None else archive_size,
+                restored_bytes=restored_bytes,
+                duration_seconds=round(duration, 3),
+                throughput_bytes_per_sec=round(restored_bytes / duration) if duration > 0 else None,
+                blob_count=len(blob_refs),
+                paths=selector.paths if selector is not None else [],
+                restored_members=selector.selected if selector is not None else 0,
+            )
+            log.info(
+                f"Volume restore completed: {volume_name} "
+                f"({restored_bytes / (1024 * 1024):.1f} MB in {duration:.1f}s)"
+            )
+            return True, stats
+            
+        except Exception as e:
+            log.error(f"Failed to restore volume {volume_name}: {e}")
+            return False, None
+
+    def restore_volume_from_stream(
+        self, volume_name: str, source: BinaryIO
+    ) -> Tuple[bool, Optional[VolumeRestoreStats]]:
+        """
+        Restore one volume from a plain tar archive read out of a backup stream.
+        
+        Args:
+            volume_name: Volume to restore (created if missing)
+            source: File object positioned at the volume's archive
+            
+        Returns:
+            Tuple of success flag and stats (None if the restore failed)
+        """
+        if not self.client:
+            log.warning("Docker client not available for volume restoration")
+            return False, None
+        return self._restore_volume(volume_name, None, codec="none", source=source)
+
+    def _restore_model_blobs(self, helper, volume_name: str, blob_refs: List[BlobRef], blob_store: BlobStore) -> None:
+        """Stream deduplicated model blobs from the blob store back into a volume."""
+        if blob_store is None:
+            raise ValueError(f"Volume {volume_name} references model blobs but no blob store was given")
+        
+        log.info(f"Restoring {len(blob_refs)} model blobs into volume: {volume_name}")
+        entries = (
+            (BlobStore.member_for(ref), lambda digest=ref.digest: blob_store.open(digest))
+            for ref in blob_refs
+        )
+        if not helper.put_archive("/data", iter_tar_stream(entries)):
+            raise docker.errors.APIError(f"Docker rejected model blobs for volume {volume_name}")
+
     def export_stack_state(self, output_file: Path) -> bool:
         """
         Export current stack state for migration purposes.
@@ -755,7 +1864,7 @@ class DockerClient:
             
             state_info = {
                 "timestamp": time.time(),
-                "docker_version": self.client.version()["Version"],
+                "docker_version": self.get_docker_info().get("ServerVersion"),
                 "containers": [],
                 "volumes": [],
                 "networks": [],
@@ -870,6 +1979,159 @@ class DockerClient:
             return False
 
 
+class _StatsStream:
+    """One container's stats subscription: the container it follows and how to stop it."""
+
+    def __init__(self, container_id: str):
+        self.container_id = container_id
+        self.stopped = threading.Event()
+        # The CancellableStream, once the consuming thread has opened it
+        self.stream = None
+
+
+class ContainerStatsMonitor:
+    """
+    Keeps one streaming stats subscription per running stack container.
+    
+    Each subscription runs on a daemon thread consuming the container's
+    stats stream, so the daemon pushes a sample roughly once a second and
+    readers just pick up the latest ResourceUsage without making any API
+    calls. Call sync() to pick up containers that started or stopped, and
+    close() when done. Stopping a subscription closes its HTTP response, so
+    the thread and connection end at once rather than at the next sample.
+    """
+
+    def __init__(self, docker_client: DockerClient):
+        self._docker_client = docker_client
+        # Guards _usage and _streams, which sync(), close() and the stream threads all change
+        self._lock = threading.Lock()
+        self._usage: Dict[str, ResourceUsage] = {}
+        # service name -> subscription
+        self._streams: Dict[str, _StatsStream] = {}
+
+    def sync(self) -> None:
+        """Starts streams for new running containers and stops streams for gone ones."""
+        client = self._docker_client.client
+        if not client:
+            return
+
+        try:
+            containers = client.containers.list(
+                filters={"label": "ollama-stack.component", "status": "running"}
+            )
+        except (docker.errors.APIError, ConnectionResetError, ConnectionError) as e:
+            log.debug(f"Could not list containers for stats streaming: {e}")
+            return
 
+        running = {c.labels.get("ollama-stack.component"): c for c in containers}
+
+        stopped = []
+        started = []
+        with self._lock:
+            # Drop streams for containers that stopped or were recreated
+            for service_name, subscription in list(self._streams.items()):
+                container = running.get(service_name)
+                if container is None or container.id != subscription.container_id:
+                    stopped.append(self._streams.pop(service_name, None))
+                    self._usage.pop(service_name, None)
+
+            for service_name, container in running.items():
+                if service_name in self._streams:
+                    continue
+                subscription = _StatsStream(container.id)
+                self._streams[service_name] = subscription
+                started.append((service_name, container, subscription))
+
+        for subscription in stopped:
+            if subscription is not None:
+                self._stop(subscription)
+
+        for service_name, container, subscription in started:
+            thread = threading.Thread(
+                target=self._consume,
+                args=(service_name, container, subscription),
+                name=f"stats-{service_name}",
+                daemon=True,
+            )
+            thread.start()
+            log.debug(f"Started stats stream for {service_name}")
+
+    @staticmethod
+    def _open_stream(container):
+        """
+        Open a container's stats stream as a docker ``CancellableStream``.
+        
+        ``container.stats(stream=True)`` returns a bare generator whose HTTP
+        response cannot be closed from another thread. The request is made
+        through the API client's public ``requests.Session`` interface
+        instead, and wrapped the way docker-py wraps ``events()``, whose
+        close() shuts the response's socket and unblocks the reader.
+        """
+        import json
+        api = container.client.api
+        response = api.get(
+            f"{api.base_url}/v{api.api_version}/containers/{container.id}/stats",
+            params={"stream": True},
+            stream=True,
+        )
+        response.raise_for_status()
+        # The daemon writes one JSON document per line
+        samples = (json.loads(line) for line in response.iter_lines() if line)
+        return docker.types.CancellableStream(samples, response)
+
+    @staticmethod
+    def _close_stream(service_name: str, stream) -> None:
+        try:
+            stream.close()
+        except Exception as e:
+            log.debug(f"Error closing stats stream for {service_name}: {e}")
+
+    def _stop(self, subscription: _StatsStream) -> None:
+        """Signal a subscription to stop and close its stream if it has one open."""
+        subscription.stopped.set()
+        with self._lock:
+            stream = subscription.stream
+        if stream is not None:
+            self._close_stream(subscription.container_id, stream)
+
+    def _consume(self, service_name: str, container, subscription: _StatsStream) -> None:
+        """Reads a container's stats stream until stopped or the stream ends."""
+        stream = None
+        try:
+            stream = self._open_stream(container)
+            with self._lock:
+                subscription.stream = stream
+            # A stop that came before the stream was recorded could not close it
+            if subscription.stopped.is_set():
+                return
+            for stats in stream:
+                if subscription.stopped.is_set():
+                    break
+                usage = self._docker_client._calculate_resource_usage(stats)
+                with self._lock:
+                    if not subscription.stopped.is_set():
+                        self._usage[service_name] = usage
+        except Exception as e:
+            if not subscription.stopped.is_set():
+                log.debug(f"Stats stream for {service_name} ended: {e}")
+        finally:
+            if stream is not None:
+                self._close_stream(service_name, stream)
+            with self._lock:
+                # Only forget the stream if it wasn't already replaced by a newer one
+                if self._streams.get(service_name) is subscription:
+                    self._streams.pop(service_name, None)
 
+    def usage(self, service_name: str) -> Optional[ResourceUsage]:
+        """Returns the latest usage sample for a service, if one has arrived."""
+        with self._lock:
+            return self._usage.get(service_name)
 
+    def close(self) -> None:
+        """Stops every stream and closes its connection."""
+        with self._lock:
+            subscriptions = list(self._streams.values())
+            self._streams.clear()
+            self._usage.clear()
+        for subscription in subscriptions:
+            self._stop(subscription)
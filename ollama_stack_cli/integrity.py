@@ -0,0 +1,196 @@
+import hashlib
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .schemas import BackupManifest, FileDigest
+
+log = logging.getLogger(__name__)
+
+# Read size for hashing; large reads keep per-call overhead negligible on multi-GB archives
+HASH_BUFFER_SIZE = 8 * 1024 * 1024
+# hashlib releases the GIL while hashing, so threads hash separate files on separate cores
+DIGEST_MAX_WORKERS = 8
+
+# Domain separation between Merkle leaves and interior nodes
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read unbuffered into one reused buffer."""
+    sha256 = hashlib.sha256()
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while count := f.readinto(buffer):
+            sha256.update(view[:count])
+    return sha256.hexdigest()
+
+
+class HashingWriter(io.RawIOBase):
+    """
+    Write-only file object that hashes and counts bytes on their way to a file.
+
+    Placed between a codec writer and the archive file, it yields the
+    archive's SHA-256 and size as it is written, so the backup does not read
+    the archive back to digest it. Closing it leaves the wrapped file open.
+    Pass the hash and size of a file's existing contents to keep hashing it
+    while appending, e.g. when a checkpointed archive is resumed.
+    """
+
+    def __init__(self, fileobj, sha256=None, bytes_written: int = 0):
+        self._fileobj = fileobj
+        self._sha256 = sha256 if sha256 is not None else hashlib.sha256()
+        self.bytes_written = bytes_written
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._sha256.update(data)
+        self._fileobj.write(data)
+        count = memoryview(data).nbytes
+        self.bytes_written += count
+        return count
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+
+class HashingReader(io.RawIOBase):
+    """
+    Read-only file object that hashes and counts the bytes read through it.
+
+    Lets a streamed backup be verified while it is being restored, without
+    holding or re-reading the data.
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._sha256 = hashlib.sha256()
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        count = self._fileobj.readinto(target)
+        if count:
+            self._sha256.update(memoryview(target)[:count])
+            self.bytes_read += count
+        return count or 0
+
+    def drain(self) -> None:
+        """Read (and hash) whatever the consumer left unread."""
+        buffer = bytearray(HASH_BUFFER_SIZE)
+        while self.readinto(buffer):
+            pass
+
+    def digest(self, path: str) -> FileDigest:
+        return FileDigest(path=path, size=self.bytes_read, sha256=self._sha256.hexdigest())
+
+
+def _workers(max_workers: Optional[int], jobs: int) -> int:
+    limit = max_workers or min(DIGEST_MAX_WORKERS, os.cpu_count() or 1)
+    return max(1, min(limit, jobs))
+
+
+def backup_file_paths(manifest: BackupManifest, volumes: Optional[List[str]] = None) -> List[str]:
+    """
+    Paths, relative to the backup directory, of the files a manifest lists.
+
+    Args:
+        manifest: Backup manifest
+        volumes: If given, only the archives of these volumes
+    """
+    from .compression import archive_name
+
+    paths = [
+        f"volumes/{archive_name(volume, manifest.codec, manifest.adaptive_compression)}"
+        for volume in manifest.volumes
+        if volumes is None or volume in volumes
+    ]
+    if volumes is None:
+        paths += [f"config/{name}" for name in manifest.config_files]
+        paths += [f"extensions/{name}.tar.gz" for name in manifest.extensions]
+    return sorted(paths)
+
+
+def digest_files(backup_dir: Path, paths: Iterable[str], max_workers: Optional[int] = None) -> List[FileDigest]:
+    """
+    Hash backup files in parallel.
+
+    Files that do not exist are skipped; the caller reports them as missing.
+
+    Returns:
+        List[FileDigest]: One digest per existing file, sorted by path
+    """
+    existing = [path for path in sorted(set(paths)) if (backup_dir / path).is_file()]
+    if not existing:
+        return []
+
+    def digest(path: str) -> FileDigest:
+        file_path = backup_dir / path
+        return FileDigest(path=path, size=file_path.stat().st_size, sha256=file_sha256(file_path))
+
+    with ThreadPoolExecutor(max_workers=_workers(max_workers, len(existing))) as executor:
+        return list(executor.map(digest, existing))
+
+
+def merkle_root(digests: Iterable[FileDigest]) -> str:
+    """
+    Merkle root over per-file digests, ordered by path.
+
+    Each leaf commits to a file's path, size and SHA-256, so the root changes
+    if a file is renamed, truncated or altered. An odd node is promoted to
+    the next level unchanged.
+    """
+    level = [
+        hashlib.sha256(
+            _LEAF_PREFIX + f"{d.path}\0{d.size}\0".encode() + bytes.fromhex(d.sha256)
+        ).digest()
+        for d in sorted(digests, key=lambda d: d.path)
+    ]
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(_NODE_PREFIX + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+def verify_files(backup_dir: Path, digests: Iterable[FileDigest], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Re-hash files in parallel and compare them with their recorded digests.
+
+    Sizes are compared first, so a truncated file is reported without being read.
+
+    Returns:
+        List[str]: Paths that are missing or do not match, sorted
+    """
+    digests = list(digests)
+    if not digests:
+        return []
+
+    def mismatched(expected: FileDigest) -> bool:
+        file_path = backup_dir / expected.path
+        try:
+            if file_path.stat().st_size != expected.size:
+                return True
+            return file_sha256(file_path) != expected.sha256
+        except OSError as e:
+            log.debug(f"Cannot verify {expected.path}: {e}")
+            return True
+
+    with ThreadPoolExecutor(max_workers=_workers(max_workers, len(digests))) as executor:
+        results = list(executor.map(mismatched, digests))
+    return sorted(d.path for d, bad in zip(digests, results) if bad)
@@ -5,12 +5,13 @@ from .commands.start import start
 from .commands.stop import stop
 from .commands.restart import restart
 from .commands.status import status
+from .commands.serve import serve
 from .commands.logs import logs
 from .commands.check import check
 from .commands.install import install
 from .commands.update import update
 from .commands.uninstall import uninstall
-from .commands.backup import backup
+from .commands.backup import backup_app
 from .commands.restore import restore
 app = typer.Typer(
     help="A CLI for managing the Ollama Stack.",
@@ -21,12 +22,13 @@ app.command()(start)
 app.command()(stop)
 app.command()(restart)
 app.command()(status)
+app.command()(serve)
 app.command()(logs)
 app.command()(check)
 app.command()(install)
 app.command()(update)
 app.command()(uninstall)
-app.command()(backup)
+app.add_typer(backup_app, name="backup")
 app.command()(restore)
 
 @app.callback(invoke_without_command=True)
@@ -44,12 +46,9 @@ def main(
     """
     Initialize the AppContext and attach it to the Typer context.
     """
-    ctx.obj = AppContext(verbose=verbose)
     # Only print the logo if no subcommand and no options (bare invocation)
     if ctx.invoked_subcommand is None and not ctx.args:
         from rich.console import Console
-        import subprocess
-        import sys
         console = Console()
         logo = """
  ██████╗ ██╗     ██╗      █████╗ ███╗   ███╗ █████╗    ███████╗████████╗ █████╗  ██████╗██╗  ██╗
@@ -68,9 +67,14 @@ def main(
             "Manage Ollama, Open WebUI, MCP Proxy, and extensions with a unified CLI interface.\n",
             style="dim",
         )
-        # Invoke help command
-        subprocess.run([sys.executable, "-m", "ollama_stack_cli.main", "--help"])
+        # Render help in-process; Typer's rich formatter prints it directly
+        help_text = ctx.get_help()
+        if help_text:
+            typer.echo(help_text)
         raise typer.Exit()
 
+    # Components are built lazily, so this is cheap until a command uses them
+    ctx.obj = AppContext(verbose=verbose)
+
 if __name__ == "__main__":
     app()
@@ -1,13 +1,13 @@
-import urllib.request
-import urllib.error
+import http.client
 import json
-import socket
 import subprocess
 import shutil
 import logging
-from typing import List, Optional
+import threading
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlparse
 
-from .schemas import ServiceStatus, ResourceUsage, EnvironmentCheck
+from .schemas import ServiceStatus, ResourceUsage, EnvironmentCheck, LoadedModel
 from .display import Display
 
 log = logging.getLogger(__name__)
@@ -15,67 +15,151 @@ log = logging.getLogger(__name__)
 class OllamaApiClient:
     """A client for interacting with the native Ollama API and managing the native service."""
 
+    # Timeout for API requests; the server is local, so anything slower is unhealthy
+    API_TIMEOUT = 2
+
     def __init__(self, display: Display):
         # Initialization logic for the client, e.g., setting base URL
         self.base_url = "http://localhost:11434"
         self.display = display
+        # One keep-alive HTTP connection shared by every API request
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._connection_lock = threading.Lock()
+
+    # =============================================================================
+    # HTTP API Access
+    # =============================================================================
+
+    def _get_json(self, path: str) -> Tuple[int, Any]:
+        """
+        Sends a GET request over the persistent connection and decodes the JSON body.
+
+        A request that fails because the server closed the idle connection is
+        retried once on a fresh connection.
+
+        Returns:
+            Tuple of HTTP status code and decoded body (None for non-2xx responses)
+
+        Raises:
+            OSError, http.client.HTTPException: If the server cannot be reached
+            ValueError: If a successful response is not valid JSON
+        """
+        with self._connection_lock:
+            for attempt in range(2):
+                reused = self._connection is not None
+                if not reused:
+                    parsed = urlparse(self.base_url)
+                    self._connection = http.client.HTTPConnection(
+                        parsed.hostname, parsed.port or 80, timeout=self.API_TIMEOUT
+                    )
+                try:
+                    self._connection.request("GET", path)
+                    response = self._connection.getresponse()
+                    body = response.read()
+                except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                    self._close_connection()
+                    if reused and attempt == 0:
+                        log.debug("Ollama API connection was closed by the server; reconnecting")
+                        continue
+                    raise
+                except (OSError, http.client.HTTPException):
+                    self._close_connection()
+                    raise
+
+                if response.will_close:
+                    self._close_connection()
+                if not 200 <= response.status < 300:
+                    return response.status, None
+                return response.status, json.loads(body)
+
+    def _close_connection(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def close(self):
+        """Closes the persistent API connection."""
+        with self._connection_lock:
+            self._close_connection()
+
+    def get_loaded_models(self) -> List[LoadedModel]:
+        """
+        Lists the models currently loaded by the server via /api/ps.
+
+        Raises the same errors as _get_json; returns an empty list for a non-2xx response.
+        """
+        status, data = self._get_json("/api/ps")
+        if data is None:
+            return []
+
+        models = []
+        for entry in data.get("models") or []:
+            size = int(entry.get("size") or 0)
+            vram = int(entry.get("size_vram") or 0)
+            details = entry.get("details") or {}
+            models.append(LoadedModel(
+                name=entry.get("name") or entry.get("model") or "unknown",
+                size_bytes=size,
+                vram_bytes=vram,
+                ram_bytes=max(0, size - vram),
+                parameter_size=details.get("parameter_size"),
+                quantization_level=details.get("quantization_level"),
+                expires_at=entry.get("expires_at"),
+            ))
+        return models
+
+    # =============================================================================
+    # Service Status
+    # =============================================================================
 
     def get_status(self) -> ServiceStatus:
         """
-        Gets the status of the native Ollama service by calling its API and ollama commands.
+        Gets the status of the native Ollama service from its HTTP API.
+
+        Uses /api/version for health and /api/ps for the loaded models, both over
+        the persistent connection, so no subprocesses are started.
         """
         status = "N/A"
         health = "unknown"
         ports = {}
         is_running = False
+        version = None
+        models: List[LoadedModel] = []
 
-        # First check if ollama command is available
-        if not shutil.which("ollama"):
-            return ServiceStatus(
-                name="ollama (Native)",
-                is_running=False,
-                status="Not installed",
-                health="unavailable",
-                ports={},
-                usage=ResourceUsage(),
-            )
-
-        # Check if ollama server is running via API
         try:
-            with urllib.request.urlopen(f"{self.base_url}/api/version", timeout=2) as response:
-                if 200 <= response.status < 300:
-                    health = "healthy"
-                    is_running = True
-                    ports = {'11434/tcp': 11434}
-                    
-                    # Get running models using ollama ps command
-                    try:
-                        result = subprocess.run(
-                            ["ollama", "ps"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if result.returncode == 0:
-                            # Parse ollama ps output to count running models
-                            lines = result.stdout.strip().split('\n')
-                            # Skip header line, count model lines
-                            model_count = max(0, len([line for line in lines[1:] if line.strip()]))
-                            if model_count > 0:
-                                status = f"Running ({model_count} model{'s' if model_count > 1 else ''})"
-                            else:
-                                status = "Running (no models loaded)"
-                        else:
-                            status = "Running"
-                    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                        status = "Running"
-                else:
-                    health = "unhealthy"
+            code, version_info = self._get_json("/api/version")
+            if version_info is not None:
+                health = "healthy"
+                is_running = True
+                ports = {'11434/tcp': 11434}
+                version = version_info.get("version")
+
+                try:
+                    models = self.get_loaded_models()
+                    if models:
+                        status = f"Running ({len(models)} model{'s' if len(models) > 1 else ''})"
+                    else:
+                        status = "Running (no models loaded)"
+                except (OSError, http.client.HTTPException, ValueError) as e:
+                    log.debug(f"Could not list loaded Ollama models: {e}")
+                    status = "Running"
+            else:
+                health = "unhealthy"
 
-        except (urllib.error.URLError, socket.timeout, ConnectionRefusedError):
+        except (OSError, http.client.HTTPException):
+            # Only distinguish "not installed" once the server proved unreachable
+            if not shutil.which("ollama"):
+                return ServiceStatus(
+                    name="ollama (Native)",
+                    is_running=False,
+                    status="Not installed",
+                    health="unavailable",
+                    ports={},
+                    usage=ResourceUsage(),
+                )
             health = "unhealthy"
             is_running = False
-        except json.JSONDecodeError:
+        except ValueError:
             log.warning("Could not parse JSON response from native Ollama API.", exc_info=True)
             health = "unhealthy"
 
@@ -86,32 +170,16 @@ class OllamaApiClient:
             health=health,
             ports=ports,
             usage=ResourceUsage(),  # Native API does not provide usage stats
+            version=version,
+            models=models,
         )
 
     def is_service_running(self) -> bool:
-        """Check if the native Ollama service is running."""
-        # Check if ollama command is available first
-        if not shutil.which("ollama"):
-            return False
-            
-        # Try process check first (fastest)
-        try:
-            result = subprocess.run(
-                ["pgrep", "-f", "ollama serve"],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
-            if result.returncode == 0:
-                return True
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-            pass
-        
-        # Fall back to API check
+        """Check if the native Ollama service is running by querying its API."""
         try:
-            with urllib.request.urlopen(f"{self.base_url}/api/version", timeout=2) as response:
-                return 200 <= response.status < 300
-        except (urllib.error.URLError, socket.timeout, ConnectionRefusedError):
+            code, _ = self._get_json("/api/version")
+            return 200 <= code < 300
+        except (OSError, http.client.HTTPException, ValueError):
             return False
 
     def start_service(self) -> bool:
@@ -37,6 +37,17 @@ class ResourceUsage(BaseModel):
     memory_mb: Optional[float] = None
 
 
+class LoadedModel(BaseModel):
+    """A model currently loaded by a native Ollama server, as reported by /api/ps."""
+    name: str
+    size_bytes: int = 0
+    vram_bytes: int = 0
+    ram_bytes: int = 0
+    parameter_size: Optional[str] = None
+    quantization_level: Optional[str] = None
+    expires_at: Optional[str] = None
+
+
 class ServiceStatus(BaseModel):
     name: str
     is_running: bool
@@ -44,6 +55,9 @@ class ServiceStatus(BaseModel):
     health: Optional[str] = None
     ports: Dict[str, Optional[int]] = Field(default_factory=dict)
     usage: ResourceUsage = Field(default_factory=ResourceUsage)
+    latency_ms: Optional[float] = None
+    version: Optional[str] = None
+    models: List[LoadedModel] = Field(default_factory=list)
 
 
 class ExtensionStatus(ServiceStatus):
@@ -55,6 +69,17 @@ class StackStatus(BaseModel):
     extensions: List[ExtensionStatus]
 
 
+class ContainerState(BaseModel):
+    """Tracked state of a single stack container, kept current from Docker events."""
+    id: str
+    name: str
+    component: Optional[str] = None
+    status: str = "created"
+    health: Optional[str] = None
+    # Whether the container (or its image) defines a healthcheck; None until known
+    has_healthcheck: Optional[bool] = None
+
+
 class EnvironmentCheck(BaseModel):
     name: str
     passed: bool
@@ -72,8 +97,143 @@ class BackupConfig(BaseModel):
     include_config: bool = True
     include_extensions: bool = True
     compression: bool = True
+    codec: Literal["none", "gzip", "gzip-mt", "zstd", "lz4"] = "gzip"
+    compression_level: Optional[int] = None
+    compression_threads: int = Field(default=0, ge=0)
+    adaptive_compression: bool = False
+    verify_after_backup: bool = False
     encryption: bool = False
     exclude_patterns: List[str] = Field(default_factory=list)
+    default_excludes: bool = True
+    max_workers: int = Field(default=4, ge=1)
+    deduplicate_blobs: bool = False
+    blob_store: Optional[str] = None
+    online: bool = False
+    rate_limit_mb: Optional[float] = Field(default=None, gt=0)
+    nice: Optional[int] = Field(default=None, ge=0, le=19)
+    ionice: Optional[Literal["idle", "best-effort"]] = None
+    helper_cpu_shares: Optional[int] = Field(default=None, ge=2)
+    helper_blkio_weight: Optional[int] = Field(default=None, ge=10, le=1000)
+
+
+class BlobRef(BaseModel):
+    """A model blob stored once in the shared blob store and referenced by a backup."""
+    path: str
+    digest: str
+    size: int
+    mode: int = 0o644
+    uid: int = 0
+    gid: int = 0
+    mtime: float = 0
+
+
+class VolumeBackupStats(BaseModel):
+    """Timing for one volume archive in a backup."""
+    name: str
+    archive: str
+    size_bytes: int = 0
+    source_bytes: int = 0
+    duration_seconds: float = 0.0
+    throughput_bytes_per_sec: Optional[int] = None
+    blob_count: int = 0
+    new_blob_count: int = 0
+    deduplicated_bytes: int = 0
+    compressed_files: int = 0
+    stored_files: int = 0
+    stored_bytes: int = 0
+    excluded_files: int = 0
+    excluded_bytes: int = 0
+    excluded_paths: List[str] = Field(default_factory=list)
+    sha256: Optional[str] = None
+    resumed_bytes: int = 0
+    paused_containers: List[str] = Field(default_factory=list)
+    pause_seconds: Optional[float] = None
+    throttled_seconds: float = 0.0
+
+
+class ArchiveChunk(BaseModel):
+    """An independently compressed, checkpointed piece of a volume archive."""
+    members: int
+    last_member: str
+    tar_offset: int
+    size: int
+    sha256: str
+
+
+class VolumeCheckpoint(BaseModel):
+    """Progress of one volume archive in a directory backup."""
+    name: str
+    archive: str
+    complete: bool = False
+    chunks: List[ArchiveChunk] = Field(default_factory=list)
+    stats: Optional[VolumeBackupStats] = None
+    blob_refs: List[BlobRef] = Field(default_factory=list)
+
+
+class BackupCheckpointState(BaseModel):
+    """Checkpoint file of a directory backup, removed once the backup completes."""
+    backup_id: str
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    backup_config: BackupConfig
+    volumes: Dict[str, VolumeCheckpoint] = Field(default_factory=dict)
+
+
+class VolumeRestoreStats(BaseModel):
+    """Timing for one volume restored from a backup archive."""
+    name: str
+    archive: str
+    size_bytes: int = 0
+    restored_bytes: int = 0
+    duration_seconds: float = 0.0
+    throughput_bytes_per_sec: Optional[int] = None
+    blob_count: int = 0
+    paths: List[str] = Field(default_factory=list)
+    restored_members: int = 0
+
+
+class CodecBenchmark(BaseModel):
+    """Compression ratio and throughput of one codec on a sample of volume data."""
+    volume: Optional[str] = None
+    codec: str
+    level: Optional[int] = None
+    threads: int = 1
+    sample_bytes: int
+    compressed_bytes: int
+    ratio: float
+    compress_mb_per_sec: Optional[float] = None
+    decompress_mb_per_sec: Optional[float] = None
+
+
+class FileDigest(BaseModel):
+    """SHA-256 of one backup file, by path relative to the backup directory."""
+    path: str
+    size: int
+    sha256: str
+
+
+class BackupCatalogEntry(BaseModel):
+    """One backup in the backup catalog, enough to list and prune it without reading its manifest."""
+    backup_id: str
+    created_at: datetime
+    path: str
+    size_bytes: Optional[int] = None
+    volumes: List[str] = Field(default_factory=list)
+    codec: str = "gzip"
+    checksum: Optional[str] = None
+    files: List[FileDigest] = Field(default_factory=list)
+    blob_store: Optional[str] = None
+    blob_digests: List[str] = Field(default_factory=list)
+    description: Optional[str] = None
+
+
+class BackupPruneReport(BaseModel):
+    """Outcome of applying a retention policy to the backup catalog."""
+    kept: List[BackupCatalogEntry] = Field(default_factory=list)
+    removed: List[BackupCatalogEntry] = Field(default_factory=list)
+    reclaimed_blobs: int = 0
+    reclaimed_bytes: int = 0
+    dry_run: bool = False
 
 
 class BackupManifest(BaseModel):
@@ -85,8 +245,18 @@ class BackupManifest(BaseModel):
     platform: str
     backup_config: BackupConfig
     volumes: List[str] = Field(default_factory=list)
+    codec: str = "gzip"
+    compression_level: Optional[int] = None
+    adaptive_compression: bool = False
+    stream_codec: Optional[str] = None
+    exclude_patterns: List[str] = Field(default_factory=list)
+    excluded_bytes: int = 0
+    volume_stats: List[VolumeBackupStats] = Field(default_factory=list)
+    blob_store: Optional[str] = None
+    volume_blobs: Dict[str, List[BlobRef]] = Field(default_factory=dict)
     config_files: List[str] = Field(default_factory=list)
     extensions: List[str] = Field(default_factory=list)
+    files: List[FileDigest] = Field(default_factory=list)
     checksum: Optional[str] = None
     size_bytes: Optional[int] = None
     description: Optional[str] = None
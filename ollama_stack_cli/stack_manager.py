@@ -4,18 +4,37 @@ import socket
 import urllib.request
 import urllib.error
 import urllib.parse
-import docker
 import secrets
 import string
+import time
 import typer
-from .docker_client import DockerClient
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from .docker_client import DockerClient, get_docker_info
 from .ollama_api_client import OllamaApiClient
-from .schemas import AppConfig, StackStatus, CheckReport, ServiceStatus, EnvironmentCheck, PlatformConfig, BackupConfig, BackupManifest
+from .stack_state import StackStateTracker
+from .stack_snapshot import StackSnapshot, snapshot_operation
+from .status_server import StatusCache
+from .blob_store import BlobStore
+from .backup_checkpoint import CHECKPOINT_FILE, BackupCheckpoint
+from .backup_catalog import BackupCatalog, catalog_entry, retained_backups
+from .throttle import BackupThrottle
+from .volume_archive import DEFAULT_EXCLUDE_PATTERNS
+from .schemas import AppConfig, StackStatus, CheckReport, ServiceStatus, EnvironmentCheck, PlatformConfig, BackupConfig, BackupManifest, CodecBenchmark, FileDigest, BackupCatalogEntry, BackupPruneReport, VolumeBackupStats
 from .display import Display
-from typing import Optional, List
+from typing import BinaryIO, Optional, List, Dict, Set, Tuple
 from pathlib import Path
 import os
-from .config import get_default_config_dir, get_default_config_file, get_default_env_file, save_config
+from .config import (
+    get_default_config_dir,
+    get_default_config_file,
+    get_default_env_file,
+    save_config,
+    docker_fingerprint,
+    load_platform_cache,
+    save_platform_cache,
+    invalidate_platform_cache,
+)
 
 log = logging.getLogger(__name__)
 
@@ -32,6 +51,10 @@ class StackManager:
         "mcp_proxy": "http://localhost:8200",
     }
 
+    # Upper bound on concurrent HTTP/TCP probes so large stacks don't open
+    # an unbounded number of sockets at once
+    HEALTH_CHECK_MAX_WORKERS = 8
+
     def __init__(self, config: AppConfig, display: Display):
         self.config = config
         self.display = display
@@ -44,10 +67,16 @@ class StackManager:
         self.docker_client = DockerClient(config, display)
         self.ollama_api_client = OllamaApiClient(display)
 
+        # Active per-operation snapshot; see stack_snapshot()
+        self._snapshot: Optional[StackSnapshot] = None
+
     def detect_platform(self) -> str:
         """
         Detects the current platform (apple, nvidia, or cpu).
         Moved from DockerClient to centralize platform-specific logic.
+
+        The Docker-based result is cached in the config directory so hot
+        commands skip the daemon round-trip; see refresh_platform().
         """
         system = platform.system()
         machine = platform.machine()
@@ -55,19 +84,53 @@ class StackManager:
         if system == "Darwin" and machine == "arm64":
             log.info("Apple Silicon platform detected.")
             return "apple"
-        
-        # For NVIDIA detection, we need to check Docker info
+
+        cached = load_platform_cache()
+        if cached:
+            log.debug(f"Using cached platform detection: {cached['platform']}")
+            return cached["platform"]
+
+        # For NVIDIA detection, we need to check Docker info. The response is
+        # cached process-wide and reused by DockerClient.
         try:
-            client = docker.from_env()
-            info = client.info()
-            if info.get("Runtimes", {}).get("nvidia"):
-                log.info("NVIDIA GPU platform detected.")
-                return "nvidia"
+            info = get_docker_info()
         except Exception:
             log.warning("Could not get Docker info to check for NVIDIA runtime.")
+            log.info("Defaulting to CPU platform.")
+            # Not cached: the daemon may simply be down right now
+            return "cpu"
+
+        if info.get("Runtimes", {}).get("nvidia"):
+            log.info("NVIDIA GPU platform detected.")
+            detected = "nvidia"
+        else:
+            log.info("Defaulting to CPU platform.")
+            detected = "cpu"
+        save_platform_cache(detected, docker_fingerprint(info))
+        return detected
 
-        log.info("Defaulting to CPU platform.")
-        return "cpu"
+    def refresh_platform(self) -> str:
+        """
+        Discards the cached platform, detects it again and reapplies the
+        platform-specific service configuration.
+        """
+        invalidate_platform_cache()
+        self.platform = self.detect_platform()
+        self.configure_services_for_platform()
+        return self.platform
+
+    def _revalidate_platform_cache(self) -> None:
+        """Re-detects the platform if the daemon no longer matches the cached fingerprint."""
+        cached = load_platform_cache()
+        if not cached:
+            return
+        try:
+            fingerprint = docker_fingerprint(get_docker_info())
+        except Exception:
+            return
+        if cached.get("fingerprint") != fingerprint:
+            log.info("Docker daemon changed since the platform was detected; detecting it again.")
+            self.refresh_platform()
 
     def configure_services_for_platform(self):
         """
@@ -103,6 +166,13 @@ class StackManager:
     def run_environment_checks(self, fix: bool = False) -> CheckReport:
         """Run comprehensive environment checks by delegating to appropriate clients."""
         log.debug("Running comprehensive environment checks...")
+
+        # --fix always starts from a fresh detection; a plain check only
+        # re-detects when the daemon fingerprint has changed
+        if fix:
+            self.refresh_platform()
+        else:
+            self._revalidate_platform_cache()
         
         # Delegate environment checks to Docker client
         report = self.docker_client.run_environment_checks(fix=fix, platform=self.platform)
@@ -174,6 +244,8 @@ class StackManager:
             # Save the configuration
             save_config(self.display, app_config, config_file, env_file)
             log.info("Created default configuration files")
+            # A fresh install re-detects the platform and seeds the cache
+            self.refresh_platform()
             # Log success message
             log.info("Configuration files created successfully!")
             # Run environment checks to validate the setup
@@ -214,8 +286,41 @@ class StackManager:
     # Service Management Delegation
     # =============================================================================
 
+    @contextmanager
+    def stack_snapshot(self, operation: str):
+        """
+        Scope a StackSnapshot to one orchestration run.
+
+        While the scope is active, stack state queries are memoized and only
+        re-issued after a mutation invalidates them. Nested scopes reuse the
+        outer snapshot, so a command can span several StackManager calls.
+        """
+        if self._snapshot is not None:
+            yield self._snapshot
+            return
+        self._snapshot = StackSnapshot(operation)
+        try:
+            yield self._snapshot
+        finally:
+            log.debug(self._snapshot.summary())
+            self._snapshot = None
+
+    def _memoized(self, key, loader):
+        """Run a stack state query through the active snapshot, if any."""
+        if self._snapshot is None:
+            return loader()
+        return self._snapshot.get(key, loader)
+
+    def _invalidate_snapshot(self, reason: str) -> None:
+        """Discard memoized stack state after a mutation."""
+        if self._snapshot is not None:
+            self._snapshot.invalidate(reason)
+
     def is_stack_running(self) -> bool:
         """Check if any stack component (Docker containers or native services) are running."""
+        return self._memoized("stack_running", self._query_stack_running)
+
+    def _query_stack_running(self) -> bool:
         # Check Docker containers
         docker_running = self.docker_client.is_stack_running()
         
@@ -229,50 +334,75 @@ class StackManager:
         
         return docker_running or native_running
     
-    def get_stack_status(self, extensions_only: bool = False) -> StackStatus:
-        """Get comprehensive status for all stack components."""
+    def get_stack_status(self, extensions_only: bool = False, include_usage: bool = True) -> StackStatus:
+        """
+        Get comprehensive status for all stack components.
+        
+        Native service status calls run on a worker pool alongside the Docker
+        status gathering, so the total latency is bounded by the slowest probe
+        rather than the sum of all of them.
+        
+        Args:
+            extensions_only: Only report extension status
+            include_usage: Sample container CPU/memory stats. Watch mode turns
+                this off and overlays usage from a ContainerStatsMonitor instead.
+        """
         core_services = []
         extensions = []  # TODO: Implement actual extensions support
         
         if not extensions_only:
-            # Get status for Docker services
             docker_services = [name for name, conf in self.config.services.items() if conf.type == 'docker']
-            if docker_services:
-                log.debug(f"Getting status for Docker services: {docker_services}")
-                try:
-                    core_services.extend(self.get_docker_services_status(docker_services))
-                except Exception as e:
-                    log.error(f"Failed to get Docker services status: {e}")
-                    # Add failed service entries
-                    for service_name in docker_services:
+            native_services = [name for name, conf in self.config.services.items() if conf.type == 'native-api']
+            
+            with ThreadPoolExecutor(max_workers=self.HEALTH_CHECK_MAX_WORKERS) as executor:
+                # Kick off native service probes first so they overlap with Docker work
+                native_futures = {}
+                for service_name in native_services:
+                    log.debug(f"Getting status for native service: {service_name}")
+                    native_futures[service_name] = executor.submit(self._timed_native_service_status, service_name)
+                
+                # Get status for Docker services
+                if docker_services:
+                    log.debug(f"Getting status for Docker services: {docker_services}")
+                    try:
+                        core_services.extend(self.get_docker_services_status(docker_services, include_usage=include_usage))
+                    except Exception as e:
+                        log.error(f"Failed to get Docker services status: {e}")
+                        # Add failed service entries
+                        for service_name in docker_services:
+                            core_services.append(ServiceStatus(
+                                name=service_name,
+                                is_running=False,
+                                status="error",
+                                health="error"
+                            ))
+                
+                # Collect native service results in configuration order
+                for service_name, future in native_futures.items():
+                    try:
+                        core_services.append(future.result())
+                    except Exception as e:
+                        log.error(f"Failed to get status for native service {service_name}: {e}")
                         core_services.append(ServiceStatus(
-                            name=service_name,
+                            name=f"{service_name} (Native)",
                             is_running=False,
                             status="error",
                             health="error"
                         ))
-            
-            # Get status for native services
-            native_services = [name for name, conf in self.config.services.items() if conf.type == 'native-api']
-            for service_name in native_services:
-                log.debug(f"Getting status for native service: {service_name}")
-                try:
-                    service_status = self.get_native_service_status(service_name)
-                    core_services.append(service_status)
-                except Exception as e:
-                    log.error(f"Failed to get status for native service {service_name}: {e}")
-                    core_services.append(ServiceStatus(
-                        name=f"{service_name} (Native)",
-                        is_running=False,
-                        status="error",
-                        health="error"
-                    ))
         
         # TODO: Add actual extensions support here
         # For now, extensions remain empty
         
         return StackStatus(core_services=core_services, extensions=extensions)
     
+    def _timed_native_service_status(self, service_name: str) -> ServiceStatus:
+        """Get native service status and record how long the probe took."""
+        started = time.perf_counter()
+        service_status = self.get_native_service_status(service_name)
+        if service_status.latency_ms is None:
+            service_status.latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        return service_status
+    
     def get_native_service_status(self, service_name: str) -> ServiceStatus:
         """Get status for a native service - generic handler."""
         if service_name == "ollama":
@@ -329,31 +459,104 @@ class StackManager:
     def start_docker_services(self, services: List[str]):
         """Start specific Docker services."""
         compose_files = self.get_compose_files()
-        return self.docker_client.start_services(services, compose_files)
+        try:
+            return self.docker_client.start_services(services, compose_files)
+        finally:
+            self._invalidate_snapshot("started Docker services")
 
     def stop_docker_services(self):
         """Stop Docker services."""
         compose_files = self.get_compose_files()
-        return self.docker_client.stop_services(compose_files)
+        try:
+            return self.docker_client.stop_services(compose_files)
+        finally:
+            self._invalidate_snapshot("stopped Docker services")
 
-    def get_docker_services_status(self, service_names: List[str]) -> List[ServiceStatus]:
+    def get_docker_services_status(self, service_names: List[str], include_usage: bool = True) -> List[ServiceStatus]:
         """Get status for Docker services with unified health checks."""
         # Get container status from Docker client (without health checks)
-        statuses = self.docker_client.get_container_status(service_names)
+        statuses = self.docker_client.get_container_status(service_names, include_usage=include_usage)
+        
+        # Probe all running services concurrently with the unified health check system
+        running = [status.name for status in statuses if status.is_running]
+        results = self.check_services_health(running)
         
-        # Apply unified health checks for running services
         for status in statuses:
             if status.is_running:
-                # Use our unified health check system
-                health = self.check_service_health(status.name)
                 # Update the status with the health check result
-                status.health = health
+                status.health, status.latency_ms = results[status.name]
             else:
                 # If not running, health is definitely unhealthy
                 status.health = "unhealthy"
         
         return statuses
 
+    def create_stats_monitor(self):
+        """Create a streaming stats monitor for live status views."""
+        return self.docker_client.create_stats_monitor()
+
+    def apply_live_usage(self, stack_status: StackStatus, stats_monitor) -> StackStatus:
+        """
+        Overlay the latest streamed resource usage onto a StackStatus.
+        
+        Makes no Docker API calls; services without a sample yet keep their
+        current usage.
+        """
+        for service in stack_status.core_services:
+            usage = stats_monitor.usage(service.name)
+            if usage is not None and service.is_running:
+                service.usage = usage
+        return stack_status
+
+    def create_state_tracker(self) -> StackStateTracker:
+        """Create an event-driven tracker for the stack's Docker resources."""
+        return StackStateTracker(self.docker_client, self.config.project_name)
+
+    def create_status_cache(self, interval: float = 5, health_interval: float = 15, extensions_only: bool = False) -> StatusCache:
+        """Create a continuously refreshed status cache for the `serve` daemon."""
+        return StatusCache(self, interval=interval, health_interval=health_interval, extensions_only=extensions_only)
+
+    def wait_for_services_healthy(self, service_names: List[str], timeout: float = 120.0) -> bool:
+        """
+        Block until Docker services are running and healthy.
+        
+        Reacts to start/die/health_status events from the Docker events stream
+        rather than polling the container list.
+        
+        Args:
+            service_names: Docker services to wait for
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            bool: True if all services became ready within the timeout
+        """
+        tracker = self.create_state_tracker()
+        if not tracker.start():
+            log.warning("Could not subscribe to Docker events - unable to wait for service health")
+            return False
+        
+        try:
+            if tracker.components_ready(service_names):
+                log.info("All services are healthy")
+                return True
+            
+            log.info(f"Waiting up to {timeout:.0f}s for services to become healthy: {', '.join(service_names)}")
+            if tracker.wait_for_components_ready(service_names, timeout=timeout):
+                log.info("All services are healthy")
+                return True
+            
+            not_ready = []
+            for name in service_names:
+                state = tracker.get_component(name)
+                if state is None:
+                    not_ready.append(f"{name} (not found)")
+                elif not tracker.components_ready([name]):
+                    not_ready.append(f"{name} ({state.status}{', ' + state.health if state.health else ''})")
+            log.warning(f"Timed out waiting for services: {', '.join(not_ready)}")
+            return False
+        finally:
+            tracker.stop()
+
     def stream_docker_logs(self, service_or_extension: Optional[str] = None, follow: bool = False, tail: Optional[int] = None, level: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None):
         """Stream logs from Docker containers."""
         compose_files = self.get_compose_files()
@@ -378,6 +581,7 @@ class StackManager:
 
     def start_native_services(self, services: List[str]) -> bool:
         """Start native services."""
+        self._invalidate_snapshot("starting native services")
         success = True
         for service_name in services:
             if service_name == "ollama":
@@ -389,6 +593,7 @@ class StackManager:
 
     def stop_native_services(self, services: List[str]) -> bool:
         """Stop native services."""
+        self._invalidate_snapshot("stopping native services")
         success = True
         for service_name in services:
             if service_name == "ollama":
@@ -457,6 +662,41 @@ class StackManager:
             log.debug(f"TCP connectivity check failed for {service_name} on port {port}")
             return "unhealthy"
 
+    def check_services_health(self, service_names: List[str]) -> Dict[str, Tuple[str, Optional[float]]]:
+        """
+        Run check_service_health for several services concurrently.
+        
+        Probes run on a bounded worker pool, so the total time is close to the
+        slowest single probe instead of the sum of every HTTP timeout and TCP
+        fallback.
+        
+        Args:
+            service_names: Names of services to check
+            
+        Returns:
+            Dict mapping service name to a (health, latency_ms) tuple
+        """
+        if not service_names:
+            return {}
+        
+        max_workers = min(self.HEALTH_CHECK_MAX_WORKERS, len(service_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(self._timed_health_check, name) for name in service_names}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _timed_health_check(self, service_name: str) -> Tuple[str, Optional[float]]:
+        """Run a single health check and measure its latency in milliseconds."""
+        started = time.perf_counter()
+        try:
+            health = self.check_service_health(service_name)
+        except Exception as e:
+            log.debug(f"Health check raised for {service_name}: {e}")
+            health = "unknown"
+        if health == "unknown" and service_name not in self.HEALTH_CHECK_URLS:
+            # Nothing was probed, so there is no meaningful latency to report
+            return health, None
+        return health, round((time.perf_counter() - started) * 1000, 2)
+
     def _check_tcp_connectivity(self, host: str, port: int, timeout: float = 2.0) -> bool:
         """
         Test TCP connectivity to a host and port.
@@ -481,6 +721,7 @@ class StackManager:
     # Update Orchestration
     # =============================================================================
 
+    @snapshot_operation("update")
     def update_stack(self, services_only: bool = False, extensions_only: bool = False, force_restart: bool = False, called_from_start_restart: bool = False) -> bool:
         """
         Orchestrates unified update flow for both services and extensions.
@@ -615,6 +856,12 @@ class StackManager:
         Returns:
             dict: Dictionary with keys 'containers', 'volumes', 'networks' containing lists of resources
         """
+        return self._memoized(
+            ("resources", label_key, label_value),
+            lambda: self._query_resources_by_label(label_key, label_value),
+        )
+
+    def _query_resources_by_label(self, label_key: str, label_value: Optional[str] = None) -> dict:
         if not self.docker_client.client:
             log.warning("Docker client not available")
             return {"containers": [], "volumes": [], "networks": []}
@@ -731,6 +978,7 @@ class StackManager:
                             log.warning(f"Failed to remove volume {volume.name}: {e}")
             
             if cleaned_count > 0:
+                self._invalidate_snapshot("removed stack resources")
                 log.info(f"Cleanup completed - removed {cleaned_count} resources")
             else:
                 log.info("No resources found for cleanup")
@@ -741,6 +989,7 @@ class StackManager:
             log.error(f"Resource cleanup failed: {e}")
             return False
 
+    @snapshot_operation("uninstall")
     def uninstall_stack(self, remove_volumes: bool = False, remove_config: bool = False, remove_images: bool = False, force: bool = False) -> bool:
         """
         Clean up all stack resources (containers, networks, images, and optionally volumes/config).
@@ -791,18 +1040,13 @@ class StackManager:
                 total_resources += len(resources["volumes"])
             if remove_images:
                 # Count images that would be removed (images used by stack containers)
-                if self.docker_client.client:
-                    try:
-                        stack_containers = self.docker_client.client.containers.list(
-                            all=True, 
-                            filters={"label": "ollama-stack.component"}
-                        )
-                        image_ids = set()
-                        for container in stack_containers:
-                            image_ids.add(container.image.id)
-                        total_resources += len(image_ids)
-                    except Exception:
-                        pass
+                try:
+                    image_ids = set()
+                    for container in resources["containers"]:
+                        image_ids.add(container.image.id)
+                    total_resources += len(image_ids)
+                except Exception:
+                    pass
             
             log.info(f"Found {len(resources['containers'])} containers, {len(resources['networks'])} networks, {len(resources['volumes'])} volumes")
             
@@ -835,23 +1079,23 @@ class StackManager:
             if remove_volumes and self.docker_client.client:
                 log.info("Ensuring all project containers are stopped and removed for volume removal...")
                 try:
-                    # Find all containers with our project label
-                    stack_containers = self.docker_client.client.containers.list(
-                        all=True, 
-                        filters={"label": "ollama-stack.component"}
-                    )
+                    # Find all containers with our project label (fresh if the stop above invalidated the snapshot)
+                    current = self.find_resources_by_label("ollama-stack.component")
+                    stack_containers = current["containers"]
                     
                     # Also find any containers that reference stack volumes (like backup containers)
                     project_name = self.config.project_name
-                    all_volumes = self.docker_client.client.volumes.list()
-                    stack_volume_names = [v.name for v in all_volumes if v.name.startswith(f"{project_name}_") or v.name == project_name]
+                    stack_volume_names = [v.name for v in current["volumes"] if v.name.startswith(f"{project_name}_") or v.name == project_name]
                     
                     volume_containers = []
                     for volume_name in stack_volume_names:
                         try:
-                            containers_using_volume = self.docker_client.client.containers.list(
-                                all=True,
-                                filters={"volume": volume_name}
+                            containers_using_volume = self._memoized(
+                                ("volume_users", volume_name),
+                                lambda volume_name=volume_name: self.docker_client.client.containers.list(
+                                    all=True,
+                                    filters={"volume": volume_name}
+                                ),
                             )
                             volume_containers.extend(containers_using_volume)
                         except Exception as e:
@@ -874,6 +1118,8 @@ class StackManager:
                             
                 except Exception as e:
                     log.warning(f"Failed to force stop/remove some containers: {e}")
+                finally:
+                    self._invalidate_snapshot("removed project containers")
             
             # Step 6: Remove containers and networks 
             log.info("Removing containers and networks...")
@@ -885,6 +1131,7 @@ class StackManager:
                 log.info("Removing Docker images...")
                 if not self.docker_client.remove_resources(remove_images=True, force=force):
                     log.warning("Failed to remove some Docker images")
+                self._invalidate_snapshot("removed Docker images")
             else:
                 log.info("Preserving Docker images (use --remove-images to remove)")
             
@@ -938,30 +1185,46 @@ class StackManager:
     # Backup and Migration Orchestration
     # =============================================================================
 
-    def create_backup(self, backup_dir: Path, backup_config: Optional[dict] = None) -> bool:
+    def create_backup(self, backup_dir: Path, backup_config: Optional[dict] = None, resume: bool = False) -> bool:
         """
         Orchestrate full backup workflow for the stack.
         
+        Progress is checkpointed in the backup directory as volume archives
+        are written (see backup_checkpoint), and the checkpoint is removed
+        once the backup completes.
+        
         Args:
             backup_dir: Directory to store the backup
             backup_config: Optional backup configuration (include_volumes, include_config, etc.)
+            resume: Continue the interrupted backup in backup_dir with the
+                configuration it was started with, keeping the volume archives
+                and chunks that still match their checkpointed digests
             
         Returns:
             bool: True if backup succeeded, False otherwise
         """
-        from .schemas import BackupConfig, BackupManifest
+        from .schemas import BackupConfig, BackupManifest, FileDigest
         import datetime
         import platform
         import json
         
         try:
+            checkpoint = None
+            if resume:
+                checkpoint = BackupCheckpoint.load(backup_dir)
+                if checkpoint is None:
+                    log.error(f"No backup checkpoint found in: {backup_dir}")
+                    return False
+                config = checkpoint.state.backup_config
+                log.info(f"Resuming backup {checkpoint.state.backup_id} started {checkpoint.state.created_at:%Y-%m-%d %H:%M:%S}")
             # Parse backup configuration
-            if backup_config:
+            elif backup_config:
                 config = BackupConfig(**backup_config)
             else:
                 config = BackupConfig()  # Use defaults
             
             log.info("Starting stack backup process...")
+            throttle = self._start_throttle(config)
             
             # Create backup directory structure
             backup_dir.mkdir(parents=True, exist_ok=True)
@@ -969,13 +1232,27 @@ class StackManager:
             config_dir = backup_dir / "config"
             extensions_dir = backup_dir / "extensions"
             
+            # --no-compress overrides the codec choice
+            codec = config.codec if config.compression else "none"
+            adaptive = config.adaptive_compression and codec != "none"
+            exclude_patterns = list(dict.fromkeys(
+                (DEFAULT_EXCLUDE_PATTERNS if config.default_excludes else []) + config.exclude_patterns
+            ))
+            
             # Initialize backup manifest
             manifest = BackupManifest(
-                stack_version="0.2.0",  # TODO: Get from actual version
-                cli_version="0.2.0",   # TODO: Get from actual version
+                **self._manifest_versions(),
                 platform=platform.system().lower(),
-                backup_config=config
+                backup_config=config,
+                codec=codec,
+                compression_level=config.compression_level,
+                adaptive_compression=adaptive,
+                exclude_patterns=exclude_patterns,
             )
+            if checkpoint is not None:
+                manifest.backup_id = checkpoint.state.backup_id
+            else:
+                checkpoint = BackupCheckpoint.create(backup_dir, manifest.backup_id, config)
             
             success = True
             
@@ -988,12 +1265,44 @@ class StackManager:
                 resources = self.find_resources_by_label("ollama-stack.component")
                 if resources["volumes"]:
                     volume_names = [vol.name for vol in resources["volumes"]]
-                    if self.docker_client.backup_volumes(volume_names, volumes_dir):
+                    volume_stats = []
+                    volume_blobs = {}
+                    blob_store = None
+                    if config.deduplicate_blobs:
+                        blob_store_path = self._blob_store_path(backup_dir, config.blob_store)
+                        blob_store = BlobStore(blob_store_path)
+                        manifest.blob_store = self._relative_blob_store_path(blob_store_path, backup_dir)
+                        log.info(f"Deduplicating model blobs into: {blob_store_path}")
+                    if self.docker_client.backup_volumes(
+                        volume_names, volumes_dir, max_workers=config.max_workers, volume_stats=volume_stats,
+                        blob_store=blob_store, volume_blobs=volume_blobs, codec=codec,
+                        compression_level=config.compression_level, compression_threads=config.compression_threads,
+                        adaptive=adaptive, exclude_patterns=exclude_patterns, checkpoint=checkpoint,
+                        online=config.online, throttle=throttle,
+                    ):
                         manifest.volumes = volume_names
                         log.info(f"Successfully backed up {len(volume_names)} volumes")
                     else:
                         log.error("Failed to backup some volumes")
                         success = False
+                    manifest.volume_stats = volume_stats
+                    manifest.volume_blobs = volume_blobs
+                    manifest.excluded_bytes = sum(stats.excluded_bytes for stats in volume_stats)
+                    resumed_bytes = sum(stats.resumed_bytes for stats in volume_stats)
+                    if resumed_bytes:
+                        log.info(f"Kept {resumed_bytes / (1024 * 1024):.1f} MB of volume archives from the interrupted backup")
+                    if manifest.excluded_bytes:
+                        log.info(f"Excluded {manifest.excluded_bytes / (1024 * 1024):.1f} MB matching exclude patterns")
+                    self._log_writer_pauses(volume_stats)
+                    throttled = sum(stats.throttled_seconds for stats in volume_stats)
+                    if throttled:
+                        log.info(f"Volume reads waited {throttled:.1f}s in total on the rate limit")
+                    for stats in volume_stats:
+                        if stats.throughput_bytes_per_sec:
+                            log.debug(
+                                f"Volume {stats.name}: {stats.size_bytes / (1024 * 1024):.1f} MB in "
+                                f"{stats.duration_seconds:.1f}s ({stats.throughput_bytes_per_sec / (1024 * 1024):.1f} MB/s)"
+                            )
                 else:
                     log.info("No volumes found to backup")
             
@@ -1039,15 +1348,35 @@ class StackManager:
             
             # Step 5: Calculate backup size and checksum
             log.info("Calculating backup metadata...")
-            total_size = 0
+            from .integrity import backup_file_paths, digest_files, merkle_root
+            started = time.perf_counter()
+            paths = backup_file_paths(manifest)
+            # Volume archives were hashed and counted as they were written; only the rest is read here
+            streamed = {
+                digest.path: digest
+                for digest in (
+                    FileDigest(path=f"volumes/{stats.archive}", size=stats.size_bytes, sha256=stats.sha256)
+                    for stats in manifest.volume_stats if stats.sha256
+                )
+                if digest.path in paths
+            }
+            hashed = digest_files(backup_dir, [path for path in paths if path not in streamed])
+            manifest.files = sorted([*streamed.values(), *hashed], key=lambda digest: digest.path)
+            manifest.checksum = merkle_root(manifest.files)
+            log.debug(
+                f"Hashed {len(hashed)} backup files in {time.perf_counter() - started:.1f}s "
+                f"({len(streamed)} volume archives hashed while written)"
+            )
+            
+            total_size = sum(digest.size for digest in manifest.files)
             try:
-                for file_path in backup_dir.rglob("*"):
-                    if file_path.is_file():
-                        total_size += file_path.stat().st_size
-                manifest.size_bytes = total_size
-                log.debug(f"Backup size: {total_size} bytes")
+                total_size += os.path.getsize(state_file)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 log.warning(f"Failed to calculate backup size: {e}")
+            manifest.size_bytes = total_size
+            log.debug(f"Backup size: {total_size} bytes")
             
             # Step 6: Create backup manifest
             manifest_file = backup_dir / "backup_manifest.json"
@@ -1059,10 +1388,16 @@ class StackManager:
                 log.error(f"Failed to create backup manifest: {e}")
                 success = False
             
-            # Step 7: Verify backup integrity
-            log.info("Verifying backup integrity...")
+            # Step 7: Verify backup integrity. The digests were taken from the bytes
+            # as they were written, so files are only re-read when asked to
+            if config.verify_after_backup:
+                log.info("Verifying backup integrity (re-reading all files)...")
+            else:
+                log.info("Verifying backup integrity...")
             from .config import validate_backup_manifest
-            is_valid, verified_manifest = validate_backup_manifest(manifest_file, backup_dir)
+            is_valid, verified_manifest = validate_backup_manifest(
+                manifest_file, backup_dir, verify_contents=config.verify_after_backup
+            )
             if not is_valid:
                 log.error("Backup integrity verification failed")
                 success = False
@@ -1070,6 +1405,8 @@ class StackManager:
                 log.info("Backup integrity verification passed")
             
             if success:
+                checkpoint.remove()
+                self._catalog_backup(manifest, backup_dir)
                 log.info(f"Backup completed successfully in: {backup_dir}")
                 log.info(f"Backup ID: {manifest.backup_id}")
                 if manifest.size_bytes:
@@ -1077,6 +1414,7 @@ class StackManager:
                     log.info(f"Backup size: {size_mb:.1f} MB")
             else:
                 log.error("Backup completed with errors")
+                log.info(f"To continue it, run: ollama-stack backup --resume {backup_dir}")
                 
             return success
             
@@ -1084,13 +1422,507 @@ class StackManager:
             log.error(f"Backup creation failed: {e}")
             return False
 
-    def restore_from_backup(self, backup_dir: Path, validate_only: bool = False) -> bool:
+    def create_backup_stream(self, output: BinaryIO, backup_config: Optional[dict] = None) -> bool:
+        """
+        Write a backup of the stack as a single stream.
+        
+        The stream carries the same files as a backup directory, framed by a
+        header and a trailer manifest (see backup_stream), and is written in
+        one pass with constant memory, so it can go to stdout, a pipe or a
+        file without first being staged on disk.
+        
+        Args:
+            output: Binary file object to write the stream to (left open)
+            backup_config: Optional backup configuration (include_volumes, include_config, etc.)
+            
+        Returns:
+            bool: True if the complete stream, trailer included, was written
+        """
+        from .backup_stream import STREAM_HEADER, STREAM_TRAILER, BackupStreamWriter
+        from .integrity import merkle_root
+        import platform
+        import json
+        import tempfile
+        
+        try:
+            config = BackupConfig(**backup_config) if backup_config else BackupConfig()
+            
+            if config.deduplicate_blobs:
+                log.error("Model blob deduplication needs a backup directory and cannot be used with a backup stream")
+                return False
+            codec = config.codec if config.compression else "none"
+            if config.adaptive_compression:
+                log.warning(f"Adaptive compression does not apply to backup streams; the whole stream is compressed with {codec}")
+            exclude_patterns = list(dict.fromkeys(
+                (DEFAULT_EXCLUDE_PATTERNS if config.default_excludes else []) + config.exclude_patterns
+            ))
+            
+            # Volume archives inside the stream are plain tars; the stream itself is compressed
+            manifest = BackupManifest(
+                **self._manifest_versions(),
+                platform=platform.system().lower(),
+                backup_config=config,
+                codec="none",
+                compression_level=config.compression_level,
+                stream_codec=codec,
+                exclude_patterns=exclude_patterns,
+            )
+            volume_names = []
+            if config.include_volumes:
+                volume_names = [vol.name for vol in self.find_resources_by_label("ollama-stack.component")["volumes"]]
+                manifest.volumes = volume_names
+            if config.include_extensions and self.config.extensions.enabled:
+                manifest.extensions = self.config.extensions.enabled
+                for ext_name in manifest.extensions:
+                    log.warning(f"Extension backup not yet implemented for: {ext_name}")
+            
+            log.info(f"Starting streamed stack backup ({codec})...")
+            throttle = self._start_throttle(config)
+            started = time.perf_counter()
+            files = []
+            with BackupStreamWriter(output, codec, config.compression_level, config.compression_threads) as writer, \
+                    tempfile.TemporaryDirectory(prefix="ollama-stack-backup-") as staging:
+                staging_dir = Path(staging)
+                writer.add_bytes(STREAM_HEADER, json.dumps(manifest.model_dump(), indent=2, default=str).encode())
+                
+                if config.include_config:
+                    log.info("Backing up configuration files...")
+                    from .config import Config
+                    config_dir = staging_dir / "config"
+                    if not Config(self.display).export_configuration(config_dir):
+                        log.error("Failed to backup configuration files")
+                        return False
+                    for path in sorted(config_dir.iterdir()):
+                        files.append(writer.add_file(f"config/{path.name}", path))
+                        manifest.config_files.append(path.name)
+                
+                state_file = staging_dir / "stack_state.json"
+                if self.docker_client.export_stack_state(state_file):
+                    writer.add_file("stack_state.json", state_file)
+                else:
+                    log.warning("Failed to export stack state")
+                
+                if volume_names:
+                    volume_stats = []
+                    if not self.docker_client.backup_volumes_to_stream(
+                        volume_names, writer, volume_stats=volume_stats, exclude_patterns=exclude_patterns,
+                        online=config.online, throttle=throttle,
+                    ):
+                        log.error("Failed to backup volumes - the stream is incomplete")
+                        return False
+                    manifest.volumes = [stats.name for stats in volume_stats]
+                    manifest.volume_stats = volume_stats
+                    manifest.excluded_bytes = sum(stats.excluded_bytes for stats in volume_stats)
+                    self._log_writer_pauses(volume_stats)
+                    files += [
+                        FileDigest(path=f"volumes/{stats.archive}", size=stats.size_bytes, sha256=stats.sha256)
+                        for stats in volume_stats
+                    ]
+                
+                manifest.files = sorted(files, key=lambda digest: digest.path)
+                manifest.checksum = merkle_root(manifest.files)
+                manifest.size_bytes = sum(digest.size for digest in manifest.files)
+                writer.add_bytes(STREAM_TRAILER, json.dumps(manifest.model_dump(), indent=2, default=str).encode())
+            
+            log.info(
+                f"Streamed backup completed: {len(manifest.volumes)} volumes, "
+                f"{manifest.size_bytes / (1024 * 1024):.1f} MB before compression in {time.perf_counter() - started:.1f}s"
+            )
+            log.info(f"Backup ID: {manifest.backup_id}")
+            return True
+            
+        except Exception as e:
+            log.error(f"Streamed backup failed: {e}")
+            return False
+
+    def restore_from_stream(self, source: BinaryIO, validate_only: bool = False) -> bool:
+        """
+        Restore the stack from a backup stream in a single pass.
+        
+        Volumes are restored as their archives arrive, hashed on the way
+        through; configuration files are held back and only applied once the
+        trailer manifest confirms every digest. A stream that is cut short or
+        does not match its trailer fails the restore (volumes already written
+        are left as restored, and the run should be repeated from a good
+        backup).
+        
+        Args:
+            source: Buffered binary file object positioned at the stream start
+            validate_only: If True, read and verify the stream without restoring
+            
+        Returns:
+            bool: True if the stream verified (and, unless validating, was restored)
+        """
+        from .backup_stream import STREAM_HEADER, STREAM_TRAILER, BackupStreamReader
+        from .compression import archive_name
+        from .config import import_configuration
+        from .integrity import HashingReader, merkle_root
+        import shutil
+        import tempfile
+        
+        try:
+            log.info("Reading backup stream...")
+            reader = BackupStreamReader(source)
+            entries = iter(reader)
+            name, contents = next(entries, (None, None))
+            if name != STREAM_HEADER:
+                log.error("Not a backup stream: it does not start with a backup header")
+                return False
+            header = BackupManifest.model_validate_json(contents.read())
+            log.info(f"Backup ID: {header.backup_id}")
+            log.info(f"Created: {header.created_at}")
+            log.info(f"Platform: {header.platform}")
+            
+            if not validate_only and not self._stop_stack_for_restore():
+                return False
+            
+            volumes_by_file = {f"volumes/{archive_name(volume, header.codec)}": volume for volume in header.volumes}
+            digests = {}
+            trailer = None
+            restored = True
+            with tempfile.TemporaryDirectory(prefix="ollama-stack-restore-") as staging:
+                config_dir = Path(staging) / "config"
+                config_dir.mkdir()
+                for name, contents in entries:
+                    if name == STREAM_TRAILER:
+                        trailer = BackupManifest.model_validate_json(contents.read())
+                        continue
+                    hashed = HashingReader(contents)
+                    volume = volumes_by_file.get(name)
+                    if volume is not None and not validate_only:
+                        ok, stats = self.docker_client.restore_volume_from_stream(volume, hashed)
+                        self._invalidate_snapshot("restored volume")
+                        restored = restored and ok
+                        if stats is not None and stats.throughput_bytes_per_sec:
+                            log.debug(
+                                f"Volume {stats.name}: {stats.restored_bytes / (1024 * 1024):.1f} MB in "
+                                f"{stats.duration_seconds:.1f}s ({stats.throughput_bytes_per_sec / (1024 * 1024):.1f} MB/s)"
+                            )
+                    elif name.startswith("config/"):
+                        with open(config_dir / Path(name).name, "wb") as out:
+                            shutil.copyfileobj(hashed, out)
+                    hashed.drain()
+                    digests[name] = hashed.digest(name)
+                
+                if trailer is None:
+                    log.error("Backup stream ended before its manifest - the backup is incomplete")
+                    return False
+                mismatched = sorted(d.path for d in trailer.files if digests.get(d.path) != d)
+                if mismatched or merkle_root(trailer.files) != trailer.checksum:
+                    log.error(f"Backup stream failed verification: {', '.join(mismatched) or 'manifest checksum mismatch'}")
+                    return False
+                log.info(f"Backup stream verified ({len(trailer.files)} files)")
+                
+                if validate_only:
+                    log.info("Validation-only mode - restore not performed")
+                    return True
+                if not restored:
+                    log.error("Failed to restore some volumes")
+                    return False
+                
+                if trailer.config_files:
+                    log.info("Restoring configuration files...")
+                    if not import_configuration(self.display, config_dir):
+                        log.error("Failed to restore configuration files")
+                        return False
+                    from .config import load_config
+                    self.config, _ = load_config(self.display)
+                    log.info("Configuration reloaded after restore")
+            
+            for ext_name in trailer.extensions:
+                log.warning(f"Extension restore not yet implemented for: {ext_name}")
+            
+            log.info(f"Restore completed successfully ({len(trailer.volumes)} volumes)")
+            log.info("You can now start the stack with: ollama-stack start")
+            return True
+            
+        except Exception as e:
+            log.error(f"Restore from stream failed: {e}")
+            return False
+
+    def _stop_stack_for_restore(self) -> bool:
+        """Stop running services before a restore overwrites their data."""
+        if not self.is_stack_running():
+            return True
+        
+        log.info("Stack is running - stopping services for restore...")
+        
+        docker_services = [name for name, conf in self.config.services.items() if conf.type == 'docker']
+        native_services = [name for name, conf in self.config.services.items() if conf.type == 'native-api']
+        
+        success = True
+        if docker_services and not self.stop_docker_services():
+            log.error("Failed to stop Docker services")
+            success = False
+        
+        if native_services and not self.stop_native_services(native_services):
+            log.error("Failed to stop native services")
+            success = False
+        
+        if not success:
+            log.error("Failed to stop services - cannot proceed with restore")
+        return success
+
+    def benchmark_compression(
+        self,
+        codecs: Optional[List[str]] = None,
+        sample_bytes: Optional[int] = None,
+        compression_threads: int = 0,
+    ) -> List[CodecBenchmark]:
+        """
+        Measure compression codecs on a sample of each stack volume.
+        
+        Reports ratio and MB/s per volume and codec, so a codec can be chosen
+        for data that compresses well (databases, configuration) separately
+        from data that does not (model weights).
+        
+        Args:
+            codecs: Codec names to measure (all installed codecs if None)
+            sample_bytes: Uncompressed bytes to sample per volume
+            compression_threads: Threads for multithreaded codecs (0 = one per CPU)
+            
+        Returns:
+            List[CodecBenchmark]: One result per volume and codec
+        """
+        resources = self.find_resources_by_label("ollama-stack.component")
+        volume_names = [vol.name for vol in resources["volumes"]]
+        if not volume_names:
+            log.info("No volumes found to benchmark")
+            return []
+        return self.docker_client.benchmark_volumes(
+            volume_names, codecs=codecs, sample_bytes=sample_bytes, compression_threads=compression_threads
+        )
+
+    # =============================================================================
+    # Backup Catalog and Retention
+    # =============================================================================
+
+    def backup_catalog(self) -> BackupCatalog:
+        from .config import get_backup_catalog_file
+        return BackupCatalog(get_backup_catalog_file())
+
+    def _catalog_backup(self, manifest: BackupManifest, backup_dir: Path) -> None:
+        """Record a completed backup in the catalog; the backup itself stands even if this fails."""
+        try:
+            self.backup_catalog().add(catalog_entry(manifest, backup_dir))
+        except Exception as e:
+            log.warning(f"Failed to record backup in the catalog: {e}")
+
+    def list_backups(self, rebuild: bool = False) -> List[BackupCatalogEntry]:
+        """
+        Backups in the catalog, newest first.
+        
+        Args:
+            rebuild: Re-read the manifests under the configured backup
+                directory first, e.g. to pick up backups made before the
+                catalog existed
+        """
+        catalog = self.backup_catalog()
+        if rebuild:
+            backup_root = Path(self.config.backup_directory).expanduser()
+            log.info(f"Rebuilding backup catalog from manifests in: {backup_root}")
+            return catalog.rebuild(backup_root)
+        return catalog.entries()
+
+    def prune_backups(self, keep_daily: int = 0, keep_weekly: int = 0, dry_run: bool = False) -> BackupPruneReport:
+        """
+        Delete cataloged backups a keep-daily/keep-weekly policy does not keep.
+        
+        Backups to keep are chosen from the catalog alone, and a backup
+        directory is only deleted if its manifest names the cataloged backup.
+        Afterwards, model blobs in the blob stores of deleted backups that no
+        backup on disk still references are deleted too (see
+        _referenced_blobs).
+        
+        Args:
+            keep_daily: Keep the newest backup of each of this many recent days
+            keep_weekly: Keep the newest backup of each of this many recent weeks
+            dry_run: Only report what would be deleted and reclaimed
+        """
+        import shutil
+        
+        catalog = self.backup_catalog()
+        entries = catalog.entries()
+        keep = retained_backups(entries, keep_daily, keep_weekly)
+        report = BackupPruneReport(
+            kept=[entry for entry in entries if entry.backup_id in keep],
+            dry_run=dry_run,
+        )
+        
+        for entry in entries:
+            if entry.backup_id in keep:
+                continue
+            if Path(entry.path).exists() and not self._holds_backup(Path(entry.path), entry.backup_id):
+                log.error(f"Not removing {entry.path}: it does not hold backup {entry.backup_id}")
+                report.kept.append(entry)
+                continue
+            if not dry_run:
+                try:
+                    shutil.rmtree(entry.path)
+                    log.info(f"Removed backup {entry.backup_id}: {entry.path}")
+                except FileNotFoundError:
+                    log.debug(f"Backup {entry.backup_id} was already gone: {entry.path}")
+                except OSError as e:
+                    log.error(f"Failed to remove backup {entry.path}: {e}")
+                    report.kept.append(entry)
+                    continue
+            report.removed.append(entry)
+        
+        # Only stores that lost a backup can hold newly unreferenced blobs
+        removed_dirs = {Path(entry.path).resolve() for entry in report.removed}
+        search_dirs = {Path(self.config.backup_directory).expanduser()}
+        search_dirs.update(Path(entry.path).parent for entry in entries)
+        for store_path in sorted({entry.blob_store for entry in report.removed if entry.blob_store}):
+            referenced = self._referenced_blobs(Path(store_path), search_dirs | {Path(store_path).parent}, removed_dirs)
+            if referenced is None:
+                continue
+            referenced.update(
+                digest for entry in report.kept if entry.blob_store == store_path for digest in entry.blob_digests
+            )
+            store = BlobStore(Path(store_path))
+            for digest in store.digests():
+                if digest in referenced:
+                    continue
+                if dry_run:
+                    size = store.object_path(digest).stat().st_size
+                else:
+                    size = store.remove(digest)
+                report.reclaimed_blobs += 1
+                report.reclaimed_bytes += size
+        
+        if not dry_run and report.removed:
+            catalog.remove(entry.backup_id for entry in report.removed)
+            catalog.compact()
+        return report
+
+    @staticmethod
+    def _holds_backup(backup_dir: Path, backup_id: str) -> bool:
+        """Whether backup_dir has a manifest for the given backup, so it is safe to delete as that backup."""
+        import json
+        
+        try:
+            with open(backup_dir / "backup_manifest.json", "r") as f:
+                return json.load(f).get("backup_id") == backup_id
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    def _referenced_blobs(self, store_path: Path, search_dirs: Set[Path], removed_dirs: Set[Path]) -> Optional[Set[str]]:
+        """
+        Digests that backups on disk reference in a blob store, or None if that cannot be known.
+        
+        The store is shared by every backup that points at it, cataloged or
+        not, so the backup directories in search_dirs are read: the manifests
+        of finished backups, and the checkpoints of running or interrupted
+        ones. A backup with a checkpoint may have stored blobs it has not
+        recorded yet and an unreadable manifest hides what it references, so
+        either leaves the store's blobs alone. Directories in removed_dirs
+        are being pruned and are skipped.
+        """
+        import json
+        
+        store = store_path.resolve()
+        referenced: Set[str] = set()
+        for search_dir in sorted(search_dirs):
+            if not search_dir.is_dir():
+                continue
+            for backup_dir in sorted(path for path in search_dir.iterdir() if path.is_dir()):
+                if backup_dir.resolve() in removed_dirs:
+                    continue
+                checkpoint = BackupCheckpoint.load(backup_dir)
+                if checkpoint is None and (backup_dir / CHECKPOINT_FILE).exists():
+                    log.warning(f"Not reclaiming blobs in {store}: cannot read the checkpoint in {backup_dir}")
+                    return None
+                if checkpoint is not None:
+                    config = checkpoint.state.backup_config
+                    if config.deduplicate_blobs and self._blob_store_path(backup_dir, config.blob_store).resolve() == store:
+                        log.warning(f"Not reclaiming blobs in {store}: the backup in {backup_dir} is running or was interrupted")
+                        return None
+                manifest_file = backup_dir / "backup_manifest.json"
+                if not manifest_file.exists():
+                    continue
+                try:
+                    with open(manifest_file, "r") as f:
+                        manifest = BackupManifest(**json.load(f))
+                except (OSError, ValueError) as e:
+                    log.warning(f"Not reclaiming blobs in {store}: cannot read {manifest_file}: {e}")
+                    return None
+                if manifest.volume_blobs and self._blob_store_path(backup_dir, manifest.blob_store).resolve() == store:
+                    referenced.update(ref.digest for refs in manifest.volume_blobs.values() for ref in refs)
+        return referenced
+
+    @staticmethod
+    def _start_throttle(config: BackupConfig) -> Optional[BackupThrottle]:
+        """Lower this process's priority as configured; returns the throttle for the volume backups, if any."""
+        throttle = BackupThrottle.from_config(config)
+        if not throttle.active:
+            return None
+        log.info(f"Throttling backup: {throttle}")
+        throttle.apply_to_process()
+        return throttle
+
+    @staticmethod
+    def _log_writer_pauses(volume_stats: List[VolumeBackupStats]) -> None:
+        """Report how long each service was paused for online backup snapshots."""
+        pauses: Dict[str, float] = {}
+        for stats in volume_stats:
+            for container in stats.paused_containers:
+                pauses[container] = pauses.get(container, 0.0) + (stats.pause_seconds or 0.0)
+        for container, seconds in pauses.items():
+            log.info(f"Service {container} was paused for {seconds:.1f}s while its volumes were snapshotted")
+
+    def _manifest_versions(self) -> Dict[str, str]:
+        """Stack and CLI versions recorded in backup manifests."""
+        from importlib.metadata import PackageNotFoundError, version
+        try:
+            cli_version = version("ollama-stack-cli")
+        except PackageNotFoundError:
+            # Running from a source checkout that was never installed
+            cli_version = "unknown"
+        return {"stack_version": self.config.version, "cli_version": cli_version}
+
+    @staticmethod
+    def _blob_store_path(backup_dir: Path, blob_store: Optional[str]) -> Path:
+        """
+        Resolve the shared model blob store for a backup.
+        
+        Defaults to ``blob-store`` next to the backup directory, so backups
+        written to the same parent share one store. Relative paths (as stored
+        in manifests) are resolved against the backup directory.
+        """
+        if not blob_store:
+            return backup_dir.parent / "blob-store"
+        return (backup_dir / Path(blob_store).expanduser()).resolve()
+    
+    @staticmethod
+    def _relative_blob_store_path(blob_store_path: Path, backup_dir: Path) -> str:
+        """Record the blob store relative to the backup so the pair can be moved together."""
+        try:
+            return os.path.relpath(blob_store_path, backup_dir)
+        except ValueError:
+            # Different drives on Windows
+            return str(blob_store_path)
+
+    @snapshot_operation("restore")
+    def restore_from_backup(
+        self,
+        backup_dir: Path,
+        validate_only: bool = False,
+        max_workers: int = 4,
+        volumes: Optional[List[str]] = None,
+        paths: Optional[Dict[str, List[str]]] = None,
+    ) -> bool:
         """
         Restore workflow with validation.
         
+        Naming ``volumes`` or ``paths`` makes the restore selective: see
+        _restore_selected.
+        
         Args:
             backup_dir: Directory containing the backup
             validate_only: If True, only validate the backup without restoring
+            max_workers: Maximum number of volumes to restore concurrently
+            volumes: Volumes to restore whole, instead of the whole backup
+            paths: Paths relative to the volume root to restore, by volume
             
         Returns:
             bool: True if restore succeeded, False otherwise
@@ -1114,29 +1946,25 @@ class StackManager:
             log.info(f"Created: {manifest.created_at}")
             log.info(f"Platform: {manifest.platform}")
             
+            selected = list(dict.fromkeys([*(volumes or []), *(paths or {})]))
+            missing = [name for name in selected if name not in manifest.volumes]
+            if missing:
+                log.error(
+                    f"Not in this backup: {', '.join(missing)} "
+                    f"(it has volumes: {', '.join(manifest.volumes) or 'none'})"
+                )
+                return False
+            
             if validate_only:
                 log.info("Validation-only mode - restore not performed")
                 return True
             
+            if selected:
+                return self._restore_selected(backup_dir, manifest, selected, paths or {}, max_workers)
+            
             # Step 2: Check if stack is running and stop if necessary
-            if self.is_stack_running():
-                log.info("Stack is running - stopping services for restore...")
-                
-                docker_services = [name for name, conf in self.config.services.items() if conf.type == 'docker']
-                native_services = [name for name, conf in self.config.services.items() if conf.type == 'native-api']
-                
-                success = True
-                if docker_services and not self.stop_docker_services():
-                    log.error("Failed to stop Docker services")
-                    success = False
-                
-                if native_services and not self.stop_native_services(native_services):
-                    log.error("Failed to stop native services")
-                    success = False
-                
-                if not success:
-                    log.error("Failed to stop services - cannot proceed with restore")
-                    return False
+            if not self._stop_stack_for_restore():
+                return False
             
             # Step 3: Restore configuration files
             if manifest.config_files:
@@ -1159,7 +1987,23 @@ class StackManager:
                 log.info("Restoring Docker volumes...")
                 volumes_dir = backup_dir / "volumes"
                 
-                if not self.docker_client.restore_volumes(manifest.volumes, volumes_dir):
+                blob_store = None
+                if manifest.volume_blobs:
+                    blob_store = BlobStore(self._blob_store_path(backup_dir, manifest.blob_store))
+                volume_stats = []
+                restored = self.docker_client.restore_volumes(
+                    manifest.volumes, volumes_dir, blob_store=blob_store, volume_blobs=manifest.volume_blobs,
+                    codec=manifest.codec, adaptive=manifest.adaptive_compression,
+                    max_workers=max_workers, volume_stats=volume_stats,
+                )
+                self._invalidate_snapshot("restored volumes")
+                for stats in volume_stats:
+                    if stats.throughput_bytes_per_sec:
+                        log.debug(
+                            f"Volume {stats.name}: {stats.restored_bytes / (1024 * 1024):.1f} MB in "
+                            f"{stats.duration_seconds:.1f}s ({stats.throughput_bytes_per_sec / (1024 * 1024):.1f} MB/s)"
+                        )
+                if not restored:
                     log.error("Failed to restore some volumes")
                     return False
                 
@@ -1198,6 +2042,52 @@ class StackManager:
             log.error(f"Restore failed: {e}")
             return False
 
+    def _restore_selected(
+        self,
+        backup_dir: Path,
+        manifest: BackupManifest,
+        volume_names: List[str],
+        paths: Dict[str, List[str]],
+        max_workers: int,
+    ) -> bool:
+        """
+        Restore some volumes, or paths within them, from a validated backup.
+        
+        Configuration is left alone and only the containers that mount the
+        restored volumes are stopped; they are started again once the restore
+        succeeds. Volumes in ``paths`` only get those paths back, the rest of
+        their contents are kept.
+        """
+        stopped = self.docker_client.stop_volume_users(volume_names)
+        self._invalidate_snapshot("stopped services for restore")
+        
+        blob_store = None
+        if any(manifest.volume_blobs.get(name) for name in volume_names):
+            blob_store = BlobStore(self._blob_store_path(backup_dir, manifest.blob_store))
+        volume_stats = []
+        restored = self.docker_client.restore_volumes(
+            volume_names, backup_dir / "volumes", blob_store=blob_store, volume_blobs=manifest.volume_blobs,
+            codec=manifest.codec, adaptive=manifest.adaptive_compression,
+            max_workers=max_workers, volume_stats=volume_stats, volume_paths=paths,
+        )
+        self._invalidate_snapshot("restored volumes")
+        for stats in volume_stats:
+            restored_from = f" ({stats.restored_members} entries under {', '.join(stats.paths) or '/'})" if stats.paths else ""
+            log.info(f"Restored {stats.name}{restored_from}: {stats.restored_bytes / (1024 * 1024):.1f} MB")
+        
+        if not restored:
+            log.error("Failed to restore some volumes")
+            if stopped:
+                log.warning(f"Left stopped after the failed restore: {', '.join(stopped)}")
+            return False
+        
+        if stopped and not self.docker_client.start_containers(stopped):
+            log.error("Restore completed but some services failed to start again")
+            return False
+        
+        log.info("Restore completed successfully")
+        return True
+
 
 
  
\ No newline at end of file
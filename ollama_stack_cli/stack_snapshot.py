@@ -0,0 +1,72 @@
+import functools
+import logging
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .docker_client import docker_request_count
+
+log = logging.getLogger(__name__)
+
+
+class StackSnapshot:
+    """
+    Memoized view of the stack's Docker state for a single orchestration run.
+
+    StackManager routes its read-only queries (is the stack running, which
+    containers/volumes/networks carry the stack label, which containers mount a
+    volume) through the active snapshot so each one reaches the daemon at most
+    once. Steps that mutate the stack call invalidate() so later steps see
+    fresh state. For verbose output, the Docker API requests sent while the
+    snapshot is active are counted where they are sent (every request of the
+    shared client, mutations and background streams included), along with
+    the queries the snapshot answered without one.
+    """
+
+    def __init__(self, operation: str, request_count: Optional[Callable[[], int]] = None):
+        self.operation = operation
+        self.hits = 0
+        self._values: Dict[Hashable, Any] = {}
+        self._request_count = request_count or docker_request_count
+        self._requests_at_start = self._request_count()
+
+    @property
+    def api_calls(self) -> int:
+        """Docker API requests sent since the snapshot was taken."""
+        return self._request_count() - self._requests_at_start
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Returns the memoized value for key, running loader on a miss.
+
+        Args:
+            key: Identifies the query
+            loader: Performs the query
+        """
+        if key in self._values:
+            self.hits += 1
+            return self._values[key]
+        value = loader()
+        self._values[key] = value
+        return value
+
+    def invalidate(self, reason: str = "") -> None:
+        """Discards all memoized values after the stack has been changed."""
+        if self._values:
+            log.debug(f"Stack snapshot invalidated{f' ({reason})' if reason else ''}")
+        self._values.clear()
+
+    def summary(self) -> str:
+        return (
+            f"Docker API requests for {self.operation}: {self.api_calls} "
+            f"({self.hits} queries served from snapshot)"
+        )
+
+
+def snapshot_operation(operation: str):
+    """Runs a StackManager method inside a stack snapshot scope for `operation`."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.stack_snapshot(operation):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
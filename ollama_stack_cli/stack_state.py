@@ -0,0 +1,343 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import docker
+
+from .schemas import ContainerState
+
+log = logging.getLogger(__name__)
+
+COMPONENT_LABEL = "ollama-stack.component"
+
+
+class StackStateTracker:
+    """
+    In-memory model of the stack's containers, networks and volumes, kept
+    current from the Docker events stream.
+    
+    The model is primed with one set of list calls, then updated incrementally
+    from events, so consumers (status --watch, health-gated start) can react to
+    start/die/health_status changes as they happen instead of re-listing
+    containers on every poll.
+    
+    Container events are filtered server-side on the ``ollama-stack.component``
+    label. Network and volume events carry no labels, so they are matched by
+    the compose project name prefix, the same rule find_resources_by_label uses.
+    """
+
+    # Container event actions that map directly onto a container status
+    CONTAINER_STATUS_ACTIONS = {
+        "create": "created",
+        "start": "running",
+        "restart": "running",
+        "unpause": "running",
+        "pause": "paused",
+        "die": "exited",
+        "stop": "exited",
+    }
+
+    # Actions after which a container whose healthcheck is unknown is inspected
+    INSPECT_ACTIONS = {"create", "start", "restart"}
+
+    def __init__(self, docker_client, project_name: str):
+        self._docker_client = docker_client
+        self._project_name = project_name
+        self._condition = threading.Condition()
+        self._containers: Dict[str, ContainerState] = {}
+        self._networks: Dict[str, str] = {}
+        self._volumes: set = set()
+        self._listeners: List[Callable[[dict], None]] = []
+        self._streams: list = []
+        self.generation = 0
+
+    @property
+    def is_tracking(self) -> bool:
+        """Whether event streams are currently attached."""
+        return bool(self._streams)
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> bool:
+        """
+        Prime the model and attach to the Docker events stream.
+
+        Returns:
+            bool: True if tracking started, False if Docker is unavailable
+        """
+        client = self._docker_client.client
+        if not client:
+            log.debug("Docker client not available for state tracking")
+            return False
+
+        # Subscribe from just before priming so nothing between the list calls
+        # and the subscription is missed; replayed events are idempotent
+        since = int(time.time())
+        try:
+            self._prime(client)
+            self._streams = [
+                client.events(decode=True, since=since, filters={"type": "container", "label": COMPONENT_LABEL}),
+                client.events(decode=True, since=since, filters={"type": ["network", "volume"]}),
+            ]
+        except (docker.errors.APIError, ConnectionResetError, ConnectionError) as e:
+            log.warning(f"Could not subscribe to Docker events: {e}")
+            self.stop()
+            return False
+
+        for stream in self._streams:
+            threading.Thread(target=self._consume, args=(stream,), name="stack-events", daemon=True).start()
+        log.debug("Stack state tracking started")
+        return True
+
+    def stop(self) -> None:
+        """Detach from the events stream."""
+        for stream in self._streams:
+            try:
+                stream.close()
+            except Exception as e:
+                log.debug(f"Error closing events stream: {e}")
+        self._streams = []
+
+    def add_listener(self, callback: Callable[[dict], None]) -> None:
+        """Register a callback invoked with each event that changed the model."""
+        self._listeners.append(callback)
+
+    def _prime(self, client) -> None:
+        """Load the current state with one list call per resource type."""
+        # sparse=True avoids an inspect call per container; list data is enough here
+        containers = client.containers.list(all=True, sparse=True, filters={"label": COMPONENT_LABEL})
+        networks = client.networks.list()
+        volumes = client.volumes.list()
+
+        with self._condition:
+            self._containers = {}
+            for container in containers:
+                state = self._state_from_list_entry(container.id, container.attrs)
+                self._containers[state.id] = state
+            self._networks = {n.id: n.name for n in networks if self._is_stack_resource(n.name)}
+            self._volumes = {v.name for v in volumes if self._is_stack_resource(v.name)}
+            self.generation += 1
+            self._condition.notify_all()
+
+        log.debug(
+            f"Primed stack state: {len(self._containers)} containers, "
+            f"{len(self._networks)} networks, {len(self._volumes)} volumes"
+        )
+
+    @staticmethod
+    def _state_from_list_entry(container_id: str, attrs: dict) -> ContainerState:
+        """Build a ContainerState from a /containers/json entry."""
+        names = attrs.get("Names") or [container_id]
+        # The human-readable status carries health, e.g. "Up 5 minutes (healthy)"
+        summary = attrs.get("Status") or ""
+        health = None
+        for candidate in ("health: starting", "unhealthy", "healthy"):
+            if f"({candidate})" in summary:
+                health = "starting" if candidate == "health: starting" else candidate
+                break
+        status = attrs.get("State") or "created"
+        # Only a running container's summary tells whether it has a healthcheck
+        has_healthcheck = True if health is not None else (False if status == "running" else None)
+        return ContainerState(
+            id=container_id,
+            name=names[0].lstrip("/"),
+            component=(attrs.get("Labels") or {}).get(COMPONENT_LABEL),
+            status=status,
+            health=health,
+            has_healthcheck=has_healthcheck,
+        )
+
+    def _inspect_healthcheck(self, container_id: str) -> Optional[bool]:
+        """Whether a container defines a healthcheck (its own or its image's); None if it cannot be inspected."""
+        client = self._docker_client.client
+        if not client:
+            return None
+        try:
+            attrs = client.api.inspect_container(container_id)
+        except (docker.errors.APIError, ConnectionResetError, ConnectionError) as e:
+            log.debug(f"Could not inspect container {container_id} for its healthcheck: {e}")
+            return None
+        test = ((attrs.get("Config") or {}).get("Healthcheck") or {}).get("Test") or []
+        return bool(test) and test[0] != "NONE"
+
+    def _consume(self, stream) -> None:
+        """Apply events from one stream until it is closed."""
+        try:
+            for event in stream:
+                self.apply_event(event)
+        except Exception as e:
+            # Closing the stream from stop() surfaces here as a read error
+            log.debug(f"Docker events stream ended: {e}")
+
+    # =========================================================================
+    # Event Handling
+    # =========================================================================
+
+    def apply_event(self, event: dict) -> bool:
+        """
+        Update the model from a single Docker event.
+
+        Returns:
+            bool: True if the event changed the model
+        """
+        event_type = event.get("Type")
+        action = event.get("Action") or event.get("status") or ""
+        actor = event.get("Actor") or {}
+        actor_id = actor.get("ID") or event.get("id")
+        attributes = actor.get("Attributes") or {}
+
+        has_healthcheck = None
+        if event_type == "container" and action in self.INSPECT_ACTIONS and attributes.get(COMPONENT_LABEL) is not None:
+            with self._condition:
+                state = self._containers.get(actor_id)
+                known = state is not None and state.has_healthcheck is not None
+            # Inspect outside the lock so readers are not held up by the request
+            if not known:
+                has_healthcheck = self._inspect_healthcheck(actor_id)
+
+        with self._condition:
+            if event_type == "container":
+                changed = self._apply_container_event(action, actor_id, attributes, has_healthcheck)
+            elif event_type == "network":
+                changed = self._apply_network_event(action, actor_id, attributes.get("name"))
+            elif event_type == "volume":
+                # Volume events use the volume name as the actor ID
+                changed = self._apply_volume_event(action, actor_id)
+            else:
+                changed = False
+
+            if changed:
+                self.generation += 1
+                self._condition.notify_all()
+
+        if changed:
+            log.debug(f"Stack state changed: {event_type} {action} {attributes.get('name', actor_id)}")
+            for listener in list(self._listeners):
+                try:
+                    listener(event)
+                except Exception as e:
+                    log.debug(f"State listener raised: {e}")
+        return changed
+
+    def _apply_container_event(
+        self, action: str, container_id: str, attributes: dict, has_healthcheck: Optional[bool] = None
+    ) -> bool:
+        component = attributes.get(COMPONENT_LABEL)
+        if not container_id or component is None:
+            return False
+
+        if action == "destroy":
+            return self._containers.pop(container_id, None) is not None
+
+        state = self._containers.get(container_id)
+        if state is None:
+            state = ContainerState(id=container_id, name=attributes.get("name", container_id), component=component)
+            self._containers[container_id] = state
+        if has_healthcheck is not None:
+            state.has_healthcheck = has_healthcheck
+
+        if action.startswith("health_status"):
+            # Docker emits "health_status: healthy" / "health_status: unhealthy"
+            state.health = action.split(":", 1)[1].strip() if ":" in action else None
+            state.has_healthcheck = True
+            return True
+
+        status = self.CONTAINER_STATUS_ACTIONS.get(action)
+        if status is None:
+            # exec_*, attach, top and similar actions don't change lifecycle state
+            return False
+        state.status = status
+        if status == "running" and (state.has_healthcheck or state.health is not None):
+            # Health resets when the container (re)starts
+            state.health = "starting"
+        return True
+
+    def _apply_network_event(self, action: str, network_id: str, name: Optional[str]) -> bool:
+        if not name or not self._is_stack_resource(name):
+            return False
+        if action == "create":
+            self._networks[network_id] = name
+            return True
+        if action == "destroy":
+            return self._networks.pop(network_id, None) is not None
+        return False
+
+    def _apply_volume_event(self, action: str, name: Optional[str]) -> bool:
+        if not name or not self._is_stack_resource(name):
+            return False
+        if action == "create":
+            self._volumes.add(name)
+            return True
+        if action == "destroy":
+            if name in self._volumes:
+                self._volumes.discard(name)
+                return True
+        return False
+
+    def _is_stack_resource(self, name: str) -> bool:
+        return name == self._project_name or name.startswith(f"{self._project_name}_")
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def containers(self) -> List[ContainerState]:
+        """Snapshot of all tracked stack containers."""
+        with self._condition:
+            return [state.model_copy() for state in self._containers.values()]
+
+    def get_component(self, component: str) -> Optional[ContainerState]:
+        """Current state of the container for a stack component, if any."""
+        with self._condition:
+            for state in self._containers.values():
+                if state.component == component:
+                    return state.model_copy()
+        return None
+
+    def running_components(self) -> List[str]:
+        """Components whose containers are currently running."""
+        with self._condition:
+            return [s.component for s in self._containers.values() if s.status == "running"]
+
+    def networks(self) -> List[str]:
+        with self._condition:
+            return sorted(self._networks.values())
+
+    def volumes(self) -> List[str]:
+        with self._condition:
+            return sorted(self._volumes)
+
+    def components_ready(self, components: List[str]) -> bool:
+        """
+        Whether every component is running and, if it defines a healthcheck,
+        reported healthy by Docker.
+
+        A container with a healthcheck is not ready until Docker has reported
+        it healthy at least once since it started.
+        """
+        with self._condition:
+            return self._components_ready(components)
+
+    def _components_ready(self, components: List[str]) -> bool:
+        by_component = {s.component: s for s in self._containers.values()}
+        for component in components:
+            state = by_component.get(component)
+            if state is None or state.status != "running":
+                return False
+            if state.has_healthcheck and state.health != "healthy":
+                return False
+            if state.health not in (None, "healthy"):
+                return False
+        return True
+
+    def wait_for_components_ready(self, components: List[str], timeout: float) -> bool:
+        """
+        Block until the given components are ready or the timeout expires.
+
+        Wakes on each relevant event rather than polling.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._components_ready(components), timeout=timeout)
@@ -0,0 +1,305 @@
+import errno
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+from .schemas import StackStatus
+
+log = logging.getLogger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class StatusCache:
+    """
+    Keeps a pre-rendered StackStatus current for the `serve` daemon.
+
+    A single background thread owns all Docker and HTTP traffic: resource
+    usage is overlaid every ``interval`` seconds from the persistent stats
+    streams, while the container list and health probes are refreshed every
+    ``health_interval`` seconds or as soon as the Docker events stream reports
+    a stack change. Each refresh renders the JSON document and Prometheus text
+    once, so serving a request is a dictionary lookup.
+    """
+
+    def __init__(self, stack_manager, interval: float = 5, health_interval: float = 15, extensions_only: bool = False):
+        self._stack_manager = stack_manager
+        self.interval = interval
+        self.health_interval = health_interval
+        self.extensions_only = extensions_only
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_monitor = None
+        self._state_tracker = None
+        self._status: Optional[StackStatus] = None
+        self._rendered: Optional[Tuple[bytes, bytes]] = None
+        self._last_probe = 0.0
+        self._seen_generation = None
+        self.updated_at: Optional[float] = None
+        self.refresh_count = 0
+        self.error_count = 0
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Attach the stats and events streams and start the refresh thread."""
+        self._stats_monitor = self._stack_manager.create_stats_monitor()
+        self._state_tracker = self._stack_manager.create_state_tracker()
+        self._state_tracker.add_listener(lambda event: self._wake.set())
+        self._state_tracker.start()
+        self._thread = threading.Thread(target=self._run, name="status-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop refreshing and close the Docker streams."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._state_tracker is not None:
+            self._state_tracker.stop()
+        if self._stats_monitor is not None:
+            self._stats_monitor.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    # =========================================================================
+    # Refresh
+    # =========================================================================
+
+    def refresh(self) -> None:
+        """Re-probe if due, overlay live usage and re-render both formats."""
+        try:
+            now = time.monotonic()
+            generation = self._state_tracker.generation if self._state_tracker else None
+            if (
+                self._status is None
+                or generation != self._seen_generation
+                or now - self._last_probe >= self.health_interval
+            ):
+                self._seen_generation = generation
+                self._status = self._stack_manager.get_stack_status(
+                    extensions_only=self.extensions_only, include_usage=False
+                )
+                if self._stats_monitor is not None:
+                    self._stats_monitor.sync()
+                self._last_probe = now
+
+            if self._stats_monitor is not None:
+                self._stack_manager.apply_live_usage(self._status, self._stats_monitor)
+
+            self.updated_at = time.time()
+            self.refresh_count += 1
+            self._rendered = (
+                self._status.model_dump_json().encode(),
+                render_prometheus(self._status, self).encode(),
+            )
+        except Exception as e:
+            self.error_count += 1
+            log.warning(f"Status refresh failed: {e}")
+
+    def json_document(self) -> Optional[bytes]:
+        """The latest status as JSON, or None before the first refresh."""
+        rendered = self._rendered
+        return rendered[0] if rendered else None
+
+    def metrics_document(self) -> Optional[bytes]:
+        """The latest status as Prometheus text, or None before the first refresh."""
+        rendered = self._rendered
+        return rendered[1] if rendered else None
+
+
+# =============================================================================
+# Prometheus Rendering
+# =============================================================================
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels.items())
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render_prometheus(stack_status: StackStatus, cache: Optional[StatusCache] = None) -> str:
+    """Render a StackStatus in the Prometheus text exposition format."""
+    metrics: List[Tuple[str, str, str, List[Tuple[str, float]]]] = []
+
+    def metric(name: str, kind: str, help_text: str) -> List[Tuple[str, float]]:
+        samples: List[Tuple[str, float]] = []
+        metrics.append((name, kind, help_text, samples))
+        return samples
+
+    up = metric("ollama_stack_service_up", "gauge", "Whether the service is running (1) or not (0).")
+    health = metric("ollama_stack_service_health", "gauge", "Current health of the service; the health label carries the state.")
+    cpu = metric("ollama_stack_service_cpu_percent", "gauge", "Container CPU usage in percent.")
+    memory = metric("ollama_stack_service_memory_bytes", "gauge", "Container memory usage in bytes.")
+    latency = metric("ollama_stack_service_probe_latency_seconds", "gauge", "Duration of the last health/status probe.")
+    loaded = metric("ollama_stack_ollama_loaded_models", "gauge", "Number of models loaded by a native Ollama server.")
+    model_size = metric("ollama_stack_ollama_model_size_bytes", "gauge", "Memory held by a loaded model.")
+    model_vram = metric("ollama_stack_ollama_model_vram_bytes", "gauge", "VRAM held by a loaded model.")
+
+    for service in list(stack_status.core_services) + list(stack_status.extensions):
+        labels = _labels(service=service.name)
+        up.append((labels, 1 if service.is_running else 0))
+        health.append((_labels(service=service.name, health=service.health or "unknown"), 1))
+        if service.usage.cpu_percent is not None:
+            cpu.append((labels, service.usage.cpu_percent))
+        if service.usage.memory_mb is not None:
+            memory.append((labels, service.usage.memory_mb * 1024 * 1024))
+        if service.latency_ms is not None:
+            latency.append((labels, service.latency_ms / 1000))
+        if service.version is not None or service.models:
+            loaded.append((labels, len(service.models)))
+        for model in service.models:
+            model_labels = _labels(service=service.name, model=model.name)
+            model_size.append((model_labels, model.size_bytes))
+            model_vram.append((model_labels, model.vram_bytes))
+
+    if cache is not None:
+        metric("ollama_stack_status_refreshes_total", "counter", "Status refreshes performed by the daemon.").append(("", cache.refresh_count))
+        metric("ollama_stack_status_refresh_errors_total", "counter", "Status refreshes that failed.").append(("", cache.error_count))
+        if cache.updated_at is not None:
+            metric("ollama_stack_status_updated_timestamp_seconds", "gauge", "Unix time of the last successful refresh.").append(("", cache.updated_at))
+
+    lines = []
+    for name, kind, help_text, samples in metrics:
+        if not samples:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            sample = f"{name}{{{labels}}}" if labels else name
+            lines.append(f"{sample} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# HTTP Server
+# =============================================================================
+
+class StatusRequestHandler(BaseHTTPRequestHandler):
+    """Serves /status (JSON), /metrics (Prometheus) and /healthz from a StatusCache."""
+
+    server_version = "ollama-stack"
+
+    def do_GET(self):
+        cache: StatusCache = self.server.status_cache
+        path = self.path.split("?", 1)[0]
+        if path in ("/", "/status"):
+            self._send_document(cache.json_document(), JSON_CONTENT_TYPE)
+        elif path == "/metrics":
+            self._send_document(cache.metrics_document(), PROMETHEUS_CONTENT_TYPE)
+        elif path == "/healthz":
+            self._send(200, b"ok\n", "text/plain; charset=utf-8")
+        else:
+            self._send(404, b"not found\n", "text/plain; charset=utf-8")
+
+    def _send_document(self, body: Optional[bytes], content_type: str):
+        if body is None:
+            self._send(503, b"status not collected yet\n", "text/plain; charset=utf-8")
+        else:
+            self._send(200, body, content_type)
+
+    def _send(self, code: int, body: bytes, content_type: str):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        log.debug(f"{self.address_string()} - {format % args}")
+
+
+class UnixStatusServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server listening on a unix domain socket."""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove a unix socket left behind by a server that is no longer running.
+
+    Raises:
+        OSError: If the path exists but is not a socket, or a server still
+            accepts connections on it
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, "Path exists and is not a socket", socket_path)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        # Nothing is listening, so the socket is stale
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, "Another server is listening on this socket", socket_path)
+
+
+def remove_socket(socket_path: str) -> None:
+    """Remove the socket a server listened on once it has shut down."""
+    try:
+        if stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+
+
+def create_status_server(
+    cache: StatusCache,
+    host: str = "127.0.0.1",
+    port: int = 9464,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """
+    Create the HTTP server for a StatusCache, on a unix socket if socket_path is given.
+
+    A stale socket left behind by a previous run is removed first; any other
+    file at socket_path, or the socket of a server still running, is left
+    alone and binding fails with OSError.
+    """
+    if socket_path:
+        remove_stale_socket(socket_path)
+        server = UnixStatusServer(socket_path, StatusRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), StatusRequestHandler)
+        server.daemon_threads = True
+    server.status_cache = cache
+    return server
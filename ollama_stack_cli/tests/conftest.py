@@ -1,11 +1,37 @@
 import pytest
 from unittest.mock import MagicMock
 
+from ollama_stack_cli.docker_client import reset_shared_docker_client
 from ollama_stack_cli.schemas import (
     StackStatus, ServiceStatus, CheckReport, EnvironmentCheck, ExtensionsConfig
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_platform_cache(tmp_path, monkeypatch):
+    """Keeps platform detection results out of the real ~/.ollama-stack directory."""
+    cache_file = tmp_path / "platform-cache" / "platform-cache.json"
+    cache_file.parent.mkdir()
+    monkeypatch.setattr("ollama_stack_cli.config.get_platform_cache_file", lambda: cache_file)
+    return cache_file
+
+
+@pytest.fixture(autouse=True)
+def isolated_backup_catalog(tmp_path, monkeypatch):
+    """Keeps backups created by tests out of the real backup catalog."""
+    catalog_file = tmp_path / "backup-catalog" / "backup-catalog.jsonl"
+    monkeypatch.setattr("ollama_stack_cli.config.get_backup_catalog_file", lambda: catalog_file)
+    return catalog_file
+
+
+@pytest.fixture(autouse=True)
+def reset_docker_connection():
+    """Ensures each test starts without a cached process-wide Docker client."""
+    reset_shared_docker_client()
+    yield
+    reset_shared_docker_client()
+
+
 @pytest.fixture
 def mock_app_context():
     """Fixture to mock the AppContext and its components."""
@@ -0,0 +1,100 @@
+import json
+from datetime import datetime, timedelta
+
+from ollama_stack_cli.backup_catalog import BackupCatalog, catalog_entry, retained_backups
+from ollama_stack_cli.schemas import BackupCatalogEntry, BackupConfig, BackupManifest, BlobRef
+
+
+def make_entry(backup_id, created_at, path="/backups/x", **kwargs):
+    return BackupCatalogEntry(backup_id=backup_id, created_at=created_at, path=path, **kwargs)
+
+
+def make_manifest(backup_id="backup-1", **kwargs):
+    return BackupManifest(
+        backup_id=backup_id,
+        stack_version="0.2.0",
+        cli_version="0.2.0",
+        platform="cpu",
+        backup_config=BackupConfig(),
+        **kwargs
+    )
+
+
+def test_catalog_entry_from_manifest(tmp_path):
+    """Tests a manifest's blob references are summarized by digest with the store's absolute path."""
+    backup_dir = tmp_path / "backups" / "backup-1"
+    ref = BlobRef(path="./models/blobs/sha256-aa", digest="a" * 64, size=1, mode=0o644, uid=0, gid=0, mtime=0)
+    manifest = make_manifest(
+        volumes=["ollama_data"], size_bytes=100, codec="zstd", description="nightly",
+        volume_blobs={"ollama_data": [ref, ref]},
+    )
+
+    entry = catalog_entry(manifest, backup_dir)
+
+    assert entry.path == str(backup_dir.resolve())
+    assert entry.blob_store == str((tmp_path / "backups" / "blob-store").resolve())
+    assert entry.blob_digests == ["a" * 64]
+    assert (entry.size_bytes, entry.codec, entry.description) == (100, "zstd", "nightly")
+    assert catalog_entry(make_manifest(), backup_dir).blob_store is None
+
+
+def test_catalog_replays_additions_and_removals(tmp_path):
+    """Tests later lines supersede earlier ones and entries come back newest first."""
+    catalog = BackupCatalog(tmp_path / "catalog" / "backup-catalog.jsonl")
+    now = datetime(2026, 3, 10, 12, 0)
+    catalog.add(make_entry("old", now - timedelta(days=2)))
+    catalog.add(make_entry("new", now))
+    catalog.add(make_entry("gone", now - timedelta(days=1)))
+    catalog.remove(["gone"])
+
+    assert [entry.backup_id for entry in catalog.entries()] == ["new", "old"]
+    assert len(catalog.path.read_text().splitlines()) == 4
+
+    catalog.compact()
+
+    assert [json.loads(line)["backup_id"] for line in catalog.path.read_text().splitlines()] == ["old", "new"]
+
+
+def test_catalog_skips_unreadable_lines(tmp_path):
+    """Tests a torn last line does not hide the entries before it."""
+    catalog = BackupCatalog(tmp_path / "backup-catalog.jsonl")
+    catalog.add(make_entry("backup-1", datetime(2026, 3, 10)))
+    with open(catalog.path, "a") as f:
+        f.write('{"backup_id": "backup-2", "crea')
+
+    assert [entry.backup_id for entry in catalog.entries()] == ["backup-1"]
+    assert BackupCatalog(tmp_path / "missing.jsonl").entries() == []
+
+
+def test_catalog_rebuild_from_manifests(tmp_path):
+    """Tests rebuild picks up uncataloged backups and drops entries whose directory is gone."""
+    backup_root = tmp_path / "backups"
+    backup_dir = backup_root / "backup-1"
+    backup_dir.mkdir(parents=True)
+    (backup_dir / "backup_manifest.json").write_text(make_manifest("backup-1").model_dump_json())
+    (backup_root / "broken").mkdir()
+    (backup_root / "broken" / "backup_manifest.json").write_text("{")
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    catalog = BackupCatalog(tmp_path / "backup-catalog.jsonl")
+    catalog.add(make_entry("elsewhere", datetime(2026, 1, 1), path=str(elsewhere)))
+    catalog.add(make_entry("deleted", datetime(2026, 1, 2), path=str(tmp_path / "deleted")))
+
+    entries = catalog.rebuild(backup_root)
+
+    assert [entry.backup_id for entry in entries] == ["backup-1", "elsewhere"]
+    assert [entry.backup_id for entry in catalog.entries()] == ["backup-1", "elsewhere"]
+
+
+def test_retained_backups_keeps_newest_per_day_and_week():
+    # 2026-03-09 is a Monday; two backups a day for ten days
+    start = datetime(2026, 3, 9)
+    entries = [
+        make_entry(f"{day}-{hour}", start + timedelta(days=day, hours=hour))
+        for day in range(10) for hour in (1, 13)
+    ]
+
+    assert retained_backups(entries, keep_daily=2) == {"9-13", "8-13"}
+    assert retained_backups(entries, keep_weekly=2) == {"9-13", "6-13"}
+    assert retained_backups(entries, keep_daily=1, keep_weekly=2) == {"9-13", "6-13"}
+    assert retained_backups(entries) == set()
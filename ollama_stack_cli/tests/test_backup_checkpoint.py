@@ -0,0 +1,128 @@
+import gzip
+import hashlib
+import io
+import json
+
+import pytest
+
+from ollama_stack_cli.backup_checkpoint import (
+    CHECKPOINT_FILE,
+    BackupCheckpoint,
+    ChunkedArchiveWriter,
+)
+from ollama_stack_cli.compression import get_codec
+from ollama_stack_cli.schemas import ArchiveChunk, BackupConfig, VolumeBackupStats
+
+
+def write_chunks(path, pieces, codec="gzip"):
+    """Writes pieces of data as separate chunks; returns each chunk's (size, sha256)."""
+    with open(path, "wb") as raw, ChunkedArchiveWriter(raw, codec) as writer:
+        cuts = []
+        for piece in pieces[:-1]:
+            writer.write(piece)
+            cuts.append(writer.cut())
+        writer.write(pieces[-1])
+    return cuts
+
+
+def make_checkpoint(tmp_path, chunks, archive="ollama_data.tar.gz"):
+    checkpoint = BackupCheckpoint.create(tmp_path, "backup-1", BackupConfig())
+    for index, (size, sha256) in enumerate(chunks):
+        checkpoint.record_chunk(
+            "ollama_data", archive,
+            ArchiveChunk(members=index + 1, last_member=f"./file{index}", tar_offset=(index + 1) * 1024,
+                         size=size, sha256=sha256),
+            VolumeBackupStats(name="ollama_data", archive=archive, excluded_files=index),
+            [],
+        )
+    return checkpoint
+
+
+@pytest.mark.parametrize("codec", ["gzip", "gzip-mt", "none"])
+def test_chunked_archive_writer_chunks_decode_as_one_stream(tmp_path, codec):
+    """Tests chunks are independently framed but decompress as one continuous stream."""
+    path = tmp_path / "archive"
+    pieces = [b"first " * 500, b"second " * 500, b"third"]
+
+    cuts = write_chunks(path, pieces, codec)
+
+    data = path.read_bytes()
+    assert sum(size for size, _ in cuts) < len(data)
+    offset = 0
+    for size, sha256 in cuts:
+        assert hashlib.sha256(data[offset:offset + size]).hexdigest() == sha256
+        offset += size
+    with get_codec(codec).open_reader(io.BytesIO(data)) as reader:
+        assert reader.read() == b"".join(pieces)
+
+
+def test_checkpoint_round_trips_through_file(tmp_path):
+    """Tests recorded chunks and finished volumes survive a reload."""
+    checkpoint = make_checkpoint(tmp_path, [(10, "a" * 64)])
+    checkpoint.record_volume(VolumeBackupStats(name="webui_data", archive="webui_data.tar.gz", sha256="b" * 64), [])
+
+    loaded = BackupCheckpoint.load(tmp_path)
+
+    assert loaded.state.backup_id == "backup-1"
+    assert loaded.state.volumes["ollama_data"].chunks[0].size == 10
+    assert loaded.state.volumes["webui_data"].complete
+    assert not (tmp_path / f"{CHECKPOINT_FILE}.partial").exists()
+
+
+def test_checkpoint_load_missing_or_invalid(tmp_path):
+    assert BackupCheckpoint.load(tmp_path) is None
+    (tmp_path / CHECKPOINT_FILE).write_text("{not json")
+    assert BackupCheckpoint.load(tmp_path) is None
+
+
+def test_resume_point_truncates_after_last_verified_chunk(tmp_path):
+    """Tests bytes written after the last checkpoint are cut off and the prefix hash is carried over."""
+    partial_file = tmp_path / "ollama_data.tar.gz.partial"
+    cuts = write_chunks(partial_file, [b"one" * 100, b"two" * 100, b"unfinished" * 100])
+    checkpoint = make_checkpoint(tmp_path, cuts)
+
+    resume = checkpoint.resume_point("ollama_data", "ollama_data.tar.gz", partial_file)
+
+    kept = sum(size for size, _ in cuts)
+    assert resume.size == kept
+    assert partial_file.stat().st_size == kept
+    assert resume.sha256.hexdigest() == hashlib.sha256(partial_file.read_bytes()).hexdigest()
+    assert resume.position == (2, "./file1", 2048)
+    assert resume.volume.stats.excluded_files == 1
+    assert gzip.decompress(partial_file.read_bytes()) == b"one" * 100 + b"two" * 100
+
+
+def test_resume_point_discards_volume_with_corrupted_chunk(tmp_path):
+    partial_file = tmp_path / "ollama_data.tar.gz.partial"
+    cuts = write_chunks(partial_file, [b"one" * 100, b"two" * 100])
+    checkpoint = make_checkpoint(tmp_path, cuts)
+    data = bytearray(partial_file.read_bytes())
+    data[5] ^= 0xFF
+    partial_file.write_bytes(bytes(data))
+
+    assert checkpoint.resume_point("ollama_data", "ollama_data.tar.gz", partial_file) is None
+    assert "ollama_data" not in json.loads((tmp_path / CHECKPOINT_FILE).read_text())["volumes"]
+
+
+def test_resume_point_ignores_other_codec(tmp_path):
+    """Tests a checkpoint for a differently named archive (another codec) is not resumed."""
+    partial_file = tmp_path / "ollama_data.tar.zst.partial"
+    partial_file.write_bytes(b"data")
+    checkpoint = make_checkpoint(tmp_path, [(4, hashlib.sha256(b"data").hexdigest())])
+
+    assert checkpoint.resume_point("ollama_data", "ollama_data.tar.zst", partial_file) is None
+
+
+def test_completed_volume_is_verified_against_its_digest(tmp_path):
+    archive = tmp_path / "webui_data.tar.gz"
+    archive.write_bytes(b"archive bytes")
+    checkpoint = BackupCheckpoint.create(tmp_path, "backup-1", BackupConfig())
+    checkpoint.record_volume(VolumeBackupStats(
+        name="webui_data", archive=archive.name, size_bytes=13, sha256=hashlib.sha256(b"archive bytes").hexdigest(),
+    ), [])
+
+    assert checkpoint.completed_volume("webui_data", archive.name, archive) is not None
+
+    archive.write_bytes(b"archive byteZ")
+    assert checkpoint.completed_volume("webui_data", archive.name, archive) is None
+    assert "webui_data" not in checkpoint.state.volumes
@@ -11,7 +11,10 @@ from unittest.mock import MagicMock, patch, call
 from datetime import datetime
 import typer
 
-from ollama_stack_cli.commands.backup import backup_stack_logic, backup
+from ollama_stack_cli.commands.backup import (
+    backup_stack_logic, backup, benchmark_compression_logic, resume_backup_logic,
+    backup_list_logic, prune_backups_logic,
+)
 from ollama_stack_cli.context import AppContext
 
 
@@ -29,6 +32,7 @@ def mock_typer_context(mock_app_context):
     """Create a mock Typer context with AppContext."""
     mock_ctx = MagicMock()
     mock_ctx.obj = mock_app_context
+    mock_ctx.invoked_subcommand = None
     return mock_ctx
 
 
@@ -65,6 +69,8 @@ def test_backup_stack_logic_success_all_defaults(mock_log, mock_app_context):
     assert backup_config['include_config'] == True
     assert backup_config['include_extensions'] == True
     assert backup_config['compression'] == True
+    assert backup_config['max_workers'] == 4
+    assert backup_config['online'] == False
     
     # Verify logging was called for success and backup information
     mock_log.info.assert_any_call("Backup completed successfully!")
@@ -73,6 +79,36 @@ def test_backup_stack_logic_success_all_defaults(mock_log, mock_app_context):
     assert any("Location:" in call for call in logged_calls)
     assert any("ollama-stack restore" in call for call in logged_calls)
 
+def test_backup_stack_logic_online(mock_app_context):
+    """Test --online is passed on in the backup configuration."""
+    mock_app_context.stack_manager.create_backup.return_value = True
+    
+    with patch('pathlib.Path.exists', return_value=False):
+        assert backup_stack_logic(mock_app_context, output_path="/tmp/online-backup", online=True) == True
+    
+    assert mock_app_context.stack_manager.create_backup.call_args.kwargs["backup_config"]["online"] == True
+
+def test_backup_stack_logic_throttling(mock_app_context):
+    """Test throttling options are passed on in the backup configuration."""
+    mock_app_context.stack_manager.create_backup.return_value = True
+    
+    with patch('pathlib.Path.exists', return_value=False):
+        assert backup_stack_logic(
+            mock_app_context, output_path="/tmp/throttled-backup",
+            rate_limit=25.0, nice=10, ionice="best-effort", helper_cpu_shares=256, helper_blkio_weight=100
+        ) == True
+    
+    backup_config = mock_app_context.stack_manager.create_backup.call_args.kwargs["backup_config"]
+    assert backup_config["rate_limit_mb"] == 25.0
+    assert backup_config["nice"] == 10
+    assert backup_config["ionice"] == "best-effort"
+    assert backup_config["helper_cpu_shares"] == 256
+    assert backup_config["helper_blkio_weight"] == 100
+
+def test_backup_stack_logic_rejects_unknown_io_class(mock_app_context):
+    assert backup_stack_logic(mock_app_context, output_path="/tmp/backup", ionice="realtime") == False
+    mock_app_context.stack_manager.create_backup.assert_not_called()
+
 def test_backup_stack_logic_custom_output_path(mock_app_context):
     """Test backup with custom output path."""
     mock_app_context.stack_manager.create_backup.return_value = True
@@ -324,7 +360,23 @@ def test_backup_command_success(mock_typer_context):
             include_extensions=True,
             output_path=None,
             compress=True,
-            description=None
+            description=None,
+            max_workers=4,
+            dedupe_blobs=False,
+            blob_store=None,
+            codec="gzip",
+            compression_level=None,
+            compression_threads=0,
+            adaptive=False,
+            verify=False,
+            exclude_patterns=None,
+            default_excludes=True,
+            online=False,
+            rate_limit=None,
+            nice=None,
+            ionice=None,
+            helper_cpu_shares=None,
+            helper_blkio_weight=None
         )
 
 def test_backup_command_failure_raises_exit(mock_typer_context):
@@ -345,7 +397,23 @@ def test_backup_command_all_parameters(mock_typer_context):
             include_extensions=False,
             output="/custom/path",
             compress=False,
-            description="Test backup"
+            description="Test backup",
+            workers=2,
+            dedupe_blobs=True,
+            blob_store="/srv/blobs",
+            codec="zstd",
+            compression_level=9,
+            compression_threads=2,
+            adaptive=True,
+            verify=True,
+            exclude=["*.log"],
+            default_excludes=False,
+            online=True,
+            rate_limit=50.0,
+            nice=19,
+            ionice="idle",
+            helper_cpu_shares=128,
+            helper_blkio_weight=10
         )
         
         mock_logic.assert_called_once_with(
@@ -355,7 +423,23 @@ def test_backup_command_all_parameters(mock_typer_context):
             include_extensions=False,
             output_path="/custom/path",
             compress=False,
-            description="Test backup"
+            description="Test backup",
+            max_workers=2,
+            dedupe_blobs=True,
+            blob_store="/srv/blobs",
+            codec="zstd",
+            compression_level=9,
+            compression_threads=2,
+            adaptive=True,
+            verify=True,
+            exclude_patterns=["*.log"],
+            default_excludes=False,
+            online=True,
+            rate_limit=50.0,
+            nice=19,
+            ionice="idle",
+            helper_cpu_shares=128,
+            helper_blkio_weight=10
         )
 
 def test_backup_command_default_parameters(mock_typer_context):
@@ -370,7 +454,23 @@ def test_backup_command_default_parameters(mock_typer_context):
             include_extensions=True,
             output_path=None,
             compress=True,
-            description=None
+            description=None,
+            max_workers=4,
+            dedupe_blobs=False,
+            blob_store=None,
+            codec="gzip",
+            compression_level=None,
+            compression_threads=0,
+            adaptive=False,
+            verify=False,
+            exclude_patterns=None,
+            default_excludes=True,
+            online=False,
+            rate_limit=None,
+            nice=None,
+            ionice=None,
+            helper_cpu_shares=None,
+            helper_blkio_weight=None
         )
 
 
@@ -564,4 +664,250 @@ def test_backup_description_types(mock_log, mock_app_context):
         # Verify description handling in logging
         if description and description.strip():
             logged_calls = [call.args[0] for call in mock_log.info.call_args_list]
-            assert any(f"Description: {description}" in call for call in logged_calls)
\ No newline at end of file
+            assert any(f"Description: {description}" in call for call in logged_calls)
+
+# =============================================================================
+# Compression Codec Tests
+# =============================================================================
+
+def test_backup_stack_logic_passes_codec_settings(mock_app_context):
+    """Test codec, level and threads reach the backup configuration."""
+    mock_app_context.stack_manager.create_backup.return_value = True
+    
+    result = backup_stack_logic(mock_app_context, codec="gzip-mt", compression_level=9, compression_threads=2,
+                                adaptive=True, verify=True, exclude_patterns=["cache/audio"], default_excludes=False)
+    
+    assert result == True
+    backup_config = mock_app_context.stack_manager.create_backup.call_args[1]['backup_config']
+    assert backup_config['adaptive_compression'] == True
+    assert backup_config['verify_after_backup'] == True
+    assert backup_config['exclude_patterns'] == ["cache/audio"]
+    assert backup_config['default_excludes'] == False
+    assert backup_config['codec'] == "gzip-mt"
+    assert backup_config['compression_level'] == 9
+    assert backup_config['compression_threads'] == 2
+
+@patch('ollama_stack_cli.commands.backup.log')
+def test_backup_stack_logic_unknown_codec(mock_log, mock_app_context):
+    """Test an unknown codec is rejected before the backup starts."""
+    result = backup_stack_logic(mock_app_context, codec="brotli")
+    
+    assert result == False
+    mock_app_context.stack_manager.create_backup.assert_not_called()
+    assert "Unknown compression codec: brotli" in mock_log.error.call_args.args[0]
+
+@patch('ollama_stack_cli.commands.backup.log')
+def test_backup_stack_logic_codec_ignored_without_compression(mock_log, mock_app_context):
+    """Test --no-compress does not require the codec to be installed."""
+    mock_app_context.stack_manager.create_backup.return_value = True
+    
+    assert backup_stack_logic(mock_app_context, compress=False, codec="brotli") == True
+
+def test_benchmark_compression_logic_renders_table(mock_app_context):
+    """Test benchmark results are shown as one table row per volume and codec."""
+    from ollama_stack_cli.schemas import CodecBenchmark
+    mock_app_context.stack_manager.benchmark_compression.return_value = [
+        CodecBenchmark(volume="webui_data", codec="gzip", level=6, sample_bytes=8 * 1024 * 1024,
+                       compressed_bytes=2 * 1024 * 1024, ratio=4.0, compress_mb_per_sec=55.5,
+                       decompress_mb_per_sec=310.2),
+    ]
+    
+    result = benchmark_compression_logic(mock_app_context, sample_mb=8, compression_threads=2)
+    
+    assert result == True
+    mock_app_context.stack_manager.benchmark_compression.assert_called_once_with(
+        codecs=None, sample_bytes=8 * 1024 * 1024, compression_threads=2
+    )
+    title, columns, rows = mock_app_context.display.table.call_args.args
+    assert columns[5] == "Ratio"
+    assert rows == [["webui_data", "gzip", "6", "1", "8.0", "4.00", "55.5", "310.2"]]
+
+def test_benchmark_compression_logic_no_volumes(mock_app_context):
+    mock_app_context.stack_manager.benchmark_compression.return_value = []
+    
+    assert benchmark_compression_logic(mock_app_context) == False
+    mock_app_context.display.table.assert_not_called()
+
+def test_backup_command_benchmark_skips_backup(mock_typer_context):
+    """Test --benchmark runs the benchmark instead of a backup."""
+    with patch('ollama_stack_cli.commands.backup.benchmark_compression_logic', return_value=True) as mock_benchmark, \
+            patch('ollama_stack_cli.commands.backup.backup_stack_logic') as mock_logic:
+        backup(ctx=mock_typer_context, benchmark=True, benchmark_sample=16, compression_threads=3)
+    
+    mock_benchmark.assert_called_once_with(
+        app_context=mock_typer_context.obj, sample_mb=16, compression_threads=3
+    )
+    mock_logic.assert_not_called()
+
+def test_backup_command_benchmark_failure_raises_exit(mock_typer_context):
+    with patch('ollama_stack_cli.commands.backup.benchmark_compression_logic', return_value=False):
+        with pytest.raises(typer.Exit) as exc_info:
+            backup(ctx=mock_typer_context, benchmark=True)
+    
+    assert exc_info.value.exit_code == 1
+
+# =============================================================================
+# Streamed Backup Tests
+# =============================================================================
+
+def test_backup_stack_logic_stream_file_uses_extension_codec(mock_app_context, tmp_path):
+    """Test a .tar.zst output is written as one stream with the codec its extension names."""
+    def write_stream(output, backup_config):
+        output.write(b"stream")
+        return True
+    mock_app_context.stack_manager.create_backup_stream.side_effect = write_stream
+    
+    with patch('ollama_stack_cli.compression.ZstdCodec.require'):
+        result = backup_stack_logic(mock_app_context, output_path=str(tmp_path / "backup.tar.zst"))
+    
+    assert result == True
+    mock_app_context.stack_manager.create_backup.assert_not_called()
+    assert mock_app_context.stack_manager.create_backup_stream.call_args.args[1]['codec'] == "zstd"
+    assert (tmp_path / "backup.tar.zst").read_bytes() == b"stream"
+    assert not (tmp_path / "backup.tar.zst.partial").exists()
+
+def test_backup_stack_logic_stream_failure_removes_partial_file(mock_app_context, tmp_path):
+    """Test a failed streamed backup leaves no file behind."""
+    mock_app_context.stack_manager.create_backup_stream.return_value = False
+    
+    result = backup_stack_logic(mock_app_context, output_path=str(tmp_path / "backups" / "backup.tar.gz"))
+    
+    assert result == False
+    assert list((tmp_path / "backups").iterdir()) == []
+
+def test_backup_stack_logic_stream_to_stdout(mock_app_context):
+    """Test -o - streams to the binary stdout."""
+    mock_app_context.stack_manager.create_backup_stream.return_value = True
+    
+    with patch('sys.stdout') as mock_stdout:
+        mock_stdout.isatty.return_value = False
+        result = backup_stack_logic(mock_app_context, output_path="-")
+    
+    assert result == True
+    assert mock_app_context.stack_manager.create_backup_stream.call_args.args[0] is mock_stdout.buffer
+
+def test_backup_stack_logic_stream_refuses_terminal(mock_app_context):
+    with patch('sys.stdout') as mock_stdout:
+        mock_stdout.isatty.return_value = True
+        result = backup_stack_logic(mock_app_context, output_path="-")
+    
+    assert result == False
+    mock_app_context.stack_manager.create_backup_stream.assert_not_called()
+
+def test_backup_stack_logic_stream_rejects_dedupe(mock_app_context):
+    assert backup_stack_logic(mock_app_context, output_path="-", dedupe_blobs=True) == False
+    mock_app_context.stack_manager.create_backup_stream.assert_not_called()
+
+def test_backup_command_stdout_moves_display_to_stderr(mock_typer_context):
+    """Test -o - keeps stdout for the stream by sending output to stderr."""
+    with patch('ollama_stack_cli.commands.backup.backup_stack_logic', return_value=True):
+        backup(ctx=mock_typer_context, output="-")
+    
+    mock_typer_context.obj.display.use_stderr.assert_called_once()
+
+# =============================================================================
+# Resumed Backup Tests
+# =============================================================================
+
+def test_resume_backup_logic_continues_checkpointed_backup(mock_app_context, tmp_path):
+    """Test --resume hands the directory to create_backup with resume=True."""
+    (tmp_path / "backup_checkpoint.json").write_text("{}")
+    mock_app_context.stack_manager.create_backup.return_value = True
+    
+    assert resume_backup_logic(mock_app_context, str(tmp_path)) == True
+    mock_app_context.stack_manager.create_backup.assert_called_once_with(backup_dir=tmp_path.resolve(), resume=True)
+
+def test_resume_backup_logic_without_checkpoint(mock_app_context, tmp_path):
+    assert resume_backup_logic(mock_app_context, str(tmp_path)) == False
+    mock_app_context.stack_manager.create_backup.assert_not_called()
+
+def test_backup_command_resume_skips_new_backup(mock_typer_context):
+    with patch('ollama_stack_cli.commands.backup.resume_backup_logic', return_value=True) as mock_resume, \
+            patch('ollama_stack_cli.commands.backup.backup_stack_logic') as mock_logic:
+        backup(ctx=mock_typer_context, resume="./backup")
+    
+    mock_resume.assert_called_once_with(mock_typer_context.obj, "./backup")
+    mock_logic.assert_not_called()
+
+def test_backup_command_resume_rejects_output(mock_typer_context):
+    with patch('ollama_stack_cli.commands.backup.resume_backup_logic') as mock_resume:
+        with pytest.raises(typer.Exit):
+            backup(ctx=mock_typer_context, resume="./backup", output="-")
+    mock_resume.assert_not_called()
+
+# =============================================================================
+# Backup Catalog Tests
+# =============================================================================
+
+def _catalog_entry(backup_id, day):
+    from ollama_stack_cli.schemas import BackupCatalogEntry
+    return BackupCatalogEntry(
+        backup_id=backup_id, created_at=datetime(2026, 3, day), path=f"/backups/{backup_id}",
+        size_bytes=2 * 1024 * 1024, volumes=["ollama_data", "webui_data"],
+    )
+
+def test_backup_list_logic_renders_table(mock_app_context):
+    mock_app_context.stack_manager.list_backups.return_value = [_catalog_entry("new", 2), _catalog_entry("old", 1)]
+    
+    assert backup_list_logic(mock_app_context) == True
+    
+    mock_app_context.stack_manager.list_backups.assert_called_once_with(rebuild=False)
+    title, columns, rows = mock_app_context.display.table.call_args.args
+    assert [row[0] for row in rows] == ["new", "old"]
+    assert rows[0][2] == "2.0"
+    assert rows[0][4] == "ollama_data, webui_data"
+
+def test_backup_list_logic_empty_catalog(mock_app_context):
+    mock_app_context.stack_manager.list_backups.return_value = []
+    
+    assert backup_list_logic(mock_app_context) == True
+    mock_app_context.display.table.assert_not_called()
+
+def test_backup_list_logic_failure(mock_app_context):
+    mock_app_context.stack_manager.list_backups.side_effect = OSError("unreadable")
+    assert backup_list_logic(mock_app_context, rebuild=True) == False
+
+def test_prune_backups_logic_requires_retention_policy(mock_app_context):
+    """Test pruning without a keep option is refused rather than deleting every backup."""
+    assert prune_backups_logic(mock_app_context, force=True) == False
+    mock_app_context.stack_manager.prune_backups.assert_not_called()
+
+@patch('typer.confirm', return_value=False)
+def test_prune_backups_logic_cancelled(mock_confirm, mock_app_context):
+    assert prune_backups_logic(mock_app_context, keep_daily=7) == False
+    mock_confirm.assert_called_once()
+    mock_app_context.stack_manager.prune_backups.assert_not_called()
+
+@patch('typer.confirm')
+def test_prune_backups_logic_dry_run_skips_confirmation(mock_confirm, mock_app_context):
+    from ollama_stack_cli.schemas import BackupPruneReport
+    mock_app_context.stack_manager.prune_backups.return_value = BackupPruneReport(
+        kept=[_catalog_entry("new", 2)], removed=[_catalog_entry("old", 1)],
+        reclaimed_blobs=2, reclaimed_bytes=1024, dry_run=True,
+    )
+    
+    assert prune_backups_logic(mock_app_context, keep_daily=1, keep_weekly=4, dry_run=True) == True
+    
+    mock_confirm.assert_not_called()
+    mock_app_context.stack_manager.prune_backups.assert_called_once_with(keep_daily=1, keep_weekly=4, dry_run=True)
+
+def test_prune_backups_logic_failure(mock_app_context):
+    mock_app_context.stack_manager.prune_backups.side_effect = OSError("denied")
+    assert prune_backups_logic(mock_app_context, keep_weekly=4, force=True) == False
+
+def test_backup_group_runs_subcommands_without_backing_up(mock_app_context):
+    """Test `backup list` and `backup prune` reach their own logic instead of creating a backup."""
+    from typer.testing import CliRunner
+    from ollama_stack_cli.main import app
+    runner = CliRunner()
+    
+    with patch('ollama_stack_cli.main.AppContext', return_value=mock_app_context), \
+            patch('ollama_stack_cli.commands.backup.backup_stack_logic') as mock_logic, \
+            patch('ollama_stack_cli.commands.backup.backup_list_logic', return_value=True) as mock_list, \
+            patch('ollama_stack_cli.commands.backup.prune_backups_logic', return_value=True) as mock_prune:
+        assert runner.invoke(app, ["backup", "list", "--rebuild"]).exit_code == 0
+        assert runner.invoke(app, ["backup", "prune", "--keep-daily", "7", "--force"]).exit_code == 0
+    
+    mock_logic.assert_not_called()
+    mock_list.assert_called_once_with(mock_app_context, rebuild=True)
+    mock_prune.assert_called_once_with(mock_app_context, keep_daily=7, keep_weekly=0, dry_run=False, force=True)
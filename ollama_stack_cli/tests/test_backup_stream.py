@@ -0,0 +1,105 @@
+import gzip
+import hashlib
+import io
+import tarfile
+
+import pytest
+
+from ollama_stack_cli.backup_stream import (
+    STREAM_HEADER,
+    STREAM_TRAILER,
+    BackupStreamReader,
+    BackupStreamWriter,
+    codec_for_path,
+    is_stream_path,
+)
+from ollama_stack_cli.compression import detect_codec
+
+VOLUME = bytes(range(256)) * 400
+
+
+def write_stream(codec="gzip", part_size=4096):
+    output = io.BytesIO()
+    with BackupStreamWriter(output, codec, part_size=part_size) as writer:
+        writer.add_bytes(STREAM_HEADER, b"{}")
+        with writer.open_file("volumes/ollama_data.tar") as volume:
+            for offset in range(0, len(VOLUME), 1000):
+                volume.write(VOLUME[offset:offset + 1000])
+        with writer.open_file("volumes/empty.tar"):
+            pass
+        writer.add_bytes(STREAM_TRAILER, b"{}")
+    return output.getvalue()
+
+
+def read_stream(data):
+    return [(name, contents.read()) for name, contents in BackupStreamReader(io.BufferedReader(io.BytesIO(data)))]
+
+
+@pytest.mark.parametrize("codec", ["none", "gzip", "gzip-mt"])
+def test_stream_round_trip_joins_parts(codec):
+    """Tests files split into parts come back whole and in order, whatever the codec."""
+    entries = read_stream(write_stream(codec))
+
+    assert entries == [
+        (STREAM_HEADER, b"{}"),
+        ("volumes/ollama_data.tar", VOLUME),
+        ("volumes/empty.tar", b""),
+        (STREAM_TRAILER, b"{}"),
+    ]
+
+
+def test_stream_is_a_standard_compressed_tar():
+    """Tests the stream unpacks with plain tar tooling, one member per part."""
+    data = write_stream("gzip")
+
+    with tarfile.open(fileobj=io.BytesIO(gzip.decompress(data)), mode="r") as tar:
+        names = tar.getnames()
+        joined = b"".join(tar.extractfile(name).read() for name in names if name.startswith("volumes/ollama_data"))
+
+    assert names[0] == STREAM_HEADER
+    assert names[-1] == STREAM_TRAILER
+    assert len([name for name in names if name.startswith("volumes/ollama_data.tar.part")]) == -(-len(VOLUME) // 4096)
+    assert hashlib.sha256(joined).digest() == hashlib.sha256(VOLUME).digest()
+
+
+def test_stream_reader_rejects_missing_part():
+    """Tests a stream with a part dropped fails instead of restoring a spliced file."""
+    with tarfile.open(fileobj=io.BytesIO(write_stream("none")), mode="r") as tar:
+        members = [(member, tar.extractfile(member).read()) for member in tar.getmembers()]
+    damaged = io.BytesIO()
+    with tarfile.open(fileobj=damaged, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for member, data in members:
+            if not member.name.endswith(".part000002"):
+                tar.addfile(member, io.BytesIO(data))
+
+    with pytest.raises(ValueError, match="missing part 2 of volumes/ollama_data.tar"):
+        read_stream(damaged.getvalue())
+
+
+def test_add_bytes_returns_digest():
+    writer = BackupStreamWriter(io.BytesIO(), "none")
+
+    digest = writer.add_bytes("config/.env", b"KEY=1")
+
+    assert (digest.path, digest.size) == ("config/.env", 5)
+    assert digest.sha256 == hashlib.sha256(b"KEY=1").hexdigest()
+
+
+@pytest.mark.parametrize("head,expected", [
+    (b"\x1f\x8b\x08\x00", "gzip"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"\x04\x22\x4d\x18", "lz4"),
+    (b"back", "none"),
+])
+def test_detect_codec(head, expected):
+    assert detect_codec(head) == expected
+
+
+def test_stream_paths_and_codecs():
+    assert is_stream_path("-")
+    assert is_stream_path("backup.tar.zst")
+    assert not is_stream_path("./backup-20250101")
+    assert codec_for_path("backup.tar.zst", "gzip") == "zstd"
+    assert codec_for_path("backup.tar", "gzip") == "none"
+    assert codec_for_path("backup.tar.gz", "gzip-mt") == "gzip-mt"
+    assert codec_for_path("-", "lz4") == "lz4"
@@ -0,0 +1,110 @@
+import hashlib
+import io
+import tarfile
+
+import pytest
+
+from ollama_stack_cli.blob_store import BlobStore, model_blob_digest
+from ollama_stack_cli.schemas import BlobRef
+
+
+def blob_member(content, digest=None):
+    digest = digest or hashlib.sha256(content).hexdigest()
+    member = tarfile.TarInfo(f"./models/blobs/sha256-{digest}")
+    member.size = len(content)
+    member.mode = 0o600
+    member.mtime = 1700000000
+    return member, digest
+
+
+def test_model_blob_digest():
+    """Tests only Ollama model blob paths are recognized."""
+    digest = "0123456789abcdef" * 4
+
+    assert model_blob_digest(f"./models/blobs/sha256-{digest}") == digest
+    assert model_blob_digest(f"./models/manifests/sha256-{digest}") is None
+    assert model_blob_digest("./models/blobs/sha256-short") is None
+    assert model_blob_digest("./id_ed25519") is None
+
+
+def test_ingest_copies_new_blob(tmp_path):
+    """Tests a new blob is copied into the store and referenced with its metadata."""
+    store = BlobStore(tmp_path / "store")
+    member, digest = blob_member(b"model weights")
+
+    ref, copied = store.ingest(member, io.BytesIO(b"model weights"), digest)
+
+    assert copied is True
+    assert store.has(digest)
+    assert store.object_path(digest).read_bytes() == b"model weights"
+    assert ref == BlobRef(path=member.name, digest=digest, size=13, mode=0o600, uid=0, gid=0, mtime=1700000000)
+    assert [p.name for p in (tmp_path / "store" / "sha256").iterdir()] == [digest]
+
+
+def test_ingest_skips_known_blob_without_reading(tmp_path):
+    """Tests a blob already in the store is referenced without reading its contents."""
+    store = BlobStore(tmp_path / "store")
+    member, digest = blob_member(b"model weights")
+    store.ingest(member, io.BytesIO(b"model weights"), digest)
+
+    class Unreadable(io.RawIOBase):
+        def read(self, size=-1):
+            raise AssertionError("known blob contents were read")
+
+    ref, copied = store.ingest(member, Unreadable(), digest)
+
+    assert copied is False
+    assert ref.digest == digest
+
+
+def test_ingest_stores_mismatched_blob_by_content(tmp_path):
+    """Tests a blob whose contents do not match its name is stored under its real digest."""
+    store = BlobStore(tmp_path / "store")
+    claimed = "f" * 64
+    member, _ = blob_member(b"unexpected", digest=claimed)
+
+    ref, copied = store.ingest(member, io.BytesIO(b"unexpected"), claimed)
+
+    actual = hashlib.sha256(b"unexpected").hexdigest()
+    assert ref.digest == actual
+    assert store.has(actual)
+    assert not store.has(claimed)
+
+
+def test_ingest_failure_leaves_no_partial_object(tmp_path):
+    """Tests an interrupted copy removes its temporary file."""
+    store = BlobStore(tmp_path / "store")
+    member, digest = blob_member(b"data")
+
+    class Broken(io.RawIOBase):
+        def read(self, size=-1):
+            raise OSError("stream reset")
+
+    with pytest.raises(OSError):
+        store.ingest(member, Broken(), digest)
+
+    assert list((tmp_path / "store" / "sha256").iterdir()) == []
+
+
+def test_member_for_round_trips_ref():
+    """Tests member_for rebuilds the original archive member."""
+    ref = BlobRef(path="./models/blobs/sha256-" + "a" * 64, digest="a" * 64, size=42, mode=0o640, uid=1, gid=2, mtime=5)
+
+    member = BlobStore.member_for(ref)
+
+    assert (member.name, member.size, member.mode, member.uid, member.gid, member.mtime) == (ref.path, 42, 0o640, 1, 2, 5)
+    assert member.isreg()
+
+
+def test_digests_and_remove(tmp_path):
+    """Tests stored blobs are listed, in-progress copies skipped, and removal reports the bytes freed."""
+    store = BlobStore(tmp_path / "store")
+    member, digest = blob_member(b"model weights")
+    store.ingest(member, io.BytesIO(b"model weights"), digest)
+    (store.root / "sha256" / ".partial-copy").write_bytes(b"in progress")
+
+    assert list(store.digests()) == [digest]
+    assert store.remove(digest) == 13
+    assert not store.has(digest)
+    assert store.remove(digest) == 0
+    assert list(BlobStore(tmp_path / "missing").digests()) == []
@@ -0,0 +1,249 @@
+import gzip
+import io
+import os
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from ollama_stack_cli.compression import (
+    ADAPTIVE_CODEC_KEY,
+    ADAPTIVE_SIZE_KEY,
+    CODECS,
+    AdaptiveCompressor,
+    ParallelGzipWriter,
+    archive_name,
+    benchmark_codec,
+    benchmark_codecs,
+    detect_incompressible_format,
+    get_codec,
+    is_compressible,
+    iter_adaptive_tar,
+    iter_selected_tar,
+)
+from ollama_stack_cli.volume_archive import PathSelector, rebase_tar_stream
+
+SAMPLE = b"".join(f"line {i}: some fairly repetitive volume data\n".encode() for i in range(20000))
+
+
+def round_trip(codec_name, data, **kwargs):
+    codec = get_codec(codec_name)
+    raw = io.BytesIO()
+    with codec.open_writer(raw, **kwargs) as writer:
+        writer.write(data)
+    assert not raw.closed
+    compressed = raw.getvalue()
+    with codec.open_reader(io.BytesIO(compressed)) as reader:
+        return compressed, reader.read()
+
+
+@pytest.mark.parametrize("codec_name", ["none", "gzip", "gzip-mt"])
+def test_round_trip_leaves_file_open(codec_name):
+    """Tests that built-in codecs restore the input and never close the wrapped file."""
+    compressed, restored = round_trip(codec_name, SAMPLE)
+
+    assert restored == SAMPLE
+    if codec_name != "none":
+        assert len(compressed) < len(SAMPLE)
+
+
+def test_parallel_gzip_writes_standard_gzip_members():
+    """Tests that gzip-mt output is a multi-member gzip file any gzip reader accepts."""
+    raw = io.BytesIO()
+    with ParallelGzipWriter(raw, level=6, threads=3, block_size=4096) as writer:
+        for offset in range(0, len(SAMPLE), 1000):
+            writer.write(SAMPLE[offset:offset + 1000])
+
+    assert gzip.decompress(raw.getvalue()) == SAMPLE
+    # Every block became its own member, written in input order
+    assert raw.getvalue().count(b"\x1f\x8b\x08") >= len(SAMPLE) // 4096
+
+
+def test_compression_level_is_applied():
+    """Tests that a higher level produces a smaller gzip archive than level 1."""
+    fast, _ = round_trip("gzip", SAMPLE, level=1)
+    small, _ = round_trip("gzip", SAMPLE, level=9)
+
+    assert len(small) < len(fast)
+
+
+def test_get_codec_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown compression codec: brotli"):
+        get_codec("brotli")
+
+
+def test_archive_name_uses_codec_extension():
+    assert archive_name("ollama_data", "gzip") == "ollama_data.tar.gz"
+    assert archive_name("ollama_data", "gzip-mt") == "ollama_data.tar.gz"
+    assert archive_name("ollama_data", "none") == "ollama_data.tar"
+    assert archive_name("ollama_data", "zstd") == "ollama_data.tar.zst"
+    assert archive_name("ollama_data", "lz4") == "ollama_data.tar.lz4"
+    assert archive_name("ollama_data", "zstd", adaptive=True) == "ollama_data.tar"
+
+
+@pytest.mark.parametrize("codec_name,package", [("zstd", "zstandard"), ("lz4", "lz4")])
+def test_optional_codecs_name_their_package_when_missing(codec_name, package):
+    """Tests that using an uninstalled optional codec explains what to install."""
+    codec = get_codec(codec_name)
+    with patch.object(codec, "available", return_value=False):
+        with pytest.raises(RuntimeError, match=f"pip install {package}"):
+            codec.open_writer(io.BytesIO())
+
+
+def test_benchmark_codec_reports_ratio_and_throughput():
+    result = benchmark_codec("gzip", SAMPLE, volume="webui_data")
+
+    assert result.volume == "webui_data"
+    assert result.codec == "gzip"
+    assert result.level == 6
+    assert result.threads == 1
+    assert result.sample_bytes == len(SAMPLE)
+    assert result.ratio == pytest.approx(len(SAMPLE) / result.compressed_bytes, rel=1e-3)
+    assert result.ratio > 1
+    assert result.compress_mb_per_sec > 0
+    assert result.decompress_mb_per_sec > 0
+
+
+def test_benchmark_codecs_skips_uninstalled_codecs():
+    """Tests that the benchmark covers installed codecs and skips the rest."""
+    with patch.object(CODECS["zstd"], "available", return_value=False), \
+            patch.object(CODECS["lz4"], "available", return_value=False):
+        results = benchmark_codecs(SAMPLE, threads=2)
+
+    assert [result.codec for result in results] == ["none", "gzip", "gzip-mt"]
+    assert results[0].ratio == pytest.approx(1.0)
+    assert results[2].threads == 2
+
+
+# =============================================================================
+# Adaptive Per-File Compression
+# =============================================================================
+
+WEIGHTS = b"GGUF" + os.urandom(200_000)
+SQLITE = b"SQLite format 3\x00" + b"CREATE TABLE chat (id INTEGER, body TEXT);" * 2000
+NOISE = os.urandom(100_000)
+
+
+def build_volume_tar(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        directory = tarfile.TarInfo("data")
+        directory.type = tarfile.DIRTYPE
+        tar.addfile(directory)
+        for name, content in files.items():
+            info = tarfile.TarInfo(f"data/{name}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("head,expected", [
+    (b"GGUF\x03\x00\x00\x00", "gguf"),
+    (b"\x89PNG\r\n\x1a\n....", "png"),
+    (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "webp"),
+    (b"\x00\x00\x00\x18ftypmp42", "mp4"),
+    (b"SQLite format 3\x00", None),
+    (b'{"schemaVersion": 2}', None),
+])
+def test_detect_incompressible_format(head, expected):
+    assert detect_incompressible_format(head) == expected
+
+
+def test_is_compressible_samples_data():
+    assert is_compressible(SQLITE[:65536]) is True
+    assert is_compressible(NOISE[:65536]) is False
+    assert is_compressible(b"") is False
+
+
+def test_adaptive_compressor_round_trip():
+    """Tests weights and noise are stored, text is compressed, and decoding restores every file."""
+    files = {
+        "models/blobs/sha256-" + "a" * 64: WEIGHTS,
+        "webui.db": SQLITE,
+        "cache/random.bin": NOISE,
+        "models/manifests/llama3": b'{"layers": []}',
+    }
+    encoder = AdaptiveCompressor("gzip")
+    archive = io.BytesIO()
+
+    rebase_tar_stream(io.BytesIO(build_volume_tar(files)), archive, "data", encode=encoder)
+
+    assert (encoder.compressed_files, encoder.stored_files) == (1, 3)
+    assert encoder.stored_bytes == len(WEIGHTS) + len(NOISE) + len(files["models/manifests/llama3"])
+    archive.seek(0)
+    with tarfile.open(fileobj=archive, mode="r") as tar:
+        db = tar.getmember("./webui.db")
+        assert db.pax_headers[ADAPTIVE_CODEC_KEY] == "gzip"
+        assert db.pax_headers[ADAPTIVE_SIZE_KEY] == str(len(SQLITE))
+        assert db.size < len(SQLITE) // 10
+        weights = tar.getmember("./models/blobs/sha256-" + "a" * 64)
+        assert ADAPTIVE_CODEC_KEY not in weights.pax_headers
+        assert weights.size == len(WEIGHTS)
+
+    archive.seek(0)
+    decoded = b"".join(iter_adaptive_tar(archive))
+    with tarfile.open(fileobj=io.BytesIO(decoded), mode="r") as tar:
+        assert tar.getnames()[0] == "."
+        for name, content in files.items():
+            member = tar.getmember(f"./{name}")
+            assert ADAPTIVE_CODEC_KEY not in member.pax_headers
+            assert tar.extractfile(member).read() == content
+
+
+def test_iter_adaptive_tar_passes_plain_archives_through():
+    """Tests an archive without adaptive members decodes to the same files."""
+    plain = build_volume_tar({"config.json": b"{}"})
+
+    decoded = b"".join(iter_adaptive_tar(io.BytesIO(plain)))
+
+    with tarfile.open(fileobj=io.BytesIO(decoded), mode="r") as tar:
+        assert tar.extractfile("data/config.json").read() == b"{}"
+
+
+class CountingReader(io.BytesIO):
+    """BytesIO that counts the bytes read out of it."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def test_iter_selected_tar_seeks_past_unselected_members():
+    """Tests a seekable adaptive archive yields only the selected files, decoded, without reading the rest."""
+    files = {
+        "models/blobs/sha256-" + "a" * 64: WEIGHTS,
+        "webui.db": SQLITE,
+        "uploads/a.txt": b"first",
+        "uploads/b.txt": b"second",
+        "uploads.txt": b"not under uploads/",
+    }
+    archive = io.BytesIO()
+    rebase_tar_stream(io.BytesIO(build_volume_tar(files)), archive, "data", encode=AdaptiveCompressor("gzip"))
+    source = CountingReader(archive.getvalue())
+    selector = PathSelector(["/webui.db", "uploads/"])
+
+    decoded = b"".join(iter_selected_tar(source, selector, seekable=True))
+
+    with tarfile.open(fileobj=io.BytesIO(decoded), mode="r") as tar:
+        assert sorted(tar.getnames()) == ["./uploads/a.txt", "./uploads/b.txt", "./webui.db"]
+        assert tar.extractfile("./webui.db").read() == SQLITE
+    assert selector.selected == 3
+    assert source.bytes_read < len(WEIGHTS) // 2
+
+
+def test_iter_selected_tar_filters_a_compressed_stream():
+    """Tests members are selected out of a whole-archive compressed stream."""
+    plain = build_volume_tar({"webui.db": SQLITE, "config.json": b"{}"})
+    compressed = gzip.compress(plain)
+    selector = PathSelector(["data/config.json"])
+
+    decoded = b"".join(iter_selected_tar(get_codec("gzip").open_reader(io.BytesIO(compressed)), selector))
+
+    with tarfile.open(fileobj=io.BytesIO(decoded), mode="r") as tar:
+        assert tar.getnames() == ["data/config.json"]
+        assert tar.extractfile("data/config.json").read() == b"{}"
@@ -763,6 +763,69 @@ def test_validate_backup_manifest_missing_volume_files(tmp_path: Path, mock_disp
     assert is_valid == False
     assert parsed_manifest is not None  # Manifest parses but files are missing
 
+def test_validate_backup_manifest_uses_codec_archive_names(tmp_path: Path, mock_display: MagicMock):
+    """Tests validation looks for volume archives under the extension of the recorded codec."""
+    from ollama_stack_cli.config import validate_backup_manifest
+    from ollama_stack_cli.schemas import BackupManifest, BackupConfig
+    import json
+    
+    backup_dir = tmp_path / "backup"
+    (backup_dir / "volumes").mkdir(parents=True)
+    manifest = BackupManifest(
+        stack_version="0.2.0",
+        cli_version="0.2.0",
+        platform="linux",
+        backup_config=BackupConfig(codec="zstd"),
+        codec="zstd",
+        volumes=["webui_data"],
+    )
+    manifest_file = backup_dir / "backup_manifest.json"
+    with open(manifest_file, "w") as f:
+        json.dump(manifest.model_dump(), f, default=str)
+    
+    # A gzip archive does not satisfy a zstd manifest
+    (backup_dir / "volumes" / "webui_data.tar.gz").touch()
+    assert validate_backup_manifest(manifest_file, backup_dir)[0] is False
+    
+    (backup_dir / "volumes" / "webui_data.tar.zst").touch()
+    assert validate_backup_manifest(manifest_file, backup_dir)[0] is True
+
+def test_validate_backup_manifest_missing_model_blobs(tmp_path: Path, mock_display: MagicMock):
+    """Tests validation checks deduplicated model blobs in the shared blob store."""
+    from ollama_stack_cli.config import validate_backup_manifest
+    from ollama_stack_cli.schemas import BackupManifest, BackupConfig, BlobRef
+    import json
+    
+    backup_dir = tmp_path / "backups" / "backup-1"
+    (backup_dir / "volumes").mkdir(parents=True)
+    (backup_dir / "volumes" / "ollama_data.tar.gz").touch()
+    present, missing = "a" * 64, "b" * 64
+    (tmp_path / "backups" / "blob-store" / "sha256").mkdir(parents=True)
+    (tmp_path / "backups" / "blob-store" / "sha256" / present).touch()
+    
+    manifest = BackupManifest(
+        stack_version="0.2.0",
+        cli_version="0.2.0",
+        platform="linux",
+        backup_config=BackupConfig(deduplicate_blobs=True),
+        volumes=["ollama_data"],
+        blob_store="../blob-store",
+        volume_blobs={"ollama_data": [
+            BlobRef(path=f"./models/blobs/sha256-{present}", digest=present, size=0),
+        ]},
+    )
+    manifest_file = backup_dir / "backup_manifest.json"
+    manifest_file.write_text(json.dumps(manifest.model_dump(), default=str))
+    
+    assert validate_backup_manifest(manifest_file, backup_dir)[0] is True
+    
+    manifest.volume_blobs["ollama_data"].append(
+        BlobRef(path=f"./models/blobs/sha256-{missing}", digest=missing, size=0)
+    )
+    manifest_file.write_text(json.dumps(manifest.model_dump(), default=str))
+    
+    assert validate_backup_manifest(manifest_file, backup_dir)[0] is False
+
 def test_validate_backup_manifest_missing_config_files(tmp_path: Path, mock_display: MagicMock):
     """Tests validation failure when config backup files are missing."""
     from ollama_stack_cli.config import validate_backup_manifest
@@ -939,6 +1002,114 @@ def test_validate_backup_manifest_no_checksum(tmp_path: Path, mock_display: Magi
     assert is_valid == True
     assert parsed_manifest is not None
 
+def write_digested_backup(backup_dir: Path):
+    """Writes a two-volume backup whose manifest records per-file digests and a Merkle root."""
+    from ollama_stack_cli.integrity import backup_file_paths, digest_files, merkle_root
+    from ollama_stack_cli.schemas import BackupManifest, BackupConfig
+    import json
+
+    (backup_dir / "volumes").mkdir(parents=True)
+    (backup_dir / "config").mkdir()
+    (backup_dir / "volumes" / "ollama_data.tar.gz").write_bytes(b"ollama archive")
+    (backup_dir / "volumes" / "webui_data.tar.gz").write_bytes(b"webui archive")
+    (backup_dir / "config" / ".env").write_text("KEY=1")
+
+    manifest = BackupManifest(
+        stack_version="0.2.0",
+        cli_version="0.2.0",
+        platform="linux",
+        backup_config=BackupConfig(),
+        volumes=["ollama_data", "webui_data"],
+        config_files=[".env"],
+    )
+    manifest.files = digest_files(backup_dir, backup_file_paths(manifest))
+    manifest.checksum = merkle_root(manifest.files)
+
+    manifest_file = backup_dir / "backup_manifest.json"
+    with open(manifest_file, "w") as f:
+        json.dump(manifest.model_dump(), f, default=str)
+    return manifest_file
+
+def test_validate_backup_manifest_file_digests_success(tmp_path: Path, mock_display: MagicMock):
+    """Tests validation of a backup whose manifest carries per-file digests."""
+    from ollama_stack_cli.config import validate_backup_manifest
+
+    manifest_file = write_digested_backup(tmp_path)
+
+    is_valid, manifest = validate_backup_manifest(manifest_file, tmp_path)
+
+    assert is_valid == True
+    assert [d.path for d in manifest.files] == [
+        "config/.env", "volumes/ollama_data.tar.gz", "volumes/webui_data.tar.gz",
+    ]
+
+def test_validate_backup_manifest_detects_corrupted_file(tmp_path: Path, mock_display: MagicMock):
+    """Tests that a file whose contents changed fails its recorded digest."""
+    from ollama_stack_cli.config import validate_backup_manifest
+
+    manifest_file = write_digested_backup(tmp_path)
+    (tmp_path / "volumes" / "webui_data.tar.gz").write_bytes(b"webui archivX")
+
+    is_valid, _ = validate_backup_manifest(manifest_file, tmp_path)
+
+    assert is_valid == False
+
+def test_validate_backup_manifest_detects_tampered_digest_list(tmp_path: Path, mock_display: MagicMock):
+    """Tests that digests edited to match altered files no longer match the Merkle root."""
+    from ollama_stack_cli.config import validate_backup_manifest
+    from ollama_stack_cli.integrity import file_sha256
+    import json
+
+    manifest_file = write_digested_backup(tmp_path)
+    archive = tmp_path / "volumes" / "webui_data.tar.gz"
+    archive.write_bytes(b"webui archivX")
+    data = json.loads(manifest_file.read_text())
+    data["files"][2]["sha256"] = file_sha256(archive)
+    manifest_file.write_text(json.dumps(data))
+
+    is_valid, _ = validate_backup_manifest(manifest_file, tmp_path)
+
+    assert is_valid == False
+
+def test_validate_backup_manifest_selected_volumes_only(tmp_path: Path, mock_display: MagicMock):
+    """Tests that validating selected volumes ignores damage to files outside them."""
+    from ollama_stack_cli.config import validate_backup_manifest
+    from ollama_stack_cli.integrity import file_sha256
+
+    manifest_file = write_digested_backup(tmp_path)
+    (tmp_path / "volumes" / "webui_data.tar.gz").write_bytes(b"corrupted")
+    (tmp_path / "config" / ".env").unlink()
+
+    with patch("ollama_stack_cli.integrity.file_sha256", wraps=file_sha256) as mock_hash:
+        is_valid, _ = validate_backup_manifest(manifest_file, tmp_path, volumes=["ollama_data"])
+
+    assert is_valid == True
+    mock_hash.assert_called_once_with(tmp_path / "volumes" / "ollama_data.tar.gz")
+    assert validate_backup_manifest(manifest_file, tmp_path, volumes=["webui_data"])[0] == False
+
+def test_validate_backup_manifest_unknown_volume(tmp_path: Path, mock_display: MagicMock):
+    """Tests that selecting a volume the backup does not contain fails validation."""
+    from ollama_stack_cli.config import validate_backup_manifest
+
+    manifest_file = write_digested_backup(tmp_path)
+
+    is_valid, _ = validate_backup_manifest(manifest_file, tmp_path, volumes=["missing_data"])
+
+    assert is_valid == False
+
+def test_validate_backup_manifest_skip_content_verification(tmp_path: Path, mock_display: MagicMock):
+    """Tests that verify_contents=False checks presence without hashing."""
+    from ollama_stack_cli.config import validate_backup_manifest
+
+    manifest_file = write_digested_backup(tmp_path)
+    (tmp_path / "volumes" / "webui_data.tar.gz").write_bytes(b"corrupted")
+
+    with patch("ollama_stack_cli.integrity.file_sha256") as mock_hash:
+        is_valid, _ = validate_backup_manifest(manifest_file, tmp_path, verify_contents=False)
+
+    assert is_valid == True
+    mock_hash.assert_not_called()
+
 # =============================================================================
 # Phase 6.1: _calculate_backup_checksum() Tests
 # =============================================================================
@@ -1463,24 +1634,24 @@ def test_validate_backup_manifest_duplicate_entries(tmp_path: Path, mock_display
 # get_compose_file_path Tests
 # =============================================================================
 
-def test_get_compose_file_path_with_pkg_resources():
-    """Tests get_compose_file_path when pkg_resources is available."""
+def test_get_compose_file_path_with_importlib_resources():
+    """Tests get_compose_file_path resolves package data via importlib.resources."""
     from ollama_stack_cli.config import get_compose_file_path
     
-    with patch('pkg_resources.resource_filename') as mock_resource_filename:
-        mock_resource_filename.return_value = "/path/to/package/docker-compose.yml"
+    with patch('importlib.resources.files') as mock_files:
+        mock_files.return_value = Path("/path/to/package")
         
         result = get_compose_file_path("docker-compose.yml")
         
-        mock_resource_filename.assert_called_once_with('ollama_stack_cli', 'docker-compose.yml')
+        mock_files.assert_called_once_with('ollama_stack_cli')
         assert result == Path("/path/to/package/docker-compose.yml")
 
 
-def test_get_compose_file_path_without_pkg_resources():
-    """Tests get_compose_file_path fallback when pkg_resources is not available."""
+def test_get_compose_file_path_without_importlib_resources():
+    """Tests get_compose_file_path fallback when importlib.resources.files is unavailable."""
     from ollama_stack_cli.config import get_compose_file_path
     
-    with patch('pkg_resources.resource_filename', side_effect=ImportError):
+    with patch('importlib.resources.files', side_effect=ImportError):
         result = get_compose_file_path("docker-compose.yml")
         
         # Should fall back to relative path from config.py location
@@ -1494,12 +1665,12 @@ def test_get_compose_file_path_different_filenames():
     """Tests get_compose_file_path with different compose file names."""
     from ollama_stack_cli.config import get_compose_file_path
     
-    with patch('pkg_resources.resource_filename') as mock_resource_filename:
-        mock_resource_filename.return_value = "/path/to/package/test-file.yml"
+    with patch('importlib.resources.files') as mock_files:
+        mock_files.return_value = Path("/path/to/package")
         
         result = get_compose_file_path("test-file.yml")
         
-        mock_resource_filename.assert_called_once_with('ollama_stack_cli', 'test-file.yml')
+        mock_files.assert_called_once_with('ollama_stack_cli')
         assert result == Path("/path/to/package/test-file.yml")
 
 
@@ -1507,8 +1678,8 @@ def test_get_compose_file_path_development_fallback():
     """Tests get_compose_file_path fallback in development environment."""
     from ollama_stack_cli.config import get_compose_file_path
     
-    # Mock both pkg_resources import and the fallback path
-    with patch('pkg_resources.resource_filename', side_effect=ImportError):
+    # Mock both importlib.resources lookup and the fallback path
+    with patch('importlib.resources.files', side_effect=ImportError):
         with patch('ollama_stack_cli.config.__file__', '/dev/path/config.py'):
             result = get_compose_file_path("docker-compose.apple.yml")
             
@@ -1521,8 +1692,8 @@ def test_get_compose_file_path_absolute_paths():
     """Tests that get_compose_file_path returns absolute paths."""
     from ollama_stack_cli.config import get_compose_file_path
     
-    with patch('pkg_resources.resource_filename') as mock_resource_filename:
-        mock_resource_filename.return_value = "/absolute/path/to/docker-compose.yml"
+    with patch('importlib.resources.files') as mock_files:
+        mock_files.return_value = Path("/absolute/path/to")
         
         result = get_compose_file_path("docker-compose.yml")
         
@@ -5,13 +5,63 @@ import logging
 from ollama_stack_cli.context import AppContext
 
 
+def build_context(**kwargs):
+    """Creates an AppContext and forces its lazily built components into existence."""
+    ctx = AppContext(**kwargs)
+    ctx.stack_manager
+    return ctx
+
+
+# =============================================================================
+# Lazy Initialization Tests
+# =============================================================================
+
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
+def test_app_context_builds_nothing_up_front(MockConfig, MockDisplay, MockStackManager):
+    """Tests that constructing AppContext does not build any component."""
+    AppContext(verbose=True)
+
+    MockDisplay.assert_not_called()
+    MockConfig.assert_not_called()
+    MockStackManager.assert_not_called()
+
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
+def test_app_context_builds_only_requested_components(MockConfig, MockDisplay, MockStackManager):
+    """Tests that accessing config does not create the StackManager."""
+    ctx = AppContext()
+
+    assert ctx.config is MockConfig.return_value
+
+    MockDisplay.assert_called_once_with(verbose=False)
+    MockStackManager.assert_not_called()
+
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
+def test_app_context_components_are_built_once(MockConfig, MockDisplay, MockStackManager):
+    """Tests that repeated access returns the same cached components."""
+    ctx = AppContext()
+
+    assert ctx.stack_manager is ctx.stack_manager
+    assert ctx.config is ctx.config
+    assert ctx.display is ctx.display
+
+    MockDisplay.assert_called_once()
+    MockConfig.assert_called_once()
+    MockStackManager.assert_called_once()
+
+
 # =============================================================================
 # Successful Initialization Tests
 # =============================================================================
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_initialization_with_verbose_true(MockConfig, MockDisplay, MockStackManager):
     """Tests that AppContext correctly initializes its components with verbose=True."""
     # Setup mocks
@@ -28,7 +78,7 @@ def test_app_context_initialization_with_verbose_true(MockConfig, MockDisplay, M
     MockStackManager.return_value = mock_stack_manager_instance
     
     # Create an instance of AppContext
-    ctx = AppContext(verbose=True)
+    ctx = build_context(verbose=True)
 
     # Assert that our mocks were called correctly with proper parameters
     MockDisplay.assert_called_once_with(verbose=True)
@@ -43,9 +93,9 @@ def test_app_context_initialization_with_verbose_true(MockConfig, MockDisplay, M
     # Test the verbose property
     assert ctx.verbose is True
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_initialization_with_verbose_false_default(MockConfig, MockDisplay, MockStackManager):
     """Tests that AppContext correctly initializes its components with verbose=False (default)."""
     # Setup mocks
@@ -62,7 +112,7 @@ def test_app_context_initialization_with_verbose_false_default(MockConfig, MockD
     MockStackManager.return_value = mock_stack_manager_instance
     
     # Create an instance of AppContext with default verbose
-    ctx = AppContext()
+    ctx = build_context()
 
     # Assert that our mocks were called correctly with proper parameters
     MockDisplay.assert_called_once_with(verbose=False)
@@ -72,9 +122,9 @@ def test_app_context_initialization_with_verbose_false_default(MockConfig, MockD
     # Test the verbose property
     assert ctx.verbose is False
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_initialization_explicit_verbose_false(MockConfig, MockDisplay, MockStackManager):
     """Tests AppContext initialization with explicitly set verbose=False."""
     # Setup mocks
@@ -91,7 +141,7 @@ def test_app_context_initialization_explicit_verbose_false(MockConfig, MockDispl
     MockStackManager.return_value = mock_stack_manager_instance
     
     # Create an instance of AppContext with explicit verbose=False
-    ctx = AppContext(verbose=False)
+    ctx = build_context(verbose=False)
 
     # Assert that our mocks were called correctly
     MockDisplay.assert_called_once_with(verbose=False)
@@ -101,9 +151,9 @@ def test_app_context_initialization_explicit_verbose_false(MockConfig, MockDispl
     # Test the verbose property
     assert ctx.verbose is False
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_component_initialization_order(MockConfig, MockDisplay, MockStackManager):
     """Tests that AppContext initializes components in the correct order."""
     # Setup mocks
@@ -119,7 +169,7 @@ def test_app_context_component_initialization_order(MockConfig, MockDisplay, Moc
     MockStackManager.return_value = mock_stack_manager_instance
     
     # Create AppContext
-    AppContext(verbose=True)
+    build_context(verbose=True)
     
     # Verify the initialization order through call order
     # Display should be created first, then Config with Display, then StackManager with both
@@ -127,9 +177,9 @@ def test_app_context_component_initialization_order(MockConfig, MockDisplay, Moc
     MockConfig.assert_called_once_with(mock_display_instance)
     MockStackManager.assert_called_once_with(mock_app_config, mock_display_instance)
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_property_assignments(MockConfig, MockDisplay, MockStackManager):
     """Tests that AppContext correctly assigns all properties during initialization."""
     # Setup mocks with specific instances
@@ -144,7 +194,7 @@ def test_app_context_property_assignments(MockConfig, MockDisplay, MockStackMana
     mock_stack_manager_instance = MagicMock()
     MockStackManager.return_value = mock_stack_manager_instance
     
-    ctx = AppContext()
+    ctx = build_context()
     
     # Verify all properties are correctly assigned
     assert ctx.config is mock_config_instance
@@ -156,21 +206,21 @@ def test_app_context_property_assignments(MockConfig, MockDisplay, MockStackMana
 # Error Handling Tests - Display Initialization Failures
 # =============================================================================
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.config.Config')
 @patch('ollama_stack_cli.context.log')
 def test_app_context_display_initialization_failure(mock_log, MockConfig, MockStackManager):
     """Tests that AppContext handles exceptions from Display init and exits gracefully."""
     # Create a mock fallback display for error reporting
     mock_fallback_display = MagicMock()
     
-    with patch('ollama_stack_cli.context.Display') as MockDisplay:
+    with patch('ollama_stack_cli.display.Display') as MockDisplay:
         # First call (self.display creation) raises exception
         # Second call (fallback display for error reporting) succeeds
         MockDisplay.side_effect = [Exception("Display Error"), mock_fallback_display]
         
         with pytest.raises(SystemExit) as exc_info:
-            AppContext()
+            build_context()
         
         # Verify exit code
         assert exc_info.value.code == 1
@@ -198,14 +248,14 @@ def test_app_context_display_initialization_failure(mock_log, MockConfig, MockSt
 # Error Handling Tests - Config Initialization Failures
 # =============================================================================
 
-@patch('ollama_stack_cli.context.StackManager')
+@patch('ollama_stack_cli.stack_manager.StackManager')
 @patch('ollama_stack_cli.context.log')
 def test_app_context_config_initialization_failure(mock_log, MockStackManager):
     """Tests that AppContext handles exceptions from Config init and exits gracefully."""
     mock_fallback_display = MagicMock()
     
-    with patch('ollama_stack_cli.context.Display') as MockDisplay, \
-         patch('ollama_stack_cli.context.Config') as MockConfig:
+    with patch('ollama_stack_cli.display.Display') as MockDisplay, \
+         patch('ollama_stack_cli.config.Config') as MockConfig:
         
         # Main display succeeds, fallback display succeeds
         mock_display_instance = MagicMock()
@@ -215,7 +265,7 @@ def test_app_context_config_initialization_failure(mock_log, MockStackManager):
         MockConfig.side_effect = Exception("Config Error")
         
         with pytest.raises(SystemExit) as exc_info:
-            AppContext()
+            build_context()
         
         # Verify exit code
         assert exc_info.value.code == 1
@@ -245,9 +295,9 @@ def test_app_context_config_initialization_failure_with_verbose(mock_log):
     """Tests Config init failure with verbose=True propagates to fallback Display."""
     mock_fallback_display = MagicMock()
     
-    with patch('ollama_stack_cli.context.Display') as MockDisplay, \
-         patch('ollama_stack_cli.context.Config') as MockConfig, \
-         patch('ollama_stack_cli.context.StackManager') as MockStackManager:
+    with patch('ollama_stack_cli.display.Display') as MockDisplay, \
+         patch('ollama_stack_cli.config.Config') as MockConfig, \
+         patch('ollama_stack_cli.stack_manager.StackManager') as MockStackManager:
         
         # Main display succeeds, fallback display succeeds
         mock_display_instance = MagicMock()
@@ -257,7 +307,7 @@ def test_app_context_config_initialization_failure_with_verbose(mock_log):
         MockConfig.side_effect = Exception("Config Error")
         
         with pytest.raises(SystemExit):
-            AppContext(verbose=True)
+            build_context(verbose=True)
         
         # Verify Display calls: first with verbose=True, second fallback with verbose=True
         MockDisplay.assert_has_calls([
@@ -275,9 +325,9 @@ def test_app_context_stack_manager_initialization_failure(mock_log):
     """Tests that AppContext handles exceptions from StackManager init and exits gracefully."""
     mock_fallback_display = MagicMock()
     
-    with patch('ollama_stack_cli.context.Display') as MockDisplay, \
-         patch('ollama_stack_cli.context.Config') as MockConfig, \
-         patch('ollama_stack_cli.context.StackManager') as MockStackManager:
+    with patch('ollama_stack_cli.display.Display') as MockDisplay, \
+         patch('ollama_stack_cli.config.Config') as MockConfig, \
+         patch('ollama_stack_cli.stack_manager.StackManager') as MockStackManager:
         
         # Setup successful Display and Config
         mock_display_instance = MagicMock()
@@ -292,7 +342,7 @@ def test_app_context_stack_manager_initialization_failure(mock_log):
         MockStackManager.side_effect = Exception("StackManager Error")
         
         with pytest.raises(SystemExit) as exc_info:
-            AppContext()
+            build_context()
         
         # Verify exit code
         assert exc_info.value.code == 1
@@ -320,14 +370,14 @@ def test_app_context_stack_manager_initialization_failure(mock_log):
 @patch('ollama_stack_cli.context.log')
 def test_app_context_fallback_display_creation_failure(mock_log):
     """Tests behavior when both main and fallback Display creation fail."""
-    with patch('ollama_stack_cli.context.Display') as MockDisplay:
+    with patch('ollama_stack_cli.display.Display') as MockDisplay:
         # Both Display calls fail
         MockDisplay.side_effect = [Exception("Display Error"), Exception("Fallback Display Error")]
         
         # When fallback Display creation fails, the exception propagates (this is current behavior)
         # The fallback Display creation is not wrapped in try/catch, so the second exception propagates
         with pytest.raises(Exception) as exc_info:
-            AppContext()
+            build_context()
         
         # The second exception (Fallback Display Error) should propagate
         assert str(exc_info.value) == "Fallback Display Error"
@@ -338,8 +388,8 @@ def test_app_context_error_logging_message_format(mock_log):
     """Tests that error logging contains proper message format and exception details."""
     mock_fallback_display = MagicMock()
     
-    with patch('ollama_stack_cli.context.Display') as MockDisplay, \
-         patch('ollama_stack_cli.context.Config') as MockConfig:
+    with patch('ollama_stack_cli.display.Display') as MockDisplay, \
+         patch('ollama_stack_cli.config.Config') as MockConfig:
         
         mock_display_instance = MagicMock()
         MockDisplay.side_effect = [mock_display_instance, mock_fallback_display]
@@ -349,7 +399,7 @@ def test_app_context_error_logging_message_format(mock_log):
         MockConfig.side_effect = test_exception
         
         with pytest.raises(SystemExit):
-            AppContext()
+            build_context()
         
         # Verify logging call details
         mock_log.error.assert_called_once()
@@ -364,9 +414,9 @@ def test_app_context_error_logging_message_format(mock_log):
 # Property and Delegation Tests
 # =============================================================================
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_verbose_property_delegation(MockConfig, MockDisplay, MockStackManager):
     """Tests that the verbose property correctly delegates to the display object."""
     # Setup mocks
@@ -380,7 +430,7 @@ def test_app_context_verbose_property_delegation(MockConfig, MockDisplay, MockSt
     mock_stack_manager_instance = MagicMock()
     MockStackManager.return_value = mock_stack_manager_instance
     
-    ctx = AppContext(verbose=True)
+    ctx = build_context(verbose=True)
     
     # Test that verbose property delegates to display
     assert ctx.verbose == mock_display_instance.verbose
@@ -390,9 +440,9 @@ def test_app_context_verbose_property_delegation(MockConfig, MockDisplay, MockSt
     mock_display_instance.verbose = False
     assert ctx.verbose is False
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_verbose_property_consistency(MockConfig, MockDisplay, MockStackManager):
     """Tests that verbose property remains consistent with display throughout lifecycle."""
     # Setup mocks
@@ -405,7 +455,7 @@ def test_app_context_verbose_property_consistency(MockConfig, MockDisplay, MockS
     
     MockStackManager.return_value = MagicMock()
     
-    ctx = AppContext()
+    ctx = build_context()
     
     # Test initial state
     assert ctx.verbose is False
@@ -422,9 +472,9 @@ def test_app_context_verbose_property_consistency(MockConfig, MockDisplay, MockS
 # Parameter Passing and Integration Tests
 # =============================================================================
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_config_receives_display_instance(MockConfig, MockDisplay, MockStackManager):
     """Tests that Config receives the exact Display instance created by AppContext."""
     # Setup mocks
@@ -436,14 +486,14 @@ def test_app_context_config_receives_display_instance(MockConfig, MockDisplay, M
     
     MockStackManager.return_value = MagicMock()
     
-    AppContext(verbose=True)
+    build_context(verbose=True)
     
     # Verify Config was called with the exact display instance
     MockConfig.assert_called_once_with(mock_display_instance)
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_stack_manager_receives_correct_parameters(MockConfig, MockDisplay, MockStackManager):
     """Tests that StackManager receives the correct app_config and display instances."""
     # Setup mocks
@@ -458,14 +508,14 @@ def test_app_context_stack_manager_receives_correct_parameters(MockConfig, MockD
     mock_stack_manager_instance = MagicMock()
     MockStackManager.return_value = mock_stack_manager_instance
     
-    AppContext()
+    build_context()
     
     # Verify StackManager was called with the exact instances
     MockStackManager.assert_called_once_with(mock_app_config, mock_display_instance)
 
-@patch('ollama_stack_cli.context.StackManager')
-@patch('ollama_stack_cli.context.Display')
-@patch('ollama_stack_cli.context.Config')
+@patch('ollama_stack_cli.stack_manager.StackManager')
+@patch('ollama_stack_cli.display.Display')
+@patch('ollama_stack_cli.config.Config')
 def test_app_context_handles_none_app_config(MockConfig, MockDisplay, MockStackManager):
     """Tests that AppContext handles the case where config.app_config is None."""
     # Setup mocks
@@ -479,7 +529,7 @@ def test_app_context_handles_none_app_config(MockConfig, MockDisplay, MockStackM
     mock_stack_manager_instance = MagicMock()
     MockStackManager.return_value = mock_stack_manager_instance
     
-    AppContext()
+    build_context()
     
     # Verify StackManager was still called with None (should be handled by StackManager)
     MockStackManager.assert_called_once_with(None, mock_display_instance) 
\ No newline at end of file
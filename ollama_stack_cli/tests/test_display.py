@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch, call
 import pytest
 import logging
+import sys
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress
@@ -116,6 +117,16 @@ class TestDisplayInitialization:
         assert display_false.verbose is False
         assert display_true.verbose is True
 
+    def test_use_stderr(self):
+        """Test that output, including log records, can be moved off stdout."""
+        display = Display()
+        assert display._console.stderr is False
+
+        display.use_stderr()
+
+        assert display._console.stderr is True
+        assert display._console.file is sys.stderr
+
 
 class TestDisplayBasicMethods:
     """Tests for basic display methods."""
@@ -8,10 +8,20 @@ import sys
 import pathlib
 import os
 import json
+import threading
+import time
+import io
+import tarfile
+import hashlib
+import functools
 from pathlib import Path
 
-from ollama_stack_cli.docker_client import DockerClient
-from ollama_stack_cli.schemas import AppConfig, PlatformConfig, ServiceStatus, ResourceUsage, CheckReport, EnvironmentCheck
+from ollama_stack_cli.blob_store import BlobStore
+from ollama_stack_cli.backup_checkpoint import BackupCheckpoint
+from ollama_stack_cli.compression import get_codec
+from ollama_stack_cli.volume_archive import ChunkStreamReader
+from ollama_stack_cli.docker_client import DockerClient, ContainerStatsMonitor, docker_request_count, get_docker_info, get_shared_docker_client
+from ollama_stack_cli.schemas import AppConfig, PlatformConfig, ServiceStatus, ResourceUsage, CheckReport, EnvironmentCheck, BackupConfig
 
 @pytest.fixture
 def mock_display():
@@ -66,6 +76,75 @@ def test_docker_client_init_connection_refused_message(mock_docker_from_env, moc
     
     assert client.client is None
 
+@patch('docker.from_env')
+def test_docker_client_connects_lazily(mock_docker_from_env, mock_config, mock_display):
+    """Tests that constructing a DockerClient does not contact the daemon."""
+    DockerClient(config=mock_config, display=mock_display)
+
+    mock_docker_from_env.assert_not_called()
+
+@patch('docker.from_env')
+def test_docker_clients_share_one_connection(mock_docker_from_env, mock_config, mock_display):
+    """Tests that every DockerClient reuses the process-wide SDK client."""
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+
+    first = DockerClient(config=mock_config, display=mock_display)
+    second = DockerClient(config=mock_config, display=mock_display)
+
+    assert first.client is second.client is mock_docker_client
+    mock_docker_from_env.assert_called_once()
+
+@patch('docker.from_env')
+def test_shared_client_counts_requests(mock_docker_from_env):
+    """Tests every response the shared client receives is counted."""
+    mock_docker_from_env.return_value.api.hooks = {"response": []}
+
+    client = get_shared_docker_client()
+    before = docker_request_count()
+    for hook in client.api.hooks["response"]:
+        assert hook(MagicMock()) is None
+        assert hook(MagicMock(), timeout=None) is None
+
+    assert docker_request_count() == before + 2
+
+@patch('docker.from_env')
+def test_shared_client_remembers_connection_failure(mock_docker_from_env):
+    """Tests that a failed connection is not retried by later callers."""
+    mock_docker_from_env.side_effect = docker.errors.DockerException("Docker not found")
+
+    for _ in range(2):
+        with pytest.raises(docker.errors.DockerException):
+            get_shared_docker_client()
+
+    mock_docker_from_env.assert_called_once()
+
+@patch('docker.from_env')
+def test_docker_info_fetched_once_and_reused(mock_docker_from_env, mock_config, mock_display, tmp_path):
+    """Tests that platform detection, the NVIDIA check and state export share one info() call."""
+    mock_docker_client = MagicMock()
+    mock_docker_client.info.return_value = {
+        'ServerVersion': '24.0.7',
+        'Runtimes': {'nvidia': {'path': '/usr/bin/nvidia-container-runtime'}},
+    }
+    mock_docker_client.containers.list.return_value = []
+    mock_docker_client.volumes.list.return_value = []
+    mock_docker_client.networks.list.return_value = []
+    mock_docker_client.images.list.return_value = []
+    mock_docker_from_env.return_value = mock_docker_client
+
+    assert get_docker_info()['ServerVersion'] == '24.0.7'
+    client = DockerClient(config=mock_config, display=mock_display)
+    check = client._check_nvidia_runtime()
+    assert client.export_stack_state(tmp_path / "state.json") is True
+
+    assert check.passed is True
+    assert json.loads((tmp_path / "state.json").read_text())["docker_version"] == '24.0.7'
+    mock_docker_client.info.assert_called_once()
+    # The cached info() response already proved the daemon is reachable
+    mock_docker_client.ping.assert_not_called()
+    mock_docker_client.version.assert_not_called()
+
 @patch('docker.from_env')
 def test_docker_client_init_ping_failure_exits(mock_docker_from_env, mock_config, mock_display):
     """Tests that DockerClient handles ping failures gracefully."""
@@ -439,10 +518,276 @@ def test_get_resource_usage_stats_error(mock_docker_from_env, mock_config, mock_
     mock_container.stats.side_effect = docker.errors.APIError("Stats unavailable")
     
     result = client._get_resource_usage(mock_container)
-    
+
     assert result.cpu_percent is None
     assert result.memory_mb is None
 
+def _one_shot_stats(total_usage, system_usage, memory=104857600):
+    """Builds a one-shot stats payload, which carries no precpu sample."""
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": total_usage}, "system_cpu_usage": system_usage, "online_cpus": 2},
+        "precpu_stats": {"cpu_usage": {"total_usage": 0}},
+        "memory_stats": {"usage": memory},
+    }
+
+@patch('ollama_stack_cli.docker_client.time.sleep')
+@patch('docker.from_env')
+def test_collect_resource_usage_one_shot_two_samples(mock_docker_from_env, mock_sleep, mock_config, mock_display):
+    """Tests collect_resource_usage derives CPU% from two one-shot samples."""
+    client = DockerClient(config=mock_config, display=mock_display)
+
+    mock_container = MagicMock(id="abc", status="running")
+    mock_container.stats.side_effect = [_one_shot_stats(100, 1000), _one_shot_stats(150, 1100)]
+
+    result = client.collect_resource_usage([mock_container])
+
+    mock_container.stats.assert_called_with(stream=False, one_shot=True)
+    assert mock_container.stats.call_count == 2
+    mock_sleep.assert_called_once_with(DockerClient.STATS_SAMPLE_INTERVAL)
+    assert result["abc"].cpu_percent == 100.0  # (150-100)/(1100-1000) * 2 * 100
+    assert result["abc"].memory_mb == 100.0
+
+@patch('ollama_stack_cli.docker_client.time.sleep')
+@patch('docker.from_env')
+def test_collect_resource_usage_reuses_cached_snapshot(mock_docker_from_env, mock_sleep, mock_config, mock_display):
+    """Tests a cached snapshot serves as CPU baseline so later calls need one sample."""
+    client = DockerClient(config=mock_config, display=mock_display)
+    client._stats_cache["abc"] = _one_shot_stats(100, 1000)
+
+    mock_container = MagicMock(id="abc", status="running")
+    mock_container.stats.return_value = _one_shot_stats(120, 1200)
+
+    result = client.collect_resource_usage([mock_container])
+
+    mock_container.stats.assert_called_once_with(stream=False, one_shot=True)
+    mock_sleep.assert_not_called()
+    assert result["abc"].cpu_percent == 20.0
+    assert client._stats_cache["abc"]["cpu_stats"]["cpu_usage"]["total_usage"] == 120
+
+@patch('docker.from_env')
+def test_collect_resource_usage_falls_back_without_one_shot(mock_docker_from_env, mock_config, mock_display):
+    """Tests blocking stats are used when the engine rejects one-shot requests."""
+    client = DockerClient(config=mock_config, display=mock_display)
+
+    full_stats = {
+        "cpu_stats": {"cpu_usage": {"total_usage": 200}, "system_cpu_usage": 2000, "online_cpus": 4},
+        "precpu_stats": {"cpu_usage": {"total_usage": 100}, "system_cpu_usage": 1000},
+        "memory_stats": {"usage": 209715200},
+    }
+    mock_container = MagicMock(id="abc", status="running")
+    mock_container.stats.side_effect = [docker.errors.InvalidVersion("too old"), full_stats]
+
+    result = client.collect_resource_usage([mock_container])
+
+    assert mock_container.stats.call_args_list[-1] == call(stream=False)
+    assert client._one_shot_supported is False
+    assert result["abc"].cpu_percent == 40.0
+
+@patch('docker.from_env')
+def test_collect_resource_usage_fetches_concurrently(mock_docker_from_env, mock_config, mock_display):
+    """Tests stats for several containers are fetched in parallel."""
+    import time
+    client = DockerClient(config=mock_config, display=mock_display)
+
+    full_stats = {
+        "cpu_stats": {"cpu_usage": {"total_usage": 200}, "system_cpu_usage": 2000, "online_cpus": 4},
+        "precpu_stats": {"cpu_usage": {"total_usage": 100}, "system_cpu_usage": 1000},
+        "memory_stats": {"usage": 209715200},
+    }
+
+    def slow_stats(**kwargs):
+        time.sleep(0.3)
+        return full_stats
+
+    containers = []
+    for i in range(4):
+        container = MagicMock(id=f"c{i}", status="running")
+        container.stats.side_effect = slow_stats
+        containers.append(container)
+
+    started = time.perf_counter()
+    result = client.collect_resource_usage(containers)
+    elapsed = time.perf_counter() - started
+
+    assert len(result) == 4
+    assert all(usage.cpu_percent == 40.0 for usage in result.values())
+    # Four serial calls would take at least 1.2s
+    assert elapsed < 1.0
+
+@patch('docker.from_env')
+def test_collect_resource_usage_skips_stopped_containers(mock_docker_from_env, mock_config, mock_display):
+    """Tests stopped containers get empty usage without a stats call."""
+    client = DockerClient(config=mock_config, display=mock_display)
+
+    mock_container = MagicMock(id="abc", status="exited")
+
+    result = client.collect_resource_usage([mock_container])
+
+    mock_container.stats.assert_not_called()
+    assert result["abc"] == ResourceUsage()
+
+def _wait_for(predicate, timeout=2.0):
+    """Polls until predicate() is truthy, for assertions on background threads."""
+    import time
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+class FakeStatsStream:
+    """Stands in for a CancellableStream: yields samples, then blocks until closed."""
+
+    def __init__(self, samples=()):
+        import threading
+        self._samples = list(samples)
+        self._closed = threading.Event()
+        self.close_calls = 0
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    def __iter__(self):
+        yield from self._samples
+        self._closed.wait(5)
+
+    def close(self):
+        self.close_calls += 1
+        self._closed.set()
+
+@patch('docker.from_env')
+def test_stats_monitor_streams_usage(mock_docker_from_env, mock_config, mock_display):
+    """Tests ContainerStatsMonitor keeps the latest streamed usage per service."""
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    client = DockerClient(config=mock_config, display=mock_display)
+
+    streamed = [
+        _one_shot_stats(100, 1000),
+        {
+            "cpu_stats": {"cpu_usage": {"total_usage": 150}, "system_cpu_usage": 1100, "online_cpus": 2},
+            "precpu_stats": {"cpu_usage": {"total_usage": 100}, "system_cpu_usage": 1000},
+            "memory_stats": {"usage": 104857600},
+        },
+    ]
+    mock_container = MagicMock(id="abc", labels={"ollama-stack.component": "webui"})
+    mock_docker_client.containers.list.return_value = [mock_container]
+    stream = FakeStatsStream(streamed)
+
+    monitor = client.create_stats_monitor()
+    assert isinstance(monitor, ContainerStatsMonitor)
+    with patch.object(ContainerStatsMonitor, "_open_stream", return_value=stream) as mock_open:
+        monitor.sync()
+        assert _wait_for(lambda: monitor.usage("webui") is not None and monitor.usage("webui").cpu_percent == 100.0)
+
+    mock_open.assert_called_once_with(mock_container)
+    monitor.close()
+    assert monitor.usage("webui") is None
+    assert _wait_for(lambda: stream.closed)
+
+@patch('docker.from_env')
+def test_stats_monitor_sync_drops_stopped_containers(mock_docker_from_env, mock_config, mock_display):
+    """Tests sync() stops streams for containers that are no longer running."""
+    import threading
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    client = DockerClient(config=mock_config, display=mock_display)
+
+    mock_container = MagicMock(id="abc", labels={"ollama-stack.component": "webui"})
+    mock_docker_client.containers.list.return_value = [mock_container]
+    stream = FakeStatsStream()
+    opened = threading.Event()
+
+    def open_stream(container):
+        opened.set()
+        return stream
+
+    monitor = client.create_stats_monitor()
+    with patch.object(ContainerStatsMonitor, "_open_stream", side_effect=open_stream):
+        monitor.sync()
+        assert "webui" in monitor._streams
+        assert opened.wait(2)
+
+        mock_docker_client.containers.list.return_value = []
+        monitor.sync()
+
+    assert "webui" not in monitor._streams
+    assert monitor.usage("webui") is None
+    # The blocked reader is released by closing its stream, not by waiting for a sample
+    assert _wait_for(lambda: stream.closed)
+
+@patch('docker.from_env')
+def test_stats_monitor_sync_tolerates_streams_ending_concurrently(mock_docker_from_env, mock_config, mock_display):
+    """Tests sync() survives stream threads that end and drop themselves while it runs."""
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    client = DockerClient(config=mock_config, display=mock_display)
+    containers = [MagicMock(id=f"id{n}", labels={"ollama-stack.component": f"svc{n}"}) for n in range(20)]
+
+    monitor = client.create_stats_monitor()
+    with patch.object(ContainerStatsMonitor, "_open_stream", side_effect=lambda container: iter([])):
+        for round_number in range(50):
+            mock_docker_client.containers.list.return_value = containers if round_number % 2 else []
+            monitor.sync()
+    monitor.close()
+
+    assert monitor._streams == {}
+
+@patch('docker.from_env')
+def test_stats_monitor_stop_before_stream_opens_closes_it(mock_docker_from_env, mock_config, mock_display):
+    """Tests a stream opened after close() was called is closed right away."""
+    import threading
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    client = DockerClient(config=mock_config, display=mock_display)
+    mock_container = MagicMock(id="abc", labels={"ollama-stack.component": "webui"})
+    mock_docker_client.containers.list.return_value = [mock_container]
+    stream = FakeStatsStream()
+    release = threading.Event()
+
+    def open_stream(container):
+        release.wait(2)
+        return stream
+
+    monitor = client.create_stats_monitor()
+    with patch.object(ContainerStatsMonitor, "_open_stream", side_effect=open_stream):
+        monitor.sync()
+        monitor.close()
+        release.set()
+        assert _wait_for(lambda: stream.closed)
+
+def test_stats_monitor_open_stream_is_cancellable():
+    """Tests the stats request goes through a real API client's public interface and can be closed."""
+    import json
+    api = docker.APIClient(base_url="tcp://127.0.0.1:2375", version="1.41")
+    response = MagicMock()
+    response.iter_lines.return_value = iter([json.dumps({"read": 1}).encode(), b"", json.dumps({"read": 2}).encode()])
+    container = MagicMock(id="abc")
+    container.client.api = api
+
+    with patch.object(api, "get", return_value=response) as mock_get:
+        stream = ContainerStatsMonitor._open_stream(container)
+
+    assert isinstance(stream, docker.types.CancellableStream)
+    mock_get.assert_called_once_with(
+        "http://127.0.0.1:2375/v1.41/containers/abc/stats", params={"stream": True}, stream=True
+    )
+    response.raise_for_status.assert_called_once()
+    assert list(stream) == [{"read": 1}, {"read": 2}]
+
+@patch('docker.from_env')
+def test_stats_monitor_sync_without_docker(mock_docker_from_env, mock_config, mock_display):
+    """Tests sync() is a no-op when Docker is unavailable."""
+    mock_docker_from_env.side_effect = docker.errors.DockerException("Docker not found")
+    client = DockerClient(config=mock_config, display=mock_display)
+
+    monitor = client.create_stats_monitor()
+    monitor.sync()
+
+    assert monitor._streams == {}
+
 # =============================================================================
 # Log Streaming Tests
 # =============================================================================
@@ -1283,6 +1628,28 @@ def test_export_compose_config_empty_config(mock_docker_from_env, mock_subproces
     assert result is True
     mock_print.assert_called_once_with("")
 
+def make_volume_tar(files, prefix="data"):
+    """Build the uncompressed tar stream get_archive returns for a volume mounted at /data."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        directory = tarfile.TarInfo(prefix)
+        directory.type = tarfile.DIRTYPE
+        tar.addfile(directory)
+        for name, content in files.items():
+            info = tarfile.TarInfo(f"{prefix}/{name}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+def make_archive_helper(files):
+    """Mock helper container whose get_archive streams a tar of files in small chunks."""
+    data = make_volume_tar(files)
+    helper = MagicMock()
+    helper.get_archive.side_effect = lambda path, chunk_size=None: (
+        iter([data[i:i + 1000] for i in range(0, len(data), 1000)]), {"name": "data"}
+    )
+    return helper
+
 def test_backup_volumes_no_client(mock_config, mock_display):
     """Test backup_volumes when client is None"""
     client = DockerClient(config=mock_config, display=mock_display)
@@ -1305,180 +1672,900 @@ def test_backup_volumes_volume_not_found(mock_config, mock_display):
     
     assert result is True  # Should succeed because volume not found is handled gracefully
     mock_client.volumes.get.assert_called_once_with("nonexistent_vol")
+    mock_client.containers.create.assert_not_called()
 
-def test_backup_volumes_container_run_fails(mock_config, mock_display):
-    """Test backup_volumes when container run fails"""
-    with patch("pathlib.Path.mkdir"), patch("pathlib.Path.exists", return_value=True):
-        mock_client = MagicMock()
-        mock_volume = MagicMock()
-        mock_volume.name = "test_vol"
-        mock_client.volumes.get.return_value = mock_volume
-        mock_client.containers.run.side_effect = docker.errors.APIError("Container run failed")
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.backup_volumes(["test_vol"], Path("/backup/path"))
-        
-        assert result is False
-        mock_client.volumes.get.assert_called_once_with("test_vol")
-        mock_client.containers.run.assert_called_once()
-
-def test_backup_volumes_container_wait_fails(mock_config, mock_display):
-    """Test backup_volumes when container wait returns non-zero exit code"""
-    with patch("pathlib.Path.mkdir"), patch("pathlib.Path.exists", return_value=False):
-        mock_client = MagicMock()
-        mock_volume = MagicMock()
-        mock_volume.name = "test_vol"
-        mock_client.volumes.get.return_value = mock_volume
-        
-        mock_container = MagicMock()
-        mock_container.wait.return_value = {"StatusCode": 1}
-        mock_container.logs.return_value = b"Backup failed"
-        mock_client.containers.run.return_value = mock_container
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.backup_volumes(["test_vol"], Path("/backup/path"))
-        
-        assert result is False
-        mock_client.containers.run.assert_called_once()
-
-def test_backup_volumes_empty_list(mock_config, mock_display):
-    """Test backup_volumes with empty volume list"""
+def test_backup_volumes_streams_archive(mock_config, mock_display, tmp_path):
+    """Test backup_volumes streams get_archive output into a gzip archive rooted at '.'"""
     mock_client = MagicMock()
+    helper = make_archive_helper({"models/blob": b"weights" * 100, "config.json": b"{}"})
+    mock_client.containers.create.return_value = helper
+    
     client = DockerClient(config=mock_config, display=mock_display)
     client.client = mock_client
     
-    with patch("pathlib.Path.mkdir"):
-        result = client.backup_volumes([], Path("/backup/path"))
+    volume_stats = []
+    result = client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats)
     
     assert result is True
-    mock_client.volumes.get.assert_not_called()
+    mock_client.containers.create.assert_called_once_with(
+        "alpine:latest", command="true", volumes={"test_vol": {"bind": "/data", "mode": "ro"}}
+    )
+    helper.start.assert_not_called()
     mock_client.containers.run.assert_not_called()
+    helper.get_archive.assert_called_once_with("/data", chunk_size=ANY)
+    helper.remove.assert_called_once_with(force=True)
+    
+    with tarfile.open(tmp_path / "test_vol.tar.gz", "r:gz") as tar:
+        assert tar.getnames() == [".", "./models/blob", "./config.json"]
+        assert tar.extractfile("./models/blob").read() == b"weights" * 100
+    assert not (tmp_path / "test_vol.tar.gz.partial").exists()
+    
+    stats = volume_stats[0]
+    assert stats.size_bytes == (tmp_path / "test_vol.tar.gz").stat().st_size
+    assert stats.sha256 == hashlib.sha256((tmp_path / "test_vol.tar.gz").read_bytes()).hexdigest()
+    assert stats.source_bytes == len(make_volume_tar({"models/blob": b"weights" * 100, "config.json": b"{}"}))
 
-def test_backup_volumes_backup_dir_creation(mock_config, mock_display):
-    """Test backup_volumes creates backup directory structure"""
-    with patch("pathlib.Path.mkdir") as mock_mkdir, patch("pathlib.Path.exists") as mock_exists:
-        mock_exists.return_value = True
-        
-        mock_client = MagicMock()
-        mock_volume = MagicMock()
-        mock_volume.name = "test_vol"
-        mock_client.volumes.get.return_value = mock_volume
-        
-        mock_container = MagicMock()
-        mock_container.wait.return_value = {"StatusCode": 0}
-        mock_client.containers.run.return_value = mock_container
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.backup_volumes(["test_vol"], Path("/backup/path"))
-        
-        assert result is True
-        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-
-def test_backup_volumes_partial_failure(mock_config, mock_display):
-    """Test backup_volumes with some volumes failing"""
-    with patch("pathlib.Path.mkdir"), patch("pathlib.Path.exists") as mock_patches:
-        mock_mkdir = mock_patches[0]
-        mock_exists = mock_patches[1]
-        mock_exists.return_value = True
-        
-        mock_client = MagicMock()
-        
-        # First volume succeeds
-        mock_vol1 = MagicMock()
-        mock_vol1.name = "vol1"
-        
-        # Second volume fails
-        def volume_get_side_effect(name):
-            if name == "vol1":
-                return mock_vol1
-            elif name == "vol2":
-                raise docker.errors.NotFound("Volume not found")
-        
-        mock_client.volumes.get.side_effect = volume_get_side_effect
-        
-        mock_container = MagicMock()
-        mock_container.wait.return_value = {"StatusCode": 0}
-        mock_client.containers.run.return_value = mock_container
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.backup_volumes(["vol1", "vol2"], Path("/backup/path"))
-        
-        assert result is True  # Should succeed even if some volumes are not found (they are skipped)
-        assert mock_client.volumes.get.call_count == 2
+def test_backup_volumes_excludes_patterns(mock_config, mock_display, tmp_path):
+    """Test excluded paths are left out of the archive and reported in the volume stats"""
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = make_archive_helper({
+        "webui.db": b"rows" * 10, "cache/whisper/models/base.pt": b"w" * 300, "uploads/part.tmp": b"t" * 20,
+    })
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    volume_stats = []
+    assert client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats,
+                                 exclude_patterns=["cache/whisper", "*.tmp"]) is True
+
+    with tarfile.open(tmp_path / "test_vol.tar.gz", "r:gz") as tar:
+        assert tar.getnames() == [".", "./webui.db"]
+    stats = volume_stats[0]
+    assert stats.excluded_files == 2
+    assert stats.excluded_bytes == 320
+    assert stats.excluded_paths == ["cache/whisper/models/base.pt", "uploads/part.tmp"]
+
+@pytest.mark.parametrize("codec,extension,mode", [("none", ".tar", "r:"), ("gzip-mt", ".tar.gz", "r:gz")])
+def test_backup_volumes_uses_codec(mock_config, mock_display, tmp_path, codec, extension, mode):
+    """Test backup_volumes names and compresses archives with the requested codec"""
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = make_archive_helper({"db.sqlite": b"rows" * 500})
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
     
-def test_restore_volumes_success(mock_config, mock_display):
-    """Test restore_volumes successful execution"""
-    with patch("pathlib.Path.exists", return_value=True):
-        mock_client = MagicMock()
-        mock_volume = MagicMock()
-        mock_volume.name = "test_vol"
-        mock_client.volumes.get.side_effect = docker.errors.NotFound("Volume not found")
-        mock_client.volumes.create.return_value = mock_volume
-        
-        mock_container = MagicMock()
-        mock_container.wait.return_value = {"StatusCode": 0}
-        mock_client.containers.run.return_value = mock_container
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.restore_volumes(["test_vol"], Path("/backup/path"))
-        
-        assert result is True
-        mock_client.volumes.create.assert_called_once_with(name="test_vol")
-        mock_client.containers.run.assert_called_once()
+    volume_stats = []
+    result = client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats, codec=codec,
+                                   compression_threads=2)
+    
+    assert result is True
+    assert volume_stats[0].archive == f"test_vol{extension}"
+    archive = (tmp_path / f"test_vol{extension}").read_bytes()
+    # Size and digest were taken from the bytes as they were written
+    assert volume_stats[0].size_bytes == len(archive)
+    assert volume_stats[0].sha256 == hashlib.sha256(archive).hexdigest()
+    with tarfile.open(tmp_path / f"test_vol{extension}", mode) as tar:
+        assert tar.extractfile("./db.sqlite").read() == b"rows" * 500
+
+def test_backup_volumes_adaptive_compression(mock_config, mock_display, tmp_path):
+    """Test adaptive backups store GGUF weights raw and compress text inside a plain tar"""
+    weights = b"GGUF" + os.urandom(50_000)
+    database = b"SQLite format 3\x00" + b"INSERT INTO chat VALUES (1, 'hello');" * 1000
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = make_archive_helper({"blob.gguf": weights, "webui.db": database})
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    volume_stats = []
+    assert client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats, adaptive=True) is True
+    
+    stats = volume_stats[0]
+    assert stats.archive == "test_vol.tar"
+    assert (stats.compressed_files, stats.stored_files, stats.stored_bytes) == (1, 1, len(weights))
+    with tarfile.open(tmp_path / "test_vol.tar", "r:") as tar:
+        assert tar.extractfile("./blob.gguf").read() == weights
+        assert tar.getmember("./webui.db").pax_headers["OLLAMASTACK.codec"] == "gzip"
 
-def test_restore_volumes_multiple_volumes(mock_config, mock_display):
-    """Test restore_volumes with multiple volumes"""
-    with patch("pathlib.Path.exists", return_value=True):
-        mock_client = MagicMock()
-        
-        mock_vol1 = MagicMock()
-        mock_vol1.name = "vol1"
-        mock_vol2 = MagicMock()
-        mock_vol2.name = "vol2"
-        
-        mock_client.volumes.get.side_effect = docker.errors.NotFound("Volume not found")
-        mock_client.volumes.create.side_effect = [mock_vol1, mock_vol2]
-        
-        mock_container = MagicMock()
-        mock_container.wait.return_value = {"StatusCode": 0}
-        mock_client.containers.run.return_value = mock_container
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.restore_volumes(["vol1", "vol2"], Path("/backup/path"))
-        
-        assert result is True
-        assert mock_client.volumes.create.call_count == 2
-        assert mock_client.containers.run.call_count == 2
-        mock_client.volumes.create.assert_any_call(name="vol1")
-        mock_client.volumes.create.assert_any_call(name="vol2")
+def test_restore_volumes_adaptive_decodes_members(mock_config, mock_display, tmp_path):
+    """Test adaptive archives are uploaded as a plain tar with members decompressed"""
+    database = b"CREATE TABLE t (x);" * 1000
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = make_archive_helper({"webui.db": database})
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    assert client.backup_volumes(["test_vol"], tmp_path, adaptive=True) is True
+    
+    helper = MagicMock()
+    uploads = []
+    capture_put_archive(helper, uploads)
+    mock_client.containers.create.return_value = helper
+    
+    assert client.restore_volumes(["test_vol"], tmp_path, adaptive=True) is True
+    with tarfile.open(fileobj=io.BytesIO(uploads[0][1]), mode="r") as tar:
+        member = tar.getmember("./webui.db")
+        assert member.size == len(database)
+        assert tar.extractfile(member).read() == database
 
-def test_restore_volumes_no_client(mock_config, mock_display):
-    """Test restore_volumes when client is None"""
+def test_backup_volumes_codec_not_installed(mock_config, mock_display, tmp_path):
+    """Test backup_volumes fails up front when the codec's package is missing"""
+    mock_client = MagicMock()
     client = DockerClient(config=mock_config, display=mock_display)
-    client.client = None
+    client.client = mock_client
     
-    result = client.restore_volumes(["vol1"], Path("/backup/path"))
+    with patch.object(get_codec("lz4"), "available", return_value=False):
+        result = client.backup_volumes(["test_vol"], tmp_path, codec="lz4")
     
     assert result is False
+    mock_client.containers.create.assert_not_called()
+
+def test_sample_volume_stops_after_max_bytes(mock_config, mock_display):
+    """Test sample_volume reads only the start of the archive stream and closes it"""
+    chunks = MagicMock()
+    chunks.__iter__.return_value = iter([b"a" * 100, b"b" * 100, b"c" * 100])
+    helper = MagicMock()
+    helper.get_archive.return_value = (chunks, {"name": "data"})
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = helper
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    sample = client.sample_volume("ollama_data", max_bytes=150)
+    
+    assert sample == b"a" * 100 + b"b" * 50
+    chunks.close.assert_called_once()
+    mock_client.containers.create.assert_called_once_with(
+        "alpine:latest", command="true", volumes={"ollama_data": {"bind": "/data", "mode": "ro"}}
+    )
+    helper.remove.assert_called_once_with(force=True)
 
-def test_restore_volumes_backup_file_missing(mock_config, mock_display):
-    """Test restore_volumes when backup file doesn't exist"""
-    with patch("pathlib.Path.exists", return_value=False):
-        mock_client = MagicMock()
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
+def test_benchmark_volumes_reports_each_volume(mock_config, mock_display):
+    """Test benchmark_volumes samples existing volumes and benchmarks each"""
+    mock_client = MagicMock()
+    mock_client.volumes.get.side_effect = [MagicMock(), docker.errors.NotFound("missing")]
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    with patch.object(client, "sample_volume", return_value=b"data" * 1000) as mock_sample:
+        results = client.benchmark_volumes(["webui_data", "gone"], codecs=["none", "gzip"], sample_bytes=4000)
+    
+    mock_sample.assert_called_once_with("webui_data", 4000)
+    assert [(r.volume, r.codec) for r in results] == [("webui_data", "none"), ("webui_data", "gzip")]
+    assert results[1].ratio > 1
+
+def test_backup_volumes_pulls_missing_helper_image(mock_config, mock_display, tmp_path):
+    """Test the helper image is pulled only when it is not available locally"""
+    mock_client = MagicMock()
+    helper = make_archive_helper({"a": b"1"})
+    mock_client.containers.create.side_effect = [docker.errors.ImageNotFound("missing"), helper]
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    assert client.backup_volumes(["test_vol"], tmp_path) is True
+    mock_client.images.pull.assert_called_once_with("alpine:latest")
+
+def test_backup_volumes_helper_create_fails(mock_config, mock_display, tmp_path):
+    """Test backup_volumes when the helper container cannot be created"""
+    mock_client = MagicMock()
+    mock_client.containers.create.side_effect = docker.errors.APIError("Create failed")
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    result = client.backup_volumes(["test_vol"], tmp_path)
+    
+    assert result is False
+    mock_client.volumes.get.assert_called_once_with("test_vol")
+    mock_client.containers.create.assert_called_once()
+
+def test_backup_volumes_archive_stream_fails(mock_config, mock_display, tmp_path):
+    """Test a failed archive stream leaves no archive behind and removes the helper"""
+    mock_client = MagicMock()
+    helper = MagicMock()
+    helper.get_archive.side_effect = docker.errors.APIError("Archive failed")
+    mock_client.containers.create.return_value = helper
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    backup_dir = tmp_path / "volumes"
+    result = client.backup_volumes(["test_vol"], backup_dir)
+    
+    assert result is False
+    helper.remove.assert_called_once_with(force=True)
+    assert list(backup_dir.iterdir()) == []
+
+def test_backup_volumes_empty_list(mock_config, mock_display):
+    """Test backup_volumes with empty volume list"""
+    mock_client = MagicMock()
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    with patch("pathlib.Path.mkdir"):
+        result = client.backup_volumes([], Path("/backup/path"))
+    
+    assert result is True
+    mock_client.volumes.get.assert_not_called()
+    mock_client.containers.create.assert_not_called()
+
+def test_backup_volumes_backup_dir_creation(mock_config, mock_display, tmp_path):
+    """Test backup_volumes creates backup directory structure"""
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = make_archive_helper({"a": b"1"})
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    backup_dir = tmp_path / "nested" / "volumes"
+    result = client.backup_volumes(["test_vol"], backup_dir)
+    
+    assert result is True
+    assert (backup_dir / "test_vol.tar.gz").exists()
+
+def test_backup_volumes_partial_failure(mock_config, mock_display, tmp_path):
+    """Test backup_volumes with some volumes missing"""
+    mock_client = MagicMock()
+    
+    def volume_get_side_effect(name):
+        if name == "vol2":
+            raise docker.errors.NotFound("Volume not found")
+        return MagicMock()
+    
+    mock_client.volumes.get.side_effect = volume_get_side_effect
+    mock_client.containers.create.return_value = make_archive_helper({"a": b"1"})
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    volume_stats = []
+    result = client.backup_volumes(["vol1", "vol2"], tmp_path, volume_stats=volume_stats)
+    
+    assert result is True  # Should succeed even if some volumes are not found (they are skipped)
+    assert mock_client.volumes.get.call_count == 2
+    assert [stats.name for stats in volume_stats] == ["vol1"]
+
+def test_backup_volumes_runs_volumes_concurrently(mock_config, mock_display, tmp_path):
+    """Test backup_volumes archives volumes in parallel and records per-volume stats"""
+    barrier = threading.Barrier(2, timeout=5)
+    data = make_volume_tar({"file": b"x" * 2048})
+    mock_client = MagicMock()
+
+    def create_side_effect(image, command, volumes):
+        helper = MagicMock()
+
+        def get_archive(path, chunk_size=None):
+            # Both volumes must be streaming at once to pass the barrier
+            barrier.wait()
+            return iter([data]), {}
+
+        helper.get_archive.side_effect = get_archive
+        return helper
+
+    mock_client.containers.create.side_effect = create_side_effect
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    volume_stats = []
+    result = client.backup_volumes(["vol1", "vol2"], tmp_path, max_workers=2, volume_stats=volume_stats)
+
+    assert result is True
+    assert [stats.name for stats in volume_stats] == ["vol1", "vol2"]
+    assert volume_stats[0].archive == "vol1.tar.gz"
+    assert volume_stats[0].source_bytes == len(data)
+    assert volume_stats[0].duration_seconds >= 0
+
+def test_backup_volumes_worker_limit(mock_config, mock_display, tmp_path):
+    """Test backup_volumes never streams more volumes than max_workers"""
+    lock = threading.Lock()
+    active = []
+    peak = []
+    data = make_volume_tar({"file": b"x"})
+    mock_client = MagicMock()
+
+    def get_archive(path, chunk_size=None):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+        return iter([data]), {}
+
+    mock_client.containers.create.return_value.get_archive.side_effect = get_archive
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    client.backup_volumes([f"vol{i}" for i in range(6)], tmp_path, max_workers=1)
+
+    assert max(peak) == 1
+    assert mock_client.containers.create.call_count == 6
+
+def test_backup_volumes_deduplicates_model_blobs(mock_config, mock_display, tmp_path):
+    """Test model blobs go to the blob store once and later backups only reference them"""
+    blob = b"gguf" * 1000
+    digest = hashlib.sha256(blob).hexdigest()
+    files = {f"models/blobs/sha256-{digest}": blob, "models/manifests/llama3": b"{}"}
+    mock_client = MagicMock()
+    mock_client.containers.create.side_effect = lambda *args, **kwargs: make_archive_helper(files)
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    blob_store = BlobStore(tmp_path / "blob-store")
+
+    first_stats, first_blobs = [], {}
+    assert client.backup_volumes(["ollama_data"], tmp_path / "b1", volume_stats=first_stats,
+                                 blob_store=blob_store, volume_blobs=first_blobs) is True
+    second_stats, second_blobs = [], {}
+    assert client.backup_volumes(["ollama_data"], tmp_path / "b2", volume_stats=second_stats,
+                                 blob_store=blob_store, volume_blobs=second_blobs) is True
+
+    assert blob_store.object_path(digest).read_bytes() == blob
+    assert first_blobs["ollama_data"][0].path == f"./models/blobs/sha256-{digest}"
+    assert (first_stats[0].blob_count, first_stats[0].new_blob_count, first_stats[0].deduplicated_bytes) == (1, 1, 0)
+    assert (second_stats[0].blob_count, second_stats[0].new_blob_count, second_stats[0].deduplicated_bytes) == (1, 0, len(blob))
+    with tarfile.open(tmp_path / "b2" / "ollama_data.tar.gz", "r:gz") as tar:
+        assert tar.getnames() == [".", "./models/manifests/llama3"]
+
+def test_restore_volumes_restores_model_blobs(mock_config, mock_display, tmp_path):
+    """Test deduplicated blobs are streamed back into the volume with put_archive"""
+    blob = b"gguf" * 1000
+    digest = hashlib.sha256(blob).hexdigest()
+    blob_store = BlobStore(tmp_path / "blob-store")
+    member = tarfile.TarInfo(f"./models/blobs/sha256-{digest}")
+    member.size = len(blob)
+    ref, _ = blob_store.ingest(member, io.BytesIO(blob), digest)
+    (tmp_path / "ollama_data.tar.gz").touch()
+
+    uploaded = {}
+    helper = MagicMock()
+
+    def put_archive(path, data):
+        uploaded["path"] = path
+        uploaded["data"] = b"".join(data)
+        return True
+
+    helper.put_archive.side_effect = put_archive
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = helper
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    result = client.restore_volumes(["ollama_data"], tmp_path, blob_store=blob_store,
+                                    volume_blobs={"ollama_data": [ref]})
+
+    assert result is True
+    mock_client.containers.create.assert_called_once_with(
+        "alpine:latest", command="true", volumes={"ollama_data": {"bind": "/data", "mode": "rw"}}
+    )
+    helper.remove.assert_called_once_with(force=True)
+    assert uploaded["path"] == "/data"
+    with tarfile.open(fileobj=io.BytesIO(uploaded["data"]), mode="r") as tar:
+        assert tar.extractfile(ref.path).read() == blob
+
+def make_volume_archive(path, files, codec="gzip"):
+    """Write a volume archive rooted at '.' with the given codec."""
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(f"./{name}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    with open(path, "wb") as raw, get_codec(codec).open_writer(raw) as writer:
+        writer.write(data.getvalue())
+
+def capture_put_archive(helper, uploads, result=True):
+    """Record the uncompressed tar streams put_archive receives."""
+    def put_archive(path, data):
+        uploads.append((path, b"".join(data)))
+        return result
+    helper.put_archive.side_effect = put_archive
+
+def test_restore_volumes_success(mock_config, mock_display, tmp_path):
+    """Test restore_volumes decompresses on the host and streams the archive with put_archive"""
+    make_volume_archive(tmp_path / "test_vol.tar.gz", {"config.json": b"{}"})
+    mock_client = MagicMock()
+    mock_client.volumes.get.side_effect = docker.errors.NotFound("Volume not found")
+    helper = MagicMock()
+    uploads = []
+    capture_put_archive(helper, uploads)
+    mock_client.containers.create.return_value = helper
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    result = client.restore_volumes(["test_vol"], tmp_path)
+    
+    assert result is True
+    mock_client.volumes.create.assert_called_once_with(name="test_vol")
+    mock_client.containers.create.assert_called_once_with(
+        "alpine:latest", command="true", volumes={"test_vol": {"bind": "/data", "mode": "rw"}}
+    )
+    mock_client.containers.run.assert_not_called()
+    helper.remove.assert_called_once_with(force=True)
+    assert uploads[0][0] == "/data"
+    with tarfile.open(fileobj=io.BytesIO(uploads[0][1]), mode="r") as tar:
+        assert tar.extractfile("./config.json").read() == b"{}"
+
+def make_interrupted_archive_helper(files, fail_after):
+    """Mock helper container whose archive stream breaks off after fail_after bytes."""
+    data = make_volume_tar(files)
+    def get_archive(path, chunk_size=None):
+        def chunks():
+            yield data[:fail_after]
+            raise docker.errors.APIError("daemon restarted")
+        return chunks(), {"name": "data"}
+    helper = MagicMock()
+    helper.get_archive.side_effect = get_archive
+    return helper
+
+def test_backup_volumes_resumes_from_checkpoint(mock_config, mock_display, tmp_path):
+    """Test an interrupted backup keeps its checkpointed chunks and a resumed run finishes the same archive"""
+    files = {f"models/part{index}": os.urandom(4000) for index in range(4)}
+    mock_client = MagicMock()
+    # Directory and first two files complete, third cut off mid-content
+    mock_client.containers.create.return_value = make_interrupted_archive_helper(files, 12000)
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    checkpoint = BackupCheckpoint.create(tmp_path, "backup-1", BackupConfig(), interval=1)
+    
+    assert client.backup_volumes(["test_vol"], tmp_path, checkpoint=checkpoint) is False
+    chunks = checkpoint.state.volumes["test_vol"].chunks
+    assert [chunk.last_member for chunk in chunks] == [".", "./models/part0", "./models/part1"]
+    assert (tmp_path / "test_vol.tar.gz.partial").exists()
+    
+    mock_client.containers.create.return_value = make_archive_helper(files)
+    resumed = BackupCheckpoint.load(tmp_path, interval=1)
+    volume_stats = []
+    assert client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats, checkpoint=resumed) is True
+    
+    archive = (tmp_path / "test_vol.tar.gz").read_bytes()
+    stats = volume_stats[0]
+    assert stats.resumed_bytes == sum(chunk.size for chunk in chunks)
+    assert (stats.size_bytes, stats.sha256) == (len(archive), hashlib.sha256(archive).hexdigest())
+    with tarfile.open(tmp_path / "test_vol.tar.gz", "r:gz") as tar:
+        assert {name: tar.extractfile(f"./{name}").read() for name in files} == files
+    assert resumed.state.volumes["test_vol"].complete
+    
+    # A finished volume is verified against its digest and not read again
+    helper = MagicMock()
+    mock_client.containers.create.return_value = helper
+    volume_stats = []
+    assert client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats, checkpoint=resumed) is True
+    helper.get_archive.assert_not_called()
+    assert volume_stats[0].sha256 == stats.sha256
+
+def test_backup_volumes_restarts_volume_changed_since_checkpoint(mock_config, mock_display, tmp_path):
+    """Test a volume whose contents no longer line up with its checkpoint is backed up from the start"""
+    mock_client = MagicMock()
+    mock_client.containers.create.return_value = make_interrupted_archive_helper(
+        {"a": b"1" * 3000, "b": b"2" * 3000}, 5000
+    )
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    checkpoint = BackupCheckpoint.create(tmp_path, "backup-1", BackupConfig(), interval=1)
+    assert client.backup_volumes(["test_vol"], tmp_path, checkpoint=checkpoint) is False
+    
+    mock_client.containers.create.return_value = make_archive_helper({"renamed": b"1" * 3000, "b": b"2" * 3000})
+    volume_stats = []
+    assert client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats, checkpoint=checkpoint) is True
+    
+    assert volume_stats[0].resumed_bytes == 0
+    with tarfile.open(tmp_path / "test_vol.tar.gz", "r:gz") as tar:
+        assert tar.getnames() == [".", "./renamed", "./b"]
+
+def make_writer(name, volume_name, status="running", rw=True):
+    """Mock running container that mounts a volume."""
+    writer = MagicMock()
+    writer.id = f"{name}-id"
+    writer.name = name
+    writer.status = status
+    writer.attrs = {"Mounts": [{"Type": "volume", "Name": volume_name, "RW": rw}]}
+    return writer
+
+def make_snapshot_probe(reflink=True, copy_bytes=6, blobs=False):
+    """Mock helper container running the snapshot probe script."""
+    probe = MagicMock()
+    probe.wait.return_value = {"StatusCode": 0}
+    output = f"reflink {int(reflink)}\nbytes {copy_bytes}\nblobs {int(blobs)}\n".encode()
+    probe.logs.side_effect = lambda stdout=True, stderr=True: output if stdout else b""
+    return probe
+
+def test_backup_volumes_online_archives_snapshot(mock_config, mock_display, tmp_path):
+    """Test online backups pause the volume's writers only while it is copied to a snapshot"""
+    events = []
+    mock_client = MagicMock()
+    writer = make_writer("webui", "webui_data")
+    writer.pause.side_effect = lambda: events.append("pause")
+    writer.unpause.side_effect = lambda: events.append("unpause")
+    mock_client.containers.list.return_value = [writer]
+    mock_client.volumes.create.return_value.name = "webui_data-snapshot-1"
+    copier = MagicMock()
+    copier.start.side_effect = lambda: events.append("copy")
+    copier.wait.return_value = {"StatusCode": 0}
+    helper = make_archive_helper({"webui.db": b"sqlite"})
+    helper.get_archive.side_effect = lambda path, chunk_size=None: (
+        events.append("archive") or iter([make_volume_tar({"webui.db": b"sqlite"})]), {}
+    )
+    probe = make_snapshot_probe()
+    probe.start.side_effect = lambda: events.append("probe")
+    mock_client.containers.create.side_effect = [probe, copier, helper]
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    volume_stats = []
+    assert client.backup_volumes(
+        ["webui_data"], tmp_path, volume_stats=volume_stats, exclude_patterns=["*.tmp"], online=True,
+    ) is True
+    
+    assert events == ["probe", "pause", "copy", "unpause", "archive"]
+    mock_client.containers.list.assert_called_once_with(filters={"volume": "webui_data"})
+    assert mock_client.volumes.create.call_args.kwargs["labels"] == {DockerClient.SNAPSHOT_LABEL: "webui_data"}
+    probe_call, copy_call, archive_call = mock_client.containers.create.call_args_list
+    prune = ["-name", "*.tmp", "-o", "-path", "./models/blobs"]
+    assert probe_call.kwargs["command"] == ["sh", "-c", DockerClient.SNAPSHOT_PROBE_SCRIPT, "probe", *prune]
+    assert copy_call.kwargs["command"] == ["sh", "-c", DockerClient.SNAPSHOT_COPY_SCRIPT, "snapshot", "reflink", *prune]
+    assert copy_call.kwargs["volumes"] == probe_call.kwargs["volumes"] == {
+        "webui_data": {"bind": "/data", "mode": "ro"},
+        "webui_data-snapshot-1": {"bind": "/snapshot", "mode": "rw"},
+    }
+    assert archive_call.kwargs["volumes"] == {"webui_data-snapshot-1": {"bind": "/data", "mode": "ro"}}
+    copier.remove.assert_called_once_with(force=True)
+    mock_client.volumes.get.return_value.remove.assert_called_once_with(force=True)
+    assert volume_stats[0].paused_containers == ["webui"]
+    assert volume_stats[0].pause_seconds is not None
+    with tarfile.open(tmp_path / "webui_data.tar.gz", "r:gz") as tar:
+        assert tar.extractfile("./webui.db").read() == b"sqlite"
+
+def test_backup_volumes_online_reads_model_blobs_from_live_volume(mock_config, mock_display, tmp_path):
+    """Test model blobs are left out of the paused copy and archived from the live volume afterwards"""
+    blob = "sha256-" + "a" * 64
+    mock_client = MagicMock()
+    mock_client.containers.list.return_value = [make_writer("ollama", "ollama_data")]
+    mock_client.volumes.create.return_value.name = "ollama_data-snapshot-1"
+    copier = MagicMock()
+    copier.wait.return_value = {"StatusCode": 0}
+    snapshot_helper = make_archive_helper({"models/manifests/llama3": b"manifest"})
+    live_data = make_volume_tar({blob: b"weights", f"{blob}-partial-0": b"half"}, prefix="blobs")
+    live_helper = MagicMock()
+    live_helper.get_archive.return_value = (iter([live_data]), {"name": "blobs"})
+    mock_client.containers.create.side_effect = [
+        make_snapshot_probe(blobs=True), copier, snapshot_helper, live_helper,
+    ]
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    volume_stats = []
+    assert client.backup_volumes(["ollama_data"], tmp_path, volume_stats=volume_stats, online=True) is True
+    
+    live_call = mock_client.containers.create.call_args_list[3]
+    assert live_call.kwargs["volumes"] == {"ollama_data": {"bind": "/data", "mode": "ro"}}
+    assert live_helper.get_archive.call_args.args == ("/data/models/blobs",)
+    live_helper.remove.assert_called_once_with(force=True)
+    with tarfile.open(tmp_path / "ollama_data.tar.gz", "r:gz") as tar:
+        assert tar.getnames() == [
+            ".", "./models/manifests/llama3", "./models/blobs", f"./models/blobs/{blob}",
+        ]
+        assert tar.extractfile(f"./models/blobs/{blob}").read() == b"weights"
+    assert volume_stats[0].source_bytes == len(make_volume_tar({"models/manifests/llama3": b"manifest"})) + len(live_data)
+
+def test_backup_volumes_online_copy_without_reflink(mock_config, mock_display, tmp_path):
+    """Test a small volume on a filesystem without reflinks is copied with only its kept files"""
+    mock_client = MagicMock()
+    mock_client.containers.list.return_value = [make_writer("webui", "webui_data")]
+    mock_client.volumes.create.return_value.name = "webui_data-snapshot-1"
+    copier = MagicMock()
+    copier.wait.return_value = {"StatusCode": 0}
+    mock_client.containers.create.side_effect = [
+        make_snapshot_probe(reflink=False, copy_bytes=1024), copier, make_archive_helper({"webui.db": b"sqlite"}),
+    ]
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    assert client.backup_volumes(["webui_data"], tmp_path, online=True) is True
+    
+    command = mock_client.containers.create.call_args_list[1].kwargs["command"]
+    assert command[3:5] == ["snapshot", "copy"]
+
+def test_backup_volumes_online_refuses_long_plain_copy(mock_config, mock_display, tmp_path):
+    """Test a copy over the limit without reflinks fails the volume before its writers are paused"""
+    mock_client = MagicMock()
+    writer = make_writer("ollama", "ollama_data")
+    mock_client.containers.list.return_value = [writer]
+    probe = make_snapshot_probe(reflink=False, copy_bytes=DockerClient.ONLINE_COPY_LIMIT_BYTES + 1)
+    mock_client.containers.create.return_value = probe
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    assert client.backup_volumes(["ollama_data"], tmp_path, online=True) is False
+    
+    writer.pause.assert_not_called()
+    mock_client.containers.create.assert_called_once()
+    probe.remove.assert_called_once_with(force=True)
+    mock_client.volumes.get.return_value.remove.assert_called_once_with(force=True)
+
+def test_backup_volumes_online_without_writers_archives_in_place(mock_config, mock_display, tmp_path):
+    """Test a volume only mounted read-only (or not at all) is archived without a snapshot"""
+    mock_client = MagicMock()
+    reader = make_writer("viewer", "test_vol", rw=False)
+    mock_client.containers.list.return_value = [reader]
+    mock_client.containers.create.return_value = make_archive_helper({"a": b"1"})
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    volume_stats = []
+    assert client.backup_volumes(["test_vol"], tmp_path, volume_stats=volume_stats, online=True) is True
+    
+    reader.pause.assert_not_called()
+    mock_client.volumes.create.assert_not_called()
+    mock_client.containers.create.assert_called_once_with(
+        "alpine:latest", command="true", volumes={"test_vol": {"bind": "/data", "mode": "ro"}}
+    )
+    assert volume_stats[0].pause_seconds is None
+
+def test_backup_volumes_online_snapshot_failure(mock_config, mock_display, tmp_path):
+    """Test a failed snapshot copy fails the volume, resumes the writer and removes the snapshot"""
+    mock_client = MagicMock()
+    writer = make_writer("ollama", "ollama_data")
+    mock_client.containers.list.return_value = [writer]
+    copier = MagicMock()
+    copier.wait.return_value = {"StatusCode": 1}
+    copier.logs.return_value = b"cp: write error: No space left on device"
+    mock_client.containers.create.side_effect = [make_snapshot_probe(), copier]
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    assert client.backup_volumes(["ollama_data"], tmp_path, online=True) is False
+    
+    writer.pause.assert_called_once()
+    writer.unpause.assert_called_once()
+    copier.remove.assert_called_once_with(force=True)
+    mock_client.volumes.get.return_value.remove.assert_called_once_with(force=True)
+    assert mock_client.containers.create.call_count == 2
+    assert not (tmp_path / "ollama_data.tar.gz").exists()
+
+def test_paused_counts_overlapping_holds(mock_config, mock_display):
+    """Test a writer shared by concurrent snapshots is paused once and resumed after the last one"""
+    client = DockerClient(config=mock_config, display=mock_display)
+    shared = make_writer("webui", "webui_data")
+    frozen = make_writer("tools", "webui_data", status="paused")
+    
+    with client._paused([shared, frozen]) as names:
+        with client._paused([shared]):
+            pass
+        shared.unpause.assert_not_called()
+    
+    assert names == ["webui", "tools"]
+    shared.pause.assert_called_once()
+    shared.unpause.assert_called_once()
+    frozen.pause.assert_not_called()
+    frozen.unpause.assert_not_called()
+    assert client._pauses == {}
+
+def test_backup_volumes_applies_throttle(mock_config, mock_display, tmp_path):
+    """Test a throttle limits helper containers and rate-limits the archive stream"""
+    from ollama_stack_cli.throttle import BackupThrottle
+    mock_client = MagicMock()
+    writer = make_writer("ollama", "ollama_data")
+    mock_client.containers.list.return_value = [writer]
+    mock_client.volumes.create.return_value.name = "ollama_data-snapshot-1"
+    copier = MagicMock()
+    copier.wait.return_value = {"StatusCode": 0}
+    mock_client.containers.create.side_effect = [
+        make_snapshot_probe(), copier, make_archive_helper({"a": b"1" * 5000}),
+    ]
+    throttle = BackupThrottle(rate_limit=1024 * 1024, cpu_shares=128, blkio_weight=10)
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    volume_stats = []
+    with patch.object(throttle.limiter, "throttle", return_value=0.5) as mock_throttle:
+        assert client.backup_volumes(
+            ["ollama_data"], tmp_path, volume_stats=volume_stats, online=True, throttle=throttle,
+        ) is True
+    
+    for create_call in mock_client.containers.create.call_args_list:
+        assert create_call.kwargs["cpu_shares"] == 128
+        assert create_call.kwargs["blkio_weight"] == 10
+    # Everything up to the tar end marker goes through the limiter; only the trailing padding is drained past it
+    assert 5000 < sum(c.args[0] for c in mock_throttle.call_args_list) <= volume_stats[0].source_bytes
+    assert volume_stats[0].throttled_seconds == 0.5 * mock_throttle.call_count
+
+def test_backup_volumes_to_stream_writes_plain_archives(mock_config, mock_display):
+    """Test volumes go into the backup stream as uncompressed archives, hashed as written"""
+    from ollama_stack_cli.backup_stream import BackupStreamReader, BackupStreamWriter
+    mock_client = MagicMock()
+    mock_client.containers.create.side_effect = lambda *args, **kwargs: make_archive_helper({"webui.db": b"rows" * 10})
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    output = io.BytesIO()
+    volume_stats = []
+    with BackupStreamWriter(output, "gzip") as writer:
+        assert client.backup_volumes_to_stream(["vol_a", "vol_b"], writer, volume_stats=volume_stats) is True
+
+    entries = {name: contents.read() for name, contents in BackupStreamReader(io.BufferedReader(io.BytesIO(output.getvalue())))}
+    assert list(entries) == ["volumes/vol_a.tar", "volumes/vol_b.tar"]
+    with tarfile.open(fileobj=io.BytesIO(entries["volumes/vol_a.tar"]), mode="r") as tar:
+        assert tar.getnames() == [".", "./webui.db"]
+    assert [stats.archive for stats in volume_stats] == ["vol_a.tar", "vol_b.tar"]
+    assert volume_stats[0].sha256 == hashlib.sha256(entries["volumes/vol_a.tar"]).hexdigest()
+    assert volume_stats[0].size_bytes == len(entries["volumes/vol_a.tar"])
+
+def test_restore_volume_from_stream(mock_config, mock_display):
+    """Test a volume archive read from a stream is uploaded with put_archive"""
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        info = tarfile.TarInfo("./config.json")
+        info.size = 2
+        tar.addfile(info, io.BytesIO(b"{}"))
+    mock_client = MagicMock()
+    helper = MagicMock()
+    uploads = []
+    capture_put_archive(helper, uploads)
+    mock_client.containers.create.return_value = helper
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    ok, stats = client.restore_volume_from_stream("test_vol", io.BytesIO(archive.getvalue()))
+
+    assert ok is True
+    assert stats.size_bytes == len(archive.getvalue())
+    with tarfile.open(fileobj=io.BytesIO(uploads[0][1]), mode="r") as tar:
+        assert tar.extractfile("./config.json").read() == b"{}"
+    helper.remove.assert_called_once_with(force=True)
+
+def test_restore_volumes_multiple_volumes(mock_config, mock_display, tmp_path):
+    """Test restore_volumes with multiple volumes"""
+    make_volume_archive(tmp_path / "vol1.tar.gz", {"a": b"1"})
+    make_volume_archive(tmp_path / "vol2.tar.gz", {"b": b"2"})
+    mock_client = MagicMock()
+    mock_client.volumes.get.side_effect = docker.errors.NotFound("Volume not found")
+    helper = MagicMock()
+    helper.put_archive.return_value = True
+    mock_client.containers.create.return_value = helper
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    result = client.restore_volumes(["vol1", "vol2"], tmp_path)
+    
+    assert result is True
+    assert mock_client.volumes.create.call_count == 2
+    assert helper.put_archive.call_count == 2
+    assert helper.remove.call_count == 2
+    mock_client.volumes.create.assert_any_call(name="vol1")
+    mock_client.volumes.create.assert_any_call(name="vol2")
+
+def test_restore_volumes_runs_volumes_concurrently(mock_config, mock_display, tmp_path):
+    """Test restore_volumes streams archives in parallel and records per-volume stats"""
+    barrier = threading.Barrier(2, timeout=5)
+    make_volume_archive(tmp_path / "vol1.tar.gz", {"a": b"1" * 4096})
+    make_volume_archive(tmp_path / "vol2.tar.gz", {"b": b"2"})
+    uploads = {}
+    mock_client = MagicMock()
+
+    def create_side_effect(image, command, volumes):
+        helper = MagicMock()
+        name = next(iter(volumes))
+
+        def put_archive(path, data):
+            # Both volumes must be uploading at once to pass the barrier
+            barrier.wait()
+            uploads[name] = b"".join(data)
+            return True
+
+        helper.put_archive.side_effect = put_archive
+        return helper
+
+    mock_client.containers.create.side_effect = create_side_effect
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    volume_stats = []
+    result = client.restore_volumes(["vol1", "vol2"], tmp_path, max_workers=2, volume_stats=volume_stats)
+
+    assert result is True
+    assert [stats.name for stats in volume_stats] == ["vol1", "vol2"]
+    assert volume_stats[0].archive == "vol1.tar.gz"
+    assert volume_stats[0].size_bytes == (tmp_path / "vol1.tar.gz").stat().st_size
+    assert volume_stats[0].restored_bytes == len(uploads["vol1"])
+    assert volume_stats[0].duration_seconds >= 0
+
+def test_restore_volumes_worker_limit(mock_config, mock_display, tmp_path):
+    """Test restore_volumes never uploads more volumes than max_workers"""
+    lock = threading.Lock()
+    active = []
+    peak = []
+    names = [f"vol{i}" for i in range(4)]
+    for name in names:
+        make_volume_archive(tmp_path / f"{name}.tar.gz", {"file": b"x"})
+    mock_client = MagicMock()
+
+    def put_archive(path, data):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        b"".join(data)
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+        return True
+
+    mock_client.containers.create.return_value.put_archive.side_effect = put_archive
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    assert client.restore_volumes(names, tmp_path, max_workers=1) is True
+    assert max(peak) == 1
+
+def test_restore_volumes_reports_progress(mock_config, mock_display, tmp_path):
+    """Test restore progress reports the share of the archive read and the decompressed rate"""
+    make_volume_archive(tmp_path / "test_vol.tar", {"weights": os.urandom(3 * 1024 * 1024)}, codec="none")
+    mock_client = MagicMock()
+    capture_put_archive(mock_client.containers.create.return_value, [])
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+
+    # Report on every read instead of every few seconds
+    report_every_read = functools.partial(ChunkStreamReader, progress_interval=0)
+    with patch("ollama_stack_cli.docker_client.ChunkStreamReader", report_every_read), \
+            patch("ollama_stack_cli.docker_client.log") as mock_log:
+        assert client.restore_volumes(["test_vol"], tmp_path, codec="none") is True
+
+    messages = [call.args[0] for call in mock_log.info.call_args_list]
+    progress = [message for message in messages if message.startswith("Restoring volume test_vol: ")]
+    assert progress
+    assert progress[-1].startswith("Restoring volume test_vol: 100% of archive read")
+    assert "MB/s" in progress[-1]
+
+@pytest.mark.parametrize("codec,extension", [("none", ".tar"), ("gzip-mt", ".tar.gz")])
+def test_restore_volumes_uses_recorded_codec(mock_config, mock_display, tmp_path, codec, extension):
+    """Test restore_volumes opens the archive name and format the codec wrote"""
+    make_volume_archive(tmp_path / f"test_vol{extension}", {"history.db": b"sqlite" * 100}, codec=codec)
+    mock_client = MagicMock()
+    helper = MagicMock()
+    uploads = []
+    capture_put_archive(helper, uploads)
+    mock_client.containers.create.return_value = helper
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    assert client.restore_volumes(["test_vol"], tmp_path, codec=codec) is True
+    with tarfile.open(fileobj=io.BytesIO(uploads[0][1]), mode="r") as tar:
+        assert tar.extractfile("./history.db").read() == b"sqlite" * 100
+
+def test_restore_volumes_codec_not_installed(mock_config, mock_display, tmp_path):
+    """Test restore_volumes fails before touching volumes when the codec's package is missing"""
+    mock_client = MagicMock()
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    with patch.object(get_codec("zstd"), "available", return_value=False):
+        result = client.restore_volumes(["test_vol"], tmp_path, codec="zstd")
+    
+    assert result is False
+    mock_client.containers.create.assert_not_called()
+
+def test_restore_volumes_no_client(mock_config, mock_display):
+    """Test restore_volumes when client is None"""
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = None
+    
+    result = client.restore_volumes(["vol1"], Path("/backup/path"))
+    
+    assert result is False
+
+def test_restore_volumes_backup_file_missing(mock_config, mock_display):
+    """Test restore_volumes when backup file doesn't exist"""
+    with patch("pathlib.Path.exists", return_value=False):
+        mock_client = MagicMock()
+        client = DockerClient(config=mock_config, display=mock_display)
+        client.client = mock_client
         
         result = client.restore_volumes(["test_vol"], Path("/backup/path"))
         
@@ -1501,50 +2588,38 @@ def test_restore_volumes_volume_create_fails(mock_config, mock_display):
         assert result is False
         mock_client.volumes.create.assert_called_once_with(name="test_vol")
 
-def test_restore_volumes_container_run_fails(mock_config, mock_display):
-    """Test restore_volumes when container run fails"""
-    with patch("pathlib.Path.exists", return_value=True):
-        mock_client = MagicMock()
-        mock_volume = MagicMock()
-        mock_volume.name = "test_vol"
-        mock_client.volumes.get.side_effect = docker.errors.NotFound("Volume not found")
-        mock_client.volumes.create.return_value = mock_volume
-        mock_client.containers.run.side_effect = docker.errors.APIError("Container run failed")
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.restore_volumes(["test_vol"], Path("/backup/path"))
-        
-        assert result is False
-        mock_client.volumes.create.assert_called_once_with(name="test_vol")
-        mock_client.containers.run.assert_called_once()
+def test_restore_volumes_put_archive_fails(mock_config, mock_display, tmp_path):
+    """Test restore_volumes when the archive upload raises"""
+    make_volume_archive(tmp_path / "test_vol.tar.gz", {"a": b"1"})
+    mock_client = MagicMock()
+    helper = MagicMock()
+    helper.put_archive.side_effect = docker.errors.APIError("Upload failed")
+    mock_client.containers.create.return_value = helper
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    result = client.restore_volumes(["test_vol"], tmp_path)
+    
+    assert result is False
+    helper.put_archive.assert_called_once()
+    helper.remove.assert_called_once_with(force=True)
 
-def test_restore_volumes_container_wait_fails(mock_config, mock_display):
-    """Test restore_volumes when container wait returns non-zero exit code"""
-    with patch("pathlib.Path.exists", return_value=True):
-        mock_client = MagicMock()
-        mock_volume = MagicMock()
-        mock_volume.name = "test_vol"
-        mock_client.volumes.get.side_effect = docker.errors.NotFound("Volume not found")
-        mock_client.volumes.create.return_value = mock_volume
-        
-        # When detach=False, container failures raise exceptions rather than returning exit codes
-        mock_client.containers.run.side_effect = docker.errors.ContainerError(
-            container=MagicMock(),
-            exit_status=1,
-            command="tar -xzf /backup/test_vol.tar.gz -C /data",
-            image="alpine:latest",
-            stderr=b"Restore failed"
-        )
-        
-        client = DockerClient(config=mock_config, display=mock_display)
-        client.client = mock_client
-        
-        result = client.restore_volumes(["test_vol"], Path("/backup/path"))
-        
-        assert result is False
-        mock_client.containers.run.assert_called_once()
+def test_restore_volumes_put_archive_rejected(mock_config, mock_display, tmp_path):
+    """Test restore_volumes when Docker rejects the archive"""
+    make_volume_archive(tmp_path / "test_vol.tar.gz", {"a": b"1"})
+    mock_client = MagicMock()
+    helper = MagicMock()
+    helper.put_archive.return_value = False
+    mock_client.containers.create.return_value = helper
+    
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    result = client.restore_volumes(["test_vol"], tmp_path)
+    
+    assert result is False
+    helper.remove.assert_called_once_with(force=True)
 
 def test_restore_volumes_empty_list(mock_config, mock_display):
     """Test restore_volumes with empty volume list"""
@@ -1609,11 +2684,112 @@ def test_restore_volumes_partial_failure(mock_config, mock_display):
         assert result is False  # Should fail if any volume fails
         assert mock_client.volumes.create.call_count == 2
 
+@pytest.mark.parametrize("codec,extension", [("none", ".tar"), ("gzip", ".tar.gz")])
+def test_restore_volumes_selected_paths(mock_config, mock_display, tmp_path, codec, extension):
+    """Test a path restore uploads only the members under the requested paths"""
+    make_volume_archive(tmp_path / f"webui_data{extension}", {
+        "webui.db": b"sqlite" * 100,
+        "uploads/report.pdf": b"%PDF",
+        "vector_db/chroma.sqlite3": b"vectors" * 1000,
+    }, codec=codec)
+    mock_client = MagicMock()
+    helper = MagicMock()
+    uploads = []
+    capture_put_archive(helper, uploads)
+    mock_client.containers.create.return_value = helper
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    volume_stats = []
+    
+    result = client.restore_volumes(
+        ["webui_data"], tmp_path, codec=codec, volume_stats=volume_stats,
+        volume_paths={"webui_data": ["/webui.db", "uploads"]},
+    )
+    
+    assert result is True
+    with tarfile.open(fileobj=io.BytesIO(uploads[0][1]), mode="r") as tar:
+        assert sorted(tar.getnames()) == ["./uploads/report.pdf", "./webui.db"]
+        assert tar.extractfile("./webui.db").read() == b"sqlite" * 100
+    assert volume_stats[0].paths == ["webui.db", "uploads"]
+    assert volume_stats[0].restored_members == 2
+
+def test_restore_volumes_selected_path_filters_model_blobs(mock_config, mock_display, tmp_path):
+    """Test a path restore only streams back the model blobs under the requested paths"""
+    blob_store = BlobStore(tmp_path / "blob-store")
+    refs = []
+    for content in (b"first", b"second"):
+        digest = hashlib.sha256(content).hexdigest()
+        member = tarfile.TarInfo(f"./models/blobs/sha256-{digest}")
+        member.size = len(content)
+        refs.append(blob_store.ingest(member, io.BytesIO(content), digest)[0])
+    make_volume_archive(tmp_path / "ollama_data.tar", {"models/manifests/llama3": b"{}"}, codec="none")
+    mock_client = MagicMock()
+    helper = MagicMock()
+    uploads = []
+    capture_put_archive(helper, uploads)
+    mock_client.containers.create.return_value = helper
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    result = client.restore_volumes(
+        ["ollama_data"], tmp_path, blob_store=blob_store, volume_blobs={"ollama_data": refs},
+        codec="none", volume_paths={"ollama_data": [refs[1].path]},
+    )
+    
+    assert result is True
+    assert len(uploads) == 2
+    with tarfile.open(fileobj=io.BytesIO(uploads[0][1]), mode="r") as tar:
+        assert tar.getnames() == []
+    with tarfile.open(fileobj=io.BytesIO(uploads[1][1]), mode="r") as tar:
+        assert tar.getnames() == [refs[1].path]
+
+def test_restore_volumes_selected_path_not_in_archive(mock_config, mock_display, tmp_path):
+    """Test a path restore fails when nothing in the archive matches"""
+    make_volume_archive(tmp_path / "webui_data.tar.gz", {"webui.db": b"sqlite"})
+    mock_client = MagicMock()
+    helper = MagicMock()
+    capture_put_archive(helper, [])
+    mock_client.containers.create.return_value = helper
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    result = client.restore_volumes(["webui_data"], tmp_path, volume_paths={"webui_data": ["/missing.db"]})
+    
+    assert result is False
+    helper.remove.assert_called_once_with(force=True)
+
+def test_stop_volume_users_stops_each_container_once(mock_config, mock_display):
+    """Test containers mounting any of the volumes are stopped once and returned by name"""
+    webui = make_writer("webui", "webui_data")
+    tools = make_writer("tools", "tools_data")
+    mock_client = MagicMock()
+    mock_client.containers.list.side_effect = [[webui], [webui, tools]]
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    stopped = client.stop_volume_users(["webui_data", "tools_data"])
+    
+    assert stopped == ["webui", "tools"]
+    webui.stop.assert_called_once()
+    tools.stop.assert_called_once()
+    mock_client.containers.list.assert_any_call(filters={"volume": "tools_data"})
+
+def test_start_containers_reports_failures(mock_config, mock_display):
+    """Test start_containers starts every container and returns False if one fails"""
+    webui = MagicMock()
+    mock_client = MagicMock()
+    mock_client.containers.get.side_effect = [webui, docker.errors.NotFound("gone")]
+    client = DockerClient(config=mock_config, display=mock_display)
+    client.client = mock_client
+    
+    assert client.start_containers(["webui", "tools"]) is False
+    webui.start.assert_called_once()
+
 def test_export_stack_state_success(mock_config, mock_display):
     """Test export_stack_state successful execution with all resource types"""
     with patch("pathlib.Path.mkdir"), patch("builtins.open", mock_open()) as mock_file:
         mock_client = MagicMock()
-        mock_client.version.return_value = {"Version": "20.10.0"}
+        mock_client.info.return_value = {"ServerVersion": "20.10.0"}
         
         # Mock containers
         mock_container = MagicMock()
@@ -1774,7 +2950,7 @@ def test_export_stack_state_empty_resources(mock_config, mock_display):
     """Test export_stack_state with no resources"""
     with patch("pathlib.Path.mkdir"), patch("builtins.open", mock_open()) as mock_file:
         mock_client = MagicMock()
-        mock_client.version.return_value = {"Version": "20.10.0"}
+        mock_client.info.return_value = {"ServerVersion": "20.10.0"}
         mock_client.containers.list.return_value = []
         mock_client.volumes.list.return_value = []
         mock_client.networks.list.return_value = []
@@ -1849,7 +3025,7 @@ def test_export_stack_state_directory_creation(mock_config, mock_display):
     """Test export_stack_state creates parent directories"""
     with patch("pathlib.Path.mkdir") as mock_mkdir, patch("builtins.open", mock_open()) as mock_file:
         mock_client = MagicMock()
-        mock_client.version.return_value = {"Version": "20.10.0"}
+        mock_client.info.return_value = {"ServerVersion": "20.10.0"}
         mock_client.containers.list.return_value = []
         mock_client.volumes.list.return_value = []
         mock_client.networks.list.return_value = []
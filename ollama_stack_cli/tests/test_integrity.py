@@ -0,0 +1,110 @@
+import gzip
+import hashlib
+import io
+from unittest.mock import patch
+
+from ollama_stack_cli.integrity import (
+    HashingWriter,
+    backup_file_paths,
+    digest_files,
+    file_sha256,
+    merkle_root,
+    verify_files,
+)
+from ollama_stack_cli.schemas import BackupConfig, BackupManifest, FileDigest
+
+
+def make_manifest(**kwargs):
+    return BackupManifest(
+        stack_version="0.2.0",
+        cli_version="0.2.0",
+        platform="linux",
+        backup_config=BackupConfig(),
+        **kwargs,
+    )
+
+
+def write_backup(backup_dir, files):
+    for path, content in files.items():
+        (backup_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (backup_dir / path).write_bytes(content)
+
+
+def test_file_sha256_matches_hashlib_across_buffer_boundaries(tmp_path):
+    """Tests that hashing through the reused buffer equals a one-shot digest."""
+    data = bytes(range(256)) * 5000
+    path = tmp_path / "archive.tar.gz"
+    path.write_bytes(data)
+
+    with patch("ollama_stack_cli.integrity.HASH_BUFFER_SIZE", 4096):
+        assert file_sha256(path) == hashlib.sha256(data).hexdigest()
+
+
+def test_hashing_writer_tees_bytes_into_digest_and_count():
+    """Tests the writer passes bytes through unchanged and leaves the file open when closed."""
+    raw = io.BytesIO()
+    with gzip.GzipFile(fileobj=HashingWriter(raw), mode="wb") as compressed:
+        compressed.write(b"volume data " * 10000)
+
+    hashed = HashingWriter(io.BytesIO())
+    with hashed:
+        hashed.write(raw.getvalue()[:100])
+        hashed.write(memoryview(raw.getvalue())[100:])
+
+    assert not raw.closed
+    assert hashed.bytes_written == len(raw.getvalue())
+    assert hashed.hexdigest() == hashlib.sha256(raw.getvalue()).hexdigest()
+
+
+def test_backup_file_paths_follow_manifest_and_codec():
+    manifest = make_manifest(
+        volumes=["webui_data", "ollama_data"], codec="zstd",
+        config_files=[".env"], extensions=["ext1"],
+    )
+
+    assert backup_file_paths(manifest) == [
+        "config/.env", "extensions/ext1.tar.gz", "volumes/ollama_data.tar.zst", "volumes/webui_data.tar.zst",
+    ]
+    assert backup_file_paths(manifest, volumes=["webui_data"]) == ["volumes/webui_data.tar.zst"]
+
+
+def test_digest_files_hashes_existing_files_in_parallel(tmp_path):
+    write_backup(tmp_path, {"volumes/a.tar.gz": b"a" * 1000, "config/.env": b"KEY=1"})
+
+    digests = digest_files(tmp_path, ["volumes/a.tar.gz", "config/.env", "volumes/missing.tar.gz"], max_workers=2)
+
+    assert [d.path for d in digests] == ["config/.env", "volumes/a.tar.gz"]
+    assert digests[1].size == 1000
+    assert digests[1].sha256 == hashlib.sha256(b"a" * 1000).hexdigest()
+
+
+def test_merkle_root_is_order_independent_and_binds_every_field():
+    """Tests the root depends on path, size and digest of every file, not on list order."""
+    a = FileDigest(path="volumes/a.tar.gz", size=1, sha256="00" * 32)
+    b = FileDigest(path="volumes/b.tar.gz", size=2, sha256="11" * 32)
+    c = FileDigest(path="config/.env", size=3, sha256="22" * 32)
+    root = merkle_root([a, b, c])
+
+    assert root == merkle_root([c, b, a])
+    assert root != merkle_root([a, b])
+    assert root != merkle_root([a, b, c.model_copy(update={"path": "config/.env.bak"})])
+    assert root != merkle_root([a, b, c.model_copy(update={"size": 4})])
+    assert root != merkle_root([a, b, c.model_copy(update={"sha256": "33" * 32})])
+    assert merkle_root([]) == hashlib.sha256(b"").hexdigest()
+
+
+def test_verify_files_reports_corrupted_truncated_and_missing_files(tmp_path):
+    write_backup(tmp_path, {
+        "volumes/ok.tar.gz": b"intact",
+        "volumes/flipped.tar.gz": b"before",
+        "volumes/short.tar.gz": b"complete",
+    })
+    digests = digest_files(tmp_path, ["volumes/ok.tar.gz", "volumes/flipped.tar.gz", "volumes/short.tar.gz"])
+    digests.append(FileDigest(path="volumes/gone.tar.gz", size=1, sha256="00" * 32))
+    (tmp_path / "volumes/flipped.tar.gz").write_bytes(b"after!")
+    (tmp_path / "volumes/short.tar.gz").write_bytes(b"comp")
+
+    assert verify_files(tmp_path, digests) == [
+        "volumes/flipped.tar.gz", "volumes/gone.tar.gz", "volumes/short.tar.gz",
+    ]
+    assert verify_files(tmp_path, [d for d in digests if d.path == "volumes/ok.tar.gz"]) == []
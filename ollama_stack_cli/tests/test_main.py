@@ -38,7 +38,7 @@ class TestCommandRegistration:
         assert result.exit_code == 0
         help_text = result.stdout
 
-        expected_commands = ["start", "stop", "restart", "status", "logs", "check", "install", "update", "uninstall", "backup", "restore"]
+        expected_commands = ["start", "stop", "restart", "status", "serve", "logs", "check", "install", "update", "uninstall", "backup", "restore"]
         for command in expected_commands:
             assert command in help_text
     
@@ -50,7 +50,7 @@ class TestCommandRegistration:
         
         # Count command occurrences in the Commands section
         commands_section = help_text.split("Commands:")[1] if "Commands:" in help_text else help_text
-        expected_commands = ["start", "stop", "restart", "status", "logs", "check", "install", "update", "uninstall", "backup", "restore"]
+        expected_commands = ["start", "stop", "restart", "status", "serve", "logs", "check", "install", "update", "uninstall", "backup", "restore"]
         
         for command in expected_commands:
             assert command in commands_section
@@ -184,7 +184,7 @@ class TestBasicCommandRouting:
         MockAppContext.return_value = mock_context
         
         # Test that each command can be invoked (not testing detailed logic)
-        commands = ["start", "stop", "restart", "status", "logs", "check", "install", "update", "uninstall", "backup", "restore"]
+        commands = ["start", "stop", "restart", "status", "serve", "logs", "check", "install", "update", "uninstall", "backup", "restore"]
         for command in commands:
             result = runner.invoke(app, [command, "--help"])
             assert result.exit_code == 0, f"Command '{command} --help' failed with exit code {result.exit_code}"
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import MagicMock, patch, mock_open
-import urllib.error
+import http.client
 import socket
 import json
 import subprocess
@@ -33,134 +33,280 @@ def test_ollama_api_client_init(mock_display):
     assert client.display == mock_display
     assert client.base_url == "http://localhost:11434"
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_healthy_with_models(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests a healthy response with models loaded via ollama ps command."""
-    # Mock API response
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    # Mock ollama ps command response
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "NAME\tID\t\nllama2:latest\t123\ncodellama:latest\t456\n"
-    
+PS_RESPONSE = {
+    "models": [
+        {
+            "name": "llama3:8b",
+            "model": "llama3:8b",
+            "size": 6_000_000_000,
+            "size_vram": 4_000_000_000,
+            "expires_at": "2026-10-16T12:05:00Z",
+            "details": {"parameter_size": "8.0B", "quantization_level": "Q4_0"},
+        },
+        {
+            "name": "nomic-embed-text:latest",
+            "size": 300_000_000,
+            "size_vram": 300_000_000,
+            "expires_at": "2026-10-16T12:04:00Z",
+            "details": {},
+        },
+    ]
+}
+
+
+def make_response(status=200, payload=None, will_close=False):
+    """Builds a fake http.client response."""
+    response = MagicMock()
+    response.status = status
+    response.will_close = will_close
+    response.read.return_value = json.dumps(payload if payload is not None else {}).encode()
+    return response
+
+
+def route_responses(mock_conn_cls, routes):
+    """Makes the mocked connection answer each request path from routes."""
+    connection = mock_conn_cls.return_value
+    requested = []
+
+    def request(method, path):
+        requested.append(path)
+
+    def getresponse():
+        result = routes[requested[-1]]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    connection.request.side_effect = request
+    connection.getresponse.side_effect = getresponse
+    return requested
+
+
+# =============================================================================
+# get_status Tests
+# =============================================================================
+
+@patch('http.client.HTTPConnection')
+def test_get_status_healthy_with_models(mock_conn_cls, api_client):
+    """Tests a healthy response with loaded models reported by /api/ps."""
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload=PS_RESPONSE),
+    })
+
     status = api_client.get_status()
-    
+
     assert status.is_running is True
     assert status.health == "healthy"
     assert status.status == "Running (2 models)"
-    mock_urlopen.assert_called_once()
-    mock_subprocess.assert_called_once_with(["ollama", "ps"], capture_output=True, text=True, timeout=5)
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_healthy_no_models(mock_urlopen, mock_subprocess, mock_which, api_client):
+    assert status.version == "0.4.2"
+    assert status.ports == {'11434/tcp': 11434}
+    llama = status.models[0]
+    assert llama.name == "llama3:8b"
+    assert llama.size_bytes == 6_000_000_000
+    assert llama.vram_bytes == 4_000_000_000
+    assert llama.ram_bytes == 2_000_000_000
+    assert llama.parameter_size == "8.0B"
+    assert llama.quantization_level == "Q4_0"
+    assert llama.expires_at == "2026-10-16T12:05:00Z"
+    assert status.models[1].ram_bytes == 0
+
+
+@patch('http.client.HTTPConnection')
+def test_get_status_reuses_one_connection(mock_conn_cls, api_client):
+    """Tests that both API requests share one keep-alive connection and no subprocess runs."""
+    requested = route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload={"models": []}),
+    })
+
+    with patch('subprocess.run') as mock_run, patch('shutil.which') as mock_which:
+        api_client.get_status()
+        api_client.get_status()
+
+    mock_conn_cls.assert_called_once_with("localhost", 11434, timeout=OllamaApiClient.API_TIMEOUT)
+    assert requested == ["/api/version", "/api/ps", "/api/version", "/api/ps"]
+    mock_run.assert_not_called()
+    mock_which.assert_not_called()
+
+
+@patch('http.client.HTTPConnection')
+def test_get_status_healthy_no_models(mock_conn_cls, api_client):
     """Tests a healthy response with no models loaded."""
-    # Mock API response
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    # Mock ollama ps command response (only header line)
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "NAME\tID\t\n"
-    
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload={"models": []}),
+    })
+
     status = api_client.get_status()
-    
+
     assert status.is_running is True
-    assert status.health == "healthy"
     assert status.status == "Running (no models loaded)"
+    assert status.models == []
+
+
+@patch('http.client.HTTPConnection')
+def test_get_status_single_model(mock_conn_cls, api_client):
+    """Tests get_status with exactly one model loaded."""
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload={"models": PS_RESPONSE["models"][:1]}),
+    })
+
+    status = api_client.get_status()
+
+    assert status.status == "Running (1 model)"  # Singular form
+
+
+@patch('http.client.HTTPConnection')
+def test_get_status_ps_request_fails(mock_conn_cls, api_client):
+    """Tests that a failing /api/ps still reports a healthy server."""
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": socket.timeout("Request timed out"),
+    })
+
+    status = api_client.get_status()
+
+    assert status.is_running is True
+    assert status.health == "healthy"
+    assert status.status == "Running"  # Falls back to basic "Running"
+    assert status.models == []
+
 
 @patch('shutil.which', return_value=None)
-def test_get_status_ollama_not_installed(mock_which, api_client):
-    """Tests when ollama command is not installed."""
+@patch('http.client.HTTPConnection')
+def test_get_status_ollama_not_installed(mock_conn_cls, mock_which, api_client):
+    """Tests when the server is unreachable and ollama is not installed."""
+    mock_conn_cls.return_value.request.side_effect = ConnectionRefusedError("Connection refused")
+
     status = api_client.get_status()
-    
+
     assert status.is_running is False
-    assert status.health == "unavailable"
     assert status.status == "Not installed"
-    assert status.name == "ollama (Native)"
+    assert status.health == "unavailable"
+
 
 @patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('urllib.request.urlopen', side_effect=urllib.error.URLError("Connection failed"))
-def test_get_status_connection_error(mock_urlopen, mock_which, api_client):
-    """Tests a URLError, indicating the service is not reachable."""
+@patch('http.client.HTTPConnection')
+def test_get_status_connection_refused_error(mock_conn_cls, mock_which, api_client):
+    """Tests get_status when API connection is refused."""
+    mock_conn_cls.return_value.request.side_effect = ConnectionRefusedError("Connection refused")
+
     status = api_client.get_status()
-    
+
     assert status.is_running is False
     assert status.health == "unhealthy"
+    assert api_client._connection is None
+
 
 @patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('urllib.request.urlopen')
-def test_get_status_http_error(mock_urlopen, mock_which, api_client):
-    """Tests a non-200 HTTP status response."""
-    mock_response = MagicMock()
-    mock_response.status = 500
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
+@patch('http.client.HTTPConnection')
+def test_get_status_timeout(mock_conn_cls, mock_which, api_client):
+    """Tests get_status when the version request times out."""
+    mock_conn_cls.return_value.getresponse.side_effect = socket.timeout("Request timed out")
+
     status = api_client.get_status()
-    
+
     assert status.is_running is False
     assert status.health == "unhealthy"
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('urllib.request.urlopen', side_effect=socket.timeout("Request timed out"))
-def test_get_status_timeout(mock_urlopen, mock_which, api_client):
-    """Tests a socket.timeout, indicating the service is unresponsive."""
+
+@patch('http.client.HTTPConnection')
+def test_get_status_http_error(mock_conn_cls, api_client):
+    """Tests a non-2xx response from /api/version."""
+    route_responses(mock_conn_cls, {"/api/version": make_response(status=500)})
+
     status = api_client.get_status()
-    
+
     assert status.is_running is False
     assert status.health == "unhealthy"
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_ollama_ps_command_fails(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests when ollama ps command fails but API is responsive."""
-    # Mock API response (healthy)
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    # Mock ollama ps command failure
-    mock_subprocess.return_value.returncode = 1
-    
+
+@patch('http.client.HTTPConnection')
+def test_get_status_invalid_json(mock_conn_cls, api_client):
+    """Tests a successful response whose body is not JSON."""
+    response = make_response()
+    response.read.return_value = b"not json"
+    route_responses(mock_conn_cls, {"/api/version": response})
+
     status = api_client.get_status()
-    
-    assert status.is_running is True
-    assert status.health == "healthy"
-    assert status.status == "Running"  # Falls back to basic "Running"
 
-@patch('shutil.which', return_value=None)
-def test_is_service_running_not_installed(mock_which, api_client):
-    """Tests is_service_running when ollama is not installed."""
-    result = api_client.is_service_running()
-    assert result is False
+    assert status.is_running is False
+    assert status.health == "unhealthy"
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-def test_is_service_running_process_found(mock_subprocess, mock_which, api_client):
-    """Tests is_service_running when process is found via pgrep."""
-    mock_subprocess.return_value.returncode = 0
-    result = api_client.is_service_running()
-    assert result is True
-    mock_subprocess.assert_called_once_with(["pgrep", "-f", "ollama serve"], capture_output=True, text=True, timeout=3)
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run', side_effect=subprocess.TimeoutExpired('pgrep', 3))
-@patch('urllib.request.urlopen')
-def test_is_service_running_fallback_to_api(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests fallback to API check when pgrep times out."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    result = api_client.is_service_running()
-    assert result is True
+@patch('http.client.HTTPConnection')
+def test_get_json_reconnects_after_server_closed_idle_connection(mock_conn_cls, api_client):
+    """Tests that a stale keep-alive connection is replaced and the request retried once."""
+    stale, fresh = MagicMock(), MagicMock()
+    stale.getresponse.side_effect = [
+        make_response(payload={"version": "0.4.2"}),
+        http.client.RemoteDisconnected("Remote end closed connection"),
+    ]
+    fresh.getresponse.return_value = make_response(payload={"version": "0.4.2"})
+    mock_conn_cls.side_effect = [stale, fresh]
+
+    assert api_client._get_json("/api/version") == (200, {"version": "0.4.2"})
+    assert api_client._get_json("/api/version") == (200, {"version": "0.4.2"})
+
+    stale.close.assert_called_once()
+    assert api_client._connection is fresh
+
+
+@patch('http.client.HTTPConnection')
+def test_get_json_drops_connection_server_will_close(mock_conn_cls, api_client):
+    """Tests that a response marked Connection: close is not reused."""
+    route_responses(mock_conn_cls, {"/api/version": make_response(payload={}, will_close=True)})
+
+    api_client._get_json("/api/version")
+
+    mock_conn_cls.return_value.close.assert_called_once()
+    assert api_client._connection is None
+
+
+@patch('http.client.HTTPConnection')
+def test_close_closes_connection(mock_conn_cls, api_client):
+    """Tests close() releases the persistent connection."""
+    route_responses(mock_conn_cls, {"/api/version": make_response(payload={})})
+    api_client._get_json("/api/version")
+
+    api_client.close()
+
+    mock_conn_cls.return_value.close.assert_called_once()
+    assert api_client._connection is None
+
+
+# =============================================================================
+# is_service_running Tests
+# =============================================================================
+
+@patch('http.client.HTTPConnection')
+def test_is_service_running_api_responds(mock_conn_cls, api_client):
+    """Tests is_service_running when /api/version answers, without spawning pgrep."""
+    route_responses(mock_conn_cls, {"/api/version": make_response(payload={"version": "0.4.2"})})
+
+    with patch('subprocess.run') as mock_run:
+        assert api_client.is_service_running() is True
+
+    mock_run.assert_not_called()
+
+
+@patch('http.client.HTTPConnection')
+def test_is_service_running_connection_refused(mock_conn_cls, api_client):
+    """Tests is_service_running when API connection is refused."""
+    mock_conn_cls.return_value.request.side_effect = ConnectionRefusedError("Connection refused")
+
+    assert api_client.is_service_running() is False
+
+
+@patch('http.client.HTTPConnection')
+def test_is_service_running_http_error(mock_conn_cls, api_client):
+    """Tests is_service_running with a non-2xx response."""
+    route_responses(mock_conn_cls, {"/api/version": make_response(status=503)})
+
+    assert api_client.is_service_running() is False
+
 
 @patch('shutil.which', return_value=None)
 def test_start_service_not_installed(mock_which, api_client):
@@ -226,103 +372,6 @@ def test_stop_service_timeout(mock_subprocess, mock_is_running, mock_which, api_
     assert result is False
 
 
-# =============================================================================
-# Enhanced get_status Tests (Missing Cases)
-# =============================================================================
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('urllib.request.urlopen', side_effect=ConnectionRefusedError("Connection refused"))
-def test_get_status_connection_refused_error(mock_urlopen, mock_which, api_client):
-    """Tests get_status when API connection is refused."""
-    status = api_client.get_status()
-    
-    assert status.is_running is False
-    assert status.health == "unhealthy"
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run', side_effect=subprocess.TimeoutExpired('ollama', 5))
-@patch('urllib.request.urlopen')
-def test_get_status_subprocess_timeout(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests get_status when ollama ps times out."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    status = api_client.get_status()
-    
-    assert status.is_running is True
-    assert status.health == "healthy"
-    assert status.status == "Running"  # Falls back to basic status
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_subprocess_error(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests get_status when ollama ps has subprocess error."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    mock_subprocess.side_effect = subprocess.SubprocessError("Command failed")
-    
-    status = api_client.get_status()
-    
-    assert status.is_running is True
-    assert status.health == "healthy" 
-    assert status.status == "Running"
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_single_model(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests get_status with exactly one model loaded."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "NAME\tID\t\nllama2:latest\t123\n"
-    
-    status = api_client.get_status()
-    
-    assert status.is_running is True
-    assert status.health == "healthy"
-    assert status.status == "Running (1 model)"  # Singular form
-
-
-# =============================================================================
-# Enhanced is_service_running Tests (Missing Cases)
-# =============================================================================
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run', side_effect=subprocess.SubprocessError("Process error"))
-@patch('urllib.request.urlopen')
-def test_is_service_running_subprocess_error_fallback(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests is_service_running when pgrep has subprocess error, falls back to API."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    result = api_client.is_service_running()
-    assert result is True
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run', return_value=MagicMock(returncode=1))  # Process not found
-@patch('urllib.request.urlopen', side_effect=urllib.error.URLError("Connection failed"))
-def test_is_service_running_both_checks_fail(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests is_service_running when both process and API checks fail."""
-    result = api_client.is_service_running()
-    assert result is False
-
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run', return_value=MagicMock(returncode=1))  # Process not found
-@patch('urllib.request.urlopen', side_effect=ConnectionRefusedError("Connection refused"))
-def test_is_service_running_connection_refused(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests is_service_running when API connection is refused."""
-    result = api_client.is_service_running()
-    assert result is False
-
-
 # =============================================================================
 # Enhanced start_service Tests (Missing Cases)
 # =============================================================================
@@ -800,45 +849,36 @@ def test_run_environment_checks_which_exception(mock_which, api_client):
 # Enhanced get_status Tests - Additional Edge Cases
 # =============================================================================
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_ollama_ps_with_whitespace_and_tabs(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests get_status with ollama ps output containing various whitespace."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    # Output with mixed whitespace and empty lines
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "NAME\t\tID\t\t\n\nmodel1\t123\t\n  \t\nmodel2\t456\t\n\n"
-    
+@patch('http.client.HTTPConnection')
+def test_get_status_ps_entries_with_missing_fields(mock_conn_cls, api_client):
+    """Tests get_status with /api/ps entries that omit optional fields."""
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload={"models": [{"model": "model1"}, {"name": "model2", "details": None}]}),
+    })
+
     status = api_client.get_status()
-    
-    assert status.is_running is True
-    assert status.health == "healthy"
-    assert status.status == "Running (2 models)"  # Should correctly count despite whitespace
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_ollama_ps_with_very_long_output(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests get_status with ollama ps output containing many models."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    # Generate output with many models
-    header = "NAME\tID\t\n"
-    models = "\n".join([f"model{i}\t{i}abc\t" for i in range(25)])
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = header + models + "\n"
-    
+    assert status.status == "Running (2 models)"
+    assert [m.name for m in status.models] == ["model1", "model2"]
+    assert status.models[0].size_bytes == 0
+    assert status.models[0].expires_at is None
+
+@patch('http.client.HTTPConnection')
+def test_get_status_many_loaded_models(mock_conn_cls, api_client):
+    """Tests get_status with many models loaded."""
+    models = [{"name": f"model{i}", "size": 1000, "size_vram": 0} for i in range(25)]
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload={"models": models}),
+    })
+
     status = api_client.get_status()
-    
+
     assert status.is_running is True
     assert status.health == "healthy"
     assert status.status == "Running (25 models)"
+    assert all(m.ram_bytes == 1000 for m in status.models)
 
 # =============================================================================
 # Enhanced get_logs Tests - Additional Edge Cases  
@@ -900,15 +940,9 @@ def test_get_logs_follow_with_binary_data_handling(mock_popen, mock_exists, mock
 # Enhanced is_service_running Tests - Additional Edge Cases
 # =============================================================================
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_is_service_running_api_returns_different_status_codes(mock_urlopen, mock_subprocess, mock_which, api_client):
+@patch('http.client.HTTPConnection')
+def test_is_service_running_api_returns_different_status_codes(mock_conn_cls, api_client):
     """Tests is_service_running with various HTTP status codes."""
-    # pgrep fails
-    mock_subprocess.return_value.returncode = 1
-    
-    # Test different status codes
     test_cases = [
         (200, True),   # Success
         (201, True),   # Created  
@@ -919,27 +953,12 @@ def test_is_service_running_api_returns_different_status_codes(mock_urlopen, moc
     ]
     
     for status_code, expected in test_cases:
-        mock_response = MagicMock()
-        mock_response.status = status_code
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_conn_cls.return_value.getresponse.side_effect = None
+        mock_conn_cls.return_value.getresponse.return_value = make_response(status=status_code)
         
         result = api_client.is_service_running()
         assert result == expected, f"Status {status_code} should return {expected}"
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_is_service_running_pgrep_with_multiple_processes(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests is_service_running when pgrep finds multiple ollama processes."""
-    # Simulate pgrep finding multiple processes (still returns 0)
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "1234\n5678\n9012\n"  # Multiple PIDs
-    
-    result = api_client.is_service_running()
-    assert result is True
-    
-    # Should not need to check API since pgrep succeeded
-    mock_urlopen.assert_not_called()
 
 # =============================================================================
 # Additional Environment Checks Edge Cases
@@ -963,45 +982,36 @@ def test_run_environment_checks_which_exception(mock_which, api_client):
 # Enhanced get_status Tests - Additional Edge Cases
 # =============================================================================
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_ollama_ps_with_whitespace_and_tabs(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests get_status with ollama ps output containing various whitespace."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    # Output with mixed whitespace and empty lines
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "NAME\t\tID\t\t\n\nmodel1\t123\t\n  \t\nmodel2\t456\t\n\n"
-    
+@patch('http.client.HTTPConnection')
+def test_get_status_ps_entries_with_missing_fields(mock_conn_cls, api_client):
+    """Tests get_status with /api/ps entries that omit optional fields."""
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload={"models": [{"model": "model1"}, {"name": "model2", "details": None}]}),
+    })
+
     status = api_client.get_status()
-    
-    assert status.is_running is True
-    assert status.health == "healthy"
-    assert status.status == "Running (2 models)"  # Should correctly count despite whitespace
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_get_status_ollama_ps_with_very_long_output(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests get_status with ollama ps output containing many models."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_urlopen.return_value.__enter__.return_value = mock_response
-    
-    # Generate output with many models
-    header = "NAME\tID\t\n"
-    models = "\n".join([f"model{i}\t{i}abc\t" for i in range(25)])
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = header + models + "\n"
-    
+    assert status.status == "Running (2 models)"
+    assert [m.name for m in status.models] == ["model1", "model2"]
+    assert status.models[0].size_bytes == 0
+    assert status.models[0].expires_at is None
+
+@patch('http.client.HTTPConnection')
+def test_get_status_many_loaded_models(mock_conn_cls, api_client):
+    """Tests get_status with many models loaded."""
+    models = [{"name": f"model{i}", "size": 1000, "size_vram": 0} for i in range(25)]
+    route_responses(mock_conn_cls, {
+        "/api/version": make_response(payload={"version": "0.4.2"}),
+        "/api/ps": make_response(payload={"models": models}),
+    })
+
     status = api_client.get_status()
-    
+
     assert status.is_running is True
     assert status.health == "healthy"
     assert status.status == "Running (25 models)"
+    assert all(m.ram_bytes == 1000 for m in status.models)
 
 # =============================================================================
 # Enhanced get_logs Tests - Additional Edge Cases  
@@ -1063,15 +1073,9 @@ def test_get_logs_follow_with_binary_data_handling(mock_popen, mock_exists, mock
 # Enhanced is_service_running Tests - Additional Edge Cases
 # =============================================================================
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_is_service_running_api_returns_different_status_codes(mock_urlopen, mock_subprocess, mock_which, api_client):
+@patch('http.client.HTTPConnection')
+def test_is_service_running_api_returns_different_status_codes(mock_conn_cls, api_client):
     """Tests is_service_running with various HTTP status codes."""
-    # pgrep fails
-    mock_subprocess.return_value.returncode = 1
-    
-    # Test different status codes
     test_cases = [
         (200, True),   # Success
         (201, True),   # Created  
@@ -1082,27 +1086,12 @@ def test_is_service_running_api_returns_different_status_codes(mock_urlopen, moc
     ]
     
     for status_code, expected in test_cases:
-        mock_response = MagicMock()
-        mock_response.status = status_code
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_conn_cls.return_value.getresponse.side_effect = None
+        mock_conn_cls.return_value.getresponse.return_value = make_response(status=status_code)
         
         result = api_client.is_service_running()
         assert result == expected, f"Status {status_code} should return {expected}"
 
-@patch('shutil.which', return_value='/usr/local/bin/ollama')
-@patch('subprocess.run')
-@patch('urllib.request.urlopen')
-def test_is_service_running_pgrep_with_multiple_processes(mock_urlopen, mock_subprocess, mock_which, api_client):
-    """Tests is_service_running when pgrep finds multiple ollama processes."""
-    # Simulate pgrep finding multiple processes (still returns 0)
-    mock_subprocess.return_value.returncode = 0
-    mock_subprocess.return_value.stdout = "1234\n5678\n9012\n"  # Multiple PIDs
-    
-    result = api_client.is_service_running()
-    assert result is True
-    
-    # Should not need to check API since pgrep succeeded
-    mock_urlopen.assert_not_called()
 
 # =============================================================================
 # Additional Environment Checks Edge Cases
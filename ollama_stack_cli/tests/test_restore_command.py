@@ -208,6 +208,48 @@ class TestRestoreCommand:
         # Should be called twice: validation and restore
         assert mock_app_context.stack_manager.restore_from_backup.call_count == 2
     
+    def test_restore_stack_logic_stream_file_validates_then_restores(self, mock_app_context, tmp_path):
+        """Test a backup stream file is verified in full before the restore pass."""
+        backup_file = tmp_path / "backup.tar.gz"
+        backup_file.write_bytes(b"stream")
+        mock_app_context.stack_manager.restore_from_stream.return_value = True
+        mock_app_context.stack_manager.is_stack_running.return_value = False
+        
+        result = restore_stack_logic(mock_app_context, backup_path=str(backup_file))
+        
+        assert result is True
+        calls = mock_app_context.stack_manager.restore_from_stream.call_args_list
+        assert [call.kwargs for call in calls] == [{"validate_only": True}, {}]
+        mock_app_context.stack_manager.restore_from_backup.assert_not_called()
+    
+    def test_restore_stack_logic_stream_file_validation_failure(self, mock_app_context, tmp_path):
+        backup_file = tmp_path / "backup.tar.zst"
+        backup_file.write_bytes(b"stream")
+        mock_app_context.stack_manager.restore_from_stream.return_value = False
+        
+        result = restore_stack_logic(mock_app_context, backup_path=str(backup_file))
+        
+        assert result is False
+        mock_app_context.stack_manager.restore_from_stream.assert_called_once()
+    
+    def test_restore_stack_logic_stdin_requires_force(self, mock_app_context):
+        """Test restoring from stdin refuses to run without --force, since it cannot prompt."""
+        result = restore_stack_logic(mock_app_context, backup_path="-")
+        
+        assert result is False
+        mock_app_context.stack_manager.restore_from_stream.assert_not_called()
+    
+    def test_restore_stack_logic_stdin_with_force(self, mock_app_context):
+        mock_app_context.stack_manager.restore_from_stream.return_value = True
+        
+        with patch('sys.stdin') as mock_stdin:
+            result = restore_stack_logic(mock_app_context, backup_path="-", force=True)
+        
+        assert result is True
+        mock_app_context.stack_manager.restore_from_stream.assert_called_once_with(
+            mock_stdin.buffer, validate_only=False
+        )
+    
     def test_restore_stack_logic_exception_handling(self, mock_app_context, temp_backup_dir):
         """Test restore exception handling."""
         mock_app_context.stack_manager.restore_from_backup.side_effect = Exception("Test error")
@@ -247,6 +289,74 @@ class TestRestoreCommand:
         assert "Configuration files" in restore_items_call
         assert "Docker volumes" not in restore_items_call
     
+    def test_restore_stack_logic_selected_volume_and_path(self, mock_app_context, temp_backup_dir):
+        """Test a selective restore skips the configuration checks and passes the selection through."""
+        mock_app_context.stack_manager.restore_from_backup.side_effect = [True, True]
+        mock_app_context.stack_manager.is_stack_running.return_value = True
+        
+        with patch('ollama_stack_cli.config.get_default_config_file') as mock_config_file, \
+             patch('typer.confirm') as mock_confirm:
+            result = restore_stack_logic(
+                mock_app_context,
+                backup_path=str(temp_backup_dir),
+                force=True,
+                volumes=["ollama-stack_tools_data"],
+                paths=["ollama-stack_webui_data:/webui.db", "ollama-stack_webui_data:/uploads"]
+            )
+        
+        assert result is True
+        mock_config_file.assert_not_called()
+        mock_confirm.assert_not_called()
+        restore_call = mock_app_context.stack_manager.restore_from_backup.call_args_list[1]
+        assert restore_call.kwargs["volumes"] == ["ollama-stack_tools_data"]
+        assert restore_call.kwargs["paths"] == {"ollama-stack_webui_data": ["/webui.db", "/uploads"]}
+        assert restore_call.kwargs["validate_only"] is False
+    
+    def test_restore_stack_logic_selected_running_no_force(self, mock_app_context, temp_backup_dir):
+        """Test a selective restore asks before stopping services that use the volumes."""
+        mock_app_context.stack_manager.restore_from_backup.return_value = True
+        mock_app_context.stack_manager.is_stack_running.return_value = True
+        
+        with patch('typer.confirm', return_value=False):
+            result = restore_stack_logic(
+                mock_app_context,
+                backup_path=str(temp_backup_dir),
+                volumes=["ollama-stack_webui_data"]
+            )
+        
+        assert result is False
+        assert mock_app_context.stack_manager.restore_from_backup.call_count == 1
+    
+    @pytest.mark.parametrize("spec", ["webui.db", "ollama-stack_webui_data:", ":/webui.db"])
+    def test_restore_stack_logic_invalid_path(self, mock_app_context, temp_backup_dir, spec):
+        """Test --path must be VOLUME:/subpath."""
+        result = restore_stack_logic(mock_app_context, backup_path=str(temp_backup_dir), paths=[spec])
+        
+        assert result is False
+        mock_app_context.stack_manager.restore_from_backup.assert_not_called()
+    
+    def test_restore_stack_logic_selection_rejects_stream(self, mock_app_context, tmp_path):
+        """Test a backup stream cannot be restored selectively."""
+        backup_file = tmp_path / "backup.tar.gz"
+        backup_file.write_bytes(b"stream")
+        
+        result = restore_stack_logic(
+            mock_app_context, backup_path=str(backup_file), force=True, volumes=["ollama-stack_webui_data"]
+        )
+        
+        assert result is False
+        mock_app_context.stack_manager.restore_from_stream.assert_not_called()
+    
+    def test_restore_stack_logic_selection_rejects_no_volumes(self, mock_app_context, temp_backup_dir):
+        """Test --volume cannot be combined with --no-volumes."""
+        result = restore_stack_logic(
+            mock_app_context, backup_path=str(temp_backup_dir), include_volumes=False,
+            volumes=["ollama-stack_webui_data"]
+        )
+        
+        assert result is False
+        mock_app_context.stack_manager.restore_from_backup.assert_not_called()
+    
     @patch('ollama_stack_cli.commands.restore.restore_stack_logic')
     def test_restore_command_success(self, mock_logic):
         """Test restore command success."""
@@ -254,7 +364,7 @@ class TestRestoreCommand:
         
         # Create mock context
         mock_ctx = Mock()
-        mock_ctx.obj = Mock()
+        mock_ctx.obj = MagicMock()
         
         # Should not raise exception
         restore(
@@ -270,7 +380,10 @@ class TestRestoreCommand:
             backup_path="/test/backup",
             include_volumes=True,
             validate_only=False,
-            force=False
+            force=False,
+            max_workers=4,
+            volumes=None,
+            paths=None
         )
     
     @patch('ollama_stack_cli.commands.restore.restore_stack_logic')
@@ -279,7 +392,7 @@ class TestRestoreCommand:
         mock_logic.return_value = False
         
         mock_ctx = Mock()
-        mock_ctx.obj = Mock()
+        mock_ctx.obj = MagicMock()
         
         with pytest.raises(typer.Exit) as exc_info:
             restore(
@@ -295,14 +408,15 @@ class TestRestoreCommand:
         mock_logic.return_value = True
         
         mock_ctx = Mock()
-        mock_ctx.obj = Mock()
+        mock_ctx.obj = MagicMock()
         
         restore(
             ctx=mock_ctx,
             backup_path="/test/backup",
             include_volumes=False,
             validate_only=True,
-            force=True
+            force=True,
+            workers=2
         )
         
         mock_logic.assert_called_once_with(
@@ -310,5 +424,8 @@ class TestRestoreCommand:
             backup_path="/test/backup",
             include_volumes=False,
             validate_only=True,
-            force=True
+            force=True,
+            max_workers=2,
+            volumes=None,
+            paths=None
         ) 
\ No newline at end of file
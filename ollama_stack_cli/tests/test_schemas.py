@@ -8,6 +8,7 @@ from ollama_stack_cli.schemas import (
     AppConfig, 
     ResourceUsage,
     ServiceStatus,
+    LoadedModel,
     ExtensionStatus,
     StackStatus, 
     EnvironmentCheck, 
@@ -308,6 +309,20 @@ class TestServiceStatus:
         assert status.health is None
         assert status.ports == {}
         assert isinstance(status.usage, ResourceUsage)
+        assert status.latency_ms is None
+        assert status.version is None
+        assert status.models == []
+    
+    def test_loaded_models(self):
+        """Test ServiceStatus carrying native Ollama version and loaded models."""
+        model = LoadedModel(name="llama3:8b", size_bytes=6000, vram_bytes=4000, ram_bytes=2000)
+        status = ServiceStatus(name="ollama (Native)", is_running=True, version="0.4.2", models=[model])
+
+        dumped = status.model_dump()
+        assert dumped["version"] == "0.4.2"
+        assert dumped["models"][0]["name"] == "llama3:8b"
+        assert dumped["models"][0]["ram_bytes"] == 2000
+        assert dumped["models"][0]["expires_at"] is None
     
     def test_full_fields(self):
         """Test ServiceStatus with all fields."""
@@ -520,6 +535,21 @@ class TestBackupConfig:
         assert config.compression is True
         assert config.encryption is False
         assert config.exclude_patterns == []
+        assert config.max_workers == 4
+        assert config.codec == "gzip"
+        assert config.compression_level is None
+        assert config.compression_threads == 0
+    
+    def test_codec_must_be_known(self):
+        """Test BackupConfig rejects codecs the CLI cannot write."""
+        assert BackupConfig(codec="zstd").codec == "zstd"
+        with pytest.raises(ValidationError):
+            BackupConfig(codec="brotli")
+    
+    def test_max_workers_must_be_positive(self):
+        """Test BackupConfig rejects a worker limit below one."""
+        with pytest.raises(ValidationError):
+            BackupConfig(max_workers=0)
     
     def test_custom_values(self):
         """Test BackupConfig with custom values."""
@@ -592,6 +622,7 @@ class TestBackupManifest:
         assert manifest.config_files == []
         assert manifest.extensions == []
         assert manifest.checksum is None
+        assert manifest.files == []
         assert manifest.size_bytes is None
         assert manifest.description is None
     
@@ -666,6 +697,22 @@ class TestBackupManifest:
         assert manifest2.config_files == []
         assert manifest2.extensions == []
     
+    def test_file_digests_round_trip(self):
+        """Test that per-file digests survive JSON serialization."""
+        manifest = BackupManifest(
+            stack_version="0.2.0",
+            cli_version="0.2.0",
+            platform="linux",
+            backup_config=BackupConfig(),
+            files=[{"path": "volumes/vol1.tar.gz", "size": 10, "sha256": "ab" * 32}]
+        )
+
+        restored = BackupManifest.model_validate_json(manifest.model_dump_json())
+
+        assert restored.files[0].path == "volumes/vol1.tar.gz"
+        assert restored.files[0].size == 10
+        assert restored.files[0].sha256 == "ab" * 32
+    
     def test_missing_required_fields(self):
         """Test ValidationError for missing required fields."""
         with pytest.raises(ValidationError):
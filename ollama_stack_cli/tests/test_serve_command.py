@@ -0,0 +1,88 @@
+import signal
+from typer.testing import CliRunner
+from unittest.mock import MagicMock, patch
+
+from ollama_stack_cli.main import app
+from ollama_stack_cli.commands.serve import serve_status_logic
+
+runner = CliRunner()
+
+
+@patch('ollama_stack_cli.commands.serve.serve_status_logic')
+@patch('ollama_stack_cli.main.AppContext')
+def test_serve_command_defaults(MockAppContext, mock_serve_logic, mock_app_context):
+    """Tests that 'serve' passes default options to the logic function."""
+    MockAppContext.return_value = mock_app_context
+
+    result = runner.invoke(app, ["serve"])
+
+    assert result.exit_code == 0
+    mock_serve_logic.assert_called_once_with(
+        mock_app_context,
+        host="127.0.0.1",
+        port=9464,
+        socket_path=None,
+        interval=5,
+        health_interval=15,
+        extensions_only=False,
+    )
+
+
+@patch('ollama_stack_cli.commands.serve.serve_status_logic')
+@patch('ollama_stack_cli.main.AppContext')
+def test_serve_command_with_options(MockAppContext, mock_serve_logic, mock_app_context):
+    """Tests that 'serve' passes socket and cadence options through."""
+    MockAppContext.return_value = mock_app_context
+
+    result = runner.invoke(app, ["serve", "--socket", "/tmp/stack.sock", "--interval", "1", "--health-interval", "30"])
+
+    assert result.exit_code == 0
+    kwargs = mock_serve_logic.call_args.kwargs
+    assert kwargs["socket_path"] == "/tmp/stack.sock"
+    assert kwargs["interval"] == 1
+    assert kwargs["health_interval"] == 30
+
+
+@patch('ollama_stack_cli.commands.serve.serve_status_logic', side_effect=OSError("Address already in use"))
+@patch('ollama_stack_cli.main.AppContext')
+def test_serve_command_bind_failure(MockAppContext, mock_serve_logic, mock_app_context):
+    """Tests that a bind failure is reported and exits with an error."""
+    MockAppContext.return_value = mock_app_context
+
+    result = runner.invoke(app, ["serve"])
+
+    assert result.exit_code == 1
+    mock_app_context.display.error.assert_called_once()
+
+
+@patch('ollama_stack_cli.status_server.create_status_server')
+def test_serve_status_logic_runs_until_interrupted(mock_create_server, mock_app_context):
+    """Tests that the cache is started and both server and cache are shut down on Ctrl+C."""
+    server = mock_create_server.return_value
+    server.server_address = ("127.0.0.1", 9464)
+    server.serve_forever.side_effect = KeyboardInterrupt
+    cache = mock_app_context.stack_manager.create_status_cache.return_value
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    serve_status_logic(mock_app_context, interval=2, health_interval=20)
+
+    mock_app_context.stack_manager.create_status_cache.assert_called_once_with(
+        interval=2, health_interval=20, extensions_only=False
+    )
+    mock_create_server.assert_called_once_with(cache, host="127.0.0.1", port=9464, socket_path=None)
+    cache.start.assert_called_once()
+    server.server_close.assert_called_once()
+    cache.stop.assert_called_once()
+    assert signal.getsignal(signal.SIGTERM) is previous_handler
+
+
+@patch('ollama_stack_cli.status_server.remove_socket')
+@patch('ollama_stack_cli.status_server.create_status_server')
+def test_serve_status_logic_removes_socket_on_shutdown(mock_create_server, mock_remove_socket, mock_app_context):
+    """Tests the unix socket is removed once the server stops."""
+    mock_create_server.return_value.serve_forever.side_effect = KeyboardInterrupt
+
+    serve_status_logic(mock_app_context, socket_path="/tmp/stack.sock")
+
+    mock_create_server.return_value.server_close.assert_called_once()
+    mock_remove_socket.assert_called_once_with("/tmp/stack.sock")
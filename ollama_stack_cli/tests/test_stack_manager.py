@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 import pytest
 from unittest.mock import MagicMock, patch, call
 from pathlib import Path
@@ -18,6 +21,7 @@ def mock_config():
     config = MagicMock(spec=AppConfig)
     config.docker_compose_file = "docker-compose.yml"
     config.project_name = "ollama-stack"
+    config.version = "0.2.0"
     config.platform = {
         "apple": PlatformConfig(compose_file="docker-compose.apple.yml"),
         "nvidia": PlatformConfig(compose_file="docker-compose.nvidia.yml"),
@@ -47,7 +51,7 @@ def stack_manager(mock_config, mock_display, mock_docker_client, mock_ollama_api
     """Fixture to create a StackManager with mocked clients."""
     with patch('ollama_stack_cli.stack_manager.DockerClient', return_value=mock_docker_client), \
          patch('ollama_stack_cli.stack_manager.OllamaApiClient', return_value=mock_ollama_api_client), \
-         patch('ollama_stack_cli.stack_manager.docker.from_env'), \
+         patch('ollama_stack_cli.docker_client.docker.from_env'), \
          patch('ollama_stack_cli.stack_manager.platform.system', return_value='Linux'), \
          patch('ollama_stack_cli.stack_manager.platform.machine', return_value='x86_64'):
         manager = StackManager(config=mock_config, display=mock_display)
@@ -75,7 +79,7 @@ def test_get_docker_services_status_on_apple(stack_manager, mock_docker_client,
     
     status = stack_manager.get_docker_services_status(docker_services)
     
-    mock_docker_client.get_container_status.assert_called_once_with(docker_services)
+    mock_docker_client.get_container_status.assert_called_once_with(docker_services, include_usage=True)
     
     assert len(status) == 2
     webui = next(s for s in status if s.name == 'webui')
@@ -99,7 +103,7 @@ def test_get_docker_services_status_on_linux(stack_manager, mock_docker_client,
     
     status = stack_manager.get_docker_services_status(docker_services)
     
-    mock_docker_client.get_container_status.assert_called_once_with(docker_services)
+    mock_docker_client.get_container_status.assert_called_once_with(docker_services, include_usage=True)
     assert len(status) == 3
 
 def test_stream_logs_delegation(stack_manager, mock_docker_client):
@@ -148,8 +152,10 @@ def test_run_environment_checks_cpu_platform(stack_manager, mock_docker_client):
     mock_report = CheckReport(checks=[])
     mock_docker_client.run_environment_checks.return_value = mock_report
     
-    report = stack_manager.run_environment_checks(fix=True)
+    with patch.object(stack_manager, 'refresh_platform') as mock_refresh:
+        report = stack_manager.run_environment_checks(fix=True)
     
+    mock_refresh.assert_called_once()
     mock_docker_client.run_environment_checks.assert_called_once_with(fix=True, platform='cpu')
     assert report == mock_report
 
@@ -192,7 +198,7 @@ def test_detect_platform_nvidia():
     """Tests platform detection for NVIDIA GPU."""
     with patch('ollama_stack_cli.stack_manager.platform.system', return_value='Linux'), \
          patch('ollama_stack_cli.stack_manager.platform.machine', return_value='x86_64'), \
-         patch('ollama_stack_cli.stack_manager.docker.from_env') as mock_docker_from_env, \
+         patch('ollama_stack_cli.docker_client.docker.from_env') as mock_docker_from_env, \
          patch('ollama_stack_cli.stack_manager.DockerClient'), \
          patch('ollama_stack_cli.stack_manager.OllamaApiClient'):
         
@@ -210,7 +216,7 @@ def test_detect_platform_nvidia_docker_exception():
     """Tests platform detection when Docker client fails during NVIDIA detection."""
     with patch('ollama_stack_cli.stack_manager.platform.system', return_value='Linux'), \
          patch('ollama_stack_cli.stack_manager.platform.machine', return_value='x86_64'), \
-         patch('ollama_stack_cli.stack_manager.docker.from_env') as mock_docker_from_env, \
+         patch('ollama_stack_cli.docker_client.docker.from_env') as mock_docker_from_env, \
          patch('ollama_stack_cli.stack_manager.DockerClient'), \
          patch('ollama_stack_cli.stack_manager.OllamaApiClient'):
         
@@ -226,7 +232,7 @@ def test_detect_platform_cpu():
     """Tests platform detection fallback to CPU."""
     with patch('ollama_stack_cli.stack_manager.platform.system', return_value='Linux'), \
          patch('ollama_stack_cli.stack_manager.platform.machine', return_value='x86_64'), \
-         patch('ollama_stack_cli.stack_manager.docker.from_env') as mock_docker_from_env, \
+         patch('ollama_stack_cli.docker_client.docker.from_env') as mock_docker_from_env, \
          patch('ollama_stack_cli.stack_manager.DockerClient'), \
          patch('ollama_stack_cli.stack_manager.OllamaApiClient'):
         
@@ -238,6 +244,103 @@ def test_detect_platform_cpu():
         manager = StackManager(config=MagicMock(), display=MagicMock())
         assert manager.platform == 'cpu'
 
+def _linux_manager_patches():
+    """Patches needed to construct a StackManager on a Linux host."""
+    return (
+        patch('ollama_stack_cli.stack_manager.platform.system', return_value='Linux'),
+        patch('ollama_stack_cli.stack_manager.platform.machine', return_value='x86_64'),
+        patch('ollama_stack_cli.stack_manager.DockerClient'),
+        patch('ollama_stack_cli.stack_manager.OllamaApiClient'),
+    )
+
+NVIDIA_INFO = {'ID': 'daemon-1', 'ServerVersion': '24.0.7', 'Runtimes': {'nvidia': {'path': 'nvidia-container-runtime'}, 'runc': {'path': 'runc'}}}
+
+def test_detect_platform_caches_result(isolated_platform_cache):
+    """Tests that the detected platform and daemon fingerprint are written to the cache."""
+    system, machine, docker_client, ollama_client = _linux_manager_patches()
+    with system, machine, docker_client, ollama_client, \
+         patch('ollama_stack_cli.docker_client.docker.from_env') as mock_from_env:
+        mock_from_env.return_value.info.return_value = NVIDIA_INFO
+
+        StackManager(config=MagicMock(), display=MagicMock())
+
+    entry = json.loads(isolated_platform_cache.read_text())
+    assert entry['platform'] == 'nvidia'
+    assert entry['fingerprint'] == {'daemon_id': 'daemon-1', 'server_version': '24.0.7', 'runtimes': ['nvidia', 'runc']}
+
+def test_detect_platform_uses_cache_without_daemon_round_trip(isolated_platform_cache):
+    """Tests that a cached platform skips the Docker info() call entirely."""
+    isolated_platform_cache.write_text(json.dumps({'platform': 'nvidia', 'fingerprint': {}, 'docker_host': os.environ.get('DOCKER_HOST', '')}))
+    system, machine, docker_client, ollama_client = _linux_manager_patches()
+    with system, machine, docker_client, ollama_client, \
+         patch('ollama_stack_cli.docker_client.docker.from_env') as mock_from_env:
+        manager = StackManager(config=MagicMock(), display=MagicMock())
+
+    assert manager.platform == 'nvidia'
+    mock_from_env.assert_not_called()
+
+def test_detect_platform_ignores_cache_for_other_docker_host(isolated_platform_cache, monkeypatch):
+    """Tests that a cache recorded against another DOCKER_HOST is not trusted."""
+    isolated_platform_cache.write_text(json.dumps({'platform': 'nvidia', 'fingerprint': {}, 'docker_host': 'tcp://elsewhere:2375'}))
+    monkeypatch.delenv('DOCKER_HOST', raising=False)
+    system, machine, docker_client, ollama_client = _linux_manager_patches()
+    with system, machine, docker_client, ollama_client, \
+         patch('ollama_stack_cli.docker_client.docker.from_env') as mock_from_env:
+        mock_from_env.return_value.info.return_value = {'Runtimes': {}}
+        manager = StackManager(config=MagicMock(), display=MagicMock())
+
+    assert manager.platform == 'cpu'
+
+def test_detect_platform_failure_is_not_cached(isolated_platform_cache):
+    """Tests that the CPU fallback used when Docker is unreachable is not persisted."""
+    system, machine, docker_client, ollama_client = _linux_manager_patches()
+    with system, machine, docker_client, ollama_client, \
+         patch('ollama_stack_cli.docker_client.docker.from_env', side_effect=Exception("Docker not available")):
+        manager = StackManager(config=MagicMock(), display=MagicMock())
+
+    assert manager.platform == 'cpu'
+    assert not isolated_platform_cache.exists()
+
+def test_run_environment_checks_redetects_when_fingerprint_changes(stack_manager, mock_docker_client, isolated_platform_cache):
+    """Tests that a plain check re-detects the platform after the daemon changes."""
+    isolated_platform_cache.write_text(json.dumps({
+        'platform': 'cpu',
+        'fingerprint': {'daemon_id': 'old', 'server_version': '20.10.0', 'runtimes': ['runc']},
+        'docker_host': os.environ.get('DOCKER_HOST', ''),
+    }))
+    mock_docker_client.run_environment_checks.return_value = CheckReport(checks=[])
+
+    with patch('ollama_stack_cli.stack_manager.get_docker_info', return_value=NVIDIA_INFO):
+        stack_manager.run_environment_checks(fix=False)
+
+    assert stack_manager.platform == 'nvidia'
+    mock_docker_client.run_environment_checks.assert_called_once_with(fix=False, platform='nvidia')
+    assert json.loads(isolated_platform_cache.read_text())['fingerprint']['daemon_id'] == 'daemon-1'
+
+def test_run_environment_checks_keeps_cache_when_fingerprint_matches(stack_manager, mock_docker_client, isolated_platform_cache):
+    """Tests that a matching fingerprint leaves the cached platform alone."""
+    isolated_platform_cache.write_text(json.dumps({
+        'platform': 'nvidia',
+        'fingerprint': {'daemon_id': 'daemon-1', 'server_version': '24.0.7', 'runtimes': ['nvidia', 'runc']},
+        'docker_host': os.environ.get('DOCKER_HOST', ''),
+    }))
+    mock_docker_client.run_environment_checks.return_value = CheckReport(checks=[])
+
+    with patch('ollama_stack_cli.stack_manager.get_docker_info', return_value=NVIDIA_INFO), \
+         patch.object(stack_manager, 'refresh_platform') as mock_refresh:
+        stack_manager.run_environment_checks(fix=False)
+
+    mock_refresh.assert_not_called()
+
+def test_refresh_platform_invalidates_cache(stack_manager, isolated_platform_cache):
+    """Tests that refresh_platform discards the cache and detects again."""
+    isolated_platform_cache.write_text(json.dumps({'platform': 'nvidia', 'fingerprint': {}, 'docker_host': os.environ.get('DOCKER_HOST', '')}))
+
+    with patch('ollama_stack_cli.stack_manager.get_docker_info', return_value={'ID': 'daemon-2', 'Runtimes': {}}):
+        assert stack_manager.refresh_platform() == 'cpu'
+
+    assert json.loads(isolated_platform_cache.read_text())['platform'] == 'cpu'
+
 def test_configure_services_for_apple_platform(stack_manager):
     """Tests service configuration for Apple Silicon platform."""
     stack_manager.platform = 'apple'
@@ -317,7 +420,7 @@ def test_get_running_services_summary_docker_only(stack_manager, mock_docker_cli
     
     assert running_docker == ['webui']
     assert running_native == []
-    mock_docker_client.get_container_status.assert_called_once_with(['webui', 'mcp_proxy'])
+    mock_docker_client.get_container_status.assert_called_once_with(['webui', 'mcp_proxy'], include_usage=True)
 
 
 def test_get_running_services_summary_native_only(stack_manager, mock_ollama_api_client):
@@ -359,7 +462,7 @@ def test_get_running_services_summary_mixed_services(stack_manager, mock_docker_
     
     assert running_docker == ['webui']
     assert running_native == ['ollama']
-    mock_docker_client.get_container_status.assert_called_once_with(['webui', 'mcp_proxy'])
+    mock_docker_client.get_container_status.assert_called_once_with(['webui', 'mcp_proxy'], include_usage=True)
     mock_ollama_api_client.is_service_running.assert_called_once()
 
 
@@ -506,7 +609,7 @@ def test_get_stack_status_docker_only(stack_manager, mock_docker_client):
     assert webui_status.is_running is True
     assert webui_status.status == 'running'
     
-    mock_docker_client.get_container_status.assert_called_once_with(['webui', 'mcp_proxy'])
+    mock_docker_client.get_container_status.assert_called_once_with(['webui', 'mcp_proxy'], include_usage=True)
 
 def test_get_stack_status_native_only(stack_manager, mock_ollama_api_client):
     """Tests get_stack_status when only native services are configured."""
@@ -557,7 +660,7 @@ def test_get_stack_status_mixed_services(stack_manager, mock_docker_client, mock
     ollama_status = next(s for s in result.core_services if s.name == 'ollama')
     assert ollama_status.is_running is False
     
-    mock_docker_client.get_container_status.assert_called_once_with(['webui'])
+    mock_docker_client.get_container_status.assert_called_once_with(['webui'], include_usage=True)
     mock_ollama_api_client.get_status.assert_called_once()
 
 def test_get_stack_status_extensions_only(stack_manager):
@@ -1868,6 +1971,144 @@ def test_get_docker_services_status_applies_health_checks(mock_health_check, sta
     assert webui_status.health == 'healthy'
     assert mcp_status.health == 'unhealthy'  # Not running, so set to unhealthy
 
+def test_check_services_health_runs_concurrently(stack_manager):
+    """Tests check_services_health probes services in parallel rather than serially."""
+    import time
+
+    def slow_health_check(service_name):
+        time.sleep(0.3)
+        return "healthy"
+
+    with patch.object(stack_manager, 'check_service_health', side_effect=slow_health_check):
+        started = time.perf_counter()
+        results = stack_manager.check_services_health(['ollama', 'webui', 'mcp_proxy'])
+        elapsed = time.perf_counter() - started
+
+    assert set(results) == {'ollama', 'webui', 'mcp_proxy'}
+    assert all(health == "healthy" for health, _ in results.values())
+    # Three serial probes would take at least 0.9s
+    assert elapsed < 0.8
+
+def test_check_services_health_records_latency(stack_manager):
+    """Tests check_services_health reports per-probe latency for known services."""
+    with patch.object(stack_manager, 'check_service_health', side_effect=['healthy', 'unknown']):
+        results = stack_manager.check_services_health(['webui', 'unknown_service'])
+
+    health, latency_ms = results['webui']
+    assert health == 'healthy'
+    assert latency_ms is not None and latency_ms >= 0
+    # Services without a probe URL report no latency
+    assert results['unknown_service'] == ('unknown', None)
+
+def test_check_services_health_empty(stack_manager):
+    """Tests check_services_health returns an empty mapping when nothing is requested."""
+    assert stack_manager.check_services_health([]) == {}
+
+@patch.object(StackManager, 'check_service_health', return_value='healthy')
+def test_get_docker_services_status_sets_latency(mock_health_check, stack_manager, mock_docker_client):
+    """Tests get_docker_services_status records probe latency on running services."""
+    mock_docker_client.get_container_status.return_value = [
+        ServiceStatus(name='webui', is_running=True, status='running'),
+        ServiceStatus(name='mcp_proxy', is_running=False, status='exited'),
+    ]
+
+    statuses = stack_manager.get_docker_services_status(['webui', 'mcp_proxy'])
+
+    webui_status = next(s for s in statuses if s.name == 'webui')
+    mcp_status = next(s for s in statuses if s.name == 'mcp_proxy')
+    assert webui_status.latency_ms is not None
+    assert mcp_status.latency_ms is None
+
+def test_get_stack_status_native_latency_recorded(stack_manager, mock_ollama_api_client):
+    """Tests get_stack_status records latency for native service probes."""
+    stack_manager.config.services = {
+        'ollama': ServiceConfig(type='native-api'),
+    }
+    mock_ollama_api_client.get_status.return_value = ServiceStatus(name='ollama (Native)', is_running=True)
+
+    result = stack_manager.get_stack_status()
+
+    assert result.core_services[0].latency_ms is not None
+
+
+def test_apply_live_usage_overlays_running_services(stack_manager):
+    """Tests apply_live_usage copies streamed usage onto running services only."""
+    stack_status = StackStatus(
+        core_services=[
+            ServiceStatus(name='webui', is_running=True),
+            ServiceStatus(name='mcp_proxy', is_running=False),
+        ],
+        extensions=[]
+    )
+    stats_monitor = MagicMock()
+    stats_monitor.usage.side_effect = lambda name: ResourceUsage(cpu_percent=12.5, memory_mb=64.0)
+
+    result = stack_manager.apply_live_usage(stack_status, stats_monitor)
+
+    assert result.core_services[0].usage.cpu_percent == 12.5
+    assert result.core_services[1].usage.cpu_percent is None
+
+def test_get_stack_status_without_usage(stack_manager, mock_docker_client):
+    """Tests get_stack_status can skip stats sampling for live views."""
+    stack_manager.config.services = {'webui': ServiceConfig(type='docker')}
+    mock_docker_client.get_container_status.return_value = []
+
+    stack_manager.get_stack_status(include_usage=False)
+
+    mock_docker_client.get_container_status.assert_called_once_with(['webui'], include_usage=False)
+
+
+def test_create_state_tracker_uses_project_name(stack_manager, mock_docker_client):
+    """Tests create_state_tracker binds the tracker to the configured project."""
+    tracker = stack_manager.create_state_tracker()
+
+    assert tracker._docker_client is mock_docker_client
+    assert tracker._project_name == "ollama-stack"
+
+def test_create_status_cache_passes_cadences(stack_manager):
+    """Tests create_status_cache binds the cache to this manager with the given cadences."""
+    cache = stack_manager.create_status_cache(interval=2, health_interval=30)
+
+    assert cache._stack_manager is stack_manager
+    assert cache.interval == 2
+    assert cache.health_interval == 30
+    assert cache.extensions_only is False
+
+def test_wait_for_services_healthy_success(stack_manager):
+    """Tests wait_for_services_healthy returns True once the tracker reports readiness."""
+    tracker = MagicMock()
+    tracker.start.return_value = True
+    tracker.components_ready.return_value = False
+    tracker.wait_for_components_ready.return_value = True
+
+    with patch.object(stack_manager, 'create_state_tracker', return_value=tracker):
+        assert stack_manager.wait_for_services_healthy(['webui'], timeout=5) is True
+
+    tracker.wait_for_components_ready.assert_called_once_with(['webui'], timeout=5)
+    tracker.stop.assert_called_once()
+
+def test_wait_for_services_healthy_timeout(stack_manager):
+    """Tests wait_for_services_healthy returns False when services never become healthy."""
+    tracker = MagicMock()
+    tracker.start.return_value = True
+    tracker.components_ready.return_value = False
+    tracker.wait_for_components_ready.return_value = False
+
+    with patch.object(stack_manager, 'create_state_tracker', return_value=tracker):
+        assert stack_manager.wait_for_services_healthy(['webui'], timeout=1) is False
+
+    tracker.stop.assert_called_once()
+
+def test_wait_for_services_healthy_no_events(stack_manager):
+    """Tests wait_for_services_healthy fails when events can't be subscribed to."""
+    tracker = MagicMock()
+    tracker.start.return_value = False
+
+    with patch.object(stack_manager, 'create_state_tracker', return_value=tracker):
+        assert stack_manager.wait_for_services_healthy(['webui']) is False
+
+    tracker.wait_for_components_ready.assert_not_called()
+
 
 # =============================================================================
 # Install Stack Management Tests
@@ -1903,6 +2144,23 @@ def test_install_stack_basic_success(mock_confirm, mock_get_config_file, mock_ge
     assert tmp_path.exists()
 
 
+@patch('ollama_stack_cli.stack_manager.get_default_config_dir')
+@patch('ollama_stack_cli.stack_manager.save_config')
+@patch('typer.confirm')
+def test_install_stack_refreshes_platform_cache(mock_confirm, mock_save_config, mock_stack_get_config_dir, stack_manager, tmp_path):
+    """Tests that install discards any cached platform and detects it again."""
+    mock_stack_get_config_dir.return_value = tmp_path
+    stack_manager.run_environment_checks = MagicMock(return_value=CheckReport(checks=[]))
+
+    with patch('ollama_stack_cli.stack_manager.get_default_config_file', return_value=tmp_path / ".ollama-stack.json"), \
+         patch('ollama_stack_cli.stack_manager.get_default_env_file', return_value=tmp_path / ".env"), \
+         patch.object(stack_manager, 'refresh_platform') as mock_refresh:
+        result = stack_manager.install_stack(force=True)
+
+    assert result['success'] is True
+    mock_refresh.assert_called_once()
+
+
 @patch('ollama_stack_cli.stack_manager.get_default_config_dir')
 @patch('ollama_stack_cli.stack_manager.save_config')
 @patch('ollama_stack_cli.config.get_default_config_dir')
@@ -2803,7 +3061,8 @@ def test_install_stack_save_config_call_arguments(mock_confirm, mock_get_config_
 @patch('pathlib.Path.rglob')
 @patch('datetime.datetime')
 @patch('platform.system')
-def test_create_backup_full_success(mock_platform_system, mock_datetime, mock_rglob, mock_mkdir, mock_open, mock_validate_manifest, mock_config_class, mock_backup_config, mock_backup_manifest, stack_manager, mock_docker_client):
+@patch('ollama_stack_cli.stack_manager.BackupCheckpoint')
+def test_create_backup_full_success(mock_checkpoint, mock_platform_system, mock_datetime, mock_rglob, mock_mkdir, mock_open, mock_validate_manifest, mock_config_class, mock_backup_config, mock_backup_manifest, stack_manager, mock_docker_client):
     """Tests create_backup with all options enabled - happy path."""
     from pathlib import Path
     
@@ -2857,17 +3116,24 @@ def test_create_backup_full_success(mock_platform_system, mock_datetime, mock_rg
     mock_file2.stat.return_value.st_size = 512000
     
     mock_rglob.return_value = [mock_file1, mock_file2]
+    stack_manager._catalog_backup = MagicMock()
     
     backup_dir = Path("/tmp/test-backup")
     result = stack_manager.create_backup(backup_dir)
     
     assert result is True
+    stack_manager._catalog_backup.assert_called_once()
+    assert stack_manager._catalog_backup.call_args.args[1] == backup_dir
     mock_mkdir.assert_called_with(parents=True, exist_ok=True)
     stack_manager.find_resources_by_label.assert_called_once_with("ollama-stack.component")
     mock_docker_client.backup_volumes.assert_called_once()
+    assert mock_docker_client.backup_volumes.call_args.kwargs["checkpoint"] is mock_checkpoint.create.return_value
+    assert mock_docker_client.backup_volumes.call_args.kwargs["online"] is False
     mock_temp_config.export_configuration.assert_called_once()
     mock_docker_client.export_stack_state.assert_called_once()
     mock_validate_manifest.assert_called_once()
+    # A completed backup no longer needs its checkpoint
+    mock_checkpoint.create.return_value.remove.assert_called_once()
 
 
 def test_create_backup_with_custom_config(stack_manager):
@@ -2906,7 +3172,8 @@ def test_create_backup_with_custom_config(stack_manager):
                 mock_manifest_instance.size_bytes = None
                 mock_manifest.return_value = mock_manifest_instance
                 
-                with patch('builtins.open', MagicMock()):
+                with patch('builtins.open', MagicMock()), patch('ollama_stack_cli.stack_manager.BackupCheckpoint'), \
+                    patch('ollama_stack_cli.stack_manager.BackupThrottle'):
                     with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, mock_manifest_instance)):
                         backup_dir = Path("/tmp/test-backup")
                         
@@ -2937,7 +3204,8 @@ def test_create_backup_no_volumes_found(stack_manager, mock_docker_client):
             mock_manifest_instance.model_dump.return_value = {'test': 'data'}
             mock_manifest.return_value = mock_manifest_instance
             
-            with patch('builtins.open', MagicMock()):
+            with patch('builtins.open', MagicMock()), patch('ollama_stack_cli.stack_manager.BackupCheckpoint'), \
+                    patch('ollama_stack_cli.stack_manager.BackupThrottle'):
                 with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, mock_manifest_instance)):
                     backup_dir = Path("/tmp/test-backup")
                     
@@ -2977,6 +3245,269 @@ def test_create_backup_volume_backup_failure(stack_manager, mock_docker_client):
     assert result is False  # Should fail when volume backup fails
 
 
+def test_create_backup_records_volume_stats(stack_manager, mock_docker_client, tmp_path):
+    """Tests create_backup passes the worker limit through and records per-volume stats in the manifest."""
+    from ollama_stack_cli.schemas import VolumeBackupStats
+
+    mock_volume = MagicMock()
+    mock_volume.name = 'ollama-data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+
+    def backup_side_effect(volume_names, volumes_dir, max_workers, volume_stats, blob_store, volume_blobs, **kwargs):
+        volume_stats.append(VolumeBackupStats(
+            name='ollama-data', archive='ollama-data.tar.gz', size_bytes=4096,
+            source_bytes=8192, duration_seconds=2.0, throughput_bytes_per_sec=4096,
+        ))
+        return True
+
+    mock_docker_client.backup_volumes.side_effect = backup_side_effect
+    mock_docker_client.export_stack_state.return_value = True
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())):
+        result = stack_manager.create_backup(tmp_path, backup_config={
+            "include_config": False, "include_extensions": False, "max_workers": 3,
+        })
+
+    assert result is True
+    assert mock_docker_client.backup_volumes.call_args.kwargs["max_workers"] == 3
+    manifest = json.loads((tmp_path / "backup_manifest.json").read_text())
+    stats = manifest["volume_stats"][0]
+    assert stats["name"] == "ollama-data"
+    assert stats["archive"] == "ollama-data.tar.gz"
+    assert stats["size_bytes"] == 4096
+    assert stats["duration_seconds"] == 2.0
+    assert stats["throughput_bytes_per_sec"] == 4096
+
+
+def test_create_backup_keeps_checkpoint_until_complete(stack_manager, mock_docker_client, tmp_path):
+    """Tests a failed backup leaves its checkpoint for --resume and a resumed one reuses its config and ID."""
+    from ollama_stack_cli.backup_checkpoint import CHECKPOINT_FILE
+
+    mock_volume = MagicMock()
+    mock_volume.name = 'ollama-data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+    mock_docker_client.backup_volumes.return_value = False
+    mock_docker_client.export_stack_state.return_value = True
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())):
+        assert stack_manager.create_backup(tmp_path, backup_config={
+            "include_config": False, "include_extensions": False, "codec": "none",
+        }) is False
+    checkpoint = json.loads((tmp_path / CHECKPOINT_FILE).read_text())
+    assert checkpoint["backup_config"]["codec"] == "none"
+
+    mock_docker_client.backup_volumes.return_value = True
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())):
+        assert stack_manager.create_backup(tmp_path, resume=True) is True
+
+    assert mock_docker_client.backup_volumes.call_args.kwargs["codec"] == "none"
+    assert mock_docker_client.backup_volumes.call_args.kwargs["checkpoint"].state.backup_id == checkpoint["backup_id"]
+    manifest = json.loads((tmp_path / "backup_manifest.json").read_text())
+    assert manifest["backup_id"] == checkpoint["backup_id"]
+    assert not (tmp_path / CHECKPOINT_FILE).exists()
+
+
+def test_create_backup_resume_without_checkpoint(stack_manager, mock_docker_client, tmp_path):
+    assert stack_manager.create_backup(tmp_path, resume=True) is False
+    mock_docker_client.backup_volumes.assert_not_called()
+
+
+def test_create_backup_deduplicates_blobs_into_shared_store(stack_manager, mock_docker_client, tmp_path):
+    """Tests create_backup hands a shared blob store to backup_volumes and records its blob references."""
+    from ollama_stack_cli.schemas import BlobRef
+
+    mock_volume = MagicMock()
+    mock_volume.name = 'ollama_data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+    ref = BlobRef(path="./models/blobs/sha256-" + "a" * 64, digest="a" * 64, size=10)
+
+    def backup_side_effect(volume_names, volumes_dir, max_workers, volume_stats, blob_store, volume_blobs, **kwargs):
+        volume_blobs['ollama_data'] = [ref]
+        return True
+
+    mock_docker_client.backup_volumes.side_effect = backup_side_effect
+    backup_dir = tmp_path / "backups" / "backup-1"
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())):
+        result = stack_manager.create_backup(backup_dir, backup_config={
+            "include_config": False, "include_extensions": False, "deduplicate_blobs": True,
+        })
+
+    assert result is True
+    blob_store = mock_docker_client.backup_volumes.call_args.kwargs["blob_store"]
+    assert blob_store.root == tmp_path / "backups" / "blob-store"
+    manifest = json.loads((backup_dir / "backup_manifest.json").read_text())
+    assert manifest["blob_store"] == os.path.join("..", "blob-store")
+    assert manifest["volume_blobs"]["ollama_data"][0]["digest"] == "a" * 64
+
+
+@pytest.mark.parametrize("compression,codec", [(True, "zstd"), (False, "none")])
+def test_create_backup_records_codec(stack_manager, mock_docker_client, tmp_path, compression, codec):
+    """Tests create_backup compresses volumes with the configured codec, unless compression is off."""
+    mock_volume = MagicMock()
+    mock_volume.name = 'webui_data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+    mock_docker_client.backup_volumes.return_value = True
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())):
+        result = stack_manager.create_backup(tmp_path, backup_config={
+            "include_config": False, "include_extensions": False, "compression": compression,
+            "codec": "zstd", "compression_level": 19, "compression_threads": 2,
+        })
+
+    assert result is True
+    kwargs = mock_docker_client.backup_volumes.call_args.kwargs
+    assert (kwargs["codec"], kwargs["compression_level"], kwargs["compression_threads"]) == (codec, 19, 2)
+    manifest = json.loads((tmp_path / "backup_manifest.json").read_text())
+    assert manifest["codec"] == codec
+    assert manifest["compression_level"] == 19
+
+
+@pytest.mark.parametrize("codec,adaptive", [("zstd", True), ("none", False)])
+def test_create_backup_adaptive_compression(stack_manager, mock_docker_client, tmp_path, codec, adaptive):
+    """Tests adaptive compression is requested and recorded unless there is no codec to apply."""
+    mock_volume = MagicMock()
+    mock_volume.name = 'ollama_data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+    mock_docker_client.backup_volumes.return_value = True
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())):
+        assert stack_manager.create_backup(tmp_path, backup_config={
+            "include_config": False, "include_extensions": False, "codec": codec, "adaptive_compression": True,
+        }) is True
+
+    assert mock_docker_client.backup_volumes.call_args.kwargs["adaptive"] is adaptive
+    manifest = json.loads((tmp_path / "backup_manifest.json").read_text())
+    assert manifest["adaptive_compression"] is adaptive
+
+
+@pytest.mark.parametrize("verify", [False, True])
+def test_create_backup_records_file_digests(stack_manager, mock_docker_client, tmp_path, verify):
+    """Tests create_backup reuses archive digests taken while writing and hashes only the other files."""
+    from ollama_stack_cli.integrity import merkle_root
+    from ollama_stack_cli.schemas import FileDigest, VolumeBackupStats
+
+    mock_volume = MagicMock()
+    mock_volume.name = 'webui_data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+
+    def backup_side_effect(volume_names, volumes_dir, volume_stats, **kwargs):
+        (volumes_dir / "webui_data.tar.gz").write_bytes(b"archive")
+        volume_stats.append(VolumeBackupStats(
+            name='webui_data', archive='webui_data.tar.gz', size_bytes=7, sha256="ab" * 32,
+        ))
+        return True
+
+    def export_side_effect(config_dir):
+        (config_dir / ".env").write_text("KEY=1")
+        return True
+
+    mock_docker_client.backup_volumes.side_effect = backup_side_effect
+
+    def export_state(state_file):
+        state_file.write_text("{}")
+        return True
+
+    mock_docker_client.export_stack_state.side_effect = export_state
+
+    with patch('ollama_stack_cli.config.Config') as mock_config_class, \
+            patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())) as mock_validate, \
+            patch('ollama_stack_cli.integrity.file_sha256', wraps=lambda path: hashlib.sha256(path.read_bytes()).hexdigest()) as mock_hash:
+        mock_config_class.return_value.export_configuration.side_effect = export_side_effect
+        assert stack_manager.create_backup(tmp_path, backup_config={
+            "include_extensions": False, "verify_after_backup": verify,
+        }) is True
+
+    # The archive is not read back; only the config file is hashed
+    mock_hash.assert_called_once_with(tmp_path / "config" / ".env")
+    assert mock_validate.call_args.kwargs["verify_contents"] is verify
+    manifest = json.loads((tmp_path / "backup_manifest.json").read_text())
+    assert manifest["files"] == [
+        {"path": "config/.env", "size": 5, "sha256": hashlib.sha256(b"KEY=1").hexdigest()},
+        {"path": "volumes/webui_data.tar.gz", "size": 7, "sha256": "ab" * 32},
+    ]
+    assert manifest["checksum"] == merkle_root([FileDigest(**digest) for digest in manifest["files"]])
+    assert manifest["size_bytes"] == 7 + 5 + 2
+
+
+@pytest.mark.parametrize("default_excludes", [True, False])
+def test_create_backup_applies_exclude_patterns(stack_manager, mock_docker_client, tmp_path, default_excludes):
+    """Tests built-in and configured exclude patterns reach backup_volumes and excluded bytes are recorded."""
+    from ollama_stack_cli.schemas import VolumeBackupStats
+    from ollama_stack_cli.volume_archive import DEFAULT_EXCLUDE_PATTERNS
+
+    mock_volume = MagicMock()
+    mock_volume.name = 'webui_data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+
+    def backup_side_effect(volume_names, volumes_dir, volume_stats, **kwargs):
+        volume_stats.append(VolumeBackupStats(
+            name='webui_data', archive='webui_data.tar.gz', excluded_files=2, excluded_bytes=2048,
+            excluded_paths=["cache/whisper/models", "uploads/tmp"],
+        ))
+        return True
+
+    mock_docker_client.backup_volumes.side_effect = backup_side_effect
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, MagicMock())):
+        assert stack_manager.create_backup(tmp_path, backup_config={
+            "include_config": False, "include_extensions": False,
+            "exclude_patterns": ["uploads/tmp", "*.tmp"], "default_excludes": default_excludes,
+        }) is True
+
+    expected = [*DEFAULT_EXCLUDE_PATTERNS, "uploads/tmp"] if default_excludes else ["uploads/tmp", "*.tmp"]
+    assert mock_docker_client.backup_volumes.call_args.kwargs["exclude_patterns"] == expected
+    manifest = json.loads((tmp_path / "backup_manifest.json").read_text())
+    assert manifest["exclude_patterns"] == expected
+    assert manifest["excluded_bytes"] == 2048
+    assert manifest["volume_stats"][0]["excluded_paths"] == ["cache/whisper/models", "uploads/tmp"]
+
+
+def test_benchmark_compression_samples_stack_volumes(stack_manager, mock_docker_client):
+    """Tests benchmark_compression hands the stack's volumes to DockerClient.benchmark_volumes."""
+    volumes = [MagicMock(), MagicMock()]
+    volumes[0].name, volumes[1].name = 'ollama_data', 'webui_data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": volumes
+    })
+    mock_docker_client.benchmark_volumes.return_value = ["result"]
+
+    assert stack_manager.benchmark_compression(codecs=["gzip"], sample_bytes=1024, compression_threads=4) == ["result"]
+    mock_docker_client.benchmark_volumes.assert_called_once_with(
+        ['ollama_data', 'webui_data'], codecs=["gzip"], sample_bytes=1024, compression_threads=4
+    )
+
+
+def test_benchmark_compression_without_volumes(stack_manager, mock_docker_client):
+    stack_manager.find_resources_by_label = MagicMock(return_value={"containers": [], "networks": [], "volumes": []})
+
+    assert stack_manager.benchmark_compression() == []
+    mock_docker_client.benchmark_volumes.assert_not_called()
+
+
+def test_blob_store_path_resolution(tmp_path):
+    """Tests the default, relative and absolute blob store locations."""
+    backup_dir = tmp_path / "backups" / "backup-1"
+
+    assert StackManager._blob_store_path(backup_dir, None) == tmp_path / "backups" / "blob-store"
+    assert StackManager._blob_store_path(backup_dir, "../shared") == (tmp_path / "backups" / "shared").resolve()
+    assert StackManager._blob_store_path(backup_dir, str(tmp_path / "elsewhere")) == tmp_path / "elsewhere"
+
+
 def test_create_backup_config_export_failure(stack_manager):
     """Tests create_backup when config export fails."""
     stack_manager.find_resources_by_label = MagicMock(return_value={
@@ -3028,7 +3559,8 @@ def test_create_backup_extensions_enabled(stack_manager):
             mock_manifest_instance.model_dump.return_value = {'test': 'data'}
             mock_manifest.return_value = mock_manifest_instance
             
-            with patch('builtins.open', MagicMock()):
+            with patch('builtins.open', MagicMock()), patch('ollama_stack_cli.stack_manager.BackupCheckpoint'), \
+                    patch('ollama_stack_cli.stack_manager.BackupThrottle'):
                 with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, mock_manifest_instance)):
                     backup_dir = Path("/tmp/test-backup")
                     
@@ -3116,7 +3648,8 @@ def test_create_backup_size_calculation_failure(stack_manager):
             mock_manifest_instance.size_bytes = 1024000
             mock_manifest.return_value = mock_manifest_instance
             
-            with patch('builtins.open', MagicMock()):
+            with patch('builtins.open', MagicMock()), patch('ollama_stack_cli.stack_manager.BackupCheckpoint'), \
+                    patch('ollama_stack_cli.stack_manager.BackupThrottle'):
                 with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, mock_manifest_instance)):
                     # Mock pathlib rglob to raise exception during size calculation
                     with patch.object(Path, 'rglob', side_effect=PermissionError("Permission denied")):
@@ -3149,7 +3682,8 @@ def test_create_backup_export_stack_state_failure(stack_manager, mock_docker_cli
             mock_manifest_instance.model_dump.return_value = {'test': 'data'}
             mock_manifest.return_value = mock_manifest_instance
             
-            with patch('builtins.open', MagicMock()):
+            with patch('builtins.open', MagicMock()), patch('ollama_stack_cli.stack_manager.BackupCheckpoint'), \
+                    patch('ollama_stack_cli.stack_manager.BackupThrottle'):
                 with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, mock_manifest_instance)):
                     backup_dir = Path("/tmp/test-backup")
                     
@@ -3173,6 +3707,9 @@ def test_restore_from_backup_full_success(mock_load_config, mock_import_config,
     mock_manifest.config_files = ['.ollama-stack.json', '.env']
     mock_manifest.volumes = ['ollama-data', 'webui-data']
     mock_manifest.extensions = ['ext1', 'ext2']
+    mock_manifest.volume_blobs = {}
+    mock_manifest.codec = 'zstd'
+    mock_manifest.adaptive_compression = False
     
     mock_validate_manifest.return_value = (True, mock_manifest)
     
@@ -3201,7 +3738,10 @@ def test_restore_from_backup_full_success(mock_load_config, mock_import_config,
     assert result is True
     mock_validate_manifest.assert_called_once()
     mock_import_config.assert_called_once()
-    mock_docker_client.restore_volumes.assert_called_once_with(['ollama-data', 'webui-data'], mock_backup_dir / "volumes")
+    mock_docker_client.restore_volumes.assert_called_once_with(
+        ['ollama-data', 'webui-data'], mock_backup_dir / "volumes", blob_store=None, volume_blobs={},
+        codec='zstd', adaptive=False, max_workers=4, volume_stats=[]
+    )
     mock_load_config.assert_called_once()
 
 
@@ -3626,3 +4166,465 @@ def test_uninstall_stack_force_flag_false(stack_manager, mock_docker_client):
 
 
 
+
+
+# =============================================================================
+# Stack Snapshot Tests
+# =============================================================================
+
+def _stack_container(name, status="running", image_id="sha256:img"):
+    container = MagicMock()
+    container.name = name
+    container.id = f"id-{name}"
+    container.status = status
+    container.image.id = image_id
+    return container
+
+def test_stack_snapshot_memoizes_queries_within_scope(stack_manager, mock_docker_client):
+    """Tests that stack state queries reach Docker once per snapshot scope."""
+    mock_docker_client.is_stack_running.return_value = False
+
+    with stack_manager.stack_snapshot("test") as snapshot:
+        assert stack_manager.is_stack_running() is False
+        assert stack_manager.is_stack_running() is False
+        stack_manager.find_resources_by_label("ollama-stack.component")
+        stack_manager.find_resources_by_label("ollama-stack.component")
+
+    mock_docker_client.is_stack_running.assert_called_once()
+    mock_docker_client.client.containers.list.assert_called_once()
+    assert snapshot.hits == 2
+
+def test_stack_snapshot_not_used_outside_scope(stack_manager, mock_docker_client):
+    """Tests that queries outside an operation always reach Docker."""
+    mock_docker_client.is_stack_running.return_value = False
+
+    stack_manager.is_stack_running()
+    stack_manager.is_stack_running()
+
+    assert mock_docker_client.is_stack_running.call_count == 2
+
+def test_stack_snapshot_nested_scopes_share_snapshot(stack_manager):
+    """Tests that a command-level scope is reused by StackManager operations."""
+    with stack_manager.stack_snapshot("update") as outer:
+        with stack_manager.stack_snapshot("inner") as inner:
+            assert inner is outer
+
+    assert stack_manager._snapshot is None
+
+def test_stack_snapshot_invalidated_by_stop(stack_manager, mock_docker_client):
+    """Tests that stopping services forces the next running check to hit Docker."""
+    mock_docker_client.is_stack_running.side_effect = [True, False]
+    mock_docker_client.stop_services.return_value = True
+
+    with stack_manager.stack_snapshot("test"):
+        assert stack_manager.is_stack_running() is True
+        stack_manager.stop_docker_services()
+        assert stack_manager.is_stack_running() is False
+
+    assert mock_docker_client.is_stack_running.call_count == 2
+
+def test_stack_snapshot_logs_api_call_summary(stack_manager, mock_docker_client, caplog):
+    """Tests that the Docker API call count is reported in verbose output."""
+    requests = iter([10, 11])
+    mock_docker_client.is_stack_running.return_value = False
+
+    with patch('ollama_stack_cli.stack_snapshot.docker_request_count', side_effect=lambda: next(requests)):
+        with caplog.at_level("DEBUG", logger="ollama_stack_cli.stack_manager"):
+            with stack_manager.stack_snapshot("update"):
+                stack_manager.is_stack_running()
+
+    assert "Docker API requests for update: 1 (0 queries served from snapshot)" in caplog.text
+
+def test_uninstall_stack_lists_stack_containers_once_when_stopped(stack_manager, mock_docker_client):
+    """Tests that uninstall reuses one container listing for summary, image count and cleanup."""
+    containers = [_stack_container("webui", status="exited"), _stack_container("ollama", status="exited")]
+    mock_docker_client.client.containers.list.return_value = containers
+    mock_docker_client.client.volumes.list.return_value = []
+    mock_docker_client.client.networks.list.return_value = []
+    mock_docker_client.is_stack_running.return_value = False
+    mock_docker_client.remove_resources.return_value = True
+    stack_manager.is_native_service_running = MagicMock(return_value=False)
+
+    result = stack_manager.uninstall_stack(remove_images=True, force=True)
+
+    assert result is True
+    # One listing for discovery; cleanup removals invalidate afterwards
+    mock_docker_client.client.containers.list.assert_called_once_with(
+        all=True, filters={"label": "ollama-stack.component"}
+    )
+    for container in containers:
+        container.remove.assert_called_once_with(force=True)
+
+def test_uninstall_stack_relists_after_stopping_services(stack_manager, mock_docker_client):
+    """Tests that uninstall re-queries containers after the stop step mutates the stack."""
+    mock_docker_client.client.containers.list.return_value = [_stack_container("webui")]
+    mock_docker_client.client.volumes.list.return_value = []
+    mock_docker_client.client.networks.list.return_value = []
+    mock_docker_client.is_stack_running.return_value = True
+    mock_docker_client.stop_services.return_value = True
+    stack_manager.config.services = {"webui": ServiceConfig(type="docker")}
+
+    assert stack_manager.uninstall_stack(force=True) is True
+
+    # Discovery before the stop, then a fresh listing for cleanup
+    assert mock_docker_client.client.containers.list.call_count == 2
+    mock_docker_client.is_stack_running.assert_called_once()
+
+def test_restore_from_backup_reuses_running_check(stack_manager, mock_docker_client, tmp_path):
+    """Tests that the command-level running check is reused by restore_from_backup."""
+    manifest = MagicMock(volumes=[], config_files=[], extensions=[])
+    mock_docker_client.is_stack_running.return_value = False
+    stack_manager.is_native_service_running = MagicMock(return_value=False)
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, manifest)):
+        with stack_manager.stack_snapshot("restore"):
+            assert stack_manager.is_stack_running() is False
+            assert stack_manager.restore_from_backup(tmp_path) is True
+
+    mock_docker_client.is_stack_running.assert_called_once()
+
+def _selective_manifest():
+    return MagicMock(
+        volumes=['ollama_data', 'webui_data'], config_files=['.ollama-stack.json'], extensions=[],
+        volume_blobs={}, blob_store=None, codec='gzip', adaptive_compression=True,
+    )
+
+
+@patch('ollama_stack_cli.config.import_configuration')
+def test_restore_from_backup_selected_paths(mock_import_config, stack_manager, mock_docker_client, tmp_path):
+    """Tests a path restore stops only the volume's users, leaves config alone and starts them again."""
+    mock_docker_client.stop_volume_users.return_value = ['webui']
+    mock_docker_client.restore_volumes.return_value = True
+    mock_docker_client.start_containers.return_value = True
+    stack_manager.stop_docker_services = MagicMock()
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, _selective_manifest())):
+        result = stack_manager.restore_from_backup(tmp_path, paths={'webui_data': ['/webui.db']})
+
+    assert result is True
+    mock_import_config.assert_not_called()
+    stack_manager.stop_docker_services.assert_not_called()
+    mock_docker_client.stop_volume_users.assert_called_once_with(['webui_data'])
+    mock_docker_client.restore_volumes.assert_called_once_with(
+        ['webui_data'], tmp_path / "volumes", blob_store=None, volume_blobs={},
+        codec='gzip', adaptive=True, max_workers=4, volume_stats=[],
+        volume_paths={'webui_data': ['/webui.db']},
+    )
+    mock_docker_client.start_containers.assert_called_once_with(['webui'])
+
+
+def test_restore_from_backup_selected_volume_not_in_backup(stack_manager, mock_docker_client, tmp_path):
+    """Tests selecting a volume the backup does not have fails before anything is stopped."""
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, _selective_manifest())):
+        assert stack_manager.restore_from_backup(tmp_path, validate_only=True, volumes=['tools_data']) is False
+
+    mock_docker_client.stop_volume_users.assert_not_called()
+    mock_docker_client.restore_volumes.assert_not_called()
+
+
+def test_restore_from_backup_selected_failure_leaves_services_stopped(stack_manager, mock_docker_client, tmp_path):
+    """Tests services stopped for a failed selective restore are not started on partial data."""
+    mock_docker_client.stop_volume_users.return_value = ['webui']
+    mock_docker_client.restore_volumes.return_value = False
+
+    with patch('ollama_stack_cli.config.validate_backup_manifest', return_value=(True, _selective_manifest())):
+        assert stack_manager.restore_from_backup(tmp_path, volumes=['webui_data']) is False
+
+    mock_docker_client.start_containers.assert_not_called()
+
+def _write_stream_backup(stack_manager, mock_docker_client, backup_config=None):
+    """Create a backup stream with one volume and one config file through mocked clients."""
+    import io
+    from ollama_stack_cli.schemas import VolumeBackupStats
+
+    mock_volume = MagicMock()
+    mock_volume.name = 'webui_data'
+    stack_manager.find_resources_by_label = MagicMock(return_value={
+        "containers": [], "networks": [], "volumes": [mock_volume]
+    })
+
+    def backup_to_stream(volume_names, writer, volume_stats, **kwargs):
+        data = b"volume archive" * 100
+        with writer.open_file("volumes/webui_data.tar") as archive:
+            archive.write(data)
+        volume_stats.append(VolumeBackupStats(
+            name='webui_data', archive='webui_data.tar', size_bytes=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+        ))
+        return True
+
+    def export_state(state_file):
+        state_file.write_text("{}")
+        return True
+
+    mock_docker_client.backup_volumes_to_stream.side_effect = backup_to_stream
+    mock_docker_client.export_stack_state.side_effect = export_state
+
+    output = io.BytesIO()
+    with patch('ollama_stack_cli.config.Config') as mock_config_class:
+        mock_config_class.return_value.export_configuration.side_effect = (
+            lambda config_dir: (config_dir.mkdir(parents=True), (config_dir / ".env").write_text("KEY=1"))
+        )
+        assert stack_manager.create_backup_stream(output, backup_config or {"codec": "gzip"}) is True
+    return output.getvalue()
+
+def _restore_stream(stack_manager, data, **kwargs):
+    import io
+    imported = {}
+
+    def import_configuration(display, config_dir):
+        imported.update({path.name: path.read_text() for path in config_dir.iterdir()})
+        return True
+
+    with patch('ollama_stack_cli.config.import_configuration', side_effect=import_configuration) as mock_import, \
+            patch('ollama_stack_cli.config.load_config', return_value=(stack_manager.config, False)):
+        result = stack_manager.restore_from_stream(io.BufferedReader(io.BytesIO(data)), **kwargs)
+    mock_import.imported = imported
+    return result, mock_import
+
+def test_backup_stream_round_trip(stack_manager, mock_docker_client):
+    """Tests a streamed backup restores its volume and config after the trailer verifies."""
+    import gzip
+    data = _write_stream_backup(stack_manager, mock_docker_client)
+    restored = []
+    mock_docker_client.restore_volume_from_stream.side_effect = (
+        lambda volume, source: (restored.append((volume, source.read())), (True, None))[1]
+    )
+    mock_docker_client.is_stack_running.return_value = False
+    stack_manager.is_native_service_running = MagicMock(return_value=False)
+
+    result, mock_import = _restore_stream(stack_manager, data)
+
+    assert result is True
+    assert restored == [("webui_data", b"volume archive" * 100)]
+    assert mock_import.imported == {".env": "KEY=1"}
+    assert gzip.decompress(data)  # the outer stream is one gzip file
+    mock_docker_client.backup_volumes.assert_not_called()
+
+def test_backup_stream_trailer_lists_digests(stack_manager, mock_docker_client):
+    """Tests the trailer manifest records each file's digest and the outer codec."""
+    import io
+    from ollama_stack_cli.backup_stream import BackupStreamReader
+    from ollama_stack_cli.integrity import merkle_root
+    from ollama_stack_cli.schemas import BackupManifest
+
+    data = _write_stream_backup(stack_manager, mock_docker_client)
+    entries = {name: contents.read() for name, contents in BackupStreamReader(io.BufferedReader(io.BytesIO(data)))}
+    manifest = BackupManifest.model_validate_json(entries["backup_manifest.json"])
+
+    assert list(entries)[0] == "backup_header.json"
+    assert (manifest.codec, manifest.stream_codec) == ("none", "gzip")
+    assert [(d.path, d.sha256) for d in manifest.files] == [
+        ("config/.env", hashlib.sha256(b"KEY=1").hexdigest()),
+        ("volumes/webui_data.tar", hashlib.sha256(b"volume archive" * 100).hexdigest()),
+    ]
+    assert manifest.checksum == merkle_root(manifest.files)
+    assert manifest.config_files == [".env"]
+
+def test_restore_from_stream_rejects_truncated_stream(stack_manager, mock_docker_client):
+    """Tests a stream cut off before its trailer fails and leaves configuration untouched."""
+    data = _write_stream_backup(stack_manager, mock_docker_client, {"compression": False})
+    truncated = data[:data.index(b"backup_manifest.json") - 512]
+
+    result, mock_import = _restore_stream(stack_manager, truncated, validate_only=True)
+
+    assert result is False
+    mock_import.assert_not_called()
+
+def test_restore_from_stream_detects_tampered_file(stack_manager, mock_docker_client):
+    """Tests a file whose bytes differ from the trailer digest fails verification."""
+    data = _write_stream_backup(stack_manager, mock_docker_client, {"compression": False})
+    tampered = data.replace(b"KEY=1", b"KEY=2")
+
+    result, mock_import = _restore_stream(stack_manager, tampered, validate_only=True)
+
+    assert result is False
+    mock_import.assert_not_called()
+    mock_docker_client.restore_volume_from_stream.assert_not_called()
+
+def test_backup_manifests_record_installed_versions(stack_manager):
+    """Tests manifests carry the stack version from the config and the installed CLI's version."""
+    from importlib.metadata import PackageNotFoundError
+    with patch('importlib.metadata.version', return_value="0.5.0") as mock_version:
+        assert stack_manager._manifest_versions() == {"stack_version": "0.2.0", "cli_version": "0.5.0"}
+    mock_version.assert_called_once_with("ollama-stack-cli")
+
+    with patch('importlib.metadata.version', side_effect=PackageNotFoundError("ollama-stack-cli")):
+        assert stack_manager._manifest_versions()["cli_version"] == "unknown"
+
+def test_create_backup_stream_rejects_blob_deduplication(stack_manager, mock_docker_client):
+    import io
+    assert stack_manager.create_backup_stream(io.BytesIO(), {"deduplicate_blobs": True}) is False
+    mock_docker_client.backup_volumes_to_stream.assert_not_called()
+
+def _write_backup_dir(tmp_path, backup_id, created_at, digests=(), cataloged=True):
+    """Creates a backup directory whose manifest references model blobs in the shared store."""
+    from ollama_stack_cli.schemas import BackupConfig, BackupManifest, BlobRef
+    backup_dir = tmp_path / "backups" / backup_id
+    backup_dir.mkdir(parents=True)
+    store_dir = tmp_path / "backups" / "blob-store" / "sha256"
+    store_dir.mkdir(parents=True, exist_ok=True)
+    for digest in digests:
+        (store_dir / digest).write_bytes(b"x" * 10)
+    manifest = BackupManifest(
+        backup_id=backup_id, created_at=created_at, stack_version="0.2.0", cli_version="0.2.0", platform="cpu",
+        backup_config=BackupConfig(deduplicate_blobs=bool(digests)),
+        volume_blobs={"ollama_data": [
+            BlobRef(path=f"./models/blobs/sha256-{digest}", digest=digest, size=10) for digest in digests
+        ]} if digests else {},
+    )
+    (backup_dir / "backup_manifest.json").write_text(manifest.model_dump_json())
+    return backup_dir, store_dir
+
+def _catalog_backup_dir(stack_manager, tmp_path, backup_id, created_at, digests=()):
+    """Creates a backup directory with model blobs in a shared store and catalogs it."""
+    from ollama_stack_cli.schemas import BackupCatalogEntry
+    stack_manager.config.backup_directory = str(tmp_path / "backups")
+    backup_dir, store_dir = _write_backup_dir(tmp_path, backup_id, created_at, digests)
+    stack_manager.backup_catalog().add(BackupCatalogEntry(
+        backup_id=backup_id, created_at=created_at, path=str(backup_dir),
+        blob_store=str(store_dir.parent) if digests else None, blob_digests=sorted(digests),
+    ))
+    return backup_dir
+
+def test_catalog_backup_records_manifest(stack_manager, tmp_path, isolated_backup_catalog):
+    from ollama_stack_cli.schemas import BackupConfig, BackupManifest
+    manifest = BackupManifest(stack_version="0.2.0", cli_version="0.2.0", platform="cpu",
+                              backup_config=BackupConfig(), volumes=["ollama_data"])
+
+    stack_manager._catalog_backup(manifest, tmp_path)
+
+    assert isolated_backup_catalog.is_file()
+    assert [entry.backup_id for entry in stack_manager.list_backups()] == [manifest.backup_id]
+
+def test_catalog_backup_failure_does_not_raise(stack_manager, tmp_path):
+    """Tests a backup that cannot be cataloged is only logged."""
+    with patch('ollama_stack_cli.stack_manager.BackupCatalog') as mock_catalog:
+        mock_catalog.return_value.add.side_effect = OSError("read-only")
+        stack_manager._catalog_backup(MagicMock(), tmp_path)
+
+def test_list_backups_rebuild_scans_backup_directory(stack_manager, tmp_path):
+    stack_manager.config.backup_directory = str(tmp_path / "backups")
+    with patch('ollama_stack_cli.stack_manager.BackupCatalog') as mock_catalog:
+        result = stack_manager.list_backups(rebuild=True)
+
+    mock_catalog.return_value.rebuild.assert_called_once_with(tmp_path / "backups")
+    assert result is mock_catalog.return_value.rebuild.return_value
+
+def test_prune_backups_removes_old_backups_and_unreferenced_blobs(stack_manager, tmp_path):
+    """Tests pruning deletes backups outside the policy and blobs only they referenced."""
+    from datetime import datetime
+    shared, old_only = "a" * 64, "b" * 64
+    old = _catalog_backup_dir(stack_manager, tmp_path, "old", datetime(2026, 3, 1), [shared, old_only])
+    new = _catalog_backup_dir(stack_manager, tmp_path, "new", datetime(2026, 3, 2), [shared])
+    store = tmp_path / "backups" / "blob-store" / "sha256"
+
+    report = stack_manager.prune_backups(keep_daily=1)
+
+    assert [entry.backup_id for entry in report.kept] == ["new"]
+    assert [entry.backup_id for entry in report.removed] == ["old"]
+    assert (report.reclaimed_blobs, report.reclaimed_bytes) == (1, 10)
+    assert not old.exists() and new.exists()
+    assert (store / shared).exists() and not (store / old_only).exists()
+    assert [entry.backup_id for entry in stack_manager.list_backups()] == ["new"]
+    assert len(stack_manager.backup_catalog().path.read_text().splitlines()) == 1
+
+def test_prune_backups_dry_run_changes_nothing(stack_manager, tmp_path):
+    from datetime import datetime
+    old = _catalog_backup_dir(stack_manager, tmp_path, "old", datetime(2026, 3, 1), ["b" * 64])
+    _catalog_backup_dir(stack_manager, tmp_path, "new", datetime(2026, 3, 2))
+
+    report = stack_manager.prune_backups(keep_daily=1, dry_run=True)
+
+    assert report.dry_run is True
+    assert [entry.backup_id for entry in report.removed] == ["old"]
+    assert (report.reclaimed_blobs, report.reclaimed_bytes) == (1, 10)
+    assert old.exists()
+    assert (tmp_path / "backups" / "blob-store" / "sha256" / ("b" * 64)).exists()
+    assert len(stack_manager.list_backups()) == 2
+
+def test_prune_backups_keeps_backup_that_cannot_be_deleted(stack_manager, tmp_path):
+    """Tests a backup whose directory cannot be removed stays cataloged, with its blobs."""
+    from datetime import datetime
+    _catalog_backup_dir(stack_manager, tmp_path, "old", datetime(2026, 3, 1), ["b" * 64])
+    _catalog_backup_dir(stack_manager, tmp_path, "new", datetime(2026, 3, 2))
+
+    with patch('shutil.rmtree', side_effect=PermissionError("denied")):
+        report = stack_manager.prune_backups(keep_daily=1)
+
+    assert report.removed == []
+    assert report.reclaimed_blobs == 0
+    assert len(stack_manager.list_backups()) == 2
+
+def test_prune_backups_keeps_blobs_of_uncataloged_backups(stack_manager, tmp_path):
+    """Tests blobs referenced only by a backup the catalog does not know about are kept."""
+    from datetime import datetime
+    uncataloged_only = "c" * 64
+    _catalog_backup_dir(stack_manager, tmp_path, "old", datetime(2026, 3, 1), [uncataloged_only])
+    _catalog_backup_dir(stack_manager, tmp_path, "new", datetime(2026, 3, 2))
+    _write_backup_dir(tmp_path, "before-catalog", datetime(2026, 2, 1), [uncataloged_only])
+
+    report = stack_manager.prune_backups(keep_daily=1)
+
+    assert [entry.backup_id for entry in report.removed] == ["old"]
+    assert report.reclaimed_blobs == 0
+    assert (tmp_path / "backups" / "blob-store" / "sha256" / uncataloged_only).exists()
+
+def test_prune_backups_skips_reclaim_while_a_backup_uses_the_store(stack_manager, tmp_path):
+    """Tests a checkpointed (running or interrupted) backup sharing the store blocks blob deletion."""
+    from datetime import datetime
+    from ollama_stack_cli.backup_checkpoint import BackupCheckpoint
+    from ollama_stack_cli.schemas import BackupConfig
+    _catalog_backup_dir(stack_manager, tmp_path, "old", datetime(2026, 3, 1), ["b" * 64])
+    _catalog_backup_dir(stack_manager, tmp_path, "new", datetime(2026, 3, 2))
+    running = tmp_path / "backups" / "running"
+    running.mkdir()
+    BackupCheckpoint.create(running, "running", BackupConfig(deduplicate_blobs=True))
+
+    report = stack_manager.prune_backups(keep_daily=1)
+
+    assert [entry.backup_id for entry in report.removed] == ["old"]
+    assert report.reclaimed_blobs == 0
+    assert (tmp_path / "backups" / "blob-store" / "sha256" / ("b" * 64)).exists()
+
+def test_prune_backups_refuses_directory_without_matching_manifest(stack_manager, tmp_path):
+    """Tests a cataloged path that no longer holds that backup is not deleted."""
+    from datetime import datetime
+    old = _catalog_backup_dir(stack_manager, tmp_path, "old", datetime(2026, 3, 1))
+    _catalog_backup_dir(stack_manager, tmp_path, "new", datetime(2026, 3, 2))
+    (old / "backup_manifest.json").write_text('{"backup_id": "someone-else"}')
+
+    report = stack_manager.prune_backups(keep_daily=1)
+
+    assert report.removed == []
+    assert old.exists()
+    assert len(stack_manager.list_backups()) == 2
+
+def test_log_writer_pauses_totals_per_service(caplog):
+    """Tests a service paused for several volume snapshots is reported with its total pause."""
+    import logging
+    from ollama_stack_cli.schemas import VolumeBackupStats
+    volume_stats = [
+        VolumeBackupStats(name="webui_data", archive="a", paused_containers=["webui"], pause_seconds=0.5),
+        VolumeBackupStats(name="webui_cache", archive="b", paused_containers=["webui", "mcp_proxy"], pause_seconds=0.3),
+        VolumeBackupStats(name="tools", archive="c"),
+    ]
+
+    with caplog.at_level(logging.INFO, logger="ollama_stack_cli.stack_manager"):
+        StackManager._log_writer_pauses(volume_stats)
+
+    assert "Service webui was paused for 0.8s while its volumes were snapshotted" in caplog.messages
+    assert "Service mcp_proxy was paused for 0.3s while its volumes were snapshotted" in caplog.messages
+    assert len(caplog.messages) == 2
+
+def test_start_throttle_applies_configured_limits():
+    from ollama_stack_cli.schemas import BackupConfig
+    with patch('ollama_stack_cli.stack_manager.BackupThrottle.apply_to_process') as mock_apply:
+        assert StackManager._start_throttle(BackupConfig()) is None
+        mock_apply.assert_not_called()
+
+        throttle = StackManager._start_throttle(BackupConfig(rate_limit_mb=20, nice=19))
+
+    mock_apply.assert_called_once()
+    assert throttle.limiter.bytes_per_second == 20 * 1024 * 1024
+    assert throttle.nice == 19
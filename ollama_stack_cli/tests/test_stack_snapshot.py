@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+from ollama_stack_cli.stack_snapshot import StackSnapshot, snapshot_operation
+
+
+class FakeRequestCounter:
+    """Stands in for docker_request_count; loaders bump it like real Docker requests would."""
+
+    def __init__(self, start=0):
+        self.count = start
+
+    def __call__(self):
+        return self.count
+
+    def loader(self, value, requests=1):
+        def load():
+            self.count += requests
+            return value
+        return MagicMock(side_effect=load)
+
+
+def test_get_runs_loader_once_per_key():
+    """Tests that repeated queries are served from the snapshot."""
+    requests = FakeRequestCounter(start=7)
+    snapshot = StackSnapshot("uninstall", request_count=requests)
+    loader = requests.loader(["container"], requests=2)
+
+    assert snapshot.get("containers", loader) == ["container"]
+    assert snapshot.get("containers", loader) == ["container"]
+
+    loader.assert_called_once()
+    assert snapshot.api_calls == 2
+    assert snapshot.hits == 1
+
+
+def test_invalidate_forces_fresh_query():
+    """Tests that invalidation makes the next query reach the loader again."""
+    requests = FakeRequestCounter()
+    snapshot = StackSnapshot("update", request_count=requests)
+    loader = requests.loader(True)
+
+    assert snapshot.get("stack_running", loader) is True
+    snapshot.invalidate("stopped Docker services")
+
+    assert snapshot.get("stack_running", loader) is True
+    assert loader.call_count == 2
+    assert snapshot.api_calls == 2
+
+
+def test_loader_failure_is_not_memoized():
+    """Tests that a failed query is retried instead of cached."""
+    snapshot = StackSnapshot("restore", request_count=FakeRequestCounter())
+    loader = MagicMock(side_effect=[Exception("Docker unavailable"), True])
+
+    try:
+        snapshot.get("stack_running", loader)
+    except Exception:
+        pass
+
+    assert snapshot.get("stack_running", loader) is True
+    assert snapshot.api_calls == 0
+
+
+def test_api_calls_count_requests_outside_queries():
+    """Tests requests the snapshot did not memoize, e.g. mutations, are counted too."""
+    requests = FakeRequestCounter()
+    snapshot = StackSnapshot("uninstall", request_count=requests)
+
+    requests.count += 3
+
+    assert snapshot.api_calls == 3
+
+
+def test_summary_reports_call_counts():
+    """Tests the verbose summary line."""
+    requests = FakeRequestCounter()
+    snapshot = StackSnapshot("uninstall", request_count=requests)
+    snapshot.get("a", requests.loader(1, requests=4))
+    snapshot.get("a", requests.loader(1, requests=4))
+
+    assert snapshot.summary() == "Docker API requests for uninstall: 4 (1 queries served from snapshot)"
+
+
+def test_snapshot_operation_decorator_enters_scope():
+    """Tests that the decorator wraps the method in stack_snapshot(operation)."""
+    class Manager:
+        stack_snapshot = MagicMock()
+
+        @snapshot_operation("update")
+        def update(self, value):
+            return value * 2
+
+    manager = Manager()
+
+    assert manager.update(21) == 42
+    Manager.stack_snapshot.assert_called_once_with("update")
@@ -0,0 +1,243 @@
+import threading
+from unittest.mock import MagicMock
+
+import docker
+import pytest
+
+from ollama_stack_cli.stack_state import StackStateTracker, COMPONENT_LABEL
+
+
+def _container_entry(container_id, component, state="running", status="Up 5 minutes"):
+    """Builds a sparse container object as returned by containers.list(sparse=True)."""
+    container = MagicMock()
+    container.id = container_id
+    container.attrs = {
+        "Names": [f"/{component}"],
+        "State": state,
+        "Status": status,
+        "Labels": {COMPONENT_LABEL: component},
+    }
+    return container
+
+
+def _named(name, resource_id=None):
+    resource = MagicMock()
+    resource.name = name
+    resource.id = resource_id or name
+    return resource
+
+
+def _container_event(action, container_id, component):
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": container_id, "Attributes": {"name": component, COMPONENT_LABEL: component}},
+    }
+
+
+@pytest.fixture
+def docker_api():
+    """Fixture for a mocked docker SDK client with an empty stack."""
+    client = MagicMock()
+    client.containers.list.return_value = []
+    client.networks.list.return_value = []
+    client.volumes.list.return_value = []
+    client.events.return_value = iter([])
+    client.api.inspect_container.return_value = {"Config": {}}
+    return client
+
+
+@pytest.fixture
+def tracker(docker_api):
+    """Fixture for a tracker bound to the mocked docker client."""
+    docker_client = MagicMock()
+    docker_client.client = docker_api
+    return StackStateTracker(docker_client, "ollama-stack")
+
+
+def test_start_primes_model(tracker, docker_api):
+    """Tests start() loads containers, networks and volumes belonging to the stack."""
+    docker_api.containers.list.return_value = [
+        _container_entry("c1", "webui", status="Up 2 minutes (healthy)"),
+        _container_entry("c2", "mcp_proxy", state="exited", status="Exited (0) 1 minute ago"),
+    ]
+    docker_api.networks.list.return_value = [_named("ollama-stack_ollama-stack-network", "n1"), _named("bridge", "n2")]
+    docker_api.volumes.list.return_value = [_named("ollama-stack_ollama_data"), _named("unrelated_data")]
+
+    assert tracker.start() is True
+
+    docker_api.containers.list.assert_called_once_with(all=True, sparse=True, filters={"label": COMPONENT_LABEL})
+    assert tracker.running_components() == ["webui"]
+    assert tracker.get_component("webui").health == "healthy"
+    assert tracker.get_component("mcp_proxy").status == "exited"
+    assert tracker.networks() == ["ollama-stack_ollama-stack-network"]
+    assert tracker.volumes() == ["ollama-stack_ollama_data"]
+    tracker.stop()
+
+
+def test_start_subscribes_with_label_filter(tracker, docker_api):
+    """Tests container events are filtered server-side by the stack label."""
+    tracker.start()
+
+    filters = [c.kwargs["filters"] for c in docker_api.events.call_args_list]
+    assert {"type": "container", "label": COMPONENT_LABEL} in filters
+    assert {"type": ["network", "volume"]} in filters
+    tracker.stop()
+
+
+def test_start_without_docker():
+    """Tests start() reports failure when Docker is unavailable."""
+    docker_client = MagicMock()
+    docker_client.client = None
+
+    tracker = StackStateTracker(docker_client, "ollama-stack")
+
+    assert tracker.start() is False
+    assert tracker.is_tracking is False
+
+
+def test_start_handles_api_error(tracker, docker_api):
+    """Tests start() fails cleanly when the events endpoint errors."""
+    docker_api.events.side_effect = docker.errors.APIError("events unavailable")
+
+    assert tracker.start() is False
+    assert tracker.is_tracking is False
+
+
+def test_container_lifecycle_events(tracker):
+    """Tests container events update status incrementally."""
+    generation = tracker.generation
+
+    assert tracker.apply_event(_container_event("create", "c1", "webui")) is True
+    assert tracker.get_component("webui").status == "created"
+
+    tracker.apply_event(_container_event("start", "c1", "webui"))
+    assert tracker.running_components() == ["webui"]
+
+    tracker.apply_event(_container_event("die", "c1", "webui"))
+    assert tracker.get_component("webui").status == "exited"
+
+    tracker.apply_event(_container_event("destroy", "c1", "webui"))
+    assert tracker.get_component("webui") is None
+    assert tracker.generation == generation + 4
+
+
+def test_health_status_events(tracker):
+    """Tests health_status events update container health."""
+    tracker.apply_event(_container_event("start", "c1", "webui"))
+    tracker.apply_event(_container_event("health_status: healthy", "c1", "webui"))
+    assert tracker.get_component("webui").health == "healthy"
+
+    # A restart resets health until Docker reports again
+    tracker.apply_event(_container_event("restart", "c1", "webui"))
+    assert tracker.get_component("webui").health == "starting"
+
+
+def test_irrelevant_events_ignored(tracker):
+    """Tests exec and unrelated events don't bump the generation."""
+    generation = tracker.generation
+
+    assert tracker.apply_event(_container_event("exec_start: /bin/bash", "c1", "webui")) is False
+    assert tracker.apply_event({"Type": "volume", "Action": "create", "Actor": {"ID": "other_volume"}}) is False
+    assert tracker.apply_event({"Type": "image", "Action": "pull", "Actor": {"ID": "alpine"}}) is False
+    assert tracker.generation == generation
+
+
+def test_network_and_volume_events(tracker):
+    """Tests network and volume events matched by project name prefix."""
+    tracker.apply_event({"Type": "volume", "Action": "create", "Actor": {"ID": "ollama-stack_webui_data"}})
+    tracker.apply_event({
+        "Type": "network", "Action": "create",
+        "Actor": {"ID": "n1", "Attributes": {"name": "ollama-stack_default"}},
+    })
+    assert tracker.volumes() == ["ollama-stack_webui_data"]
+    assert tracker.networks() == ["ollama-stack_default"]
+
+    tracker.apply_event({"Type": "volume", "Action": "destroy", "Actor": {"ID": "ollama-stack_webui_data"}})
+    tracker.apply_event({
+        "Type": "network", "Action": "destroy",
+        "Actor": {"ID": "n1", "Attributes": {"name": "ollama-stack_default"}},
+    })
+    assert tracker.volumes() == []
+    assert tracker.networks() == []
+
+
+def test_listeners_notified_on_change(tracker):
+    """Tests listeners receive events that changed the model."""
+    listener = MagicMock()
+    tracker.add_listener(listener)
+
+    event = _container_event("start", "c1", "webui")
+    tracker.apply_event(event)
+    tracker.apply_event(_container_event("exec_create", "c1", "webui"))
+
+    listener.assert_called_once_with(event)
+
+
+def test_components_ready_requires_health(tracker):
+    """Tests readiness requires running plus healthy when a healthcheck exists."""
+    tracker.apply_event(_container_event("start", "c1", "webui"))
+    assert tracker.components_ready(["webui"]) is True
+
+    tracker.apply_event(_container_event("health_status: unhealthy", "c1", "webui"))
+    assert tracker.components_ready(["webui"]) is False
+    assert tracker.components_ready(["webui", "mcp_proxy"]) is False
+
+
+def test_created_container_with_healthcheck_waits_for_healthy(tracker, docker_api):
+    """Tests a container first seen on create is not ready until its healthcheck passes."""
+    docker_api.api.inspect_container.return_value = {
+        "Config": {"Healthcheck": {"Test": ["CMD-SHELL", "curl -f http://localhost:8080/health"]}}
+    }
+
+    tracker.apply_event(_container_event("create", "c1", "webui"))
+    tracker.apply_event(_container_event("start", "c1", "webui"))
+
+    state = tracker.get_component("webui")
+    assert (state.has_healthcheck, state.health) == (True, "starting")
+    assert tracker.components_ready(["webui"]) is False
+    docker_api.api.inspect_container.assert_called_once_with("c1")
+
+    tracker.apply_event(_container_event("health_status: healthy", "c1", "webui"))
+    assert tracker.components_ready(["webui"]) is True
+
+
+def test_healthcheck_disabled_is_ready_when_running(tracker, docker_api):
+    """Tests a healthcheck disabled with NONE does not hold readiness back."""
+    docker_api.api.inspect_container.return_value = {"Config": {"Healthcheck": {"Test": ["NONE"]}}}
+
+    tracker.apply_event(_container_event("start", "c1", "webui"))
+
+    assert tracker.get_component("webui").has_healthcheck is False
+    assert tracker.components_ready(["webui"]) is True
+
+
+def test_primed_running_container_healthcheck_from_status(tracker, docker_api):
+    """Tests the list entry's status summary tells whether a running container has a healthcheck."""
+    docker_api.containers.list.return_value = [
+        _container_entry("c1", "webui", status="Up 3 seconds (health: starting)"),
+        _container_entry("c2", "mcp_proxy", status="Up 3 seconds"),
+    ]
+    tracker._prime(docker_api)
+
+    assert tracker.get_component("webui").has_healthcheck is True
+    assert tracker.get_component("mcp_proxy").has_healthcheck is False
+    assert tracker.components_ready(["mcp_proxy"]) is True
+    assert tracker.components_ready(["webui"]) is False
+
+
+def test_wait_for_components_ready_wakes_on_event(tracker):
+    """Tests waiting returns as soon as an event makes components ready."""
+    tracker.apply_event(_container_event("start", "c1", "webui"))
+    tracker.apply_event(_container_event("health_status: starting", "c1", "webui"))
+
+    timer = threading.Timer(0.1, tracker.apply_event, args=(_container_event("health_status: healthy", "c1", "webui"),))
+    timer.start()
+
+    assert tracker.wait_for_components_ready(["webui"], timeout=2) is True
+    timer.join()
+
+
+def test_wait_for_components_ready_times_out(tracker):
+    """Tests waiting returns False when components never become ready."""
+    assert tracker.wait_for_components_ready(["webui"], timeout=0.05) is False
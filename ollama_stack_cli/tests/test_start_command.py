@@ -25,6 +25,40 @@ def test_start_command(MockAppContext, mock_app_context):
     mock_app_context.stack_manager.start_docker_services.assert_called_once_with(['webui'])
     mock_app_context.stack_manager.start_native_services.assert_called_once_with(['ollama'])
 
+@patch('ollama_stack_cli.main.AppContext')
+def test_start_command_wait_for_health(MockAppContext, mock_app_context):
+    """Tests that 'start --wait' blocks on health of the started Docker services."""
+    MockAppContext.return_value = mock_app_context
+    mock_app_context.stack_manager.get_running_services_summary.return_value = ([], [])
+    mock_app_context.stack_manager.config.services = {'webui': MagicMock(type='docker'), 'ollama': MagicMock(type='native-api')}
+    mock_app_context.stack_manager.wait_for_services_healthy.return_value = True
+    
+    result = runner.invoke(app, ["start", "--wait", "--wait-timeout", "30"])
+    assert result.exit_code == 0
+    mock_app_context.stack_manager.wait_for_services_healthy.assert_called_once_with(['webui'], timeout=30)
+
+@patch('ollama_stack_cli.main.AppContext')
+def test_start_command_wait_timeout_exits_nonzero(MockAppContext, mock_app_context):
+    """Tests that 'start --wait' exits with an error when services never become healthy."""
+    MockAppContext.return_value = mock_app_context
+    mock_app_context.stack_manager.get_running_services_summary.return_value = ([], [])
+    mock_app_context.stack_manager.config.services = {'webui': MagicMock(type='docker')}
+    mock_app_context.stack_manager.wait_for_services_healthy.return_value = False
+    
+    result = runner.invoke(app, ["start", "--wait"])
+    assert result.exit_code == 1
+
+@patch('ollama_stack_cli.main.AppContext')
+def test_start_command_without_wait_skips_health(MockAppContext, mock_app_context):
+    """Tests that plain 'start' does not wait on service health."""
+    MockAppContext.return_value = mock_app_context
+    mock_app_context.stack_manager.get_running_services_summary.return_value = ([], [])
+    mock_app_context.stack_manager.config.services = {'webui': MagicMock(type='docker')}
+    
+    result = runner.invoke(app, ["start"])
+    assert result.exit_code == 0
+    mock_app_context.stack_manager.wait_for_services_healthy.assert_not_called()
+
 @patch('ollama_stack_cli.main.AppContext')
 def test_start_command_with_update(MockAppContext, mock_app_context):
     """Tests that the 'start --update' command uses the unified update logic."""
@@ -0,0 +1,93 @@
+"""
+Startup benchmarks for the CLI entry point.
+
+Each command runs in a fresh interpreter so the measurement includes module
+imports, which dominate the cost of short invocations. The budgets leave
+generous headroom over typical timings; exceeding them means a heavy import or
+eager initialization has crept back onto the startup path.
+
+Wall-clock budgets are unreliable on loaded or slow CI runners, so the timed
+tests are marked ``benchmark`` and only run when OLLAMA_STACK_BENCHMARKS is
+set. The import check always runs: it catches the same regressions without
+depending on timing.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Wall-clock budgets in seconds, measured as the best of RUNS attempts
+HELP_BUDGET = 1.5
+STATUS_JSON_BUDGET = 3.0
+RUNS = 3
+
+BENCHMARK_SKIP_REASON = "Startup benchmarks run only when OLLAMA_STACK_BENCHMARKS is set"
+
+
+@pytest.fixture
+def isolated_env(tmp_path):
+    """Environment with an empty home directory and an unreachable Docker daemon."""
+    env = os.environ.copy()
+    env["HOME"] = str(tmp_path)
+    env["USERPROFILE"] = str(tmp_path)
+    env["DOCKER_HOST"] = f"unix://{tmp_path / 'missing-docker.sock'}"
+    return env
+
+
+def best_run_time(args, env):
+    """Returns the fastest wall-clock time for running the CLI with args."""
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "ollama_stack_cli.main", *args],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        timings.append(time.perf_counter() - started)
+        assert result.returncode == 0, result.stdout + result.stderr
+    return min(timings)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.environ.get("OLLAMA_STACK_BENCHMARKS"), reason=BENCHMARK_SKIP_REASON)
+def test_help_startup_within_budget(isolated_env):
+    """Tests that `--help` renders without paying for config, Docker or pydantic."""
+    elapsed = best_run_time(["--help"], isolated_env)
+
+    assert elapsed < HELP_BUDGET, f"--help took {elapsed:.2f}s (budget {HELP_BUDGET}s)"
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.environ.get("OLLAMA_STACK_BENCHMARKS"), reason=BENCHMARK_SKIP_REASON)
+def test_status_json_startup_within_budget(isolated_env):
+    """Tests that `status --json` completes quickly when the daemon is unreachable."""
+    elapsed = best_run_time(["status", "--json"], isolated_env)
+
+    assert elapsed < STATUS_JSON_BUDGET, f"status --json took {elapsed:.2f}s (budget {STATUS_JSON_BUDGET}s)"
+
+
+def test_help_does_not_import_heavy_modules(isolated_env):
+    """Tests that rendering help leaves docker, dotenv, pydantic and pkg_resources unimported."""
+    probe = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from ollama_stack_cli.main import app\n"
+        "CliRunner().invoke(app, ['--help'])\n"
+        "heavy = [m for m in ('docker', 'dotenv', 'pydantic', 'pkg_resources', 'ollama_stack_cli.stack_manager') if m in sys.modules]\n"
+        "print(','.join(heavy))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        env=isolated_env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
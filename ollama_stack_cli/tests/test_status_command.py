@@ -88,7 +88,9 @@ def test_status_command_watch_mode(MockAppContext, mock_watch_status, mock_app_c
     mock_watch_status.assert_called_once_with(
         mock_app_context,
         extensions_only=False,
-        json_output=False
+        json_output=False,
+        interval=2,
+        health_interval=15,
     )
 
 @patch('ollama_stack_cli.commands.status.watch_status')
@@ -103,9 +105,93 @@ def test_status_command_watch_mode_with_options(MockAppContext, mock_watch_statu
     mock_watch_status.assert_called_once_with(
         mock_app_context,
         extensions_only=True,
-        json_output=True
+        json_output=True,
+        interval=2,
+        health_interval=15,
     )
 
+@patch('ollama_stack_cli.commands.status.watch_status')
+@patch('ollama_stack_cli.main.AppContext')
+def test_status_command_watch_mode_custom_intervals(MockAppContext, mock_watch_status, mock_app_context):
+    """Tests that watch mode passes refresh and health cadences through."""
+    MockAppContext.return_value = mock_app_context
+    
+    result = runner.invoke(app, ["status", "--watch", "--interval", "1", "--health-interval", "30"])
+    assert result.exit_code == 0
+    mock_watch_status.assert_called_once_with(
+        mock_app_context,
+        extensions_only=False,
+        json_output=False,
+        interval=1,
+        health_interval=30,
+    )
+
+@patch('ollama_stack_cli.commands.status.time.monotonic')
+@patch('ollama_stack_cli.commands.status.time.sleep')
+def test_watch_status_reprobes_health_on_its_own_cadence(mock_sleep, mock_monotonic, mock_app_context):
+    """Tests watch mode refreshes full status only every health_interval seconds."""
+    from ollama_stack_cli.commands.status import watch_status
+    
+    stack_status = StackStatus(core_services=[ServiceStatus(name='webui', is_running=True)], extensions=[])
+    mock_app_context.stack_manager.get_stack_status.return_value = stack_status
+    mock_app_context.stack_manager.apply_live_usage.side_effect = lambda status, monitor: status
+    stats_monitor = mock_app_context.stack_manager.create_stats_monitor.return_value
+    
+    # Ticks at t=100, 102, 104, 116; the last one crosses the 15s health interval
+    mock_monotonic.side_effect = [100, 102, 104, 116]
+    mock_sleep.side_effect = [None, None, None, KeyboardInterrupt]
+    
+    watch_status(mock_app_context, json_output=True, interval=2, health_interval=15)
+    
+    assert mock_app_context.stack_manager.get_stack_status.call_count == 2
+    mock_app_context.stack_manager.get_stack_status.assert_called_with(extensions_only=False, include_usage=False)
+    assert stats_monitor.sync.call_count == 2
+    assert mock_app_context.stack_manager.apply_live_usage.call_count == 4
+    assert mock_app_context.display.json.call_count == 4
+    stats_monitor.close.assert_called_once()
+    mock_app_context.stack_manager.create_state_tracker.return_value.stop.assert_called_once()
+
+@patch('ollama_stack_cli.commands.status.time.monotonic', return_value=100)
+@patch('ollama_stack_cli.commands.status.time.sleep')
+def test_watch_status_refreshes_on_docker_event(mock_sleep, mock_monotonic, mock_app_context):
+    """Tests watch mode refreshes immediately when the state tracker sees an event."""
+    from ollama_stack_cli.commands.status import watch_status
+    
+    stack_status = StackStatus(core_services=[], extensions=[])
+    mock_app_context.stack_manager.get_stack_status.return_value = stack_status
+    mock_app_context.stack_manager.apply_live_usage.return_value = stack_status
+    tracker = mock_app_context.stack_manager.create_state_tracker.return_value
+    tracker.generation = 1
+    
+    def bump_generation(_interval):
+        # Simulate a container dying between the first and second tick
+        if mock_sleep.call_count == 1:
+            tracker.generation = 2
+        else:
+            raise KeyboardInterrupt
+    mock_sleep.side_effect = bump_generation
+    
+    watch_status(mock_app_context, json_output=True, interval=2, health_interval=60)
+    
+    tracker.start.assert_called_once()
+    assert mock_app_context.stack_manager.get_stack_status.call_count == 2
+
+@patch('ollama_stack_cli.commands.status.time.sleep', side_effect=KeyboardInterrupt)
+def test_watch_status_table_uses_live_view(mock_sleep, mock_app_context):
+    """Tests watch mode redraws a status table in place instead of clearing the screen."""
+    from ollama_stack_cli.commands.status import watch_status
+    
+    stack_status = StackStatus(core_services=[], extensions=[])
+    mock_app_context.stack_manager.get_stack_status.return_value = stack_status
+    mock_app_context.stack_manager.apply_live_usage.return_value = stack_status
+    live = mock_app_context.display.live.return_value.__enter__.return_value
+    
+    watch_status(mock_app_context)
+    
+    mock_app_context.display.status_table.assert_called_once()
+    live.update.assert_called_once_with(mock_app_context.display.status_table.return_value, refresh=True)
+    mock_app_context.stack_manager.create_stats_monitor.return_value.close.assert_called_once()
+
 @patch('ollama_stack_cli.main.AppContext')
 def test_status_command_stack_manager_failure(MockAppContext, mock_app_context):
     """Tests status command when StackManager.get_stack_status fails."""
@@ -0,0 +1,268 @@
+import http.client
+import json
+import socket
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from ollama_stack_cli.schemas import StackStatus, ServiceStatus, ResourceUsage, LoadedModel
+from ollama_stack_cli.status_server import StatusCache, render_prometheus, create_status_server, remove_socket
+
+
+@pytest.fixture
+def stack_status():
+    return StackStatus(
+        core_services=[
+            ServiceStatus(
+                name="webui",
+                is_running=True,
+                health="healthy",
+                usage=ResourceUsage(cpu_percent=12.5, memory_mb=256.0),
+                latency_ms=20.0,
+            ),
+            ServiceStatus(
+                name="ollama (Native)",
+                is_running=True,
+                health="healthy",
+                version="0.4.2",
+                models=[LoadedModel(name="llama3:8b", size_bytes=6000, vram_bytes=4000, ram_bytes=2000)],
+            ),
+            ServiceStatus(name="mcp_proxy", is_running=False, health=None),
+        ],
+        extensions=[],
+    )
+
+
+@pytest.fixture
+def stack_manager(stack_status):
+    manager = MagicMock()
+    manager.get_stack_status.return_value = stack_status
+    manager.apply_live_usage.side_effect = lambda status, monitor: status
+    manager.create_state_tracker.return_value.generation = 0
+    return manager
+
+
+# =============================================================================
+# Prometheus Rendering Tests
+# =============================================================================
+
+def test_render_prometheus(stack_status):
+    """Tests the exposition format for service, usage and model metrics."""
+    text = render_prometheus(stack_status)
+
+    assert "# TYPE ollama_stack_service_up gauge" in text
+    assert 'ollama_stack_service_up{service="webui"} 1' in text
+    assert 'ollama_stack_service_up{service="mcp_proxy"} 0' in text
+    assert 'ollama_stack_service_health{service="mcp_proxy",health="unknown"} 1' in text
+    assert 'ollama_stack_service_cpu_percent{service="webui"} 12.5' in text
+    assert 'ollama_stack_service_memory_bytes{service="webui"} 268435456' in text
+    assert 'ollama_stack_service_probe_latency_seconds{service="webui"} 0.02' in text
+    assert 'ollama_stack_ollama_loaded_models{service="ollama (Native)"} 1' in text
+    assert 'ollama_stack_ollama_model_vram_bytes{service="ollama (Native)",model="llama3:8b"} 4000' in text
+    assert text.endswith("\n")
+
+
+def test_render_prometheus_escapes_labels():
+    """Tests that quotes and backslashes in label values are escaped."""
+    status = StackStatus(core_services=[ServiceStatus(name='we"b\\ui', is_running=True)], extensions=[])
+
+    assert 'ollama_stack_service_up{service="we\\"b\\\\ui"} 1' in render_prometheus(status)
+
+
+def test_render_prometheus_skips_empty_metrics():
+    """Tests that metrics without samples are left out entirely."""
+    text = render_prometheus(StackStatus(core_services=[], extensions=[]))
+
+    assert text.strip() == ""
+
+
+# =============================================================================
+# StatusCache Tests
+# =============================================================================
+
+def test_refresh_renders_json_and_metrics(stack_manager, stack_status):
+    """Tests that one refresh renders both documents."""
+    cache = StatusCache(stack_manager)
+    assert cache.json_document() is None
+
+    cache.refresh()
+
+    assert json.loads(cache.json_document()) == json.loads(stack_status.model_dump_json())
+    assert b"ollama_stack_status_refreshes_total 1" in cache.metrics_document()
+    stack_manager.get_stack_status.assert_called_once_with(extensions_only=False, include_usage=False)
+
+
+def test_refresh_reprobes_on_health_interval(stack_manager, monkeypatch):
+    """Tests that usage-only refreshes skip the health probes until health_interval passes."""
+    clock = [100.0]
+    monkeypatch.setattr("ollama_stack_cli.status_server.time.monotonic", lambda: clock[0])
+    cache = StatusCache(stack_manager, interval=1, health_interval=10)
+    cache._stats_monitor = MagicMock()
+
+    cache.refresh()
+    clock[0] += 5
+    cache.refresh()
+    assert stack_manager.get_stack_status.call_count == 1
+    assert stack_manager.apply_live_usage.call_count == 2
+
+    clock[0] += 5
+    cache.refresh()
+    assert stack_manager.get_stack_status.call_count == 2
+
+
+def test_refresh_reprobes_on_docker_event(stack_manager):
+    """Tests that a state tracker generation change triggers an immediate re-probe."""
+    cache = StatusCache(stack_manager, health_interval=3600)
+    cache._state_tracker = MagicMock(generation=0)
+
+    cache.refresh()
+    cache._state_tracker.generation = 1
+    cache.refresh()
+
+    assert stack_manager.get_stack_status.call_count == 2
+
+
+def test_refresh_failure_keeps_previous_documents(stack_manager):
+    """Tests that a failed refresh is counted and the last good documents are kept."""
+    cache = StatusCache(stack_manager, health_interval=0)
+    cache.refresh()
+    previous = cache.json_document()
+
+    stack_manager.get_stack_status.side_effect = Exception("Docker unavailable")
+    cache.refresh()
+
+    assert cache.json_document() == previous
+    assert cache.error_count == 1
+
+
+def test_start_and_stop_manage_streams(stack_manager):
+    """Tests that start attaches the streams and stop closes them."""
+    cache = StatusCache(stack_manager, interval=60)
+
+    cache.start()
+    cache.stop()
+
+    tracker = stack_manager.create_state_tracker.return_value
+    tracker.add_listener.assert_called_once()
+    tracker.start.assert_called_once()
+    tracker.stop.assert_called_once()
+    stack_manager.create_stats_monitor.return_value.close.assert_called_once()
+    stack_manager.get_stack_status.assert_called_once()
+
+
+# =============================================================================
+# HTTP Server Tests
+# =============================================================================
+
+def serve_in_background(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_http_server_endpoints(stack_manager):
+    """Tests /status, /metrics, /healthz and unknown paths over TCP."""
+    cache = StatusCache(stack_manager)
+    server = create_status_server(cache, host="127.0.0.1", port=0)
+    serve_in_background(server)
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+
+        connection.request("GET", "/status")
+        response = connection.getresponse()
+        assert response.status == 503
+        response.read()
+
+        cache.refresh()
+        connection.request("GET", "/status")
+        response = connection.getresponse()
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "application/json"
+        assert json.loads(response.read())["core_services"][0]["name"] == "webui"
+
+        connection.request("GET", "/metrics")
+        response = connection.getresponse()
+        assert response.status == 200
+        assert response.getheader("Content-Type").startswith("text/plain; version=0.0.4")
+        assert b"ollama_stack_service_up" in response.read()
+
+        connection.request("GET", "/healthz")
+        assert connection.getresponse().read() == b"ok\n"
+
+        connection.request("GET", "/nope")
+        response = connection.getresponse()
+        assert response.status == 404
+        response.read()
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unix_socket_server(stack_manager, tmp_path):
+    """Tests serving metrics over a unix socket, replacing a stale socket file."""
+    socket_path = tmp_path / "stack.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+    cache = StatusCache(stack_manager)
+    cache.refresh()
+    server = create_status_server(cache, socket_path=str(socket_path))
+    serve_in_background(server)
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.settimeout(5)
+        client.connect(str(socket_path))
+        client.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+        data = b""
+        while chunk := client.recv(65536):
+            data += chunk
+        client.close()
+
+        assert data.startswith(b"HTTP/1.0 200")
+        assert b'ollama_stack_service_up{service="webui"} 1' in data
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unix_socket_server_keeps_regular_file(stack_manager, tmp_path):
+    """Tests a path that is not a socket is never deleted."""
+    socket_path = tmp_path / "stack.sock"
+    socket_path.write_text("not a socket")
+
+    with pytest.raises(FileExistsError):
+        create_status_server(StatusCache(stack_manager), socket_path=str(socket_path))
+
+    assert socket_path.read_text() == "not a socket"
+
+
+def test_unix_socket_server_keeps_live_socket(stack_manager, tmp_path):
+    """Tests the socket of a server that is still listening is not taken over."""
+    socket_path = tmp_path / "stack.sock"
+    live = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    live.bind(str(socket_path))
+    live.listen(1)
+    try:
+        with pytest.raises(OSError, match="Another server is listening"):
+            create_status_server(StatusCache(stack_manager), socket_path=str(socket_path))
+        assert socket_path.exists()
+    finally:
+        live.close()
+
+
+def test_remove_socket_only_removes_sockets(tmp_path):
+    socket_path = tmp_path / "stack.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.close()
+    regular = tmp_path / "regular"
+    regular.write_text("keep")
+
+    remove_socket(str(socket_path))
+    remove_socket(str(regular))
+    remove_socket(str(tmp_path / "missing"))
+
+    assert not socket_path.exists()
+    assert regular.exists()
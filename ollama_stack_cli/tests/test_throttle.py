@@ -0,0 +1,80 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ollama_stack_cli.schemas import BackupConfig
+from ollama_stack_cli.throttle import BackupThrottle, RateLimiter
+
+
+def test_rate_limiter_sleeps_off_debt():
+    """Tests reads beyond the one-second burst wait until the rate catches up."""
+    clock = [100.0]
+    with patch("ollama_stack_cli.throttle.time.monotonic", side_effect=lambda: clock[0]), \
+            patch("ollama_stack_cli.throttle.time.sleep") as mock_sleep:
+        limiter = RateLimiter(1000)
+
+        assert limiter.throttle(1000) == 0.0
+        assert limiter.throttle(500) == pytest.approx(0.5)
+        mock_sleep.assert_called_once_with(pytest.approx(0.5))
+
+        # Idle time refills the bucket, but never past one second's worth
+        clock[0] += 10
+        assert limiter.throttle(1000) == 0.0
+        assert limiter.throttle(1) > 0
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_throttle_from_config():
+    throttle = BackupThrottle.from_config(BackupConfig(
+        rate_limit_mb=50, nice=19, ionice="idle", helper_cpu_shares=128, helper_blkio_weight=10,
+    ))
+
+    assert throttle.active
+    assert throttle.limiter.bytes_per_second == 50 * 1024 * 1024
+    assert throttle.container_resources() == {"cpu_shares": 128, "blkio_weight": 10}
+    assert str(throttle) == (
+        "reads capped at 50.0 MB/s, nice 19, ionice idle, helper cpu-shares 128, helper blkio-weight 10"
+    )
+
+
+def test_throttle_inactive_by_default():
+    throttle = BackupThrottle.from_config(BackupConfig())
+
+    assert not throttle.active
+    assert throttle.limiter is None
+    assert throttle.container_resources() == {}
+    assert str(throttle) == "none"
+
+
+@patch("ollama_stack_cli.throttle.subprocess.run")
+@patch("ollama_stack_cli.throttle.shutil.which", return_value="/usr/bin/ionice")
+@patch("ollama_stack_cli.throttle.os.setpriority")
+@patch("ollama_stack_cli.throttle.os.getpriority", return_value=0)
+def test_apply_to_process_lowers_priority(mock_getpriority, mock_setpriority, mock_which, mock_run):
+    BackupThrottle(nice=19, io_class="idle").apply_to_process()
+
+    mock_setpriority.assert_called_once_with(os.PRIO_PROCESS, 0, 19)
+    assert mock_run.call_args.args[0][:3] == ["/usr/bin/ionice", "-c", "3"]
+
+
+@patch("ollama_stack_cli.throttle.subprocess.run")
+@patch("ollama_stack_cli.throttle.shutil.which", return_value=None)
+@patch("ollama_stack_cli.throttle.os.setpriority")
+@patch("ollama_stack_cli.throttle.os.getpriority", return_value=19)
+def test_apply_to_process_never_raises_priority(mock_getpriority, mock_setpriority, mock_which, mock_run):
+    """Tests an already lower priority is kept and a missing ionice only warns."""
+    BackupThrottle(nice=10, io_class="best-effort").apply_to_process()
+
+    mock_setpriority.assert_not_called()
+    mock_run.assert_not_called()
+
+
+@patch("ollama_stack_cli.throttle.os.getpriority", return_value=0)
+@patch("ollama_stack_cli.throttle.os.setpriority", side_effect=PermissionError("denied"))
+def test_apply_to_process_failure_only_warns(mock_setpriority, mock_getpriority):
+    BackupThrottle(nice=5).apply_to_process()
@@ -27,6 +27,19 @@ def test_update_command_stack_not_running(MockAppContext, mock_app_context):
         called_from_start_restart=False
     )
 
+@patch('ollama_stack_cli.main.AppContext')
+def test_update_command_runs_in_one_stack_snapshot(MockAppContext, mock_app_context):
+    """Tests that the running-state check and update share one stack snapshot."""
+    MockAppContext.return_value = mock_app_context
+    mock_app_context.stack_manager.is_stack_running.return_value = False
+    mock_app_context.stack_manager.update_stack.return_value = True
+    mock_app_context.config.app_config.version = "0.5.0"
+    
+    result = runner.invoke(app, ["update"])
+    
+    assert result.exit_code == 0
+    mock_app_context.stack_manager.stack_snapshot.assert_called_once_with("update")
+
 @patch('typer.confirm')
 @patch('ollama_stack_cli.main.AppContext')
 def test_update_command_stack_running_confirm_yes(MockAppContext, mock_confirm):
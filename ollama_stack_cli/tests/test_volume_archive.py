@@ -0,0 +1,349 @@
+import io
+import tarfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ollama_stack_cli.volume_archive import (
+    DEFAULT_EXCLUDE_PATTERNS,
+    ChunkStreamReader,
+    ExcludeFilter,
+    PathSelector,
+    SourceChangedError,
+    TarPosition,
+    iter_tar_stream,
+    rebase_tar_stream,
+)
+
+
+def build_tar(entries):
+    """Builds an uncompressed tar from (TarInfo, content) pairs."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for info, content in entries:
+            tar.addfile(info, io.BytesIO(content) if content is not None else None)
+    return buffer.getvalue()
+
+
+def test_chunk_stream_reader_reads_across_chunks():
+    """Tests reads spanning chunk boundaries and byte counting."""
+    reader = ChunkStreamReader([b"abc", b"", b"defg"])
+
+    assert reader.read(2) == b"ab"
+    assert reader.read(4) == b"c"
+    assert reader.read() == b"defg"
+    assert reader.read(1) == b""
+    assert reader.bytes_read == 7
+
+
+def test_chunk_stream_reader_drain_counts_remaining_bytes():
+    """Tests drain consumes buffered and unread chunks."""
+    reader = ChunkStreamReader([b"abcd", b"efgh"])
+    reader.read(1)
+
+    reader.drain()
+
+    assert reader.bytes_read == 8
+    assert reader.read() == b""
+
+
+def test_chunk_stream_reader_reports_progress():
+    """Tests the progress callback is rate limited by progress_interval."""
+    on_progress = MagicMock()
+    with patch("ollama_stack_cli.volume_archive.time.perf_counter", side_effect=[0.0, 1.0, 6.0]):
+        reader = ChunkStreamReader([b"a" * 10, b"b" * 10], on_progress=on_progress, progress_interval=5)
+        reader.read(10)
+        reader.read(10)
+
+    on_progress.assert_called_once_with(20, 20 / 6.0)
+
+
+def test_chunk_stream_reader_waits_on_rate_limiter():
+    """Tests every read is reported to the rate limiter and its waits are added up."""
+    limiter = MagicMock()
+    limiter.throttle.side_effect = [0.0, 0.25]
+    reader = ChunkStreamReader([b"a" * 10, b"b" * 6], rate_limiter=limiter)
+
+    reader.read(10)
+    reader.read(10)
+
+    assert [c.args for c in limiter.throttle.call_args_list] == [(10,), (6,)]
+    assert reader.throttled_seconds == 0.25
+
+
+def test_rebase_tar_stream_renames_entries_and_links():
+    """Tests data/... entries become ./... including hard link targets."""
+    directory = tarfile.TarInfo("data")
+    directory.type = tarfile.DIRTYPE
+    regular = tarfile.TarInfo("data/models/blob")
+    regular.size = 5
+    hardlink = tarfile.TarInfo("data/models/alias")
+    hardlink.type = tarfile.LNKTYPE
+    hardlink.linkname = "data/models/blob"
+    symlink = tarfile.TarInfo("data/latest")
+    symlink.type = tarfile.SYMTYPE
+    symlink.linkname = "models/blob"
+    source = io.BytesIO(build_tar([(directory, None), (regular, b"bytes"), (hardlink, None), (symlink, None)]))
+    destination = io.BytesIO()
+
+    assert rebase_tar_stream(source, destination, "data") == 4
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode="r") as tar:
+        assert tar.getnames() == [".", "./models/blob", "./models/alias", "./latest"]
+        assert tar.extractfile("./models/blob").read() == b"bytes"
+        assert tar.getmember("./models/alias").linkname == "./models/blob"
+        # Symlink targets are relative to the link and stay untouched
+        assert tar.getmember("./latest").linkname == "models/blob"
+
+
+def test_rebase_tar_stream_diverts_members():
+    """Tests diverted members are left out of the archive."""
+    keep = tarfile.TarInfo("data/keep")
+    keep.size = 4
+    drop = tarfile.TarInfo("data/drop")
+    drop.size = 4
+    source = io.BytesIO(build_tar([(keep, b"keep"), (drop, b"drop")]))
+    destination = io.BytesIO()
+    diverted = []
+
+    def divert(member, contents):
+        if member.name == "./drop":
+            diverted.append(contents.read())
+            return True
+        return False
+
+    assert rebase_tar_stream(source, destination, "data", divert=divert) == 1
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode="r") as tar:
+        assert tar.getnames() == ["./keep"]
+    assert diverted == [b"drop"]
+
+
+def test_rebase_tar_stream_renames_long_pax_paths():
+    """Tests names too long for the ustar header, carried in PAX headers, are renamed too."""
+    long_name = "data/" + "/".join(["webui", "uploads", "x" * 80, "y" * 80]) + ".json"
+    member = tarfile.TarInfo(long_name)
+    member.size = 2
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        tar.addfile(member, io.BytesIO(b"{}"))
+    destination = io.BytesIO()
+
+    rebase_tar_stream(io.BytesIO(buffer.getvalue()), destination, "data")
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode="r") as tar:
+        assert tar.getnames() == ["./" + long_name[len("data/"):]]
+
+
+def test_rebase_tar_stream_encodes_members():
+    """Tests the encode callback replaces member contents and is closed after writing."""
+    member = tarfile.TarInfo("data/notes.txt")
+    member.size = 5
+    source = io.BytesIO(build_tar([(member, b"hello")]))
+    destination = io.BytesIO()
+    replacements = []
+
+    def encode(info, contents):
+        data = contents.read().upper() + b"!"
+        info.size = len(data)
+        replacements.append(io.BytesIO(data))
+        return replacements[-1]
+
+    rebase_tar_stream(source, destination, "data", encode=encode)
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode="r") as tar:
+        assert tar.extractfile("./notes.txt").read() == b"HELLO!"
+    assert replacements[0].closed
+
+
+def test_iter_tar_stream_round_trip():
+    """Tests the generated stream is a valid tar with the given members and contents."""
+    regular = tarfile.TarInfo("./models/blobs/blob")
+    regular.size = 600  # spans a block boundary
+    directory = tarfile.TarInfo("./models")
+    directory.type = tarfile.DIRTYPE
+
+    stream = b"".join(iter_tar_stream([(directory, None), (regular, lambda: io.BytesIO(b"z" * 600))]))
+
+    assert len(stream) % tarfile.BLOCKSIZE == 0
+    with tarfile.open(fileobj=io.BytesIO(stream), mode="r") as tar:
+        assert tar.getnames() == ["./models", "./models/blobs/blob"]
+        assert tar.extractfile("./models/blobs/blob").read() == b"z" * 600
+
+
+def test_iter_tar_stream_rejects_truncated_file():
+    """Tests a source shorter than its recorded size raises instead of emitting a corrupt archive."""
+    regular = tarfile.TarInfo("./blob")
+    regular.size = 10
+
+    with pytest.raises(OSError):
+        b"".join(iter_tar_stream([(regular, lambda: io.BytesIO(b"short"))]))
+
+
+def make_member(name, size=0, type=tarfile.REGTYPE, linkname=""):
+    member = tarfile.TarInfo(name)
+    member.size = size
+    member.type = type
+    member.linkname = linkname
+    return member
+
+
+@pytest.mark.parametrize("pattern,path,excluded", [
+    ("*.tmp", "uploads/upload.tmp", True),
+    ("*.tmp", "uploads/upload.tmp.json", False),
+    ("cache/whisper", "cache/whisper/models/base.pt", True),
+    ("cache/whisper", "data/cache/whisper/models/base.pt", False),
+    ("./cache/whisper/", "cache/whisper", True),
+    ("__pycache__", "tools/__pycache__/tool.pyc", True),
+    (".cache", ".cache/pip/wheel", True),
+    (".cache", "cache/pip/wheel", False),
+    ("models/blobs/sha256-*-partial*", "models/blobs/sha256-" + "a" * 64 + "-partial-0", True),
+    ("models/blobs/sha256-*-partial*", "models/blobs/sha256-" + "a" * 64, False),
+])
+def test_exclude_filter_matching(pattern, path, excluded):
+    """Tests unanchored name patterns, root-anchored paths and excluded parent directories."""
+    assert ExcludeFilter([pattern]).matches(path) is excluded
+
+
+def test_exclude_filter_records_top_level_paths_and_bytes():
+    """Tests excluded bytes count regular files only and paths are recorded once per excluded tree."""
+    exclude = ExcludeFilter(["cache/whisper", "*.tmp"])
+
+    decisions = [exclude(member) for member in [
+        make_member(".", type=tarfile.DIRTYPE),
+        make_member("./cache/whisper", type=tarfile.DIRTYPE),
+        make_member("./cache/whisper/base.pt", size=100),
+        make_member("./cache/whisper/small.pt", size=50),
+        make_member("./uploads/a.tmp", size=7),
+        make_member("./uploads/report.pdf", size=9),
+        make_member("./uploads/alias", type=tarfile.LNKTYPE, linkname="./uploads/a.tmp"),
+    ]]
+
+    assert decisions == [False, True, True, True, True, False, True]
+    assert exclude.excluded_files == 3
+    assert exclude.excluded_bytes == 157
+    assert exclude.excluded_paths == ["cache/whisper", "uploads/a.tmp", "uploads/alias"]
+
+
+def test_exclude_filter_without_patterns_keeps_everything():
+    exclude = ExcludeFilter(["", " / "])
+
+    assert exclude.patterns == []
+    assert exclude(make_member("./cache/whisper/base.pt", size=1)) is False
+
+
+def test_exclude_filter_find_predicates():
+    """Tests name patterns become -name tests and anchored ones -path tests under ./"""
+    exclude = ExcludeFilter(["*.tmp", "/cache/whisper/", "models/blobs"])
+
+    assert exclude.find_predicates() == [
+        "-name", "*.tmp", "-o", "-path", "./cache/whisper", "-o", "-path", "./models/blobs",
+    ]
+    assert ExcludeFilter([]).find_predicates() == []
+
+
+def test_default_excludes_keep_user_data():
+    """Tests the built-in excludes leave databases, uploads and completed model blobs alone."""
+    exclude = ExcludeFilter(DEFAULT_EXCLUDE_PATTERNS)
+
+    for path in ["webui.db", "uploads/report.pdf", "vector_db/chroma.sqlite3",
+                 "models/blobs/sha256-" + "a" * 64, "models/manifests/registry.ollama.ai/library/llama3/latest"]:
+        assert not exclude.matches(path), path
+    for path in ["cache/embedding/models/model.safetensors", "cache/whisper/models/base.pt",
+                 "models/blobs/sha256-" + "a" * 64 + "-partial"]:
+        assert exclude.matches(path), path
+
+
+@pytest.mark.parametrize("path,name,selected", [
+    ("/webui.db", "./webui.db", True),
+    ("webui.db", "webui.db", True),
+    ("/webui.db", "./webui.db-journal", False),
+    ("./uploads/", "./uploads/report.pdf", True),
+    ("uploads", "./uploads", True),
+    ("uploads", "./uploads.txt", False),
+    ("/", "./models/manifests/llama3", True),
+])
+def test_path_selector_matching(path, name, selected):
+    """Tests a selected path matches itself and everything under it, however it is written."""
+    assert PathSelector([path]).matches(name) is selected
+
+
+def test_path_selector_counts_selected_members():
+    selector = PathSelector(["/webui.db", "/uploads", "/webui.db"])
+
+    decisions = [selector(name) for name in [".", "./webui.db", "./uploads", "./uploads/a.pdf", "./vector_db/x"]]
+
+    assert selector.paths == ["webui.db", "uploads"]
+    assert decisions == [False, True, True, True, False]
+    assert selector.selected == 3
+
+
+def test_rebase_tar_stream_excludes_members():
+    """Tests excluded members and everything under excluded directories are left out."""
+    cache = make_member("data/cache", type=tarfile.DIRTYPE)
+    cached = make_member("data/cache/model.bin", size=6)
+    kept = make_member("data/webui.db", size=2)
+    source = io.BytesIO(build_tar([(cache, None), (cached, b"weight"), (kept, b"db")]))
+    destination = io.BytesIO()
+    exclude = ExcludeFilter(["cache"])
+
+    assert rebase_tar_stream(source, destination, "data", exclude=exclude) == 1
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode="r") as tar:
+        assert tar.getnames() == ["./webui.db"]
+        assert tar.extractfile("./webui.db").read() == b"db"
+    assert exclude.excluded_bytes == 6
+
+
+def test_rebase_tar_stream_resumes_after_position():
+    """Tests a copy resumed from a reported position appends to a byte-identical archive."""
+    files = [(make_member(f"data/file{index}", size=700), bytes([index]) * 700) for index in range(4)]
+    source = build_tar(files)
+    full = io.BytesIO()
+    positions = []
+    rebase_tar_stream(io.BytesIO(source), full, "data", on_member=positions.append)
+    # Every reported byte has been written through when the callback runs
+    assert [position.offset for position in positions] == [1536, 3072, 4608, 6144]
+    assert positions[1] == TarPosition(2, "./file1", 3072)
+
+    resumed = io.BytesIO(full.getvalue()[:positions[1].offset])
+    resumed.seek(0, io.SEEK_END)
+    assert rebase_tar_stream(io.BytesIO(source), resumed, "data", resume=positions[1]) == 2
+
+    assert resumed.getvalue() == full.getvalue()
+
+
+def test_rebase_tar_stream_appends_further_streams():
+    """Tests streams given in then are opened after the source and renamed onto their root."""
+    source = build_tar([(make_member("data", type=tarfile.DIRTYPE), None), (make_member("data/webui.db", size=2), b"db")])
+    blobs = build_tar([(make_member("blobs", type=tarfile.DIRTYPE), None), (make_member("blobs/sha256-a", size=1), b"a")])
+    opened = []
+
+    def more():
+        opened.append(True)
+        yield io.BytesIO(blobs), "blobs", "./models/blobs"
+
+    destination = io.BytesIO()
+    positions = []
+    assert rebase_tar_stream(io.BytesIO(source), destination, "data", then=more(), on_member=positions.append) == 4
+
+    destination.seek(0)
+    with tarfile.open(fileobj=destination, mode="r") as tar:
+        assert tar.getnames() == [".", "./webui.db", "./models/blobs", "./models/blobs/sha256-a"]
+        assert tar.extractfile("./models/blobs/sha256-a").read() == b"a"
+    assert opened == [True]
+    assert [position.members for position in positions] == [1, 2, 3, 4]
+
+
+def test_rebase_tar_stream_resume_detects_changed_source():
+    source = build_tar([(make_member("data/a", size=1), b"a"), (make_member("data/b", size=1), b"b")])
+
+    with pytest.raises(SourceChangedError):
+        rebase_tar_stream(io.BytesIO(source), io.BytesIO(), "data", resume=TarPosition(2, "./other", 2048))
+    with pytest.raises(SourceChangedError):
+        rebase_tar_stream(io.BytesIO(source), io.BytesIO(), "data", resume=TarPosition(3, "./c", 3072))
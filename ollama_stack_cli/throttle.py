@@ -0,0 +1,139 @@
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from typing import List, Optional
+
+from .schemas import BackupConfig
+
+log = logging.getLogger(__name__)
+
+# ionice scheduling classes by name
+IO_CLASSES = {"best-effort": "2", "idle": "3"}
+
+
+class RateLimiter:
+    """
+    Token bucket capping the combined bytes per second of the threads sharing it.
+
+    Readers report what they consumed and are put to sleep for as long as
+    the bucket is in debt, so volumes backed up concurrently share one
+    budget. Up to one second's worth of bytes may pass in a burst.
+    """
+
+    def __init__(self, bytes_per_second: float):
+        if bytes_per_second <= 0:
+            raise ValueError("rate limit must be positive")
+        self.bytes_per_second = bytes_per_second
+        self._allowance = bytes_per_second
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def throttle(self, count: int) -> float:
+        """Account for count bytes, sleeping as long as needed to stay under the rate; returns the time slept."""
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(
+                self.bytes_per_second, self._allowance + (now - self._last) * self.bytes_per_second
+            )
+            self._last = now
+            self._allowance -= count
+            delay = -self._allowance / self.bytes_per_second if self._allowance < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class BackupThrottle:
+    """
+    Limits that let a backup run beside live inference.
+
+    The Docker daemon reads the volumes for the archive API, so the rate
+    limit is what slows their disk reads: a throttled reader leaves the
+    archive stream unread and the daemon blocks on it. Niceness and the I/O
+    class only apply to this process, i.e. to compression and writing the
+    archives. CPU shares and block I/O weight apply to the helper containers
+    that run (the online backup snapshot copy).
+    """
+
+    def __init__(
+        self,
+        rate_limit: Optional[float] = None,
+        nice: Optional[int] = None,
+        io_class: Optional[str] = None,
+        cpu_shares: Optional[int] = None,
+        blkio_weight: Optional[int] = None,
+    ):
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.nice = nice
+        self.io_class = io_class
+        self.cpu_shares = cpu_shares
+        self.blkio_weight = blkio_weight
+
+    @classmethod
+    def from_config(cls, config: BackupConfig) -> "BackupThrottle":
+        return cls(
+            rate_limit=config.rate_limit_mb * 1024 * 1024 if config.rate_limit_mb else None,
+            nice=config.nice,
+            io_class=config.ionice,
+            cpu_shares=config.helper_cpu_shares,
+            blkio_weight=config.helper_blkio_weight,
+        )
+
+    @property
+    def active(self) -> bool:
+        return any(setting is not None for setting in (
+            self.limiter, self.nice, self.io_class, self.cpu_shares, self.blkio_weight,
+        ))
+
+    def container_resources(self) -> dict:
+        """Keyword arguments for ``containers.create`` that lower a helper's share of CPU and disk."""
+        resources = {}
+        if self.cpu_shares is not None:
+            resources["cpu_shares"] = self.cpu_shares
+        if self.blkio_weight is not None:
+            resources["blkio_weight"] = self.blkio_weight
+        return resources
+
+    def apply_to_process(self) -> None:
+        """
+        Lower this process's CPU and I/O priority.
+
+        On Linux both are per thread and inherited by threads created later,
+        so this runs before the backup starts its worker threads. Priority is
+        never raised, and a failure only logs a warning.
+        """
+        if self.nice is not None:
+            try:
+                if self.nice > os.getpriority(os.PRIO_PROCESS, 0):
+                    os.setpriority(os.PRIO_PROCESS, 0, self.nice)
+            except (AttributeError, OSError) as e:
+                log.warning(f"Could not lower backup CPU priority: {e}")
+        if self.io_class is not None:
+            ionice = shutil.which("ionice")
+            if ionice is None:
+                log.warning("ionice is not available here; backup I/O priority left unchanged")
+                return
+            try:
+                subprocess.run(
+                    [ionice, "-c", IO_CLASSES[self.io_class], "-p", str(os.getpid())],
+                    check=True, capture_output=True, text=True,
+                )
+            except (OSError, subprocess.CalledProcessError) as e:
+                log.warning(f"Could not lower backup I/O priority: {e}")
+
+    def __str__(self) -> str:
+        applied: List[str] = []
+        if self.limiter is not None:
+            applied.append(f"reads capped at {self.limiter.bytes_per_second / (1024 * 1024):.1f} MB/s")
+        if self.nice is not None:
+            applied.append(f"nice {self.nice}")
+        if self.io_class is not None:
+            applied.append(f"ionice {self.io_class}")
+        if self.cpu_shares is not None:
+            applied.append(f"helper cpu-shares {self.cpu_shares}")
+        if self.blkio_weight is not None:
+            applied.append(f"helper blkio-weight {self.blkio_weight}")
+        return ", ".join(applied) or "none"
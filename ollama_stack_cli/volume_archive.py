@@ -0,0 +1,374 @@
+import fnmatch
+import io
+import itertools
+import logging
+import re
+import tarfile
+import time
+from typing import BinaryIO, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .throttle import RateLimiter
+
+log = logging.getLogger(__name__)
+
+# Chunk size requested from the Docker archive API
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+# Paths that are rebuilt on demand, left out of volume backups unless disabled:
+# interrupted Ollama pulls, and models Open WebUI downloads into its cache
+DEFAULT_EXCLUDE_PATTERNS = [
+    "models/blobs/sha256-*-partial*",
+    "cache/embedding/models",
+    "cache/whisper/models",
+    "cache/tiktoken",
+    "__pycache__",
+    "*.tmp",
+]
+
+
+class ChunkStreamReader(io.RawIOBase):
+    """
+    Read-only file object over an iterator of byte chunks.
+
+    Lets tarfile consume the Docker ``get_archive`` stream directly, without
+    buffering the archive in memory or on disk. Counts the bytes read and
+    reports throughput to ``on_progress`` at most every ``progress_interval``
+    seconds. With a ``rate_limiter``, reads wait for it, and the time spent
+    waiting is counted in ``throttled_seconds``.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        on_progress: Optional[Callable[[int, float], None]] = None,
+        progress_interval: float = 5.0,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = memoryview(b"")
+        self._on_progress = on_progress
+        self._progress_interval = progress_interval
+        self._started = time.perf_counter()
+        self._last_report = self._started
+        self._rate_limiter = rate_limiter
+        self.bytes_read = 0
+        self.throttled_seconds = 0.0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        count = min(len(target), len(self._buffer))
+        target[:count] = self._buffer[:count]
+        # Slicing the memoryview avoids copying the rest of the chunk on every read
+        self._buffer = self._buffer[count:]
+        self.bytes_read += count
+        if self._rate_limiter is not None:
+            self.throttled_seconds += self._rate_limiter.throttle(count)
+        self._report_progress()
+        return count
+
+    def drain(self) -> None:
+        """Consume the rest of the stream, e.g. the zero padding after the tar end marker."""
+        self.bytes_read += len(self._buffer)
+        self._buffer = memoryview(b"")
+        for chunk in self._chunks:
+            self.bytes_read += len(chunk)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def _report_progress(self) -> None:
+        if self._on_progress is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_report >= self._progress_interval:
+            self._last_report = now
+            elapsed = now - self._started
+            self._on_progress(self.bytes_read, self.bytes_read / elapsed if elapsed > 0 else 0.0)
+
+
+def _rebase(name: str, prefix: str, root: str = ".") -> str:
+    """Map an archive path under ``prefix`` onto ``root``, as `tar -C <dir> .` would name it."""
+    if name == prefix or name == f"{prefix}/":
+        return root
+    if name.startswith(f"{prefix}/"):
+        return f"{root}/{name[len(prefix) + 1:]}"
+    return name
+
+
+class ExcludeFilter:
+    """
+    Glob-based exclusion of volume archive members.
+
+    Patterns are matched with fnmatch against paths relative to the volume
+    root (``cache/whisper``, not ``./cache/whisper``), where ``*`` also
+    matches ``/``. A pattern without a slash matches a file or directory name
+    at any depth, as with ``tar --exclude``; a pattern with one is anchored at
+    the volume root. Excluding a directory excludes everything under it.
+
+    Counts the files and bytes it leaves out, and records the top-most
+    excluded paths (up to MAX_RECORDED_PATHS) for the backup manifest.
+    """
+
+    MAX_RECORDED_PATHS = 100
+
+    def __init__(self, patterns: Iterable[str]):
+        cleaned = [pattern.strip().removeprefix("./").strip("/") for pattern in patterns]
+        self.patterns = [pattern for pattern in dict.fromkeys(cleaned) if pattern]
+        anchored = [pattern for pattern in self.patterns if "/" in pattern]
+        names = [pattern for pattern in self.patterns if "/" not in pattern]
+        self._anchored = re.compile("|".join(map(fnmatch.translate, anchored))) if anchored else None
+        self._names = re.compile("|".join(map(fnmatch.translate, names))) if names else None
+        self.excluded_files = 0
+        self.excluded_bytes = 0
+        self.excluded_paths: List[str] = []
+        self._last_excluded: Optional[str] = None
+
+    def matches(self, path: str) -> bool:
+        """Whether a path relative to the volume root, or one of its parents, is excluded."""
+        parts = path.split("/")
+        for depth in range(1, len(parts) + 1):
+            if self._names is not None and self._names.match(parts[depth - 1]):
+                return True
+            if self._anchored is not None and self._anchored.match("/".join(parts[:depth])):
+                return True
+        return False
+
+    def find_predicates(self) -> List[str]:
+        """
+        The patterns as find(1) tests joined by ``-o``, for a search started at ``.``.
+
+        ``-name`` and ``-path`` match like fnmatch without FNM_PATHNAME, so
+        name patterns and anchored ones (where ``*`` crosses ``/``) keep
+        their meaning when a copy is filtered with ``find . ( ... ) -prune``.
+        """
+        predicates: List[str] = []
+        for pattern in self.patterns:
+            if predicates:
+                predicates.append("-o")
+            predicates += ["-path", f"./{pattern}"] if "/" in pattern else ["-name", pattern]
+        return predicates
+
+    def __call__(self, member: tarfile.TarInfo) -> bool:
+        """Decide whether to leave out a member already rebased onto ``./``."""
+        if not self.patterns or member.name == ".":
+            return False
+        path = member.name[2:] if member.name.startswith("./") else member.name
+        if not self.matches(path):
+            # A hard link to an excluded file would have nothing to link to
+            if not member.islnk() or not self.matches(member.linkname.removeprefix("./")):
+                return False
+        if member.isreg():
+            self.excluded_files += 1
+            self.excluded_bytes += member.size
+        last = self._last_excluded
+        if last is None or not path.startswith(f"{last}/"):
+            self._last_excluded = path
+            if len(self.excluded_paths) < self.MAX_RECORDED_PATHS:
+                self.excluded_paths.append(path)
+        return True
+
+
+class PathSelector:
+    """
+    Selection of volume archive members by path, for restoring part of a volume.
+
+    Paths are relative to the volume root, with or without a leading ``/``
+    or ``./``. Selecting a directory selects everything under it, and an
+    empty path (or ``/``) selects the whole volume. Counts the members it
+    selects, so a restore can tell when a path is not in the archive.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        cleaned = [path.strip().removeprefix("./").strip("/") for path in paths]
+        self.paths = list(dict.fromkeys(cleaned))
+        self.selected = 0
+
+    def matches(self, name: str) -> bool:
+        """Whether an archive member name (``./webui.db`` or ``webui.db``) is at or under a selected path."""
+        path = name.removeprefix("./").strip("/")
+        return any(
+            not selected or path == selected or path.startswith(f"{selected}/")
+            for selected in self.paths
+        )
+
+    def __call__(self, name: str) -> bool:
+        if not self.matches(name):
+            return False
+        self.selected += 1
+        return True
+
+
+class TarPosition(NamedTuple):
+    """How far rebase_tar_stream has got: source members consumed, the last one's name, bytes written."""
+    members: int
+    name: str
+    offset: int
+
+
+class SourceChangedError(ValueError):
+    """The source stream no longer matches the position a copy is resumed from."""
+
+
+class _OffsetWriter(io.RawIOBase):
+    """
+    Pass-through writer reporting its position, starting at ``offset``.
+
+    tarfile's non-streaming writer needs ``tell()`` but then writes every
+    member straight through instead of holding back a partial record, so
+    all of a member's bytes have reached the destination when it returns.
+    """
+
+    def __init__(self, fileobj: BinaryIO, offset: int = 0):
+        self._fileobj = fileobj
+        self._offset = offset
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._fileobj.write(data)
+        count = memoryview(data).nbytes
+        self._offset += count
+        return count
+
+    def tell(self) -> int:
+        return self._offset
+
+
+def rebase_tar_stream(
+    source,
+    destination,
+    prefix: str,
+    divert: Optional[Callable[[tarfile.TarInfo, BinaryIO], bool]] = None,
+    encode: Optional[Callable[[tarfile.TarInfo, BinaryIO], BinaryIO]] = None,
+    exclude: Optional[Callable[[tarfile.TarInfo], bool]] = None,
+    resume: Optional[TarPosition] = None,
+    on_member: Optional[Callable[[TarPosition], None]] = None,
+    then: Iterable[Tuple[BinaryIO, str, str]] = (),
+) -> int:
+    """
+    Copy a tar stream member by member, renaming ``prefix/...`` entries to ``./...``.
+
+    ``get_archive('/data')`` names entries ``data/...``; volume archives are
+    rooted at ``.`` so they extract straight into the volume. The source is
+    read in tarfile's streaming mode and members are written through as they
+    arrive, so file contents pass through once without being staged.
+
+    Args:
+        source: Readable file object producing an uncompressed tar stream
+        destination: Writable file object (already wrapped in a compressor)
+        prefix: Top-level directory name to strip
+        divert: Called with each regular file member (already renamed) and its
+            contents; returning True leaves the member out of the archive.
+            Contents the callback does not read are skipped.
+        encode: Called with each regular file member that is kept and its
+            contents; returns the file object to archive instead, after
+            updating the member (e.g. its size) to match. The returned
+            object is closed once written.
+        exclude: Called with every member (already renamed); returning True
+            leaves it out, and its contents are skipped without being read
+            into the writer.
+        resume: Continue a copy that stopped at this position: its members
+            are skipped (their contents are read past, not copied) and the
+            destination is taken to already hold ``resume.offset`` bytes.
+            Raises SourceChangedError if the source no longer lines up.
+        on_member: Called after every source member with the position
+            reached; all bytes written so far are in the destination.
+        then: Further ``(source, prefix, root)`` tar streams appended once
+            ``source`` is exhausted, with ``prefix/...`` renamed to
+            ``root/...`` (e.g. a directory read from another mount). It is
+            iterated lazily, so streams can be opened on demand; member
+            counts and positions run on across them.
+
+    Returns:
+        int: Number of members written
+    """
+    members = 0
+    consumed = 0
+    skipped = resume.members if resume is not None else 0
+    output = _OffsetWriter(destination, resume.offset if resume is not None else 0)
+    with tarfile.open(fileobj=output, mode="w", format=tarfile.PAX_FORMAT) as writer:
+        for stream, stream_prefix, root in itertools.chain([(source, prefix, ".")], then):
+            with tarfile.open(fileobj=stream, mode="r|", bufsize=ARCHIVE_CHUNK_SIZE) as reader:
+                for member in reader:
+                    consumed += 1
+                    member.name = _rebase(member.name, stream_prefix, root)
+                    if consumed <= skipped:
+                        if consumed == skipped and member.name != resume.name:
+                            raise SourceChangedError(f"expected {resume.name} as member {skipped}, found {member.name}")
+                        continue
+                    if _copy_member(reader, writer, member, stream_prefix, root, divert, encode, exclude):
+                        members += 1
+                    if on_member is not None:
+                        on_member(TarPosition(consumed, member.name, writer.offset))
+        if consumed < skipped:
+            raise SourceChangedError(f"source ended after {consumed} of {skipped} checkpointed members")
+    return members
+
+
+def _copy_member(reader, writer, member, prefix, root, divert, encode, exclude) -> bool:
+    """Copy one member (already renamed) unless it is excluded or diverted; returns whether it was written."""
+    # Long names arrive in PAX headers, which take priority over the renamed fields
+    member.pax_headers.pop("path", None)
+    if member.islnk():
+        member.linkname = _rebase(member.linkname, prefix, root)
+        member.pax_headers.pop("linkpath", None)
+    if exclude is not None and exclude(member):
+        return False
+    if member.isreg():
+        contents = reader.extractfile(member)
+        if divert is not None and divert(member, contents):
+            return False
+        if encode is None:
+            writer.addfile(member, contents)
+        else:
+            encoded = encode(member, contents)
+            try:
+                writer.addfile(member, encoded)
+            finally:
+                encoded.close()
+    else:
+        writer.addfile(member)
+    return True
+
+
+def iter_file_chunks(fileobj: BinaryIO, chunk_size: int = ARCHIVE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a file object's contents in chunks, e.g. a decompressed archive for ``put_archive``."""
+    while chunk := fileobj.read(chunk_size):
+        yield chunk
+
+
+def iter_tar_stream(entries: Iterable[Tuple[tarfile.TarInfo, Optional[Callable[[], BinaryIO]]]]) -> Iterator[bytes]:
+    """
+    Generate an uncompressed tar stream from (member, opener) pairs.
+
+    File contents are read in chunks as the stream is consumed, so the archive
+    can be uploaded with ``put_archive`` without being built in memory or on
+    disk. ``opener`` returns a binary file object for regular files and is
+    None for other member types.
+    """
+    for member, opener in entries:
+        yield member.tobuf(format=tarfile.PAX_FORMAT)
+        if opener is None or not member.size:
+            continue
+        remaining = member.size
+        with opener() as contents:
+            while remaining:
+                chunk = contents.read(min(ARCHIVE_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise OSError(f"Unexpected end of data for {member.name}")
+                remaining -= len(chunk)
+                yield chunk
+        padding = -member.size % tarfile.BLOCKSIZE
+        if padding:
+            yield tarfile.NUL * padding
+    # End-of-archive marker
+    yield tarfile.NUL * (tarfile.BLOCKSIZE * 2)